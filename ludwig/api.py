@@ -29,7 +29,7 @@ import time
 import traceback
 from collections import OrderedDict
 from pprint import pformat
-from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
 import pandas as pd
@@ -85,6 +85,7 @@ from ludwig.schema.model_config import ModelConfig
 from ludwig.types import ModelConfigDict, TrainingSetMetadataDict
 from ludwig.upload import get_upload_registry
 from ludwig.utils import metric_utils
+from ludwig.utils.activation_utils import ActivationWriter
 from ludwig.utils.backward_compatibility import upgrade_config_dict_to_latest_version
 from ludwig.utils.config_utils import get_preprocessing_params
 from ludwig.utils.data_utils import (
@@ -99,7 +100,7 @@ from ludwig.utils.dataset_utils import generate_dataset_statistics
 from ludwig.utils.defaults import default_random_seed
 from ludwig.utils.fs_utils import makedirs, path_exists, upload_output_directory
 from ludwig.utils.heuristics import get_auto_learning_rate
-from ludwig.utils.llm_utils import create_text_streamer, TextStreamer
+from ludwig.utils.inference_utils import to_inference_module_input_from_records
 from ludwig.utils.misc_utils import (
     get_commit_hash,
     get_file_names,
@@ -114,6 +115,9 @@ from ludwig.utils.trainer_utils import get_training_report
 from ludwig.utils.types import DataFrame, TorchDevice
 from ludwig.utils.upload_utils import HuggingFaceHub
 
+if TYPE_CHECKING:
+    from transformers import TextStreamer
+
 logger = logging.getLogger(__name__)
 
 
@@ -339,6 +343,9 @@ class LudwigModel:
         # online training state
         self._online_trainer = None
 
+        # inference stages used by predict_fast, built on first use
+        self._inference_module = None
+
         # Zero-shot LLM usage.
         if (
             self.config_obj.model_type == MODEL_LLM
@@ -626,6 +633,9 @@ class LudwigModel:
                     resume_directory=model_resume_path,
                 )
 
+            # Weights are about to change, so inference stages built from the current ones are stale
+            self._inference_module = None
+
             # Build model if not provided
             # if it was provided it means it was already loaded
             if not self.model:
@@ -856,6 +866,7 @@ class LudwigModel:
             self._tune_batch_size(self._online_trainer, dataset, random_seed=random_seed)
 
         self.model = self._online_trainer.train_online(training_dataset)
+        self._inference_module = None
 
     def _tune_batch_size(self, trainer, dataset, random_seed: int = default_random_seed):
         """Sets AUTO batch-size-related parameters based on the trainer, backend type, and number of workers.
@@ -1008,6 +1019,8 @@ class LudwigModel:
             attention_mask = tokenized_inputs["attention_mask"].to("cuda")
 
             if streaming:
+                from ludwig.utils.llm_utils import create_text_streamer
+
                 streamer = create_text_streamer(tokenizer.tokenizer)
                 outputs = self._generate_streaming_outputs(input_strings, input_ids, attention_mask, streamer)
             else:
@@ -1023,7 +1036,7 @@ class LudwigModel:
         input_strings: Union[str, List[str]],
         input_ids: torch.Tensor,
         attention_mask: torch.Tensor,
-        streamer: TextStreamer,
+        streamer: "TextStreamer",
     ) -> torch.Tensor:
         """Generate streaming outputs for the given input.
 
@@ -1086,7 +1099,7 @@ class LudwigModel:
         dataset: Optional[Union[str, dict, pd.DataFrame]] = None,
         data_format: str = None,
         split: str = FULL,
-        batch_size: int = 128,
+        batch_size: Optional[int] = None,
         generation_config: Optional[dict] = None,
         skip_save_unprocessed_output: bool = True,
         skip_save_predictions: bool = True,
@@ -1108,7 +1121,8 @@ class LudwigModel:
         :param split: (str, default= `'full'`):  if the input dataset contains a split column, this parameter
             indicates which split of the data to use. Possible values are `'full'`, `'training'`, `'validation'`,
             `'test'`.
-        :param batch_size: (int, default: 128) size of batch to use when making predictions.
+        :param batch_size: (int, default: None) size of batch to use when making predictions. Defaults to 128 rows,
+            or to large chunks of rows for GBM models.
         :param generation_config: (Dict, default: `None`) config for the generation of the
             predictions. If `None`, the config that was used during model training is
             used. This is only used if the model type is LLM. Otherwise, this parameter is
@@ -1186,6 +1200,46 @@ class LudwigModel:
             logger.info(f"Finished predicting in: {(time.time() - start_time):.2f}s.")
             return converted_postproc_predictions, output_directory
 
+    def predict_fast(self, records: Union[Dict[str, Any], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Using a trained model, make predictions for in-memory records with minimal overhead.
+
+        Unlike `predict`, no DataFrame, dataset, batcher or predictor is created. Records are converted directly into
+        the inputs of the preprocessing, prediction and postprocessing stages used for TorchScript export, which are
+        built on the first call and reused by later calls. This is intended for online serving of one or a few
+        records at a time.
+
+        # Inputs
+
+        :param records: (Union[Dict[str, Any], List[Dict[str, Any]]]) a record, or a list of records, mapping the
+            column of each input feature to its raw value. Image and audio values can be paths or tensors.
+
+        # Return
+
+        :return: (List[Dict[str, Any]]) one dictionary per record, mapping `<output feature name>_<output name>`
+            (the column names of `predict`, e.g. `label_predictions`) to plain Python values.
+        """
+        self._check_initialization()
+        if isinstance(records, dict):
+            records = [records]
+
+        if self._inference_module is None:
+            self._inference_module = InferenceModule.from_ludwig_model(
+                self.model, self.config_obj.to_dict(), self.training_set_metadata
+            )
+
+        inputs = to_inference_module_input_from_records(records, self._inference_module.config, load_paths=True)
+        predictions = self._inference_module(inputs)
+
+        outputs = [{} for _ in records]
+        for of_name, feature_predictions in predictions.items():
+            for key, values in feature_predictions.items():
+                output_key = f"{of_name}_{key}"
+                if not isinstance(values, list):
+                    values = values.tolist()
+                for output, value in zip(outputs, values):
+                    output[output_key] = value
+        return outputs
+
     def evaluate(
         self,
         dataset: Optional[Union[str, dict, pd.DataFrame]] = None,
@@ -1623,7 +1677,9 @@ class LudwigModel:
         dataset: Union[str, Dict[str, list], pd.DataFrame],
         data_format: Optional[str] = None,
         split: str = FULL,
-        batch_size: int = 128,
+        batch_size: Optional[int] = None,
+        output_directory: Optional[str] = None,
+        output_format: str = "npy",
         **kwargs,
     ) -> list:
         """Loads a pre-trained model model and input data to collect the values of the activations contained in the
@@ -1631,7 +1687,9 @@ class LudwigModel:
 
         # Inputs
         :param layer_names: (list) list of strings for layer names in the model
-            to collect activations.
+            to collect activations. The outputs of the model are always
+            collected, and the outputs of the modules named in `layer_names`,
+            as listed by `model.named_modules()`, are collected in the same pass.
         :param dataset: (Union[str, Dict[str, list], pandas.DataFrame]) source
             containing the data to make predictions.
         :param data_format: (str, default: `None`) format to interpret data
@@ -1644,11 +1702,21 @@ class LudwigModel:
         :param split: (str, default= `'full'`): if the input dataset contains
             a split column, this parameter indicates which split of the data
             to use. Possible values are `'full'`, `'training'`, `'validation'`, `'test'`.
-        :param batch_size: (int, default: 128) size of batch to use when making
-            predictions.
+        :param batch_size: (int, default: None) size of batch to use when making
+            predictions. Defaults to 128 rows, or to large chunks of rows for
+            GBM models.
+        :param output_directory: (str, default: `None`) if set, the activations
+            are written to this directory batch by batch as they are computed,
+            one file per tensor, instead of being returned, so that the
+            activations of datasets larger than memory can be collected.
+        :param output_format: (str, default: `'npy'`) format of the files
+            written to `output_directory`, one of `'npy'` (memory-mappable
+            array) or `'parquet'` (one row group per batch).
 
         # Return
-        :return: (list) list of collected tensors.
+        :return: (list) list of (name, tensor) of the collected tensors, or of
+            the paths of the files they were written to if `output_directory`
+            is set.
         """
         self._check_initialization()
 
@@ -1665,12 +1733,12 @@ class LudwigModel:
 
         logger.debug("Predicting")
         with self.backend.create_predictor(self.model, batch_size=batch_size) as predictor:
-            activations = predictor.batch_collect_activations(
-                layer_names,
-                dataset,
-            )
+            if output_directory is None:
+                return predictor.batch_collect_activations(layer_names, dataset)
 
-            return activations
+            with ActivationWriter(output_directory, len(dataset), output_format=output_format) as writer:
+                predictor.batch_collect_activations(layer_names, dataset, collect_fn=writer.write)
+            return list(writer.filenames.values())
 
     def preprocess(
         self,
@@ -1895,6 +1963,7 @@ class LudwigModel:
                 self.model.load(model_dir)
 
         self.backend.sync_model(self.model)
+        self._inference_module = None
 
     def save(self, save_path: str) -> None:
         """This function allows to save models on disk.
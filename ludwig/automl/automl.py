@@ -168,6 +168,7 @@ def create_auto_config(
     imbalance_threshold: float = 0.9,
     use_reference_config: bool = False,
     backend: Union[Backend, str] = None,
+    use_sketches: bool = False,
 ) -> ModelConfigDict:
     """Returns an auto-generated Ludwig config with the intent of training the best model on given given dataset /
     target in the given time limit.
@@ -187,6 +188,8 @@ def create_auto_config(
     :param imbalance_threshold: (float) maximum imbalance ratio (minority / majority) to perform stratified sampling
     :param use_reference_config: (bool) refine hyperopt search space by setting first
                                  search point from reference model config, if any
+    :param use_sketches: (bool) profile the dataset in a single pass with approximate sketches, which is much faster
+                         for wide or high-cardinality datasets
 
     # Return
     :return: (dict) selected model configuration
@@ -200,7 +203,9 @@ def create_auto_config(
             dataset = dataset.unwrap()
         dataset = load_dataset(dataset, df_lib=backend.df_engine.df_lib)
 
-    dataset_info = get_dataset_info(dataset) if not isinstance(dataset, DatasetInfo) else dataset
+    dataset_info = (
+        get_dataset_info(dataset, use_sketches=use_sketches) if not isinstance(dataset, DatasetInfo) else dataset
+    )
     features_config = create_features_config(dataset_info, target)
     return create_automl_config_for_features(
         features_config,
@@ -255,17 +255,19 @@ def get_reference_configs() -> dict:
     return reference_configs
 
 
-def get_dataset_info(df: Union[pd.DataFrame, dd.core.DataFrame]) -> DatasetInfo:
+def get_dataset_info(df: Union[pd.DataFrame, dd.core.DataFrame], use_sketches: bool = False) -> DatasetInfo:
     """Constructs FieldInfo objects for each feature in dataset. These objects are used for downstream type
     inference.
 
     # Inputs
     :param df: (Union[pd.DataFrame, dd.core.DataFrame]) Pandas or Dask dataframe.
+    :param use_sketches: (bool) profile all columns in a single pass using approximate, mergeable sketches
+        (HyperLogLog distinct counts, top-values summaries and reservoir samples) instead of exact per-column scans.
 
     # Return
     :return: (DatasetInfo) Structure containing list of FieldInfo objects.
     """
-    source = wrap_data_source(df)
+    source = wrap_data_source(df, use_sketches=use_sketches)
     return get_dataset_info_from_source(source)
 
 
@@ -274,7 +276,7 @@ def is_field_boolean(source: DataSource, field: str) -> bool:
 
     Columns with object dtype that have 3 distinct values of which one is Nan/None is a bool type column.
     """
-    unique_values = source.df[field].unique()
+    unique_values = source.get_unique_values(field)
     if len(unique_values) <= 3:
         for entry in unique_values:
             try:
@@ -31,7 +31,7 @@ from tqdm import tqdm
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.backend.utils.storage import StorageManager
 from ludwig.constants import MODEL_LLM
-from ludwig.data.cache.manager import CacheManager
+from ludwig.data.cache.manager import CacheManager, DEFAULT_EMBEDDING_CACHE_SIZE
 from ludwig.data.dataframe.base import DataFrameEngine
 from ludwig.data.dataframe.pandas import PANDAS
 from ludwig.data.dataset.base import DatasetManager
@@ -61,11 +61,28 @@ class Backend(ABC):
         dataset_manager: DatasetManager,
         cache_dir: str | None = None,
         credentials: dict[str, dict[str, Any]] | None = None,
+        persist_embeddings: bool = True,
+        embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        fingerprint_sample_rows: int | None = None,
     ):
+        """
+        :param persist_embeddings: whether the embeddings of fixed encoders are kept in a persistent cache under
+            `cache_dir` (or `LUDWIG_CACHE`) and reused across runs.
+        :param embedding_cache_size: maximum size in bytes of the persistent cache of embeddings.
+        :param fingerprint_sample_rows: if set, in-memory DataFrames are identified in the cache by a fingerprint of
+            only this many evenly spaced rows per partition rather than of all their rows, which is cheaper for very
+            large frames but misses changes to the rows left out.
+        """
         credentials = credentials or {}
         self._dataset_manager = dataset_manager
         self._storage_manager = StorageManager(**credentials)
-        self._cache_manager = CacheManager(self._dataset_manager, cache_dir)
+        self._cache_manager = CacheManager(
+            self._dataset_manager,
+            cache_dir,
+            persist_embeddings=persist_embeddings,
+            embedding_cache_size=embedding_cache_size,
+            fingerprint_sample_rows=fingerprint_sample_rows,
+        )
 
     @property
     def storage(self) -> StorageManager:
@@ -257,8 +274,8 @@ class LocalBackend(LocalPreprocessingMixin, LocalTrainingMixin, Backend):
             cls._shared_instance = cls()
         return cls._shared_instance
 
-    def __init__(self, **kwargs) -> None:
-        super().__init__(dataset_manager=PandasDatasetManager(self), **kwargs)
+    def __init__(self, cache_format: str = "hdf5", **kwargs) -> None:
+        super().__init__(dataset_manager=PandasDatasetManager(self, data_format=cache_format), **kwargs)
 
     @property
     def num_nodes(self) -> int:
@@ -698,7 +698,7 @@ class RayPredictor(BasePredictor):
         data_loader_kwargs,
         **predictor_kwargs,
     ):
-        self.batch_size = predictor_kwargs["batch_size"]
+        self.batch_size = predictor_kwargs.get("batch_size") or get_predictor_cls(model.type()).default_batch_size
         self.trainer_kwargs = trainer_kwargs
         self.data_loader_kwargs = data_loader_kwargs
         self.predictor_kwargs = predictor_kwargs
@@ -30,6 +30,7 @@ from ludwig.callbacks import Callback
 from ludwig.constants import FULL, TEST, TRAINING, VALIDATION
 from ludwig.contrib import add_contrib_callback_args
 from ludwig.globals import LUDWIG_VERSION
+from ludwig.utils.activation_utils import ACTIVATION_FORMATS, NPY
 from ludwig.utils.print_utils import get_logging_level_registry, print_boxed, print_ludwig
 from ludwig.utils.strings_utils import make_safe_filename
 
@@ -42,8 +43,9 @@ def collect_activations(
     dataset: str,
     data_format: str = None,
     split: str = FULL,
-    batch_size: int = 128,
+    batch_size: Optional[int] = None,
     output_directory: str = "results",
+    output_format: str = NPY,
     gpus: List[str] = None,
     gpu_memory_limit: Optional[float] = None,
     allow_parallel_threads: bool = True,
@@ -71,10 +73,14 @@ def collect_activations(
     :param split: (str, default: `full`) split on which
         to perform predictions. Valid values are `'training'`, `'validation'`,
         `'test'` and `'full'`.
-    :param batch_size: (int, default `128`) size of batches for processing.
+    :param batch_size: (int, default `None`) size of batches for processing,
+        128 unless the model type predicts on larger chunks.
     :param output_directory: (str, default: `'results'`) the directory that
         will contain the training statistics, TensorBoard logs, the saved
         model and the training progress files.
+    :param output_format: (str, default: `'npy'`) format of the activation
+        files, one of `'npy'` or `'parquet'`. Activations are written batch by
+        batch, so memory usage does not grow with the size of the dataset.
     :param gpus: (list, default: `None`) list of GPUs that are available
         for training.
     :param gpu_memory_limit: (float: default: `None`) maximum memory fraction
@@ -90,8 +96,8 @@ def collect_activations(
 
     # Return
 
-    :return: (List[str]) list of filepath to `*.npy` files containing
-        the activations.
+    :return: (List[str]) list of filepath to `*.npy` or `*.parquet` files
+        containing the activations.
     """
     logger.info(f"Dataset path: {dataset}")
     logger.info(f"Model path: {model_path}")
@@ -109,14 +115,16 @@ def collect_activations(
 
     # collect activations
     print_boxed("COLLECT ACTIVATIONS")
-    collected_tensors = model.collect_activations(
-        layers, dataset, data_format=data_format, split=split, batch_size=batch_size
+    saved_filenames = model.collect_activations(
+        layers,
+        dataset,
+        data_format=data_format,
+        split=split,
+        batch_size=batch_size,
+        output_directory=output_directory,
+        output_format=output_format,
     )
 
-    # saving
-    os.makedirs(output_directory, exist_ok=True)
-    saved_filenames = save_tensors(collected_tensors, output_directory)
-
     logger.info(f"Saved to: {output_directory}")
     return saved_filenames
 
@@ -247,6 +255,7 @@ def cli_collect_activations(sys_argv):
          required *option*
     --t: Tensors to collect
     --od: Output directory of the model, defaults to results
+    --of: Format of the activation files, npy or parquet
     --bs: Batch size
     --g: Number of gpus that are to be used
     --gf: Fraction of each GPUs memory to use.
@@ -305,11 +314,18 @@ def cli_collect_activations(sys_argv):
     parser.add_argument(
         "-od", "--output_directory", type=str, default="results", help="directory that contains the results"
     )
+    parser.add_argument(
+        "-of",
+        "--output_format",
+        default=NPY,
+        choices=ACTIVATION_FORMATS,
+        help="format of the files the activations are written to",
+    )
 
     # ------------------
     # Generic parameters
     # ------------------
-    parser.add_argument("-bs", "--batch_size", type=int, default=128, help="size of batches")
+    parser.add_argument("-bs", "--batch_size", type=int, default=None, help="size of batches")
 
     # ------------------
     # Runtime parameters
@@ -4,8 +4,6 @@ from abc import ABC, abstractmethod
 from re import findall
 from typing import Callable, TYPE_CHECKING
 
-from transformers import AutoConfig
-
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import (
     AUDIO,
@@ -29,6 +27,8 @@ from ludwig.utils.metric_utils import get_feature_to_metric_names_map_from_featu
 from ludwig.utils.misc_utils import merge_dict
 
 if TYPE_CHECKING:
+    from transformers import AutoConfig
+
     from ludwig.schema.model_config import ModelConfig
 
 # Set of all sequence feature types.
@@ -100,6 +100,23 @@ def check_tied_features_valid(config: "ModelConfig") -> None:  # noqa: F821
             )
 
 
+@register_config_check
+def check_bucketing_field(config: "ModelConfig") -> None:  # noqa: F821
+    """Checks that the bucketing field is a sequence, text or audio input feature."""
+    bucketing_field = getattr(config.trainer, "bucketing_field", None)
+    if bucketing_field is None:
+        return
+
+    input_feature_types = {input_feature.name: input_feature.type for input_feature in config.input_features}
+    if bucketing_field not in input_feature_types:
+        raise ConfigValidationError(f"Bucketing field '{bucketing_field}' is not an input feature.")
+    if input_feature_types[bucketing_field] not in {AUDIO, SEQUENCE, TEXT}:
+        raise ConfigValidationError(
+            f"Bucketing field '{bucketing_field}' has type {input_feature_types[bucketing_field]}, but bucketing "
+            "is only supported for audio, sequence and text input features."
+        )
+
+
 @register_config_check
 def check_training_runway(config: "ModelConfig") -> None:  # noqa: F821
     """Checks that checkpoints_per_epoch and steps_per_checkpoint aren't simultaneously defined."""
@@ -592,8 +609,10 @@ def check_llm_finetuning_adaption_prompt_parameters(config: "ModelConfig"):
         )
 
 
-def _get_llm_model_config(model_name: str) -> AutoConfig:
+def _get_llm_model_config(model_name: str) -> "AutoConfig":
     """Returns the LLM model config."""
+    from transformers import AutoConfig
+
     return AutoConfig.from_pretrained(model_name)
 
 
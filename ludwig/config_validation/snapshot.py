@@ -0,0 +1,255 @@
+"""On-disk snapshot of the JSON schema used to validate Ludwig configs.
+
+Building the JSON schema means walking every registered marshmallow config class, which takes seconds. The schema
+only changes when Ludwig (or a plugin registering new config classes) changes, so the first process to build it writes
+a snapshot to the Ludwig cache directory, keyed by Ludwig version and the set of registered config classes. Later
+processes load the snapshot instead of rebuilding the schema.
+
+The per-feature-type branches of the schema (`input_features`, `output_features` and `defaults`) make up most of it,
+so they are stored in separate files and only loaded for the feature types a config actually uses.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.constants import DEFAULTS, INPUT_FEATURES, OUTPUT_FEATURES, TYPE
+from ludwig.globals import LUDWIG_VERSION
+from ludwig.utils.fs_utils import get_default_cache_location
+
+logger = logging.getLogger(__name__)
+
+FEATURE_SECTIONS = (INPUT_FEATURES, OUTPUT_FEATURES)
+TYPE_SECTIONS = FEATURE_SECTIONS + (DEFAULTS,)
+
+BASE_FILE = "base.json"
+INDEX_FILE = "index.json"
+
+# Feature types used by a config for each section of `TYPE_SECTIONS`, where None means all feature types.
+ConfigFeatureTypes = Tuple[Tuple[str, Optional[FrozenSet[str]]], ...]
+
+
+def _describe_registry(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return sorted((str(k), _describe_registry(v)) for k, v in value.items())
+    return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+
+
+def _schema_fingerprint() -> str:
+    import ludwig.schema
+    from ludwig.schema.combiners.utils import combiner_config_registry
+    from ludwig.schema.decoders.utils import decoder_config_registry
+    from ludwig.schema.encoders.utils import encoder_config_registry
+    from ludwig.schema.features import utils as feature_utils
+    from ludwig.schema.model_types.base import model_type_schema_registry
+
+    registries = [
+        model_type_schema_registry,
+        feature_utils.input_config_registries,
+        feature_utils.output_config_registries,
+        feature_utils.ecd_defaults_config_registry,
+        feature_utils.gbm_defaults_config_registry,
+        feature_utils.llm_defaults_config_registry,
+        encoder_config_registry,
+        decoder_config_registry,
+        combiner_config_registry,
+    ]
+    description = [_describe_registry(registry) for registry in registries]
+
+    if "dev" in LUDWIG_VERSION:
+        # Development trees change the schema without bumping the version, so also key on the schema sources.
+        schema_dir = os.path.dirname(os.path.abspath(ludwig.schema.__file__))
+        latest_mtime = max(
+            os.path.getmtime(os.path.join(root, name))
+            for root, _, names in os.walk(schema_dir)
+            for name in names
+            if name.endswith((".py", ".yaml"))
+        )
+        description.append(latest_mtime)
+
+    return hashlib.sha256(json.dumps(description).encode("utf-8")).hexdigest()[:16]
+
+
+@DeveloperAPI
+def get_schema_snapshot_dir() -> Optional[str]:
+    """Returns the directory for schema snapshots of this Ludwig version, or None if there is no usable cache."""
+    try:
+        cache_dir = get_default_cache_location()
+    except OSError as e:
+        logger.debug(f"Not caching the config schema, the Ludwig cache is not writable: {e}")
+        return None
+    return os.path.join(cache_dir, "schema", f"{LUDWIG_VERSION}-{_schema_fingerprint()}")
+
+
+@DeveloperAPI
+def get_config_feature_types(config: Dict[str, Any]) -> ConfigFeatureTypes:
+    """Returns the feature types each type-dependent section of the config refers to.
+
+    If a section cannot be resolved to a set of feature types (e.g. a feature is missing its type), all feature types
+    are returned for that section so that validation is identical to validating against the full schema.
+    """
+    feature_types = []
+    for section in FEATURE_SECTIONS:
+        features = config.get(section)
+        types = None
+        if isinstance(features, (list, tuple)) and all(
+            isinstance(feature, dict) and isinstance(feature.get(TYPE), str) for feature in features
+        ):
+            types = frozenset(feature[TYPE] for feature in features)
+        feature_types.append((section, types))
+
+    defaults = config.get(DEFAULTS, {})
+    types = None
+    if isinstance(defaults, dict) and all(isinstance(key, str) for key in defaults):
+        types = frozenset(defaults)
+    feature_types.append((DEFAULTS, types))
+    return tuple(feature_types)
+
+
+def _get_section(schema: Dict[str, Any], section: str) -> Dict[str, Any]:
+    section_schema = schema["properties"][section]
+    return section_schema if section == DEFAULTS else section_schema["items"]
+
+
+def _branch_type(branch: Dict[str, Any]) -> str:
+    return branch["if"]["properties"][TYPE]["const"]
+
+
+@DeveloperAPI
+def split_schema(schema: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Splits the per-feature-type branches out of the schema.
+
+    Returns:
+        The schema without any feature type branches and, for each section, a dict of feature type to its branch.
+    """
+    base = json.loads(json.dumps(schema))
+    branches = {}
+    for section in TYPE_SECTIONS:
+        section_schema = _get_section(base, section)
+        if section == DEFAULTS:
+            branches[section] = section_schema.pop("properties")
+        else:
+            branches[section] = {_branch_type(branch): branch for branch in section_schema.pop("allOf")}
+    return base, branches
+
+
+@DeveloperAPI
+def join_schema(base: Dict[str, Any], branches: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Inverse of `split_schema`, where `branches` may only contain the feature types that are needed."""
+    schema = {**base, "properties": dict(base["properties"])}
+    for section, section_branches in branches.items():
+        section_schema = dict(schema["properties"][section])
+        if section == DEFAULTS:
+            section_schema["properties"] = dict(section_branches)
+        else:
+            section_schema["items"] = {**section_schema["items"], "allOf": list(section_branches.values())}
+        schema["properties"][section] = section_schema
+    return schema
+
+
+def _write_json(path: str, obj: Any):
+    with open(path, "w") as f:
+        json.dump(obj, f)
+
+
+def _read_json(path: str) -> Any:
+    with open(path) as f:
+        return json.load(f)
+
+
+@DeveloperAPI
+class SchemaSnapshot:
+    """The JSON schema for one model type, backed by an on-disk snapshot when `path` is set.
+
+    The schema is only built (with `build_fn`) when no snapshot exists yet, and feature type branches are read from
+    the snapshot the first time a config uses them.
+    """
+
+    def __init__(self, model_type: str, build_fn: Callable[[str], Dict[str, Any]], path: Optional[str] = None):
+        self.model_type = model_type
+        self.build_fn = build_fn
+        self.path = os.path.join(path, model_type) if path is not None else None
+        self._base = None
+        self._index: Dict[str, List[str]] = {}
+        self._branches: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def _load(self):
+        if self._base is not None:
+            return
+
+        if self.path is not None and os.path.exists(os.path.join(self.path, INDEX_FILE)):
+            try:
+                self._index = _read_json(os.path.join(self.path, INDEX_FILE))
+                self._base = _read_json(os.path.join(self.path, BASE_FILE))
+                return
+            except (OSError, ValueError) as e:
+                logger.warning(f"Rebuilding config schema, failed to read snapshot at {self.path}: {e}")
+
+        base, branches = split_schema(self.build_fn(self.model_type))
+        self._base = base
+        self._index = {section: list(section_branches) for section, section_branches in branches.items()}
+        self._branches = {
+            (section, feature_type): branch
+            for section, section_branches in branches.items()
+            for feature_type, branch in section_branches.items()
+        }
+        if self.path is not None:
+            self._save(base, branches)
+
+    def _save(self, base: Dict[str, Any], branches: Dict[str, Dict[str, Any]]):
+        parent = os.path.dirname(self.path)
+        tmp_path = None
+        try:
+            os.makedirs(parent, exist_ok=True)
+            tmp_path = tempfile.mkdtemp(dir=parent)
+            for section, section_branches in branches.items():
+                os.makedirs(os.path.join(tmp_path, section))
+                for feature_type, branch in section_branches.items():
+                    _write_json(os.path.join(tmp_path, section, f"{feature_type}.json"), branch)
+            _write_json(os.path.join(tmp_path, BASE_FILE), base)
+            _write_json(os.path.join(tmp_path, INDEX_FILE), self._index)
+            # Renaming the directory into place is atomic, so concurrent readers never see a partial snapshot.
+            os.rename(tmp_path, self.path)
+            tmp_path = None
+        except OSError as e:
+            # Either another process wrote the snapshot first, or the cache is not writable.
+            logger.debug(f"Did not save config schema snapshot to {self.path}: {e}")
+        finally:
+            if tmp_path is not None:
+                shutil.rmtree(tmp_path, ignore_errors=True)
+
+    def _get_branch(self, section: str, feature_type: str) -> Dict[str, Any]:
+        key = (section, feature_type)
+        if key not in self._branches:
+            self._branches[key] = _read_json(os.path.join(self.path, section, f"{feature_type}.json"))
+        return self._branches[key]
+
+    def get(self, feature_types: Optional[ConfigFeatureTypes] = None) -> Dict[str, Any]:
+        """Returns the schema with only the branches for `feature_types`, or the full schema if not provided."""
+        self._load()
+        requested = dict(feature_types or ())
+        branches = {}
+        for section in TYPE_SECTIONS:
+            types = requested.get(section)
+            # Keep the original branch order, so the full schema is identical to the one that was built.
+            branches[section] = {
+                feature_type: self._get_branch(section, feature_type)
+                for feature_type in self._index[section]
+                if types is None or feature_type in types
+            }
+        return join_schema(self._base, branches)
+
+
+if __name__ == "__main__":
+    # Pre-builds the snapshots, e.g. when building a container image, so that no Ludwig process has to build them.
+    from ludwig.config_validation.validation import get_schema
+    from ludwig.constants import MODEL_ECD, MODEL_GBM, MODEL_LLM
+
+    for model_type in (MODEL_ECD, MODEL_GBM, MODEL_LLM):
+        get_schema(model_type)
+    print(f"Saved config schema snapshots to {get_schema_snapshot_dir()}")
@@ -2,10 +2,16 @@ from functools import lru_cache
 from threading import Lock
 
 import jsonschema.exceptions
-from jsonschema import Draft7Validator, validate
+from jsonschema import Draft7Validator
 from jsonschema.validators import extend
 
 from ludwig.api_annotations import DeveloperAPI
+from ludwig.config_validation.snapshot import (
+    ConfigFeatureTypes,
+    get_config_feature_types,
+    get_schema_snapshot_dir,
+    SchemaSnapshot,
+)
 from ludwig.constants import BASE_MODEL, MODEL_ECD, MODEL_LLM, MODEL_TYPE
 from ludwig.error import ConfigValidationError
 
@@ -19,11 +25,8 @@ from ludwig.schema.utils import unload_jsonschema_from_marshmallow_class
 VALIDATION_LOCK = Lock()
 
 
-@DeveloperAPI
-@lru_cache(maxsize=3)
-def get_schema(model_type: str = MODEL_ECD):
-    # Force populate combiner registry:
-    import ludwig.combiners.combiners  # noqa: F401
+def build_schema(model_type: str = MODEL_ECD):
+    """Builds the JSON schema for the model type from the registered marshmallow config classes."""
     from ludwig.schema.model_types.base import model_type_schema_registry
 
     cls = model_type_schema_registry[model_type]
@@ -44,6 +47,20 @@ def get_schema(model_type: str = MODEL_ECD):
     }
 
 
+@lru_cache(maxsize=3)
+def get_schema_snapshot(model_type: str = MODEL_ECD) -> SchemaSnapshot:
+    # Force populate combiner registry:
+    import ludwig.combiners.combiners  # noqa: F401
+
+    return SchemaSnapshot(model_type, build_schema, get_schema_snapshot_dir())
+
+
+@DeveloperAPI
+@lru_cache(maxsize=3)
+def get_schema(model_type: str = MODEL_ECD):
+    return get_schema_snapshot(model_type).get()
+
+
 @lru_cache(maxsize=1)
 def get_validator():
     # Manually add support for tuples (pending upstream changes: https://github.com/Julian/jsonschema/issues/148):
@@ -56,6 +73,16 @@ def get_validator():
     return extend(Draft7Validator, type_checker=type_checker)
 
 
+@lru_cache(maxsize=32)
+def get_config_validator(model_type: str, feature_types: ConfigFeatureTypes):
+    """Returns a validator for the schema of the model type, restricted to the given feature types.
+
+    Feature type branches are conditioned on the type of each feature, so branches for types a config does not use
+    never apply to it. Validators are reused across configs, as checking the schema itself is expensive.
+    """
+    return get_validator()(get_schema_snapshot(model_type).get(feature_types))
+
+
 @DeveloperAPI
 def check_schema(updated_config):
     """Emulates the pure JSONSchema validation that could be used in an environment without marshmallow.
@@ -63,14 +90,10 @@ def check_schema(updated_config):
     The incoming config may not be comprehensive, but is assumed to be up to date with the latest ludwig schema.
     """
     model_type = updated_config.get(MODEL_TYPE, MODEL_ECD)
-    error = None
     with VALIDATION_LOCK:
-        try:
-            validate(instance=updated_config, schema=get_schema(model_type=model_type), cls=get_validator())
-        except jsonschema.exceptions.ValidationError as e:
-            # Capture error but don't raise here, otherwise we get the full output from `e`, which contains a dump
-            # of the entire schema
-            error = e
+        validator = get_config_validator(model_type, get_config_feature_types(updated_config))
+        # Don't raise here, otherwise we get the full output from the error, which contains a dump of the entire schema
+        error = jsonschema.exceptions.best_match(validator.iter_errors(updated_config))
 
     if error is not None:
         raise ConfigValidationError(f"Failed to validate JSON schema for config. Error: {error.message}") from error
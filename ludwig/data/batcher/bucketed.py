@@ -13,160 +13,201 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+"""Length-bucketed batching for sequence, text and audio features.
+
+Examples are grouped by the (unpadded) length of a bucketing field, so that each batch contains examples of similar
+length and padding can be trimmed to the longest example in the batch. Sharding and shuffling are delegated to the
+`DistributedSampler`, so bucketing composes with distributed training and is deterministic for a given seed and epoch.
+"""
+import logging
+import math
+from typing import Any, Dict, List, Tuple
+
 import numpy as np
+import torch
 
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.constants import AUDIO, ENCODER, NAME, PREPROCESSING, SEQUENCE, TEXT, TYPE
 from ludwig.data.batcher.base import Batcher
+from ludwig.data.sampler import DistributedSampler
+
+logger = logging.getLogger(__name__)
+
+BUCKETING_FEATURE_TYPES = {AUDIO, SEQUENCE, TEXT}
+
+# Encoders whose output does not depend on the length of the input sequence once it is reduced, so that inputs can be
+# trimmed to the longest example in the batch. Encoders with learned position embeddings or pooling layers sized for
+# `max_sequence_length` are excluded.
+TRIMMABLE_ENCODERS = {"embed", "parallel_cnn", "stacked_parallel_cnn", "rnn", "cnnrnn"}
+TRIMMABLE_REDUCE_OUTPUTS = {"sum", "mean", "avg", "max", "last", "attention"}
+
+# Rows processed at a time when computing lengths, bounding the size of the intermediate boolean mask.
+_LENGTHS_CHUNK_SIZE = 8192
+
+
+@DeveloperAPI
+def compute_lengths(matrix: np.ndarray, padding_value: Any, padding_side: str = "right") -> np.ndarray:
+    """Returns the unpadded length of every row of a padded [N x max_length (x dim)] matrix.
 
+    The length is measured up to the last (right padding) or from the first (left padding) element that is not
+    entirely made of `padding_value`, so padding symbols appearing inside a sequence do not shorten it.
+    """
+    if padding_side not in {"right", "left"}:
+        raise ValueError(f"Invalid padding side `{padding_side}`, expected one of ['right', 'left']")
 
+    lengths = np.zeros(len(matrix), dtype=np.int64)
+    for start in range(0, len(matrix), _LENGTHS_CHUNK_SIZE):
+        chunk = np.asarray(matrix[start : start + _LENGTHS_CHUNK_SIZE])
+        not_padding = (chunk != padding_value).reshape(len(chunk), chunk.shape[1], -1).any(axis=-1)
+        max_length = not_padding.shape[1]
+        if padding_side == "right":
+            chunk_lengths = max_length - np.argmax(not_padding[:, ::-1], axis=1)
+        else:
+            chunk_lengths = max_length - np.argmax(not_padding, axis=1)
+        lengths[start : start + len(chunk)] = np.where(not_padding.any(axis=1), chunk_lengths, 0)
+    return lengths
+
+
+@DeveloperAPI
+def get_bucketing_parameters(feature_config: Dict[str, Any], feature_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Returns the padding value, padding side and whether batches can be trimmed for a bucketing feature."""
+    feature_type = feature_config[TYPE]
+    if feature_type not in BUCKETING_FEATURE_TYPES:
+        raise ValueError(
+            f"Bucketing is only supported for {sorted(BUCKETING_FEATURE_TYPES)} features, "
+            f"found `{feature_config[NAME]}` of type `{feature_type}`"
+        )
+
+    preprocessing = feature_config.get(PREPROCESSING, {})
+    if feature_type == AUDIO:
+        padding_value = preprocessing.get("padding_value", 0)
+        padding_side = "right"
+    else:
+        padding_side = preprocessing.get("padding", "right")
+        if "pad_idx" in feature_metadata:
+            padding_value = feature_metadata["pad_idx"]
+        else:
+            padding_value = feature_metadata["str2idx"][feature_metadata[PREPROCESSING]["padding_symbol"]]
+
+    encoder = feature_config.get(ENCODER, {})
+    should_trim = encoder.get(TYPE) in TRIMMABLE_ENCODERS and encoder.get("reduce_output") in TRIMMABLE_REDUCE_OUTPUTS
+    if not should_trim:
+        logger.info(
+            f"Encoder `{encoder.get(TYPE)}` of bucketing feature `{feature_config[NAME]}` requires fixed length "
+            "inputs, batches will be bucketed but not trimmed."
+        )
+    return {"padding_value": padding_value, "trim_side": padding_side, "should_trim": should_trim}
+
+
+@DeveloperAPI
 class BucketedBatcher(Batcher):
+    """Batcher that groups examples of similar length.
+
+    Each epoch, the indices of this worker's shard are taken from the sampler (already shuffled and sharded), split
+    into windows of `batch_size * buckets` examples, sorted by length within each window, and cut into batches. Full
+    batches are then shuffled, with the seed and epoch of the sampler, and the partial batch, if any, comes last.
+    """
+
     def __init__(
         self,
         dataset,
-        bucketing_field,
-        batch_size=128,
-        buckets=10,
-        should_shuffle=True,
-        ignore_last=False,
-        should_trim=False,
-        trim_side="right",
+        sampler: DistributedSampler,
+        bucketing_field: str,
+        lengths: np.ndarray,
+        batch_size: int = 128,
+        buckets: int = 10,
+        ignore_last: bool = False,
+        should_trim: bool = False,
+        trim_side: str = "right",
+        augmentation_pipeline=None,
     ):
-        self.should_shuffle = should_shuffle
+        if trim_side not in {"right", "left"}:
+            raise ValueError(f"Invalid trim side `{trim_side}`, expected one of ['right', 'left']")
+
+        self.dataset = dataset
+        self.sampler = sampler
         self.bucketing_field = bucketing_field
+        self.lengths = lengths
+        self.buckets = buckets
         self.should_trim = should_trim
         self.trim_side = trim_side
-
-        # store our dataset as well
-        self.dataset = dataset
-
-        field = dataset.get_dataset()[bucketing_field]
-        field_lengths = np.apply_along_axis(lambda x: np.sign(x).sum(), 1, field)
-        sorted_idcs = np.argsort(field_lengths)
-        self.buckets_idcs = []
-        datapoints_per_bucket = len(field) // buckets
-        for b in range(buckets):
-            start = datapoints_per_bucket * b
-            end = datapoints_per_bucket * (b + 1) if b < buckets - 1 else len(sorted_idcs)
-            self.buckets_idcs.append(sorted_idcs[start:end])
-
-        if should_shuffle:
-            self.shuffle(self.buckets_idcs)
+        self.augmentation_pipeline = augmentation_pipeline
 
         self.ignore_last = ignore_last
         self.batch_size = batch_size
-        self.total_size = min(map(len, dataset.get_dataset().values()))
-        self.bucket_sizes = np.array([x for x in map(len, self.buckets_idcs)])
+        self.total_size = len(sampler)
         self.steps_per_epoch = self._compute_steps_per_epoch()
-        self.indices = np.array([0] * buckets)
+        self.batches = self._create_batches()
+        self.index = 0
         self.step = 0
-        self.epoch = 0
-
-    def shuffle(self, buckets_idcs):
-        for i in range(len(buckets_idcs)):
-            np.random.shuffle(buckets_idcs[i])
 
-    def next_batch(self):
+    def _create_batches(self) -> List[np.ndarray]:
+        indices = np.fromiter(iter(self.sampler), dtype=np.int64, count=len(self.sampler))
+        window_size = self.batch_size * self.buckets
+
+        full_batches = []
+        partial_batches = []
+        for start in range(0, len(indices), window_size):
+            window = indices[start : start + window_size]
+            window = window[np.argsort(self.lengths[window], kind="stable")]
+            for batch_start in range(0, len(window), self.batch_size):
+                batch = window[batch_start : batch_start + self.batch_size]
+                (full_batches if len(batch) == self.batch_size else partial_batches).append(batch)
+
+        if self.sampler.shuffle:
+            # deterministically shuffle based on epoch and seed, consistently with the sampler
+            rng = np.random.RandomState(seed=self.sampler.random_seed + self.sampler.epoch)
+            full_batches = [full_batches[i] for i in rng.permutation(len(full_batches))]
+        return full_batches + partial_batches
+
+    def next_batch(self) -> Dict[str, np.ndarray]:
         if self.last_batch():
-            if self.should_shuffle:
-                self.shuffle(self.buckets_idcs)
-            self.set_epoch(self.epoch + 1)
+            raise StopIteration()
 
-        if self.ignore_last:
-            idcs_below_size = self.indices + self.batch_size < self.bucket_sizes
-        else:
-            idcs_below_size = self.indices < self.bucket_sizes
-        i = np.random.choice(np.arange(0, len(self.buckets_idcs))[idcs_below_size])
-
-        selected_bucket = self.buckets_idcs[i]
-        selected_idcs = selected_bucket[self.indices[i] : self.indices[i] + self.batch_size]
-
-        sub_batch = {}
-        for key in self.dataset.get_dataset():
-            if key == self.bucketing_field and self.should_trim:
-                selected_samples = self.dataset.get(key, selected_idcs)
-                max_length = np.sign(selected_samples).sum(axis=1).max()
-                if self.trim_side == "right":
-                    sub_batch[key] = selected_samples[:, :max_length]
-                elif self.trim_side == "left":
-                    sub_batch[key] = selected_samples[:, -max_length:]
-                else:
-                    raise ValueError("Invalid trim side:", self.trim_side)
+        indices = self.batches[self.step]
+        sub_batch = {feature_name: self.dataset.get(feature_name, indices) for feature_name in self.dataset.features}
 
+        if self.should_trim:
+            max_length = max(int(self.lengths[indices].max()), 1)
+            if self.trim_side == "right":
+                sub_batch[self.bucketing_field] = sub_batch[self.bucketing_field][:, :max_length]
             else:
-                sub_batch[key] = self.dataset.get(key, selected_idcs)
+                sub_batch[self.bucketing_field] = sub_batch[self.bucketing_field][:, -max_length:]
+
+        if self.augmentation_pipeline:
+            for feature_name, augmentations in self.augmentation_pipeline.items():
+                sub_batch[feature_name] = augmentations(torch.tensor(sub_batch[feature_name]))
 
-        self.indices[i] += self.batch_size
+        self.index += len(indices)
         self.step += 1
         return sub_batch
 
-    def last_batch(self):
-        return not np.any(self.indices < self.bucket_sizes) or (
-            self.ignore_last and not np.any(self.indices + self.batch_size < self.bucket_sizes)
-        )
-
-    def set_epoch(self, epoch, batch_size):
-        self.indices = np.array([0] * len(self.buckets_idcs))
-        self.step = 0
-        self.epoch = epoch
+    def last_batch(self) -> bool:
+        if self.step >= len(self.batches):
+            return True
+        # Mirrors RandomAccessBatcher: with ignore_last, a final batch of a single example is dropped.
+        if self.ignore_last and self.step and self.step == len(self.batches) - 1:
+            if self.batch_size > 1 and len(self.batches[self.step]) == 1:
+                logger.info("Last batch in epoch only has 1 sample and will be dropped.")
+                return True
+        return False
+
+    def set_epoch(self, epoch: int, batch_size: int):
         self.batch_size = batch_size
         self.steps_per_epoch = self._compute_steps_per_epoch()
+        self.index = 0
+        self.step = 0
+        self.sampler.set_epoch(epoch)
+        self.batches = self._create_batches()
 
     def _compute_steps_per_epoch(self) -> int:
-        return int(np.sum(np.ceil(self.bucket_sizes / self.batch_size)).item())
+        return int(math.ceil(self.total_size / self.batch_size))
 
 
-# dynamic_length_encoders = {
-#     'rnn',
-#     'embed'
-# }
-#
-# todo future: reintroduce the bucketed batcher
-# def initialize_batcher(dataset, batch_size=128, bucketing_field=None,
-#                        input_features=None, preprocessing=None,
-#                        should_shuffle=True, ignore_last=False, distributed=None):
-#     if distributed:
-#         batcher = DistributedBatcher(
-#             dataset,
-#             distributed.rank(),
-#             distributed,
-#             batch_size,
-#             should_shuffle=should_shuffle,
-#             ignore_last=ignore_last
-#         )
-#     elif bucketing_field is not None:
-#         bucketing_feature = [
-#             feature for feature in input_features if
-#             feature[NAME] == bucketing_field
-#         ]
-#         if not bucketing_feature:
-#             raise ValueError(
-#                 'Bucketing field {} not present in input features'.format(
-#                     bucketing_field
-#                 )
-#             )
-#         else:
-#             bucketing_feature = bucketing_feature[0]
-#         should_trim = bucketing_feature[
-#                           'encoder'] in dynamic_length_encoders
-#         if 'preprocessing' in bucketing_feature:
-#             trim_side = bucketing_feature['preprocessing']['padding']
-#         else:
-#             trim_side = preprocessing[bucketing_feature[TYPE]]['padding']
-#
-#         batcher = BucketedBatcher(
-#             dataset,
-#             bucketing_field=bucketing_field,
-#             batch_size=batch_size,
-#             buckets=10,
-#             ignore_last=ignore_last,
-#             should_shuffle=should_shuffle,
-#             should_trim=should_trim,
-#             trim_side=trim_side
-#         )
-#     else:
-#         batcher = Batcher(
-#             dataset,
-#             batch_size,
-#             should_shuffle=should_shuffle,
-#             ignore_last=ignore_last
-#         )
-#     return batcher
+@DeveloperAPI
+def get_bucketing_field_config(features: Dict[str, Dict[str, Any]], bucketing_field: str) -> Tuple[str, Dict]:
+    """Returns the (proc column, feature config) of the feature named `bucketing_field`."""
+    for proc_column, feature_config in features.items():
+        if feature_config[NAME] == bucketing_field:
+            return proc_column, feature_config
+    raise ValueError(f"Bucketing field `{bucketing_field}` is not a feature of the dataset")
@@ -0,0 +1,259 @@
+"""Persistent cache of the embeddings computed by fixed pretrained encoders.
+
+Features with `cache_encoder_embeddings` are encoded once during preprocessing, but the result only lives in the
+processed dataset of that run. `EmbeddingCache` keeps the embeddings on disk across runs instead, keyed by:
+
+- the identity of the encoder: its feature type, its config, and a hash of its weights, which selects a directory of
+  the cache.
+- a hash of the content of every preprocessed row, e.g. the token ids of a text or the pixels of an image, which
+  selects a row within that directory.
+
+Any later preprocessing of the same values by the same encoder, whether for another training run, a hyperopt trial or
+a prediction, looks its rows up in the cache and only runs the encoder on the rows it misses.
+
+Every batch of new embeddings is written to its own shard of two `.npy` files, so that concurrent writers never touch
+the same file. A shard is only visible to readers once its keys file, written last, has been renamed in place.
+`compact_embedding_cache` periodically merges the shards of every encoder, and deletes the least recently written
+shards once the cache outgrows its maximum size.
+"""
+import hashlib
+import json
+import logging
+import os
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+
+from ludwig.api_annotations import DeveloperAPI
+
+logger = logging.getLogger(__name__)
+
+# Number of bytes of the hash of a row.
+ROW_KEY_SIZE = 16
+KEYS_SUFFIX = ".keys.npy"
+EMBEDDINGS_SUFFIX = ".embeddings.npy"
+# Number of shards of an encoder above which they are merged into one by `compact_embedding_cache`.
+MAX_SHARDS = 32
+
+
+@DeveloperAPI
+def hash_encoder_weights(module: torch.nn.Module) -> str:
+    """Returns a hash of the names, dtypes, shapes and values of all the parameters and buffers of `module`."""
+    h = hashlib.blake2b(digest_size=ROW_KEY_SIZE)
+    for name, tensor in module.state_dict().items():
+        tensor = tensor.detach().cpu().contiguous()
+        h.update(f"{name}:{tensor.dtype}:{tuple(tensor.shape)}".encode())
+        h.update(tensor.flatten().view(torch.uint8).numpy().tobytes())
+    return h.hexdigest()
+
+
+@DeveloperAPI
+def get_encoder_key(feature_type: str, encoder_config: dict, weights_hash: str) -> str:
+    """Returns the key of the cache directory of the embeddings of an encoder."""
+    identity = json.dumps(
+        {"type": feature_type, "encoder": encoder_config, "weights": weights_hash}, sort_keys=True, default=str
+    )
+    return hashlib.blake2b(identity.encode(), digest_size=ROW_KEY_SIZE).hexdigest()
+
+
+@DeveloperAPI
+def hash_rows(values: np.ndarray) -> np.ndarray:
+    """Returns the keys of the rows of `values`, as an array of `ROW_KEY_SIZE` bytes strings.
+
+    The dtype and shape of a row are hashed together with its content, so rows of different preprocessing never collide.
+    """
+    values = np.ascontiguousarray(values)
+    prefix = f"{values.dtype.str}:{values.shape[1:]}".encode()
+    return np.array(
+        [hashlib.blake2b(prefix + row.tobytes(), digest_size=ROW_KEY_SIZE).digest() for row in values],
+        dtype=f"S{ROW_KEY_SIZE}",
+    )
+
+
+@DeveloperAPI
+class EmbeddingCache:
+    """Embeddings of the rows encoded by a single encoder, stored in `directory`.
+
+    The keys of the shards are only read on the first lookup, and the embeddings of a shard are only memory-mapped once
+    a looked up row is found in it.
+
+    Args:
+        directory: directory of the cache of the encoder, see `get_encoder_key`.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self._shard_paths: List[str] = []
+        self._shards: Dict[int, Optional[np.ndarray]] = {}
+        self._index: Optional[pd.Index] = None
+
+    def __len__(self) -> int:
+        self._load_index()
+        return len(self._index)
+
+    def _load_index(self):
+        if self._index is not None:
+            return
+
+        keys = [np.empty(0, dtype=f"S{ROW_KEY_SIZE}")]
+        shard_ids = [np.empty(0, dtype=np.int64)]
+        positions = [np.empty(0, dtype=np.int64)]
+        for path in _list_shards(self.directory):
+            try:
+                shard_keys = np.load(path + KEYS_SUFFIX)
+            except (OSError, ValueError):
+                logger.warning(f"Skipping unreadable embedding cache shard {path}")
+                continue
+            keys.append(shard_keys)
+            shard_ids.append(np.full(len(shard_keys), len(self._shard_paths), dtype=np.int64))
+            positions.append(np.arange(len(shard_keys), dtype=np.int64))
+            self._shard_paths.append(path)
+
+        # Maps the key of every cached row to its shard and its position in the shard. Concurrent writers may have
+        # cached the same rows, only the first copy is looked up.
+        index = pd.Index(np.concatenate(keys).astype(object))
+        unique = ~index.duplicated()
+        self._index = index[unique]
+        self._shard_ids = np.concatenate(shard_ids)[unique]
+        self._positions = np.concatenate(positions)[unique]
+
+    def _get_shard(self, shard_id: int) -> Optional[np.ndarray]:
+        """Returns the memory-mapped embeddings of a shard, or None if the shard was deleted since the cache was
+        opened."""
+        if shard_id not in self._shards:
+            path = self._shard_paths[shard_id]
+            try:
+                self._shards[shard_id] = np.load(path + EMBEDDINGS_SUFFIX, mmap_mode="r")
+            except (OSError, ValueError):
+                logger.warning(f"Skipping unreadable embedding cache shard {path}")
+                self._shards[shard_id] = None
+        return self._shards[shard_id]
+
+    def get(self, keys: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Looks up the rows of `keys` in the cache.
+
+        Returns:
+            Tuple of the boolean mask of the keys found in the cache, and the embeddings of the found keys in the order
+            of `keys`, or None if no key was found.
+        """
+        self._load_index()
+        indices = self._index.get_indexer(pd.Index(keys.astype(object)))
+        found = indices >= 0
+        shard_ids = np.full(len(keys), -1, dtype=np.int64)
+        shard_ids[found] = self._shard_ids[indices[found]]
+        shards = {shard_id: self._get_shard(shard_id) for shard_id in np.unique(shard_ids[found])}
+        for shard_id, shard in shards.items():
+            if shard is None:
+                found &= shard_ids != shard_id
+        if not found.any():
+            return found, None
+
+        shard_ids, positions = shard_ids[found], self._positions[indices[found]]
+        first_shard = shards[shard_ids[0]]
+        embeddings = np.empty((len(shard_ids), *first_shard.shape[1:]), dtype=first_shard.dtype)
+        for shard_id in np.unique(shard_ids):
+            in_shard = shard_ids == shard_id
+            embeddings[in_shard] = shards[shard_id][positions[in_shard]]
+        return found, embeddings
+
+    def put(self, keys: np.ndarray, embeddings: np.ndarray):
+        """Writes the embeddings of the rows of `keys` to a new shard of the cache.
+
+        The new rows are only looked up by the caches opened afterwards.
+        """
+        if len(keys) == 0:
+            return
+        path = os.path.join(self.directory, uuid.uuid4().hex)
+        np.save(path + EMBEDDINGS_SUFFIX, embeddings)
+        _publish_keys(path, keys)
+
+    def compact(self):
+        """Merges all the shards of the cache into a single new shard, without duplicate rows.
+
+        Caches opened before still read the rows of the deleted shards they had already memory-mapped, and miss the
+        others.
+        """
+        self._load_index()
+        if len(self._shard_paths) <= 1:
+            return
+
+        shards = {shard_id: self._get_shard(shard_id) for shard_id in range(len(self._shard_paths))}
+        readable = ~np.isin(self._shard_ids, [shard_id for shard_id, shard in shards.items() if shard is None])
+        shard_ids, positions = self._shard_ids[readable], self._positions[readable]
+        if len(shard_ids) > 0:
+            first_shard = shards[shard_ids[0]]
+            path = os.path.join(self.directory, uuid.uuid4().hex)
+            merged = np.lib.format.open_memmap(
+                path + EMBEDDINGS_SUFFIX,
+                mode="w+",
+                dtype=first_shard.dtype,
+                shape=(len(shard_ids), *first_shard.shape[1:]),
+            )
+            for shard_id in np.unique(shard_ids):
+                in_shard = shard_ids == shard_id
+                merged[in_shard] = shards[shard_id][positions[in_shard]]
+            merged.flush()
+            del merged
+            _publish_keys(path, np.array(self._index[readable].tolist(), dtype=f"S{ROW_KEY_SIZE}"))
+
+        for path in self._shard_paths:
+            _delete_shard(path)
+        self._shard_paths = []
+        self._shards = {}
+        self._index = None
+
+
+@DeveloperAPI
+def compact_embedding_cache(cache_dir: str, max_size: int):
+    """Merges the shards of every encoder cached in `cache_dir` once there are more than `MAX_SHARDS` of them, then
+    deletes the least recently written shards until the cache takes at most `max_size` bytes."""
+    if not os.path.isdir(cache_dir):
+        return
+
+    shards = []
+    for encoder_key in os.listdir(cache_dir):
+        directory = os.path.join(cache_dir, encoder_key)
+        if not os.path.isdir(directory):
+            continue
+        if len(_list_shards(directory)) > MAX_SHARDS:
+            EmbeddingCache(directory).compact()
+        for path in _list_shards(directory):
+            try:
+                size = os.path.getsize(path + KEYS_SUFFIX) + os.path.getsize(path + EMBEDDINGS_SUFFIX)
+                mtime = os.path.getmtime(path + KEYS_SUFFIX)
+            except OSError:
+                continue
+            shards.append((mtime, size, path))
+
+    total_size = sum(size for _, size, _ in shards)
+    for _, size, path in sorted(shards):
+        if total_size <= max_size:
+            break
+        _delete_shard(path)
+        total_size -= size
+
+
+def _list_shards(directory: str) -> List[str]:
+    """Returns the paths of the published shards in `directory`, without their suffixes."""
+    names = sorted(f[: -len(KEYS_SUFFIX)] for f in os.listdir(directory) if f.endswith(KEYS_SUFFIX))
+    return [os.path.join(directory, name) for name in names]
+
+
+def _publish_keys(path: str, keys: np.ndarray):
+    # The keys are renamed in place last, once the embeddings they refer to are complete.
+    with open(path + ".tmp", "wb") as f:
+        np.save(f, keys)
+    os.replace(path + ".tmp", path + KEYS_SUFFIX)
+
+
+def _delete_shard(path: str):
+    # The keys are deleted first, so that readers never see a shard without its embeddings.
+    for suffix in (KEYS_SUFFIX, EMBEDDINGS_SUFFIX):
+        try:
+            os.remove(path + suffix)
+        except FileNotFoundError:
+            pass
@@ -7,10 +7,14 @@ from ludwig.data.cache.types import alphanum, CacheableDataset
 from ludwig.data.cache.util import calculate_checksum
 from ludwig.data.dataset.base import DatasetManager
 from ludwig.utils import data_utils
-from ludwig.utils.fs_utils import delete, path_exists
+from ludwig.utils.fs_utils import delete, get_default_cache_location, path_exists
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_CACHE_DIR_NAME = "encoder_embeddings"
+# Default maximum size in bytes of the persistent cache of the embeddings of fixed encoders.
+DEFAULT_EMBEDDING_CACHE_SIZE = 10 * 1024**3
+
 
 class DatasetCache:
     def __init__(self, config, checksum, cache_map, dataset_manager):
@@ -96,9 +100,15 @@ class CacheManager:
         self,
         dataset_manager: DatasetManager,
         cache_dir: Optional[str] = None,
+        persist_embeddings: bool = True,
+        embedding_cache_size: int = DEFAULT_EMBEDDING_CACHE_SIZE,
+        fingerprint_sample_rows: Optional[int] = None,
     ):
         self._dataset_manager = dataset_manager
         self._cache_dir = cache_dir
+        self._persist_embeddings = persist_embeddings
+        self.embedding_cache_size = embedding_cache_size
+        self.fingerprint_sample_rows = fingerprint_sample_rows
 
     def get_dataset_cache(
         self,
@@ -150,6 +160,13 @@ class CacheManager:
             return dataset.get_cache_directory()
         return self._cache_dir
 
+    def get_embedding_cache_directory(self) -> Optional[str]:
+        """Returns the directory of the persistent cache of the embeddings of fixed encoders, shared by all
+        datasets, or None if embeddings are not persisted across runs."""
+        if not self._persist_embeddings:
+            return None
+        return os.path.join(self._cache_dir or get_default_cache_location(), EMBEDDING_CACHE_DIR_NAME)
+
     def can_cache(self, skip_save_processed_input: bool) -> bool:
         return self._dataset_manager.can_cache(skip_save_processed_input)
 
@@ -14,6 +14,8 @@
 # limitations under the License.
 # ==============================================================================
 
+import hashlib
+import logging
 import os
 import re
 import uuid
@@ -22,16 +24,67 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
+import pandas as pd
+
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.utils.fs_utils import checksum
 from ludwig.utils.types import DataFrame
 
+logger = logging.getLogger(__name__)
+
 
 def alphanum(v):
     """Filters a string to only its alphanumeric characters."""
     return re.sub(r"\W+", "", v)
 
 
+def _hash_partition(df: pd.DataFrame, sample_rows: Optional[int] = None) -> str:
+    num_rows = len(df)
+    if sample_rows is not None and num_rows > sample_rows:
+        # Evenly spaced rows, so the same frame always yields the same sample.
+        df = df.iloc[np.linspace(0, num_rows - 1, sample_rows, dtype=np.int64)]
+    # A range index is fully described by its bounds, which is much cheaper than hashing it row by row.
+    range_index = isinstance(df.index, pd.RangeIndex)
+    row_hashes = pd.util.hash_pandas_object(df, index=not range_index).to_numpy(dtype=np.uint64)
+    h = hashlib.md5(f"{num_rows}:{df.index if range_index else ''}".encode())
+    h.update(row_hashes.tobytes())
+    return h.hexdigest()
+
+
+@DeveloperAPI
+def fingerprint_dataframe(df: DataFrame, sample_rows: Optional[int] = None) -> Optional[str]:
+    """Computes a fingerprint of the contents of a pandas or Dask DataFrame.
+
+    Rows (including the index) are hashed with `pd.util.hash_pandas_object` one partition at a time, and the
+    partition digests are combined in order together with the column names and dtypes. Dask frames are therefore
+    fingerprinted in parallel, but the same data split into different partitions yields a different fingerprint.
+
+    Args:
+        df: The DataFrame to fingerprint.
+        sample_rows: If set, only this many evenly spaced rows of each partition are hashed (in addition to its
+            length), which bounds the cost on very large frames at the risk of missing changes to unsampled rows.
+
+    Returns:
+        The hex fingerprint, or None if the frame contains values that cannot be hashed (e.g., lists or arrays).
+    """
+    h = hashlib.md5()
+    h.update(repr([(str(name), str(dtype)) for name, dtype in df.dtypes.items()]).encode())
+    try:
+        if hasattr(df, "map_partitions"):
+            partition_digests = df.map_partitions(
+                lambda partition: pd.Series([_hash_partition(partition, sample_rows)]), meta=(None, object)
+            ).compute()
+        else:
+            partition_digests = [_hash_partition(df, sample_rows)]
+    except TypeError:
+        logger.info("Unable to fingerprint the contents of the DataFrame, it will not be cached across calls.")
+        return None
+    for digest in partition_digests:
+        h.update(digest.encode())
+    return h.hexdigest()
+
+
 @DeveloperAPI
 class CacheableDataset(ABC):
     name: str
@@ -67,6 +120,34 @@ class CacheableDataframe(CacheableDataset):
         return self.df
 
 
+@DeveloperAPI
+class FingerprintedDataframe(CacheableDataframe):
+    """Wraps a DataFrame using a fingerprint of its contents as name and checksum, so identical frames share a cache.
+
+    The fingerprint hashes the whole frame, so it is only computed the first time the checksum is needed, e.g. to
+    compute the cache key. It falls back to a unique checksum when the contents cannot be fingerprinted.
+
+    Args:
+        df: The DataFrame to wrap.
+        sample_rows: If set, only this many rows of each partition are fingerprinted, see `fingerprint_dataframe`.
+    """
+
+    def __init__(self, df: DataFrame, sample_rows: Optional[int] = None):
+        self.df = df
+        self.sample_rows = sample_rows
+        self._checksum = None
+
+    @property
+    def name(self) -> str:
+        return self.checksum
+
+    @property
+    def checksum(self) -> str:
+        if self._checksum is None:
+            self._checksum = fingerprint_dataframe(self.df, sample_rows=self.sample_rows) or str(uuid.uuid1())
+        return self._checksum
+
+
 @DeveloperAPI
 @dataclass
 class CacheablePath(CacheableDataset):
@@ -93,7 +174,12 @@ class CacheablePath(CacheableDataset):
 CacheInput = Union[str, DataFrame, CacheableDataset]
 
 
-def wrap(dataset: Optional[CacheInput]) -> CacheableDataset:
+def wrap(dataset: Optional[CacheInput], fingerprint_sample_rows: Optional[int] = None) -> CacheableDataset:
+    """Wraps a dataset so it can be managed within the cache.
+
+    DataFrames are identified by a fingerprint of their contents, computed over only `fingerprint_sample_rows` rows of
+    each partition if set.
+    """
     if dataset is None:
         return None
 
@@ -102,7 +188,4 @@ def wrap(dataset: Optional[CacheInput]) -> CacheableDataset:
     if isinstance(dataset, str):
         return CacheablePath(path=dataset)
 
-    # TODO(travis): could try hashing the in-memory dataset, but this is tricky for Dask
-    checksum = str(uuid.uuid1())
-    name = checksum
-    return CacheableDataframe(df=dataset, name=name, checksum=checksum)
+    return FingerprintedDataframe(dataset, sample_rows=fingerprint_sample_rows)
@@ -60,6 +60,18 @@ class DataFrameEngine(ABC):
     def reduce_objects(self, series, reduce_fn):
         raise NotImplementedError()
 
+    @abstractmethod
+    def reduce_partitions(self, cols, partition_fn, merge_fn):
+        """Computes `partition_fn` over aligned partitions of several columns in a single pass and combines the
+        partial results pairwise with `merge_fn`.
+
+        Args:
+            cols: Dict of column name to Series. All Series must share the same partitioning.
+            partition_fn: Function mapping a dict of column name to in-memory Series to a partial result.
+            merge_fn: Function combining two partial results into one.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def split(self, df, probabilities):
         """Splits the input DataFrame into sections with the given proportions."""
@@ -50,6 +50,10 @@ def set_scheduler(scheduler):
     dask.config.set(scheduler=scheduler)
 
 
+def _apply_to_partition(partition_fn, names, *blocks):
+    return partition_fn(dict(zip(names, blocks)))
+
+
 @DeveloperAPI
 def reset_index_across_all_partitions(df):
     """Compute a monotonically increasing index across all partitions.
@@ -177,6 +181,23 @@ class DaskEngine(DataFrameEngine):
     def reduce_objects(self, series, reduce_fn):
         return series.reduction(reduce_fn, aggregate=reduce_fn, meta=("data", "object")).compute()[0]
 
+    def reduce_partitions(self, cols, partition_fn, merge_fn):
+        names = list(cols.keys())
+        if not names:
+            return partition_fn({})
+
+        # Columns derived from the same DataFrame share the upstream tasks of each partition, so computing all
+        # partials in one graph reads every partition exactly once.
+        partition_blocks = zip(*[cols[name].to_delayed() for name in names])
+        partials = [dask.delayed(_apply_to_partition)(partition_fn, names, *blocks) for blocks in partition_blocks]
+        while len(partials) > 1:
+            merged = [dask.delayed(merge_fn)(a, b) for a, b in zip(partials[::2], partials[1::2])]
+            if len(partials) % 2 == 1:
+                merged.append(partials[-1])
+            partials = merged
+        (result,) = dask.compute(partials[0])
+        return result
+
     def split(self, df, probabilities):
         # Split the DataFrame proprotionately along partitions. This is an inexact solution designed
         # to speed up the split process, as splitting within partitions would be significantly
@@ -60,6 +60,9 @@ class ModinEngine(DataFrameEngine):
     def reduce_objects(self, series, reduce_fn):
         return reduce_fn(series)
 
+    def reduce_partitions(self, cols, partition_fn, merge_fn):
+        return partition_fn(cols)
+
     def split(self, df, probabilities):
         return split_by_slices(df.iloc, len(df), probabilities)
 
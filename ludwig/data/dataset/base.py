@@ -41,6 +41,8 @@ class Dataset(ABC):
         random_seed: int = default_random_seed,
         ignore_last: bool = False,
         distributed: DistributedStrategy = None,
+        augmentation_pipeline=None,
+        bucketing_field: str | None = None,
     ) -> Batcher:
         raise NotImplementedError()
 
@@ -17,38 +17,76 @@
 from __future__ import annotations
 
 import contextlib
+import logging
+import os
 from typing import Iterable, TYPE_CHECKING
 
 import numpy as np
 from pandas import DataFrame
 
-from ludwig.constants import PREPROCESSING, TRAINING
+from ludwig.constants import AUDIO, IN_MEMORY, NAME, PREPROCESSING, TRAINING, TYPE
 from ludwig.data.batcher.base import Batcher
+from ludwig.data.batcher.bucketed import (
+    BucketedBatcher,
+    compute_lengths,
+    get_bucketing_field_config,
+    get_bucketing_parameters,
+)
 from ludwig.data.batcher.random_access import RandomAccessBatcher
 from ludwig.data.dataset.base import Dataset, DatasetManager
 from ludwig.data.sampler import DistributedSampler
 from ludwig.distributed import DistributedStrategy
 from ludwig.features.base_feature import BaseFeature
-from ludwig.utils.data_utils import DATA_TRAIN_HDF5_FP, load_hdf5, save_hdf5
+from ludwig.utils.data_utils import (
+    DATA_TRAIN_HDF5_FP,
+    is_memmap_dataset,
+    load_hdf5,
+    load_memmap,
+    MEMMAP_HDF5_FILE,
+    save_hdf5,
+    save_memmap,
+)
 from ludwig.utils.dataframe_utils import from_numpy_dataset, to_numpy_dataset, to_scalar_df
 from ludwig.utils.defaults import default_random_seed
-from ludwig.utils.fs_utils import download_h5
+from ludwig.utils.fs_utils import download_h5, path_exists
 from ludwig.utils.misc_utils import get_proc_features
 
 if TYPE_CHECKING:
     from ludwig.backend.base import Backend
 
+logger = logging.getLogger(__name__)
+
 
 class PandasDataset(Dataset):
-    def __init__(self, dataset, features, data_hdf5_fp):
+    def __init__(self, dataset, features, data_hdf5_fp, training_set_metadata=None):
         self.features = features
         self.data_hdf5_fp = data_hdf5_fp
-
-        if isinstance(dataset, str):
-            dataset = load_hdf5(dataset)
-        self.dataset = to_numpy_dataset(dataset)
+        self.training_set_metadata = training_set_metadata or {}
+
+        self.memmap_fp = None
+        if is_memmap_dataset(dataset):
+            # Columns are memory-mapped and only paged in as batches access them.
+            self.memmap_fp = dataset
+            self.dataset = load_memmap(dataset)
+        else:
+            if isinstance(dataset, str):
+                dataset = load_hdf5(dataset)
+            self.dataset = to_numpy_dataset(dataset)
         self.size = len(list(self.dataset.values())[0])
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.memmap_fp is not None:
+            # Pickling memory-mapped arrays would copy their contents, so processes receiving the dataset (e.g.
+            # hyperopt trials) map the same files instead, sharing their pages through the OS page cache.
+            state["dataset"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.memmap_fp is not None:
+            self.dataset = load_memmap(self.memmap_fp)
+
     def to_df(self, features: Iterable[BaseFeature] | None = None) -> DataFrame:
         """Convert the dataset to a Pandas DataFrame."""
         if features:
@@ -107,10 +145,19 @@ class PandasDataset(Dataset):
         ignore_last: bool = False,
         distributed: DistributedStrategy = None,
         augmentation_pipeline=None,
+        bucketing_field: str | None = None,
     ) -> Batcher:
         sampler = DistributedSampler(
             len(self), shuffle=should_shuffle, random_seed=random_seed, distributed=distributed
         )
+        if bucketing_field is not None:
+            batcher = self._initialize_bucketed_batcher(
+                sampler, bucketing_field, batch_size, ignore_last, augmentation_pipeline
+            )
+            if batcher is not None:
+                yield batcher
+                return
+
         batcher = RandomAccessBatcher(
             self,
             sampler,
@@ -120,15 +167,62 @@ class PandasDataset(Dataset):
         )
         yield batcher
 
+    def _initialize_bucketed_batcher(
+        self, sampler, bucketing_field, batch_size, ignore_last, augmentation_pipeline
+    ) -> BucketedBatcher | None:
+        proc_column, feature_config = get_bucketing_field_config(self.features, bucketing_field)
+        if feature_config[TYPE] == AUDIO and not feature_config.get(PREPROCESSING, {}).get(IN_MEMORY, True):
+            logger.warning(
+                f"Bucketing field `{bucketing_field}` is an audio feature that is not kept in memory, "
+                "falling back to random batching."
+            )
+            return None
+
+        params = get_bucketing_parameters(feature_config, self.training_set_metadata.get(feature_config[NAME], {}))
+        lengths = compute_lengths(self.get(proc_column), params["padding_value"], padding_side=params["trim_side"])
+        return BucketedBatcher(
+            self,
+            sampler,
+            bucketing_field=proc_column,
+            lengths=lengths,
+            batch_size=batch_size,
+            ignore_last=ignore_last,
+            should_trim=params["should_trim"],
+            trim_side=params["trim_side"],
+            augmentation_pipeline=augmentation_pipeline,
+        )
+
+
+HDF5 = "hdf5"
+MMAP = "mmap"
+CACHE_FORMATS = [HDF5, MMAP]
+
 
 class PandasDatasetManager(DatasetManager):
-    def __init__(self, backend: Backend):
+    def __init__(self, backend: Backend, data_format: str = HDF5):
+        if data_format not in CACHE_FORMATS:
+            raise ValueError(f"Invalid cache format `{data_format}`, expected one of {CACHE_FORMATS}")
         self.backend: Backend = backend
+        self._data_format = data_format
 
     def create(self, dataset, config, training_set_metadata) -> Dataset:
-        return PandasDataset(dataset, get_proc_features(config), training_set_metadata.get(DATA_TRAIN_HDF5_FP))
+        return PandasDataset(
+            dataset,
+            get_proc_features(config),
+            training_set_metadata.get(DATA_TRAIN_HDF5_FP),
+            training_set_metadata=training_set_metadata,
+        )
 
     def save(self, cache_path, dataset, config, training_set_metadata, tag) -> Dataset:
+        if self.data_format == MMAP:
+            save_memmap(cache_path, dataset)
+            if tag == TRAINING:
+                hdf5_fp = os.path.join(cache_path, MEMMAP_HDF5_FILE)
+                if path_exists(hdf5_fp):
+                    training_set_metadata[DATA_TRAIN_HDF5_FP] = hdf5_fp
+            # Return the path, so the dataset is opened memory-mapped rather than kept in memory.
+            return cache_path
+
         save_hdf5(cache_path, dataset)
         if tag == TRAINING:
             training_set_metadata[DATA_TRAIN_HDF5_FP] = cache_path
@@ -139,4 +233,4 @@ class PandasDatasetManager(DatasetManager):
 
     @property
     def data_format(self) -> str:
-        return "hdf5"
+        return self._data_format
@@ -138,7 +138,10 @@ class RayDataset(Dataset):
         ignore_last=False,
         distributed=None,
         augmentation_pipeline=None,
+        bucketing_field=None,
     ):
+        if bucketing_field is not None:
+            logger.warning("Bucketing is not supported with the Ray backend, falling back to random batching.")
         yield RayDatasetBatcher(
             self.ds.repeat().iter_datasets(),
             self.features,
@@ -276,7 +279,10 @@ class RayDatasetShard(Dataset):
         ignore_last: bool = False,
         distributed: DistributedStrategy = None,
         augmentation_pipeline=None,
+        bucketing_field: Optional[str] = None,
     ):
+        if bucketing_field is not None:
+            logger.warning("Bucketing is not supported with the Ray backend, falling back to random batching.")
         yield RayDatasetBatcher(
             self.epoch_iter,
             self.features,
@@ -0,0 +1,199 @@
+#! /usr/bin/env python
+# Copyright (c) 2023 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Feature-parallel execution of the per-feature preprocessing stages (metadata and data building).
+
+Features are independent of one another once missing values have been handled and columns have been cast, except for
+features that read the same input column (missing value handling replaces the column in place). Feature configs are
+therefore grouped by input column, and each group is submitted as a single task that runs its features in order.
+"""
+import logging
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tabulate import tabulate
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.constants import AUDIO, BAG, COLUMN, IMAGE, NAME, SEQUENCE, SET, TEXT, TIMESERIES, TYPE
+from ludwig.types import FeatureConfigDict, PreprocessingConfigDict
+
+logger = logging.getLogger(__name__)
+
+THREAD = "thread"
+PROCESS = "process"
+AUTO = "auto"
+
+FEATURE_EXECUTOR_TYPES = [AUTO, THREAD, PROCESS]
+
+# Feature types whose preprocessing is dominated by pure-Python tokenization, which holds the GIL. In `auto` mode
+# these are sent to a process pool, while everything else (numpy / pandas vectorized work) runs on threads.
+PROCESS_FEATURE_TYPES = {TEXT, SEQUENCE, SET, BAG, TIMESERIES}
+
+# Feature types that already parallelize internally through the backend (reading binary files, resizing, etc.),
+# so running them concurrently with other features only causes oversubscription.
+SEQUENTIAL_FEATURE_TYPES = {IMAGE, AUDIO}
+
+METADATA_STAGE = "metadata"
+DATA_STAGE = "data"
+
+
+@DeveloperAPI
+class FeatureTimingReport:
+    """Collects wall-clock time spent in each preprocessing stage for each feature."""
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = defaultdict(dict)
+
+    def record(self, feature_name: str, stage: str, seconds: float) -> None:
+        self.timings[feature_name][stage] = self.timings[feature_name].get(stage, 0.0) + seconds
+
+    def total(self, feature_name: str) -> float:
+        return sum(self.timings[feature_name].values())
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        return {name: dict(stages) for name, stages in self.timings.items()}
+
+    def log(self, top_k: Optional[int] = 20, level: int = logging.INFO) -> None:
+        """Logs a table of per-feature preprocessing times, slowest features first."""
+        if not self.timings:
+            return
+
+        names = sorted(self.timings, key=self.total, reverse=True)
+        if top_k is not None:
+            names = names[:top_k]
+
+        rows = [
+            [
+                name,
+                f"{self.timings[name].get(METADATA_STAGE, 0.0):.3f}",
+                f"{self.timings[name].get(DATA_STAGE, 0.0):.3f}",
+                f"{self.total(name):.3f}",
+            ]
+            for name in names
+        ]
+        table = tabulate(rows, headers=["feature", "metadata (s)", "data (s)", "total (s)"], tablefmt="simple")
+        logger.log(level, f"Per-feature preprocessing time:\n{table}")
+
+
+def group_features_by_column(feature_configs: List[FeatureConfigDict]) -> List[List[FeatureConfigDict]]:
+    """Groups feature configs that read the same input column, preserving the original feature order."""
+    groups: Dict[str, List[FeatureConfigDict]] = {}
+    for feature_config in feature_configs:
+        groups.setdefault(feature_config[COLUMN], []).append(feature_config)
+    return list(groups.values())
+
+
+def _run_group(fn: Callable, group: List[FeatureConfigDict], args: Tuple) -> List[Tuple[str, Any, float]]:
+    results = []
+    for feature_config in group:
+        start = time.perf_counter()
+        result = fn(feature_config, *args)
+        results.append((feature_config[NAME], result, time.perf_counter() - start))
+    return results
+
+
+@DeveloperAPI
+class FeatureExecutor:
+    """Runs a per-feature preprocessing function over groups of independent features.
+
+    With `num_workers <= 1`, or on a partitioned (Dask) backend where the work is already lazy and distributed, every
+    feature runs sequentially in the calling thread, which is exactly the original preprocessing behavior.
+    """
+
+    def __init__(self, num_workers: Optional[int] = None, executor_type: str = AUTO, backend=None):
+        if executor_type not in FEATURE_EXECUTOR_TYPES:
+            raise ValueError(
+                f"Invalid feature executor type `{executor_type}`, expected one of {FEATURE_EXECUTOR_TYPES}"
+            )
+
+        self.num_workers = num_workers or 1
+        self.executor_type = executor_type
+        self.timing_report = FeatureTimingReport()
+        self.parallel = self.num_workers > 1 and (backend is None or not backend.df_engine.partitioned)
+
+    @classmethod
+    def from_preprocessing_parameters(
+        cls, global_preprocessing_parameters: PreprocessingConfigDict, backend
+    ) -> "FeatureExecutor":
+        return cls(
+            num_workers=global_preprocessing_parameters.get("num_feature_workers"),
+            executor_type=global_preprocessing_parameters.get("feature_executor", AUTO),
+            backend=backend,
+        )
+
+    def _group_uses_processes(self, group: List[FeatureConfigDict]) -> bool:
+        if self.executor_type == PROCESS:
+            return True
+        if self.executor_type == THREAD:
+            return False
+        return all(feature_config[TYPE] in PROCESS_FEATURE_TYPES for feature_config in group)
+
+    def map(
+        self,
+        stage: str,
+        fn: Callable,
+        feature_configs: List[FeatureConfigDict],
+        make_args: Callable[[List[FeatureConfigDict]], Tuple],
+    ) -> Dict[str, Any]:
+        """Calls `fn(feature_config, *make_args(group))` for every feature and returns a dict of feature name to
+        result.
+
+        `make_args` is called once per group of features sharing an input column, so that only the data a group needs
+        is sent to a worker process. `fn` must be a module-level function, and `fn` and its arguments must be picklable
+        when a process pool is used.
+        """
+        groups = group_features_by_column(feature_configs)
+        sequential_groups = []
+        thread_groups = []
+        process_groups = []
+        for group in groups:
+            if not self.parallel or any(f[TYPE] in SEQUENTIAL_FEATURE_TYPES for f in group):
+                sequential_groups.append(group)
+            elif self._group_uses_processes(group):
+                process_groups.append(group)
+            else:
+                thread_groups.append(group)
+
+        group_results = []
+        pools: List[Executor] = []
+        try:
+            futures = []
+            if process_groups:
+                pools.append(ProcessPoolExecutor(max_workers=min(self.num_workers, len(process_groups))))
+                futures += [pools[-1].submit(_run_group, fn, group, make_args(group)) for group in process_groups]
+            if thread_groups:
+                pools.append(ThreadPoolExecutor(max_workers=min(self.num_workers, len(thread_groups))))
+                futures += [pools[-1].submit(_run_group, fn, group, make_args(group)) for group in thread_groups]
+
+            # Features that parallelize internally run in the calling thread while the pools make progress.
+            for group in sequential_groups:
+                group_results.append(_run_group(fn, group, make_args(group)))
+
+            for future in futures:
+                group_results.append(future.result())
+        finally:
+            for pool in pools:
+                pool.shutdown(wait=True)
+
+        results = {}
+        for group_result in group_results:
+            for feature_name, result, seconds in group_result:
+                self.timing_report.record(feature_name, stage, seconds)
+                results[feature_name] = result
+
+        # Preserve the feature config order so downstream dicts are identical to the sequential path.
+        return {f[NAME]: results[f[NAME]] for f in feature_configs if f[NAME] in results}
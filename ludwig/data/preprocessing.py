@@ -14,10 +14,11 @@
 # limitations under the License.
 # ==============================================================================
 import contextlib
+import functools
 import logging
 import warnings
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
@@ -55,12 +56,15 @@ from ludwig.constants import (
     TYPE,
     VALIDATION,
 )
+from ludwig.data.cache.embeddings import compact_embedding_cache
 from ludwig.data.cache.manager import DatasetCache
 from ludwig.data.cache.types import wrap
 from ludwig.data.concatenate_datasets import concatenate_df, concatenate_files, concatenate_splits
 from ludwig.data.dataset.base import Dataset
-from ludwig.data.prompt import format_input_with_prompt, index_column
+from ludwig.data.feature_executor import DATA_STAGE, FeatureExecutor, METADATA_STAGE
+from ludwig.data.prompt import CONTEXT, format_input_with_prompt, get_template_fields, index_column, SAMPLE, TASK
 from ludwig.data.split import get_splitter, split_dataset
+from ludwig.data.statistics import ColumnStatistics, compute_statistics, MEAN, StatisticsPlan, VALUE_COUNTS
 from ludwig.data.utils import get_input_and_output_features, set_fixed_split
 from ludwig.datasets import load_dataset_uris
 from ludwig.features.feature_registries import get_base_type_registry
@@ -85,8 +89,11 @@ from ludwig.utils.data_utils import (
     get_split_path,
     HDF5_FORMATS,
     HTML_FORMATS,
+    is_memmap_dataset,
     JSON_FORMATS,
     JSONL_FORMATS,
+    load_memmap,
+    MEMMAP_FORMATS,
     ORC_FORMATS,
     override_in_memory_flag,
     PARQUET_FORMATS,
@@ -111,13 +118,12 @@ from ludwig.utils.data_utils import (
     STATA_FORMATS,
     TSV_FORMATS,
 )
-from ludwig.utils.dataframe_utils import is_dask_series_or_df
 from ludwig.utils.defaults import (
     default_prediction_preprocessing_parameters,
     default_random_seed,
     default_training_preprocessing_parameters,
 )
-from ludwig.utils.fs_utils import file_lock, path_exists
+from ludwig.utils.fs_utils import file_lock, has_remote_protocol, path_exists
 from ludwig.utils.misc_utils import get_from_registry, merge_dict
 from ludwig.utils.types import DataFrame, Series
 
@@ -302,6 +308,7 @@ class CSVPreprocessor(DataFormatPreprocessor):
         random_seed=default_random_seed,
         callbacks=None,
     ):
+        columns = get_dataset_columns(config, features, preprocessing_params)
         return _preprocess_file_for_training(
             config,
             features,
@@ -309,7 +316,7 @@ class CSVPreprocessor(DataFormatPreprocessor):
             training_set,
             validation_set,
             test_set,
-            read_fn=read_csv,
+            read_fn=functools.partial(read_csv, columns=columns),
             training_set_metadata=training_set_metadata,
             skip_save_processed_input=skip_save_processed_input,
             preprocessing_params=preprocessing_params,
@@ -322,7 +329,8 @@ class CSVPreprocessor(DataFormatPreprocessor):
     def preprocess_for_prediction(
         config, dataset, features, preprocessing_params, training_set_metadata, backend, callbacks
     ):
-        dataset_df = read_csv(dataset, df_lib=backend.df_engine.df_lib)
+        columns = get_dataset_columns(config, features, preprocessing_params)
+        dataset_df = read_csv(dataset, df_lib=backend.df_engine.df_lib, columns=columns)
         training_set_metadata[SRC] = dataset
         dataset, training_set_metadata = build_dataset(
             config,
@@ -353,6 +361,7 @@ class TSVPreprocessor(DataFormatPreprocessor):
         random_seed=default_random_seed,
         callbacks=None,
     ):
+        columns = get_dataset_columns(config, features, preprocessing_params)
         return _preprocess_file_for_training(
             config,
             features,
@@ -360,7 +369,7 @@ class TSVPreprocessor(DataFormatPreprocessor):
             training_set,
             validation_set,
             test_set,
-            read_fn=read_tsv,
+            read_fn=functools.partial(read_tsv, columns=columns),
             training_set_metadata=training_set_metadata,
             skip_save_processed_input=skip_save_processed_input,
             preprocessing_params=preprocessing_params,
@@ -373,7 +382,8 @@ class TSVPreprocessor(DataFormatPreprocessor):
     def preprocess_for_prediction(
         config, dataset, features, preprocessing_params, training_set_metadata, backend, callbacks
     ):
-        dataset_df = read_tsv(dataset, df_lib=backend.df_engine.df_lib)
+        columns = get_dataset_columns(config, features, preprocessing_params)
+        dataset_df = read_tsv(dataset, df_lib=backend.df_engine.df_lib, columns=columns)
         training_set_metadata[SRC] = dataset
         dataset, training_set_metadata = build_dataset(
             config,
@@ -557,6 +567,7 @@ class ParquetPreprocessor(DataFormatPreprocessor):
         random_seed=default_random_seed,
         callbacks=None,
     ):
+        columns = get_dataset_columns(config, features, preprocessing_params)
         return _preprocess_file_for_training(
             config,
             features,
@@ -564,7 +575,7 @@ class ParquetPreprocessor(DataFormatPreprocessor):
             training_set,
             validation_set,
             test_set,
-            read_fn=read_parquet,
+            read_fn=functools.partial(read_parquet, columns=columns),
             training_set_metadata=training_set_metadata,
             skip_save_processed_input=skip_save_processed_input,
             preprocessing_params=preprocessing_params,
@@ -577,7 +588,8 @@ class ParquetPreprocessor(DataFormatPreprocessor):
     def preprocess_for_prediction(
         config, dataset, features, preprocessing_params, training_set_metadata, backend, callbacks
     ):
-        dataset_df = read_parquet(dataset, backend.df_engine.df_lib)
+        columns = get_dataset_columns(config, features, preprocessing_params)
+        dataset_df = read_parquet(dataset, backend.df_engine.df_lib, columns=columns)
         training_set_metadata[SRC] = dataset
         dataset, training_set_metadata = build_dataset(
             config,
@@ -1121,6 +1133,75 @@ class HDF5Preprocessor(DataFormatPreprocessor):
         return training_set, test_set, validation_set, training_set_metadata
 
 
+class MemmapPreprocessor(DataFormatPreprocessor):
+    """Reads datasets cached with the memory-mapped columnar format of the local backend.
+
+    Cached splits are passed through as paths, so that each `PandasDataset` opens its arrays memory-mapped without
+    building an intermediate DataFrame.
+    """
+
+    @staticmethod
+    def preprocess_for_training(
+        config,
+        features,
+        dataset=None,
+        training_set=None,
+        validation_set=None,
+        test_set=None,
+        training_set_metadata=None,
+        skip_save_processed_input=False,
+        preprocessing_params=default_training_preprocessing_parameters,
+        backend=LOCAL_BACKEND,
+        random_seed=default_random_seed,
+        callbacks=None,
+    ):
+        return MemmapPreprocessor.prepare_processed_data(
+            features,
+            dataset,
+            training_set,
+            validation_set,
+            test_set,
+            training_set_metadata,
+            skip_save_processed_input,
+            preprocessing_params,
+            backend,
+            random_seed,
+        )
+
+    @staticmethod
+    def preprocess_for_prediction(
+        config, dataset, features, preprocessing_params, training_set_metadata, backend, callbacks
+    ):
+        return data_utils.from_numpy_dataset(load_memmap(dataset)), training_set_metadata, None
+
+    @staticmethod
+    def prepare_processed_data(
+        features,
+        dataset=None,
+        training_set=None,
+        validation_set=None,
+        test_set=None,
+        training_set_metadata=None,
+        skip_save_processed_input=False,
+        preprocessing_params=default_training_preprocessing_parameters,
+        backend=LOCAL_BACKEND,
+        random_seed=default_random_seed,
+    ):
+        if dataset is None and training_set is None:
+            raise ValueError("One of `dataset` or `training_set` must be not None")
+
+        if not training_set_metadata:
+            raise ValueError("When providing memory-mapped data, training_set_metadata must not be None.")
+
+        if is_memmap_dataset(dataset):
+            # A single unsplit dataset needs to be split in memory.
+            logger.info(f"Loading data from: {dataset}")
+            dataset = data_utils.from_numpy_dataset(load_memmap(dataset))
+            training_set, validation_set, test_set = split_dataset(dataset, preprocessing_params, backend)
+
+        return training_set, test_set, validation_set, training_set_metadata
+
+
 data_format_preprocessor_registry = {
     **{fmt: DictPreprocessor for fmt in DICT_FORMATS},
     **{fmt: DataFramePreprocessor for fmt in DATAFRAME_FORMATS},
@@ -1139,6 +1220,7 @@ data_format_preprocessor_registry = {
     **{fmt: SPSSPreprocessor for fmt in SPSS_FORMATS},
     **{fmt: StataPreprocessor for fmt in STATA_FORMATS},
     **{fmt: HDF5Preprocessor for fmt in HDF5_FORMATS},
+    **{fmt: MemmapPreprocessor for fmt in MEMMAP_FORMATS},
 }
 
 
@@ -1277,9 +1359,11 @@ def build_dataset(
     for callback in callbacks or []:
         callback.on_build_metadata_start(dataset_df, mode)
 
+    executor = FeatureExecutor.from_preprocessing_parameters(global_preprocessing_parameters, backend)
+
     logger.debug("build metadata")
     metadata: TrainingSetMetadataDict = build_metadata(
-        config, metadata, feature_name_to_preprocessing_parameters, dataset_cols, feature_configs, backend
+        config, metadata, feature_name_to_preprocessing_parameters, dataset_cols, feature_configs, backend, executor
     )
 
     check_global_max_sequence_length_fits_prompt_template(metadata, global_preprocessing_parameters)
@@ -1291,7 +1375,9 @@ def build_dataset(
         callback.on_build_data_start(dataset_df, mode)
 
     logger.debug("build data")
-    proc_cols = build_data(dataset_cols, feature_configs, metadata, backend, skip_save_processed_input)
+    proc_cols = build_data(dataset_cols, feature_configs, metadata, backend, skip_save_processed_input, executor)
+
+    executor.timing_report.log(level=logging.INFO if executor.parallel else logging.DEBUG)
 
     for callback in callbacks or []:
         callback.on_build_data_end(dataset_df, mode)
@@ -1382,8 +1468,14 @@ def embed_fixed_features(
         metadata[feature[NAME]][PREPROCESSING]["cache_encoder_embeddings"] = False
 
     batch_size = backend.tune_batch_size(create_embed_batch_size_evaluator(features_to_encode, metadata), len(dataset))
-    transform_fn = create_embed_transform_fn(features_to_encode, metadata)
+    # Embeddings are cached across runs on the local filesystem only, unless disabled by the backend.
+    cache_dir = backend.cache.get_embedding_cache_directory()
+    if cache_dir is not None and has_remote_protocol(cache_dir):
+        cache_dir = None
+    transform_fn = create_embed_transform_fn(features_to_encode, metadata, cache_dir=cache_dir)
     results = backend.batch_transform(dataset, batch_size, transform_fn, name="Caching encoder embeddings")
+    if cache_dir is not None:
+        compact_embedding_cache(cache_dir, backend.cache.embedding_cache_size)
 
     for feature in features_to_encode:
         # Set metadata so we know to skip encoding the feature
@@ -1481,6 +1573,20 @@ def build_preprocessing_parameters(
     if metadata is None:
         metadata = {}
 
+    # Collect the statistics needed by every fill strategy, so they can be computed in a single pass over the data.
+    plan = StatisticsPlan()
+    for feature_config in feature_configs:
+        if feature_config[NAME] in metadata:
+            continue
+        preprocessing_parameters = feature_config[PREPROCESSING]
+        strategies = {
+            preprocessing_parameters["missing_value_strategy"],
+            preprocessing_parameters.get("outlier_strategy"),
+        }
+        for strategy in strategies:
+            plan.request(feature_config[COLUMN], get_fill_value_aggregations(feature_config, strategy))
+    column_statistics = compute_statistics(plan, dataset_cols, backend)
+
     feature_name_to_preprocessing_parameters = {}
     for feature_config in feature_configs:
         feature_name = feature_config[NAME]
@@ -1491,9 +1597,10 @@ def build_preprocessing_parameters(
             continue
 
         preprocessing_parameters = feature_config[PREPROCESSING]
+        statistics = column_statistics.get(feature_config[COLUMN])
         missing_value_strategy = preprocessing_parameters["missing_value_strategy"]
         fill_value = precompute_fill_value(
-            dataset_cols, feature_config, missing_value_strategy, preprocessing_parameters, backend
+            dataset_cols, feature_config, missing_value_strategy, preprocessing_parameters, backend, statistics
         )
         if fill_value is not None:
             preprocessing_parameters.update({"computed_fill_value": fill_value})
@@ -1503,7 +1610,7 @@ def build_preprocessing_parameters(
         if outlier_strategy is not None:
             if outlier_strategy != missing_value_strategy:
                 outlier_fill_value = precompute_fill_value(
-                    dataset_cols, feature_config, outlier_strategy, preprocessing_parameters, backend
+                    dataset_cols, feature_config, outlier_strategy, preprocessing_parameters, backend, statistics
                 )
             else:
                 # Use fill value from missing_value_strategy to avoid redundant computation
@@ -1530,30 +1637,70 @@ def build_metadata(
     dataset_cols: Dict[str, Series],
     feature_configs: List[FeatureConfigDict],
     backend: Backend,
+    executor: Optional[FeatureExecutor] = None,
 ) -> TrainingSetMetadataDict:
-    for feature_config in feature_configs:
-        feature_name = feature_config[NAME]
-        if feature_name in metadata:
-            continue
+    executor = executor or FeatureExecutor(backend=backend)
+    feature_configs = [f for f in feature_configs if f[NAME] not in metadata]
 
-        preprocessing_parameters = feature_name_to_preprocessing_parameters[feature_name]
+    # Statistics required by all features are computed in a single fused pass and handed to each feature.
+    plan = StatisticsPlan()
+    for feature_config in feature_configs:
+        feature_cls = get_from_registry(feature_config[TYPE], get_base_type_registry())
+        preprocessing_parameters = feature_name_to_preprocessing_parameters[feature_config[NAME]]
+        plan.request(feature_config[COLUMN], _get_required_statistics(feature_cls, preprocessing_parameters))
+    column_statistics = compute_statistics(plan, dataset_cols, backend)
 
-        column = dataset_cols[feature_config[COLUMN]]
-        metadata[feature_name] = get_from_registry(feature_config[TYPE], get_base_type_registry()).get_feature_meta(
-            config, column, preprocessing_parameters, backend, is_input_feature(feature_config)
+    def make_args(group: List[FeatureConfigDict]) -> Tuple:
+        return (
+            config,
+            {f[NAME]: feature_name_to_preprocessing_parameters[f[NAME]] for f in group},
+            {group[0][COLUMN]: dataset_cols[group[0][COLUMN]]},
+            backend,
+            column_statistics.get(group[0][COLUMN]),
         )
 
-        metadata[feature_name][PREPROCESSING] = preprocessing_parameters
-
+    feature_metadata = executor.map(METADATA_STAGE, _build_feature_metadata, feature_configs, make_args)
+    metadata.update(feature_metadata)
     return metadata
 
 
+def _get_required_statistics(feature_cls, preprocessing_parameters: PreprocessingConfigDict) -> Set[str]:
+    # Not every base type mixin derives from BaseFeatureMixin (e.g., VectorFeatureMixin).
+    required_statistics = getattr(feature_cls, "required_statistics", None)
+    return required_statistics(preprocessing_parameters) if required_statistics is not None else set()
+
+
+def _build_feature_metadata(
+    feature_config: FeatureConfigDict,
+    config: ModelConfigDict,
+    feature_name_to_preprocessing_parameters: Dict[str, PreprocessingConfigDict],
+    dataset_cols: Dict[str, Series],
+    backend: Backend,
+    statistics: Optional[ColumnStatistics],
+) -> Dict:
+    preprocessing_parameters = feature_name_to_preprocessing_parameters[feature_config[NAME]]
+
+    column = dataset_cols[feature_config[COLUMN]]
+    feature_cls = get_from_registry(feature_config[TYPE], get_base_type_registry())
+    kwargs = {}
+    if _get_required_statistics(feature_cls, preprocessing_parameters):
+        # Only features that declare required statistics accept them, which keeps custom features working.
+        kwargs["statistics"] = statistics
+    feature_metadata = feature_cls.get_feature_meta(
+        config, column, preprocessing_parameters, backend, is_input_feature(feature_config), **kwargs
+    )
+
+    feature_metadata[PREPROCESSING] = preprocessing_parameters
+    return feature_metadata
+
+
 def build_data(
     input_cols: DataFrame,
     feature_configs: List[Dict],
     training_set_metadata: Dict,
     backend: Backend,
     skip_save_processed_input: bool,
+    executor: Optional[FeatureExecutor] = None,
 ) -> Dict[str, DataFrame]:
     """Preprocesses the input dataframe columns, handles missing values, and potentially adds metadata to
     training_set_metadata.
@@ -1564,37 +1711,71 @@ def build_data(
         training_set_metadata: Training set metadata. Additional fields may be added.
         backend: Backend for data processing.
         skip_save_processed_input: (bool) Whether to skip saving the processed input.
+        executor: Executor used to process independent features in parallel. Defaults to sequential processing.
 
     Returns:
         Dictionary of (feature name) -> (processed data).
     """
-    proc_cols = {}
-    for feature_config in feature_configs:
-        # TODO(travis): instead of using raw dictionary, this should be loaded into a proper PreprocessingConfig
-        #  object, so we don't need to hackily check for the presence of added keys.
-        preprocessing_parameters = training_set_metadata[feature_config[NAME]][PREPROCESSING]
+    executor = executor or FeatureExecutor(backend=backend)
 
-        # Need to run this again here as cast_columns may have introduced new missing values
-        handle_missing_values(input_cols, feature_config, preprocessing_parameters, backend)
+    # Dataset-level entries (e.g., source and checksum) are needed by features that write to the cache.
+    feature_names = {f[NAME] for f in feature_configs}
+    dataset_metadata = {k: v for k, v in training_set_metadata.items() if k not in feature_names}
 
-        # For features that support it, we perform outlier removal here using metadata computed on the full dataset
-        handle_outliers(
-            input_cols, feature_config, preprocessing_parameters, training_set_metadata[feature_config[NAME]], backend
-        )
-
-        get_from_registry(feature_config[TYPE], get_base_type_registry()).add_feature_data(
-            feature_config,
-            input_cols,
-            proc_cols,
-            training_set_metadata,
-            preprocessing_parameters,
+    def make_args(group: List[FeatureConfigDict]) -> Tuple:
+        return (
+            {group[0][COLUMN]: input_cols[group[0][COLUMN]]},
+            {**dataset_metadata, **{f[NAME]: training_set_metadata[f[NAME]] for f in group}},
             backend,
             skip_save_processed_input,
         )
 
+    results = executor.map(DATA_STAGE, _build_feature_data, feature_configs, make_args)
+
+    proc_cols = {}
+    for feature_config in feature_configs:
+        feature_proc_cols, feature_metadata, input_col = results[feature_config[NAME]]
+        proc_cols.update(feature_proc_cols)
+        # Results computed in a worker process are copies, so write them back to the shared structures.
+        training_set_metadata[feature_config[NAME]] = feature_metadata
+        input_cols[feature_config[COLUMN]] = input_col
+
     return proc_cols
 
 
+def _build_feature_data(
+    feature_config: FeatureConfigDict,
+    input_cols: Dict[str, Series],
+    training_set_metadata: TrainingSetMetadataDict,
+    backend: Backend,
+    skip_save_processed_input: bool,
+) -> Tuple[Dict[str, Series], Dict, Series]:
+    # TODO(travis): instead of using raw dictionary, this should be loaded into a proper PreprocessingConfig
+    #  object, so we don't need to hackily check for the presence of added keys.
+    preprocessing_parameters = training_set_metadata[feature_config[NAME]][PREPROCESSING]
+
+    # Need to run this again here as cast_columns may have introduced new missing values
+    handle_missing_values(input_cols, feature_config, preprocessing_parameters, backend)
+
+    # For features that support it, we perform outlier removal here using metadata computed on the full dataset
+    handle_outliers(
+        input_cols, feature_config, preprocessing_parameters, training_set_metadata[feature_config[NAME]], backend
+    )
+
+    proc_cols = {}
+    get_from_registry(feature_config[TYPE], get_base_type_registry()).add_feature_data(
+        feature_config,
+        input_cols,
+        proc_cols,
+        training_set_metadata,
+        preprocessing_parameters,
+        backend,
+        skip_save_processed_input,
+    )
+
+    return proc_cols, training_set_metadata[feature_config[NAME]], input_cols[feature_config[COLUMN]]
+
+
 def balance_data(
     dataset_df: DataFrame,
     output_features: List[Dict],
@@ -1616,12 +1797,9 @@ def balance_data(
     """
     target = output_features[0][PROC_COLUMN]
 
-    if backend.df_engine.partitioned:
-        majority_class = backend.df_engine.compute(dataset_df[target].value_counts()).idxmax()
-        minority_class = backend.df_engine.compute(dataset_df[target].value_counts()).idxmin()
-    else:
-        majority_class = dataset_df[target].value_counts().idxmax()
-        minority_class = dataset_df[target].value_counts().idxmin()
+    value_counts = backend.df_engine.compute(dataset_df[target].value_counts())
+    majority_class = value_counts.idxmax()
+    minority_class = value_counts.idxmin()
     majority_df = dataset_df[dataset_df[target] == majority_class]
     minority_df = dataset_df[dataset_df[target] == minority_class]
 
@@ -1637,35 +1815,51 @@ def balance_data(
     return balanced_df
 
 
+def get_fill_value_aggregations(feature: FeatureConfigDict, missing_value_strategy: Optional[str]) -> Set[str]:
+    """Returns the column statistics `precompute_fill_value` needs for the given strategy."""
+    if missing_value_strategy in {FILL_WITH_MODE, FILL_WITH_FALSE, FILL_WITH_TRUE}:
+        return {VALUE_COUNTS}
+    if missing_value_strategy == FILL_WITH_MEAN and feature[TYPE] == NUMBER:
+        return {MEAN}
+    return set()
+
+
 def precompute_fill_value(
-    dataset_cols, feature, missing_value_strategy: str, preprocessing_parameters: PreprocessingConfigDict, backend
+    dataset_cols,
+    feature,
+    missing_value_strategy: str,
+    preprocessing_parameters: PreprocessingConfigDict,
+    backend,
+    statistics: Optional[ColumnStatistics] = None,
 ):
     """Precomputes the fill value for a feature.
 
     NOTE: this is called before NaNs are removed from the dataset. Modifications here must handle NaNs gracefully.
     NOTE: this is called before columns are cast. Modifications here must handle dtype conversion gracefully.
+
+    Args:
+        statistics: Precomputed statistics for the feature's column, as planned by `get_fill_value_aggregations`.
+            Computed on demand if not provided.
     """
+    aggregations = get_fill_value_aggregations(feature, missing_value_strategy)
+    if aggregations and (statistics is None or not aggregations <= statistics.aggregations):
+        plan = StatisticsPlan()
+        plan.request(feature[COLUMN], aggregations)
+        statistics = compute_statistics(plan, dataset_cols, backend)[feature[COLUMN]]
+
     if missing_value_strategy == FILL_WITH_CONST:
         return preprocessing_parameters["fill_value"]
     elif missing_value_strategy == FILL_WITH_MODE:
-        # Requires separate handling if Dask since Dask has lazy evaluation
-        # Otherwise, dask returns a Dask index structure instead of a value to use as a fill value
-        return (
-            dataset_cols[feature[COLUMN]].value_counts().index.compute()[0]
-            if is_dask_series_or_df(dataset_cols[feature[COLUMN]], backend)
-            else dataset_cols[feature[COLUMN]].value_counts().index[0]
-        )
+        return statistics.mode
     elif missing_value_strategy == FILL_WITH_MEAN:
         if feature[TYPE] != NUMBER:
             raise ValueError(
                 f"Filling missing values with mean is supported "
                 f"only for number types, not for type {feature[TYPE]}.",
             )
-        return backend.df_engine.compute(dataset_cols[feature[COLUMN]].astype(float).mean())
+        return statistics.float_mean
     elif missing_value_strategy in {FILL_WITH_FALSE, FILL_WITH_TRUE}:
-        distinct_values = backend.df_engine.compute(
-            dataset_cols[feature[COLUMN]].drop_duplicates().dropna()
-        ).values.tolist()
+        distinct_values = statistics.value_counts().index.tolist()
         if len(distinct_values) > 2:
             raise ValueError(
                 f"Missing value strategy `{missing_value_strategy}` "
@@ -1850,6 +2044,31 @@ def _has_prompt_section(config: Dict) -> bool:
     return "prompt" in config and (config["prompt"]["template"] is not None or config["prompt"]["task"] is not None)
 
 
+def get_dataset_columns(
+    config: ModelConfigDict, features: List[FeatureConfigDict], preprocessing_params: PreprocessingConfigDict
+) -> Set[str]:
+    """Returns the (sanitized) names of all dataset columns that preprocessing may read.
+
+    These are the columns of the features, the columns used to split the dataset, and the dataset columns referenced by
+    prompt templates. Readers of file formats that support it skip all other columns.
+    """
+    columns = {feature[COLUMN] for feature in features}
+
+    split_params = preprocessing_params.get(SPLIT, {})
+    columns.update(get_splitter(**split_params).required_columns)
+    # Read even when unused to warn about a "split" column in the data without a fixed split.
+    columns.add(SPLIT)
+
+    input_features, _ = get_input_and_output_features(features)
+    for input_feature_config in input_features:
+        prompt_config = _get_prompt_config(config, input_feature_config)
+        if prompt_config is not None and prompt_config["template"] is not None:
+            template_fields, _ = get_template_fields(prompt_config["template"])
+            columns.update(template_fields - {CONTEXT, SAMPLE, TASK})
+
+    return columns
+
+
 def load_hdf5(hdf5_file_path, preprocessing_params, backend, split_data=True, shuffle_training=False):
     # TODO dask: this needs to work with DataFrames
     logger.info(f"Loading data from: {hdf5_file_path}")
@@ -1915,10 +2134,11 @@ def preprocess_for_training(
         data_format = figure_data_format(dataset, training_set, validation_set, test_set)
 
     # Wrap dataset into a form we can use to manage within the cache
-    dataset = wrap(dataset)
-    training_set = wrap(training_set)
-    validation_set = wrap(validation_set)
-    test_set = wrap(test_set)
+    fingerprint_sample_rows = backend.cache.fingerprint_sample_rows
+    dataset = wrap(dataset, fingerprint_sample_rows)
+    training_set = wrap(training_set, fingerprint_sample_rows)
+    validation_set = wrap(validation_set, fingerprint_sample_rows)
+    test_set = wrap(test_set, fingerprint_sample_rows)
 
     try:
         lock_path = backend.cache.get_cache_directory(dataset)
@@ -2299,12 +2519,11 @@ def preprocess_for_prediction(
     # expensive to recombine, requiring further caching.
     cached = False
 
-    dataset = wrap(dataset)
-    cache = backend.cache.get_dataset_cache(config, dataset)
-    dataset = dataset.unwrap()
-
+    dataset = wrap(dataset, backend.cache.fingerprint_sample_rows)
     training_set = test_set = validation_set = None
     if data_format in CACHEABLE_FORMATS and split != FULL:
+        # Only look up the cache when it can be used, as computing its key requires the checksum of the dataset.
+        cache = backend.cache.get_dataset_cache(config, dataset)
         with backend.storage.cache.use_credentials():
             cache_results = cache.get()
             if cache_results is not None:
@@ -2315,6 +2534,7 @@ def preprocess_for_prediction(
                     config["data_hdf5_fp"] = training_set
                     data_format = backend.cache.data_format
                     cached = True
+    dataset = dataset.unwrap()
 
     data_format_processor = get_from_registry(data_format, data_format_preprocessor_registry)
     if cached:
@@ -174,7 +174,7 @@ def format_input_with_prompt(
             template = DEFAULT_ZERO_SHOT_PROMPT_TEMPLATE
 
     # ensure that the prompt template has all required fields
-    template_fields, field_to_dtype = _get_template_fields(template)
+    template_fields, field_to_dtype = get_template_fields(template)
     try:
         _validate_prompt_template(template_fields, task_str, is_few_shot, dataset_df.columns, input_col_name)
     except ValueError as e:
@@ -225,7 +225,7 @@ def _validate_prompt_template(
         )
 
 
-def _get_template_fields(template: str) -> Tuple[Set[str], Dict[str, Type]]:
+def get_template_fields(template: str) -> Tuple[Set[str], Dict[str, Type]]:
     """Returns the fields in the template."""
     parsed = [t for t in string.Formatter().parse(template) if t[1] is not None]
     field_set = {field for _, field, _, _ in parsed}
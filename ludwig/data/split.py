@@ -19,7 +19,6 @@ from typing import List, Optional, Tuple, TYPE_CHECKING
 from zlib import crc32
 
 import numpy as np
-from sklearn.model_selection import train_test_split
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.backend.base import Backend
@@ -166,6 +165,8 @@ def stratify_split_dataframe(
     frac_train, frac_val, frac_test = probabilities
 
     def _safe_stratify(df, column, test_size):
+        from sklearn.model_selection import train_test_split
+
         # Get the examples with cardinality of 1
         df_cadinalities = df.groupby(column)[column].size()
         low_cardinality_elems = df_cadinalities.loc[lambda x: x == 1]
@@ -0,0 +1,211 @@
+#! /usr/bin/env python
+# Copyright (c) 2023 Predibase, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Fused, mergeable column statistics for preprocessing.
+
+Instead of every feature (and every fill strategy) scanning its column separately, a `StatisticsPlan` collects the
+aggregations required for each column up front. `compute_statistics` then computes all of them in one pass over the
+data: a partial `ColumnStatistics` is built for each partition of every planned column, and partials are merged
+pairwise. On the pandas engine the whole column is a single partition, so results are identical to computing each
+aggregation directly.
+"""
+import math
+from typing import Dict, Iterable, Set
+
+import numpy as np
+import pandas as pd
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.utils.types import Series
+
+# Counts of each distinct raw value, most frequent first (NaNs excluded).
+VALUE_COUNTS = "value_counts"
+# Counts of each distinct value after stripping whitespace, most frequent first.
+STRIPPED_VALUE_COUNTS = "stripped_value_counts"
+# Mean of the column cast to float64 (NaNs excluded).
+MEAN = "mean"
+# Count, mean and sample standard deviation of the column cast to float32.
+FLOAT32_MOMENTS = "float32_moments"
+# Min and max of the column cast to float32.
+FLOAT32_MIN_MAX = "float32_min_max"
+
+AGGREGATIONS = {VALUE_COUNTS, STRIPPED_VALUE_COUNTS, MEAN, FLOAT32_MOMENTS, FLOAT32_MIN_MAX}
+
+
+def _merge_value_counts(a: pd.Series, b: pd.Series) -> pd.Series:
+    merged = a.add(b, fill_value=0).astype(np.int64)
+    return merged.sort_values(ascending=False, kind="stable")
+
+
+@DeveloperAPI
+def strip_value_counts(value_counts: pd.Series) -> pd.Series:
+    """Returns the counts of the values stripped of whitespace, most frequent first, given the raw value counts.
+
+    Stripping the distinct values rather than every row keeps the cost proportional to the number of distinct values.
+    """
+    stripped = value_counts.copy()
+    stripped.index = value_counts.index.str.strip()
+    stripped = stripped.groupby(level=0, sort=False).sum()
+    return stripped.sort_values(ascending=False, kind="stable")
+
+
+def _merge_means(n_a: int, mean_a: float, n_b: int, mean_b: float):
+    # Partials without any value (e.g., empty or all-NaN partitions) have a NaN mean, which would poison the weighted
+    # average even with a weight of 0.
+    if n_a == 0:
+        return n_b, mean_b
+    if n_b == 0:
+        return n_a, mean_a
+    n = n_a + n_b
+    return n, (mean_a * n_a + mean_b * n_b) / n
+
+
+def _merge_moments(n_a: int, mean_a: float, std_a: float, n_b: int, mean_b: float, std_b: float):
+    # Chan et al. parallel update of (count, mean, M2), with M2 recovered from the sample standard deviation.
+    n = n_a + n_b
+    if n_a == 0:
+        return n_b, mean_b, std_b
+    if n_b == 0:
+        return n_a, mean_a, std_a
+    m2_a = float(std_a) ** 2 * (n_a - 1) if n_a > 1 else 0.0
+    m2_b = float(std_b) ** 2 * (n_b - 1) if n_b > 1 else 0.0
+    delta = float(mean_b) - float(mean_a)
+    mean = float(mean_a) + delta * n_b / n
+    m2 = m2_a + m2_b + delta**2 * n_a * n_b / n
+    std = math.sqrt(m2 / (n - 1)) if n > 1 else float("nan")
+    return n, mean, std
+
+
+@DeveloperAPI
+class ColumnStatistics:
+    """Partial (mergeable) statistics over one column.
+
+    Only the aggregations that were requested are populated. Access to an aggregation that was not computed raises
+    a `KeyError` rather than silently returning a wrong value.
+    """
+
+    def __init__(self, aggregations: Iterable[str]):
+        self.aggregations = frozenset(aggregations)
+        self._values = {}
+
+    @classmethod
+    def from_series(cls, series: pd.Series, aggregations: Iterable[str]) -> "ColumnStatistics":
+        stats = cls(aggregations)
+        if VALUE_COUNTS in stats.aggregations or STRIPPED_VALUE_COUNTS in stats.aggregations:
+            value_counts = series.value_counts()
+            if VALUE_COUNTS in stats.aggregations:
+                stats._values[VALUE_COUNTS] = value_counts
+            if STRIPPED_VALUE_COUNTS in stats.aggregations:
+                stats._values[STRIPPED_VALUE_COUNTS] = strip_value_counts(value_counts)
+        if MEAN in stats.aggregations:
+            as_float = series.astype(float)
+            stats._values[MEAN] = (int(as_float.count()), as_float.mean())
+        if FLOAT32_MOMENTS in stats.aggregations or FLOAT32_MIN_MAX in stats.aggregations:
+            as_float32 = series.astype(np.float32)
+            if FLOAT32_MOMENTS in stats.aggregations:
+                stats._values[FLOAT32_MOMENTS] = (int(as_float32.count()), as_float32.mean(), as_float32.std())
+            if FLOAT32_MIN_MAX in stats.aggregations:
+                stats._values[FLOAT32_MIN_MAX] = (as_float32.min(), as_float32.max())
+        return stats
+
+    def merge(self, other: "ColumnStatistics") -> "ColumnStatistics":
+        assert self.aggregations == other.aggregations, "Cannot merge statistics with different aggregations"
+        merged = ColumnStatistics(self.aggregations)
+        for key in (VALUE_COUNTS, STRIPPED_VALUE_COUNTS):
+            if key in self._values:
+                merged._values[key] = _merge_value_counts(self._values[key], other._values[key])
+        if MEAN in self._values:
+            merged._values[MEAN] = _merge_means(*self._values[MEAN], *other._values[MEAN])
+        if FLOAT32_MOMENTS in self._values:
+            n, mean, std = _merge_moments(*self._values[FLOAT32_MOMENTS], *other._values[FLOAT32_MOMENTS])
+            merged._values[FLOAT32_MOMENTS] = (n, np.float32(mean), np.float32(std))
+        if FLOAT32_MIN_MAX in self._values:
+            (min_a, max_a), (min_b, max_b) = self._values[FLOAT32_MIN_MAX], other._values[FLOAT32_MIN_MAX]
+            merged._values[FLOAT32_MIN_MAX] = (np.nanmin([min_a, min_b]), np.nanmax([max_a, max_b]))
+        return merged
+
+    def value_counts(self) -> pd.Series:
+        return self._values[VALUE_COUNTS]
+
+    def stripped_value_counts(self) -> pd.Series:
+        return self._values[STRIPPED_VALUE_COUNTS]
+
+    @property
+    def mode(self):
+        return self._values[VALUE_COUNTS].index[0]
+
+    @property
+    def float_mean(self) -> float:
+        return self._values[MEAN][1]
+
+    @property
+    def mean(self) -> np.float32:
+        return self._values[FLOAT32_MOMENTS][1]
+
+    @property
+    def std(self) -> np.float32:
+        return self._values[FLOAT32_MOMENTS][2]
+
+    @property
+    def min(self) -> np.float32:
+        return self._values[FLOAT32_MIN_MAX][0]
+
+    @property
+    def max(self) -> np.float32:
+        return self._values[FLOAT32_MIN_MAX][1]
+
+
+@DeveloperAPI
+class StatisticsPlan:
+    """Collects the aggregations needed for each column before any of them are computed."""
+
+    def __init__(self):
+        self.column_aggregations: Dict[str, Set[str]] = {}
+
+    def request(self, column: str, aggregations: Iterable[str]) -> None:
+        aggregations = set(aggregations)
+        unknown = aggregations - AGGREGATIONS
+        if unknown:
+            raise ValueError(f"Unknown aggregations {unknown}, expected a subset of {AGGREGATIONS}")
+        if aggregations:
+            self.column_aggregations.setdefault(column, set()).update(aggregations)
+
+    def __bool__(self) -> bool:
+        return bool(self.column_aggregations)
+
+
+@DeveloperAPI
+def compute_statistics(plan: StatisticsPlan, dataset_cols: Dict[str, Series], backend) -> Dict[str, ColumnStatistics]:
+    """Computes every aggregation in the plan in a single pass over the data.
+
+    Returns:
+        Dict of column name to the computed `ColumnStatistics`.
+    """
+    if not plan:
+        return {}
+
+    column_aggregations = dict(plan.column_aggregations)
+    cols = {column: dataset_cols[column] for column in column_aggregations}
+
+    def partition_fn(partition_cols: Dict[str, pd.Series]) -> Dict[str, ColumnStatistics]:
+        return {
+            column: ColumnStatistics.from_series(series, column_aggregations[column])
+            for column, series in partition_cols.items()
+        }
+
+    def merge_fn(a: Dict[str, ColumnStatistics], b: Dict[str, ColumnStatistics]) -> Dict[str, ColumnStatistics]:
+        return {column: a[column].merge(b[column]) for column in a}
+
+    return backend.df_engine.reduce_partitions(cols, partition_fn, merge_fn)
@@ -1,14 +1,48 @@
-from typing import Dict, List, Type, Union
+import importlib
+from typing import Dict, Iterable, List, Type, Union
 
 from ludwig.api_annotations import DeveloperAPI
+from ludwig.constants import (
+    BINARY,
+    CATEGORY,
+    CATEGORY_DISTRIBUTION,
+    IMAGE,
+    NUMBER,
+    SEQUENCE,
+    SET,
+    TEXT,
+    TIMESERIES,
+    VECTOR,
+)
 from ludwig.decoders.base import Decoder
 from ludwig.utils.registry import Registry
 
 _decoder_registry = Registry()
 
+# Modules registering the built-in decoders of each feature type, imported the first time decoders for the feature type
+# are looked up (see `ludwig.encoders.registry`).
+_DECODER_MODULES = {
+    BINARY: ["ludwig.decoders.generic_decoders"],
+    CATEGORY: ["ludwig.decoders.generic_decoders", "ludwig.decoders.llm_decoders"],
+    CATEGORY_DISTRIBUTION: ["ludwig.decoders.generic_decoders"],
+    IMAGE: ["ludwig.decoders.image_decoders"],
+    NUMBER: ["ludwig.decoders.generic_decoders"],
+    SEQUENCE: ["ludwig.decoders.sequence_decoders", "ludwig.decoders.sequence_tagger"],
+    SET: ["ludwig.decoders.generic_decoders"],
+    TEXT: ["ludwig.decoders.llm_decoders", "ludwig.decoders.sequence_decoders", "ludwig.decoders.sequence_tagger"],
+    TIMESERIES: ["ludwig.decoders.generic_decoders"],
+    VECTOR: ["ludwig.decoders.generic_decoders"],
+}
+
+
+def _import_modules(modules: Iterable[str]):
+    for module in modules:
+        importlib.import_module(module)
+
 
 @DeveloperAPI
 def get_decoder_registry() -> Registry:
+    _import_modules({module for modules in _DECODER_MODULES.values() for module in modules})
     return _decoder_registry
 
 
@@ -19,9 +53,9 @@ def register_decoder(name: str, features: Union[str, List[str]]):
 
     def wrap(cls):
         for feature in features:
-            feature_registry = get_decoder_registry().get(feature, {})
+            feature_registry = _decoder_registry.get(feature, {})
             feature_registry[name] = cls
-            get_decoder_registry()[feature] = feature_registry
+            _decoder_registry[feature] = feature_registry
         return cls
 
     return wrap
@@ -29,9 +63,10 @@ def register_decoder(name: str, features: Union[str, List[str]]):
 
 @DeveloperAPI
 def get_decoder_cls(feature: str, name: str) -> Type[Decoder]:
-    return get_decoder_registry()[feature][name]
+    return get_decoder_classes(feature)[name]
 
 
 @DeveloperAPI
 def get_decoder_classes(feature: str) -> Dict[str, Type[Decoder]]:
-    return get_decoder_registry()[feature]
+    _import_modules(_DECODER_MODULES.get(feature, []))
+    return _decoder_registry[feature]
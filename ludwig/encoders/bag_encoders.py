@@ -102,8 +102,9 @@ class BagEmbedWeightedEncoder(Encoder):
 
     def forward(self, inputs: torch.Tensor) -> EncoderOutputDict:
         """
-        :param inputs: The inputs fed into the encoder.
-               Shape: [batch x vocab size], type torch.int32
+        :param inputs: The inputs fed into the encoder, the indices of the tokens of each bag padded with -1,
+               followed by their counts.
+               Shape: [batch x 2 x max_set_size], type torch.int32
 
         :param return: embeddings of shape [batch x embed size], type torch.float32
         """
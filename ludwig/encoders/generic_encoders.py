@@ -19,7 +19,7 @@ from typing import Optional, Type
 import torch
 
 from ludwig.api_annotations import DeveloperAPI
-from ludwig.constants import BINARY, ENCODER_OUTPUT, NUMBER, TEXT, TIMESERIES, VECTOR
+from ludwig.constants import BINARY, ENCODER_OUTPUT, NUMBER, TIMESERIES, VECTOR
 from ludwig.encoders.base import Encoder
 from ludwig.encoders.registry import register_encoder
 from ludwig.encoders.types import EncoderOutputDict
@@ -30,7 +30,8 @@ logger = logging.getLogger(__name__)
 
 
 @DeveloperAPI
-@register_encoder("passthrough", [BINARY, NUMBER, TEXT, VECTOR])
+# Text features use the sequence passthrough encoder.
+@register_encoder("passthrough", [BINARY, NUMBER, VECTOR])
 class PassthroughEncoder(Encoder):
     def __init__(self, input_size=1, encoder_config=None, **kwargs):
         super().__init__()
@@ -1,26 +1,69 @@
-from typing import Dict, List, Type, Union
+import importlib
+from typing import Dict, Iterable, List, Type, Union
 
 from ludwig.api_annotations import DeveloperAPI
+from ludwig.constants import (
+    AUDIO,
+    BAG,
+    BINARY,
+    CATEGORY,
+    DATE,
+    H3,
+    IMAGE,
+    NUMBER,
+    SEQUENCE,
+    SET,
+    TEXT,
+    TIMESERIES,
+    VECTOR,
+)
 from ludwig.encoders.base import Encoder
 from ludwig.utils.registry import Registry
 
 _encoder_registry = Registry()
 _sequence_encoder_registry = Registry()
 
+# Modules registering the built-in encoders of each feature type. They are only imported once encoders for the feature
+# type are looked up, so that heavy dependencies like torchvision or transformers are not imported by configs that
+# don't use image or text features.
+_ENCODER_MODULES = {
+    AUDIO: ["ludwig.encoders.sequence_encoders"],
+    BAG: ["ludwig.encoders.bag_encoders"],
+    BINARY: ["ludwig.encoders.generic_encoders"],
+    CATEGORY: ["ludwig.encoders.category_encoders"],
+    DATE: ["ludwig.encoders.date_encoders"],
+    H3: ["ludwig.encoders.h3_encoders"],
+    IMAGE: ["ludwig.encoders.image.base", "ludwig.encoders.image.torchvision"],
+    NUMBER: ["ludwig.encoders.generic_encoders"],
+    SEQUENCE: ["ludwig.encoders.sequence_encoders"],
+    SET: ["ludwig.encoders.set_encoders"],
+    TEXT: ["ludwig.encoders.sequence_encoders", "ludwig.encoders.text_encoders"],
+    TIMESERIES: ["ludwig.encoders.generic_encoders", "ludwig.encoders.sequence_encoders"],
+    VECTOR: ["ludwig.encoders.generic_encoders"],
+}
+_SEQUENCE_ENCODER_MODULES = ["ludwig.encoders.sequence_encoders"]
+
+
+def _import_modules(modules: Iterable[str]):
+    for module in modules:
+        importlib.import_module(module)
+
 
 @DeveloperAPI
 def get_encoder_registry() -> Registry:
+    _import_modules({module for modules in _ENCODER_MODULES.values() for module in modules})
     return _encoder_registry
 
 
 @DeveloperAPI
 def get_sequence_encoder_registry() -> Registry:
+    _import_modules(_SEQUENCE_ENCODER_MODULES)
     return _sequence_encoder_registry
 
 
 def register_sequence_encoder(name: str):
     def wrap(cls):
-        get_sequence_encoder_registry()[name] = cls
+        _sequence_encoder_registry[name] = cls
         return cls
 
     return wrap
@@ -30,22 +73,20 @@ def register_encoder(name: str, features: Union[str, List[str]]):
     if isinstance(features, str):
         features = [features]
 
-    def update_registry(registry_getter_fn, cls, feature):
-        feature_registry = registry_getter_fn().get(feature, {})
-        feature_registry[name] = cls
-        registry_getter_fn()[feature] = feature_registry
-
     def wrap(cls):
         for feature in features:
-            update_registry(get_encoder_registry, cls, feature)
+            feature_registry = _encoder_registry.get(feature, {})
+            feature_registry[name] = cls
+            _encoder_registry[feature] = feature_registry
         return cls
 
     return wrap
 
 
 def get_encoder_cls(feature: str, name: str) -> Type[Encoder]:
-    return get_encoder_registry()[feature][name]
+    return get_encoder_classes(feature)[name]
 
 
 def get_encoder_classes(feature: str) -> Dict[str, Type[Encoder]]:
-    return get_encoder_registry()[feature]
+    _import_modules(_ENCODER_MODULES.get(feature, []))
+    return _encoder_registry[feature]
@@ -93,11 +93,11 @@ class SetSparseEncoder(Encoder):
     def forward(self, inputs: torch.Tensor) -> EncoderOutputDict:
         """
         Params:
-            inputs: The inputs fed into the encoder.
-                    Shape: [batch x vocab_size], type tf.int32.
+            inputs: The inputs fed into the encoder, the indices of the items of each set padded with -1.
+                    Shape: [batch x max_set_size], type torch.int32.
 
         Returns:
-            Embeddings of shape [batch x vocab_size x embed size], type float32.
+            Embeddings of shape [batch x output size], type float32.
         """
         hidden = self.embed(inputs)
         hidden = self.fc_stack(hidden)
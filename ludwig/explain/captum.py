@@ -17,6 +17,7 @@ from tqdm import tqdm
 from ludwig.api import LudwigModel
 from ludwig.api_annotations import PublicAPI
 from ludwig.constants import (
+    BAG,
     BINARY,
     CATEGORY,
     DATE,
@@ -43,7 +44,7 @@ logger = logging.getLogger(__name__)
 
 # These types as provided as integer values and passed through an embedding layer that breaks integrated gradients.
 # As such, we need to take care to encode them before handing them to the explainer.
-EMBEDDED_TYPES = {SEQUENCE, TEXT, CATEGORY, SET, DATE}
+EMBEDDED_TYPES = {SEQUENCE, TEXT, CATEGORY, SET, BAG, DATE}
 
 
 @dataclass
@@ -362,6 +363,9 @@ def get_baseline(model: LudwigModel, sample_encoded: List[Variable]) -> List[tor
             # If an unknown is defined, use that as the baseline index, else use the most popular token
             baseline_tok_idx = metadata["str2idx"].get(UNKNOWN_SYMBOL, most_popular_tok_idx)
             baseline = torch.tensor(baseline_tok_idx, device=DEVICE)
+        elif feature.type() in {SET, BAG} and metadata.get("sparse", False):
+            # The empty set, as item indices are padded with -1.
+            baseline = torch.full_like(sample_input[0], -1, device=DEVICE)
         elif feature.type() == IMAGE:
             baseline = torch.zeros_like(sample_input[0], device=DEVICE)
         else:
@@ -13,11 +13,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import functools
 import logging
 import os
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import torch
 import torchaudio
 from packaging import version
@@ -30,6 +33,7 @@ from ludwig.types import FeatureMetadataDict, ModelConfigDict, PreprocessingConf
 from ludwig.utils.audio_utils import (
     calculate_mean,
     calculate_var,
+    get_batched_2D_features,
     get_default_audio,
     get_fbank,
     get_group_delay,
@@ -43,14 +47,20 @@ from ludwig.utils.audio_utils import (
     read_audio_from_path,
 )
 from ludwig.utils.data_utils import get_abs_path
-from ludwig.utils.fs_utils import has_remote_protocol
+from ludwig.utils.fs_utils import get_bytes_obj_from_path, has_remote_protocol
 from ludwig.utils.misc_utils import set_default_value
-from ludwig.utils.types import TorchscriptPreprocessingInput
+from ludwig.utils.types import TorchAudioTuple, TorchscriptPreprocessingInput
 
 logger = logging.getLogger(__name__)
 
 _TORCH_200 = version.parse(torch.__version__) >= version.parse("2.0.0")
 
+# Number of audio files featurized by each task of the worker pool.
+AUDIO_CHUNK_SIZE = 256
+
+# Maximum number of samples, including padding, of a batch of audio files transformed together.
+AUDIO_BATCH_NUM_SAMPLES = 2**20
+
 
 class _AudioPreprocessing(torch.nn.Module):
     audio_feature_dict: Dict[str, Union[float, int, str]]
@@ -151,7 +161,20 @@ class AudioFeatureMixin(BaseFeatureMixin):
         normalization_type,
         audio_file_length_limit_in_s,
         backend,
+        num_processes=None,
     ):
+        if not backend.df_engine.partitioned:
+            return AudioFeatureMixin._process_in_memory_local(
+                column,
+                audio_feature_dict,
+                feature_dim,
+                max_length,
+                padding_value,
+                normalization_type,
+                audio_file_length_limit_in_s,
+                num_processes,
+            )
+
         df_engine = backend.df_engine
         if _TORCH_200:
             # Read audio from path if the version of torch is >= 2.0.0.
@@ -197,6 +220,100 @@ class AudioFeatureMixin(BaseFeatureMixin):
             return merged_stats
 
         merged_stats = df_engine.reduce_objects(audio_stats, reduce)
+        AudioFeatureMixin._log_stats(merged_stats, audio_file_length_limit_in_s)
+        return processed_audio
+
+    @staticmethod
+    def _process_in_memory_local(
+        column,
+        audio_feature_dict,
+        feature_dim,
+        max_length,
+        padding_value,
+        normalization_type,
+        audio_file_length_limit_in_s,
+        num_processes=None,
+    ):
+        """Decodes, featurizes and gathers the stats of the audio files in a single pass over chunks of the column,
+        on a pool of `num_processes` worker processes (one per CPU by default).
+
+        Workers return padded features rather than waveforms, which are written straight into one preallocated
+        [num_files x max_length x feature_dim] array, whose rows make up the returned column.
+        """
+        entries = column.tolist()
+        features = np.empty((len(entries), max_length, feature_dim), dtype=np.float32)
+        chunks = [
+            (start, entries[start : start + AUDIO_CHUNK_SIZE]) for start in range(0, len(entries), AUDIO_CHUNK_SIZE)
+        ]
+        featurize = functools.partial(
+            _featurize_audio_chunk,
+            audio_feature_dict=audio_feature_dict,
+            feature_dim=feature_dim,
+            max_length=max_length,
+            padding_value=padding_value,
+            normalization_type=normalization_type,
+            max_length_in_s=audio_file_length_limit_in_s,
+        )
+
+        num_processes = min(num_processes or os.cpu_count() or 1, len(chunks))
+        executor = None
+        if num_processes > 1:
+            executor = ProcessPoolExecutor(max_workers=num_processes, initializer=_init_audio_worker)
+            results = executor.map(featurize, [chunk for _, chunk in chunks])
+        else:
+            results = (featurize(chunk, out=features[start : start + len(chunk)]) for start, chunk in chunks)
+
+        merged_stats = None
+        failed_indices = []
+        default_audio_sum, sampling_rate_sum, num_audio_files = None, 0, 0
+        try:
+            for (start, _), result in zip(chunks, results):
+                if executor is not None:
+                    features[start : start + len(result.features)] = result.features
+                failed_indices.extend(start + i for i in result.failed_indices)
+                if result.num_audio_files == 0:
+                    continue
+                if merged_stats is None:
+                    merged_stats = result.stats
+                    default_audio_sum = result.default_audio_sum
+                else:
+                    AudioFeatureMixin._merge_stats(merged_stats, result.stats)
+                    default_audio_sum = default_audio_sum + result.default_audio_sum
+                sampling_rate_sum += result.sampling_rate_sum
+                num_audio_files += result.num_audio_files
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if num_audio_files == 0:
+            raise RuntimeError("Unable to process audio files provided: none of the audio files could be read.")
+
+        if failed_indices:
+            # Same default as get_default_audio: the mean of the audio files, cropped or padded to a fixed length.
+            default_audio = (
+                default_audio_sum / num_audio_files,
+                calculate_mean(sampling_rate_sum, num_audio_files),
+            )
+            features[failed_indices] = AudioFeatureMixin._transform_to_feature(
+                audio=default_audio[0],
+                sampling_rate_in_hz=default_audio[1],
+                audio_feature_dict=audio_feature_dict,
+                feature_dim=feature_dim,
+                max_length=max_length,
+                padding_value=padding_value,
+                normalization_type=normalization_type,
+            ).numpy()
+            default_stats = AudioFeatureMixin._get_stats(
+                default_audio[0], default_audio[1], audio_file_length_limit_in_s
+            )
+            for _ in failed_indices:
+                AudioFeatureMixin._merge_stats(merged_stats, default_stats)
+
+        AudioFeatureMixin._log_stats(merged_stats, audio_file_length_limit_in_s)
+        return pd.Series(list(features), index=column.index)
+
+    @staticmethod
+    def _log_stats(merged_stats, audio_file_length_limit_in_s):
         merged_stats["mean"] = calculate_mean(merged_stats["sum"], merged_stats["count"])
         merged_stats["var"] = calculate_var(merged_stats["sum"], merged_stats["sum2"], merged_stats["count"])
         merged_stats["std"] = np.sqrt(merged_stats["var"] / float(merged_stats["count"]))
@@ -219,7 +336,6 @@ class AudioFeatureMixin(BaseFeatureMixin):
             audio_file_length_limit_in_s,
         )
         logger.debug(print_statistics)
-        return processed_audio
 
     @staticmethod
     def _transform_to_feature(
@@ -405,6 +521,7 @@ class AudioFeatureMixin(BaseFeatureMixin):
                 normalization_type,
                 audio_file_length_limit_in_s,
                 backend,
+                num_processes=preprocessing_parameters.get("num_processes"),
             )
             proc_df[feature_config[PROC_COLUMN]] = audio_features
 
@@ -437,6 +554,140 @@ class AudioFeatureMixin(BaseFeatureMixin):
             raise ValueError(f"{feature_type} is not recognized.")
 
 
+class AudioChunkResult(NamedTuple):
+    """Features of a chunk of audio files, with what is needed to stand in for the files that could not be read."""
+
+    features: np.ndarray
+    failed_indices: List[int]
+    stats: Optional[Dict[str, float]]
+    default_audio_sum: Optional[torch.Tensor]
+    sampling_rate_sum: int
+    num_audio_files: int
+
+
+def _init_audio_worker():
+    # Workers already run in parallel, intra-op parallelism would only oversubscribe the CPUs.
+    torch.set_num_threads(1)
+
+
+def _read_audio(entry) -> Optional[TorchAudioTuple]:
+    if is_torch_audio_tuple(entry):
+        return entry
+    if isinstance(entry, str):
+        if _TORCH_200 and not has_remote_protocol(entry):
+            return read_audio_from_path(entry)
+        entry = get_bytes_obj_from_path(entry)
+    if isinstance(entry, bytes):
+        return read_audio_from_bytes_obj(entry)
+    return None
+
+
+def _featurize_audio_chunk(
+    entries: List[Any],
+    audio_feature_dict: Dict[str, Union[float, int, str]],
+    feature_dim: int,
+    max_length: int,
+    padding_value: float,
+    normalization_type: Optional[str],
+    max_length_in_s: float,
+    out: Optional[np.ndarray] = None,
+) -> AudioChunkResult:
+    """Reads and featurizes a chunk of audio files (paths, bytes or (waveform, sampling rate) tuples), into `out` if
+    given.
+
+    The spectrogram based features are computed in batches of files of similar length and sampling rate.
+    """
+    if out is None:
+        out = np.empty((len(entries), max_length, feature_dim), dtype=np.float32)
+    features = out
+    features.fill(padding_value)
+    failed_indices = []
+    stats = None
+    default_audio_sum = None
+    sampling_rate_sum = 0
+    clips = []
+    for i, entry in enumerate(entries):
+        audio = _read_audio(entry)
+        if not is_torch_audio_tuple(audio):
+            failed_indices.append(i)
+            continue
+        waveform, sampling_rate_in_hz = audio
+        audio_stats = AudioFeatureMixin._get_stats(waveform, sampling_rate_in_hz, max_length_in_s)
+        if stats is None:
+            stats = audio_stats
+            default_audio_sum = get_default_audio([audio])[0]
+        else:
+            AudioFeatureMixin._merge_stats(stats, audio_stats)
+            default_audio_sum += get_default_audio([audio])[0]
+        sampling_rate_sum += sampling_rate_in_hz
+        clips.append((i, waveform, sampling_rate_in_hz))
+
+    def write(i: int, audio_feature: torch.Tensor):
+        if audio_feature.shape[0] == 0:
+            # Audio shorter than a window has no frames, its features are all padding.
+            return
+        if normalization_type == "per_file":
+            mean = torch.mean(audio_feature, dim=0)
+            std = torch.std(audio_feature, dim=0)
+            audio_feature = torch.divide((audio_feature - mean), std + 1.0e-10)
+        elif normalization_type == "global":
+            raise ValueError("not implemented yet")
+        audio_feature = audio_feature[:max_length]
+        features[i, : audio_feature.shape[0]] = audio_feature.numpy()
+
+    feature_type = str(audio_feature_dict[TYPE])
+    if feature_type == "raw":
+        for i, waveform, _ in clips:
+            write(i, torch.unsqueeze(waveform[0], dim=-1))
+    elif feature_type in ["stft", "stft_phase", "group_delay", "fbank"]:
+        # Only per file normalization needs the frames past max_length.
+        max_num_frames = max_length if normalization_type is None else None
+        for batch in _batch_by_length(clips):
+            sampling_rate_in_hz = batch[0][2]
+            window_length_in_samp = get_length_in_samp(audio_feature_dict["window_length_in_s"], sampling_rate_in_hz)
+            num_fft_points = audio_feature_dict.get("num_fft_points", window_length_in_samp)
+            if num_fft_points < window_length_in_samp:
+                raise ValueError(
+                    "num_fft_points: {} < window length in "
+                    "samples: {} (corresponds to window length"
+                    " in s: {}".format(num_fft_points, audio_feature_dict["window_length_in_s"], window_length_in_samp)
+                )
+            batch_features = get_batched_2D_features(
+                [waveform[0] for _, waveform, _ in batch],
+                feature_type,
+                sampling_rate_in_hz,
+                audio_feature_dict["window_length_in_s"],
+                audio_feature_dict["window_shift_in_s"],
+                int(num_fft_points),
+                audio_feature_dict.get("window_type", "hamming"),
+                num_filter_bands=audio_feature_dict.get("num_filter_bands"),
+                max_num_frames=max_num_frames,
+            )
+            for (i, _, _), audio_feature in zip(batch, batch_features):
+                write(i, audio_feature)
+    else:
+        raise ValueError(f"{feature_type} is not recognized.")
+
+    return AudioChunkResult(features, failed_indices, stats, default_audio_sum, sampling_rate_sum, len(clips))
+
+
+def _batch_by_length(clips: List[Tuple[int, torch.Tensor, int]]) -> List[List[Tuple[int, torch.Tensor, int]]]:
+    """Groups the clips of the same sampling rate into batches of similar length, so that little compute is spent on
+    padding, each holding at most AUDIO_BATCH_NUM_SAMPLES samples once padded."""
+    batches = []
+    batch = []
+    for clip in sorted(clips, key=lambda clip: (clip[2], clip[1].shape[-1])):
+        # Sorted by length, so the padded size of the batch is given by the clip being added.
+        padded_num_samples = (len(batch) + 1) * clip[1].shape[-1]
+        if batch and (clip[2] != batch[0][2] or padded_num_samples > AUDIO_BATCH_NUM_SAMPLES):
+            batches.append(batch)
+            batch = []
+        batch.append(clip)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 class AudioInputFeature(AudioFeatureMixin, SequenceInputFeature):
     def __init__(self, input_feature_config: AudioInputFeatureConfig, encoder_obj=None, **kwargs):
         super().__init__(input_feature_config, encoder_obj=encoder_obj, **kwargs)
@@ -22,7 +22,7 @@ import torch
 from ludwig.constants import BAG, COLUMN, NAME, PROC_COLUMN
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature
 from ludwig.features.feature_utils import set_str_to_idx
-from ludwig.features.set_feature import _SetPreprocessing
+from ludwig.features.set_feature import _SetPreprocessing, sample_sparse_set, to_sparse_set
 from ludwig.schema.features.bag_feature import BagInputFeatureConfig
 from ludwig.types import FeatureMetadataDict, ModelConfigDict, PreprocessingConfigDict, TrainingSetMetadataDict
 from ludwig.utils.strings_utils import create_vocabulary
@@ -60,10 +60,14 @@ class BagFeatureMixin(BaseFeatureMixin):
             "str2freq": vocabulary.str2freq,
             "vocab_size": len(vocabulary.str2idx),
             "max_set_size": vocabulary.max_sequence_length,
+            "sparse": is_input_feature,
         }
 
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters: PreprocessingConfigDict, backend):
+        if metadata.get("sparse", False):
+            return backend.df_engine.map_objects(column, lambda x: to_sparse_set(x, metadata, preprocessing_parameters))
+
         def to_vector(set_str):
             bag_vector = np.zeros((len(metadata["str2idx"]),), dtype=np.float32)
             col_counter = Counter(set_str_to_idx(set_str, metadata["str2idx"], preprocessing_parameters["tokenizer"]))
@@ -109,10 +113,26 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
 
         return encoder_output
 
+    @property
+    def input_dtype(self):
+        if self.encoder_obj.config.max_set_size is not None:
+            return torch.int32
+        return super().input_dtype
+
     @property
     def input_shape(self) -> torch.Size:
+        if self.encoder_obj.config.max_set_size is not None:
+            return torch.Size([2, self.encoder_obj.config.max_set_size])
         return torch.Size([len(self.encoder_obj.config.vocab)])
 
+    def create_sample_input(self, batch_size: int = 2):
+        if self.encoder_obj.config.max_set_size is None:
+            return super().create_sample_input(batch_size)
+        config = self.encoder_obj.config
+        indices = sample_sparse_set(batch_size, config.max_set_size, len(config.vocab))
+        counts = torch.where(indices >= 0, torch.randint_like(indices, 1, 5), indices)
+        return torch.stack([indices, counts], dim=1)
+
     @property
     def output_shape(self) -> torch.Size:
         return self.encoder_obj.output_shape
@@ -120,6 +140,8 @@ class BagInputFeature(BagFeatureMixin, InputFeature):
     @staticmethod
     def update_config_with_metadata(feature_config, feature_metadata, *args, **kwargs):
         feature_config.encoder.vocab = feature_metadata["idx2str"]
+        if feature_metadata.get("sparse", False):
+            feature_config.encoder.max_set_size = max(feature_metadata["max_set_size"], 1)
 
     @staticmethod
     def get_schema_cls():
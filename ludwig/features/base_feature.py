@@ -15,11 +15,13 @@
 import logging
 from abc import ABC, abstractmethod, abstractstaticmethod
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 import torch
 from torch import Tensor
 
+# The config schema must be imported before the loss and metric modules, which depend on each other through it.
+import ludwig.schema  # noqa: F401
 from ludwig.constants import (
     ENCODER_OUTPUT,
     ENCODER_OUTPUT_STATE,
@@ -93,6 +95,16 @@ class BaseFeatureMixin(ABC):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def required_statistics(preprocessing_parameters: PreprocessingConfigDict) -> Set[str]:
+        """Returns the aggregations (see `ludwig.data.statistics`) this feature's `get_feature_meta` consumes.
+
+        Statistics requested by all features are computed in a single fused pass over the data, and passed to
+        `get_feature_meta` through an additional `statistics` keyword argument. Features that return an empty set
+        (the default) compute their own metadata from the column and are not passed `statistics`.
+        """
+        return set()
+
     @abstractstaticmethod
     def add_feature_data(
         feature_config: FeatureConfigDict,
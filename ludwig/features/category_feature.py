@@ -14,9 +14,10 @@
 # limitations under the License.
 # ==============================================================================
 import logging
-from typing import Any, Dict, List, Union
+from typing import Dict, List, Optional, Set, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import (
@@ -33,6 +34,7 @@ from ludwig.constants import (
     PROC_COLUMN,
     PROJECTION_INPUT,
 )
+from ludwig.data.statistics import ColumnStatistics, STRIPPED_VALUE_COUNTS
 from ludwig.error import InputDataError
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
 from ludwig.features.vector_feature import VectorFeatureMixin
@@ -144,6 +146,10 @@ class CategoryFeatureMixin(BaseFeatureMixin):
     def cast_column(column, backend):
         return column.astype(str)
 
+    @staticmethod
+    def required_statistics(preprocessing_parameters: PreprocessingConfigDict) -> Set[str]:
+        return {STRIPPED_VALUE_COUNTS}
+
     @staticmethod
     def get_feature_meta(
         config: ModelConfigDict,
@@ -151,11 +157,13 @@ class CategoryFeatureMixin(BaseFeatureMixin):
         preprocessing_parameters: PreprocessingConfigDict,
         backend,
         is_input_feature: bool,
+        statistics: Optional[ColumnStatistics] = None,
     ) -> FeatureMetadataDict:
         idx2str, str2idx, str2freq = create_vocabulary_single_token(
             column,
             num_most_frequent=preprocessing_parameters["most_common"],
             processor=backend.df_engine,
+            value_counts=statistics.stripped_value_counts() if statistics is not None else None,
         )
 
         if "vocab" in preprocessing_parameters and preprocessing_parameters["vocab"]:  # Check that vocab is non-empty
@@ -194,45 +202,43 @@ class CategoryFeatureMixin(BaseFeatureMixin):
 
     @staticmethod
     def feature_data(backend, column, metadata):
-        def __replace_token_with_idx(value: Any, metadata: TrainingSetMetadataDict, fallback_symbol_idx: int) -> int:
-            stripped_value = value.strip()
-            if stripped_value in metadata["str2idx"]:
-                return metadata["str2idx"][stripped_value]
-            logger.warning(
-                f"""
-                Encountered unknown symbol '{stripped_value}' for '{column.name}' during category
-                feature preprocessing. This should never happen during training. If this happens during
-                inference, this may be an indication that not all possible symbols were present in your
-                training set. Consider re-splitting your data to ensure full representation, or setting
-                preprocessing.most_common parameter to be smaller than this feature's total vocabulary
-                size, {len(metadata["str2idx"])}, which will ensure that the model is architected and
-                trained with an UNKNOWN symbol. Returning the index for the most frequent symbol,
-                {metadata["idx2str"][fallback_symbol_idx]}, instead.
-                """
-            )
-            return fallback_symbol_idx
-
-        # No unknown symbol in Metadata from preprocessing means that all values
-        # should be mappable to vocabulary
-        if UNKNOWN_SYMBOL not in metadata["str2idx"]:
-            # If no unknown is defined, just use the most popular token's index as the fallback index
-            most_popular_token = max(metadata["str2freq"], key=metadata["str2freq"].get)
-            most_popular_token_idx = metadata["str2idx"].get(most_popular_token)
-            return backend.df_engine.map_objects(
-                column,
-                lambda x: __replace_token_with_idx(x, metadata, most_popular_token_idx),
-                meta=(column.name, int),
-            ).astype(int_type(metadata["vocab_size"]))
+        str2idx = metadata["str2idx"]
+        if UNKNOWN_SYMBOL in str2idx:
+            fallback_symbol_idx = str2idx[UNKNOWN_SYMBOL]
         else:
-            return backend.df_engine.map_objects(
-                column,
-                lambda x: (
-                    metadata["str2idx"][x.strip()]
-                    if x.strip() in metadata["str2idx"]
-                    else metadata["str2idx"][UNKNOWN_SYMBOL]
-                ),
-                meta=(column.name, int),
-            ).astype(int_type(metadata["vocab_size"]))
+            # No unknown symbol in Metadata from preprocessing means that all values should be mappable to vocabulary.
+            # If no unknown is defined, just use the most popular token's index as the fallback index.
+            most_popular_token = max(metadata["str2freq"], key=metadata["str2freq"].get)
+            fallback_symbol_idx = str2idx.get(most_popular_token)
+
+        vocab = pd.Index(list(str2idx.keys()))
+        vocab_idx = np.fromiter(str2idx.values(), dtype=np.int64, count=len(str2idx))
+        dtype = int_type(metadata["vocab_size"])
+
+        def encode_partition(partition: pd.Series) -> pd.Series:
+            # Every distinct value is stripped and looked up in the vocabulary once, then the codes of the rows are
+            # gathered from the codes of the distinct values. Missing values get the sentinel code -1, which gathers
+            # the fallback index appended last.
+            codes, uniques = pd.factorize(partition)
+            positions = vocab.get_indexer(pd.Index(uniques).str.strip())
+            unknown = positions < 0
+            if unknown.any() and UNKNOWN_SYMBOL not in str2idx:
+                logger.warning(
+                    f"""
+                    Encountered {unknown.sum()} unknown symbols, e.g. '{uniques[unknown][0].strip()}', for
+                    '{column.name}' during category feature preprocessing. This should never happen during training.
+                    If this happens during inference, this may be an indication that not all possible symbols were
+                    present in your training set. Consider re-splitting your data to ensure full representation, or
+                    setting preprocessing.most_common parameter to be smaller than this feature's total vocabulary
+                    size, {len(str2idx)}, which will ensure that the model is architected and trained with an UNKNOWN
+                    symbol. Returning the index for the most frequent symbol,
+                    {metadata["idx2str"][fallback_symbol_idx]}, instead.
+                    """
+                )
+            unique_idx = np.append(np.where(unknown, fallback_symbol_idx, vocab_idx[positions]), fallback_symbol_idx)
+            return pd.Series(unique_idx[codes].astype(dtype), index=partition.index, name=partition.name)
+
+        return backend.df_engine.map_partitions(column, encode_partition, meta=(column.name, dtype))
 
     @staticmethod
     def add_feature_data(
@@ -258,6 +264,10 @@ class CategoryDistributionFeatureMixin(VectorFeatureMixin):
     def type():
         return CATEGORY_DISTRIBUTION
 
+    @staticmethod
+    def required_statistics(preprocessing_parameters: PreprocessingConfigDict) -> Set[str]:
+        return set()
+
     @staticmethod
     def get_feature_meta(
         config: ModelConfigDict,
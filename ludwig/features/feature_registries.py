@@ -31,85 +31,75 @@ from ludwig.constants import (
     TIMESERIES,
     VECTOR,
 )
-from ludwig.features.audio_feature import AudioFeatureMixin, AudioInputFeature
-from ludwig.features.bag_feature import BagFeatureMixin, BagInputFeature
-from ludwig.features.binary_feature import BinaryFeatureMixin, BinaryInputFeature, BinaryOutputFeature
-from ludwig.features.category_feature import (
-    CategoryDistributionFeatureMixin,
-    CategoryDistributionOutputFeature,
-    CategoryFeatureMixin,
-    CategoryInputFeature,
-    CategoryOutputFeature,
-)
-from ludwig.features.date_feature import DateFeatureMixin, DateInputFeature
-from ludwig.features.h3_feature import H3FeatureMixin, H3InputFeature
-from ludwig.features.image_feature import ImageFeatureMixin, ImageInputFeature, ImageOutputFeature
-from ludwig.features.number_feature import NumberFeatureMixin, NumberInputFeature, NumberOutputFeature
-from ludwig.features.sequence_feature import SequenceFeatureMixin, SequenceInputFeature, SequenceOutputFeature
-from ludwig.features.set_feature import SetFeatureMixin, SetInputFeature, SetOutputFeature
-from ludwig.features.text_feature import TextFeatureMixin, TextInputFeature, TextOutputFeature
-from ludwig.features.timeseries_feature import TimeseriesFeatureMixin, TimeseriesInputFeature, TimeseriesOutputFeature
-from ludwig.features.vector_feature import VectorFeatureMixin, VectorInputFeature, VectorOutputFeature
 from ludwig.utils.misc_utils import get_from_registry
+from ludwig.utils.registry import LazyRegistry
 
 if TYPE_CHECKING:
     from ludwig.models.base import BaseModel
     from ludwig.schema.model_types.base import ModelConfig
 
+# Feature classes by feature type. The feature modules are only imported once a config uses the feature type, so
+# that e.g. torchaudio is not imported unless there are audio features.
+_BASE_TYPES = {
+    TEXT: "ludwig.features.text_feature.TextFeatureMixin",
+    CATEGORY: "ludwig.features.category_feature.CategoryFeatureMixin",
+    SET: "ludwig.features.set_feature.SetFeatureMixin",
+    BAG: "ludwig.features.bag_feature.BagFeatureMixin",
+    BINARY: "ludwig.features.binary_feature.BinaryFeatureMixin",
+    NUMBER: "ludwig.features.number_feature.NumberFeatureMixin",
+    SEQUENCE: "ludwig.features.sequence_feature.SequenceFeatureMixin",
+    TIMESERIES: "ludwig.features.timeseries_feature.TimeseriesFeatureMixin",
+    IMAGE: "ludwig.features.image_feature.ImageFeatureMixin",
+    AUDIO: "ludwig.features.audio_feature.AudioFeatureMixin",
+    H3: "ludwig.features.h3_feature.H3FeatureMixin",
+    DATE: "ludwig.features.date_feature.DateFeatureMixin",
+    VECTOR: "ludwig.features.vector_feature.VectorFeatureMixin",
+    CATEGORY_DISTRIBUTION: "ludwig.features.category_feature.CategoryDistributionFeatureMixin",
+}
+
+_INPUT_TYPES = {
+    TEXT: "ludwig.features.text_feature.TextInputFeature",
+    NUMBER: "ludwig.features.number_feature.NumberInputFeature",
+    BINARY: "ludwig.features.binary_feature.BinaryInputFeature",
+    CATEGORY: "ludwig.features.category_feature.CategoryInputFeature",
+    SET: "ludwig.features.set_feature.SetInputFeature",
+    SEQUENCE: "ludwig.features.sequence_feature.SequenceInputFeature",
+    IMAGE: "ludwig.features.image_feature.ImageInputFeature",
+    AUDIO: "ludwig.features.audio_feature.AudioInputFeature",
+    TIMESERIES: "ludwig.features.timeseries_feature.TimeseriesInputFeature",
+    BAG: "ludwig.features.bag_feature.BagInputFeature",
+    H3: "ludwig.features.h3_feature.H3InputFeature",
+    DATE: "ludwig.features.date_feature.DateInputFeature",
+    VECTOR: "ludwig.features.vector_feature.VectorInputFeature",
+}
+
+_OUTPUT_TYPES = {
+    CATEGORY: "ludwig.features.category_feature.CategoryOutputFeature",
+    BINARY: "ludwig.features.binary_feature.BinaryOutputFeature",
+    NUMBER: "ludwig.features.number_feature.NumberOutputFeature",
+    SEQUENCE: "ludwig.features.sequence_feature.SequenceOutputFeature",
+    SET: "ludwig.features.set_feature.SetOutputFeature",
+    TEXT: "ludwig.features.text_feature.TextOutputFeature",
+    TIMESERIES: "ludwig.features.timeseries_feature.TimeseriesOutputFeature",
+    VECTOR: "ludwig.features.vector_feature.VectorOutputFeature",
+    CATEGORY_DISTRIBUTION: "ludwig.features.category_feature.CategoryDistributionOutputFeature",
+    IMAGE: "ludwig.features.image_feature.ImageOutputFeature",
+}
+
 
 @DeveloperAPI
-def get_base_type_registry() -> Dict:
-    return {
-        TEXT: TextFeatureMixin,
-        CATEGORY: CategoryFeatureMixin,
-        SET: SetFeatureMixin,
-        BAG: BagFeatureMixin,
-        BINARY: BinaryFeatureMixin,
-        NUMBER: NumberFeatureMixin,
-        SEQUENCE: SequenceFeatureMixin,
-        TIMESERIES: TimeseriesFeatureMixin,
-        IMAGE: ImageFeatureMixin,
-        AUDIO: AudioFeatureMixin,
-        H3: H3FeatureMixin,
-        DATE: DateFeatureMixin,
-        VECTOR: VectorFeatureMixin,
-        CATEGORY_DISTRIBUTION: CategoryDistributionFeatureMixin,
-    }
+def get_base_type_registry() -> LazyRegistry:
+    return LazyRegistry(_BASE_TYPES)
 
 
 @DeveloperAPI
-def get_input_type_registry() -> Dict:
-    return {
-        TEXT: TextInputFeature,
-        NUMBER: NumberInputFeature,
-        BINARY: BinaryInputFeature,
-        CATEGORY: CategoryInputFeature,
-        SET: SetInputFeature,
-        SEQUENCE: SequenceInputFeature,
-        IMAGE: ImageInputFeature,
-        AUDIO: AudioInputFeature,
-        TIMESERIES: TimeseriesInputFeature,
-        BAG: BagInputFeature,
-        H3: H3InputFeature,
-        DATE: DateInputFeature,
-        VECTOR: VectorInputFeature,
-    }
+def get_input_type_registry() -> LazyRegistry:
+    return LazyRegistry(_INPUT_TYPES)
 
 
 @DeveloperAPI
-def get_output_type_registry() -> Dict:
-    return {
-        CATEGORY: CategoryOutputFeature,
-        BINARY: BinaryOutputFeature,
-        NUMBER: NumberOutputFeature,
-        SEQUENCE: SequenceOutputFeature,
-        SET: SetOutputFeature,
-        TEXT: TextOutputFeature,
-        TIMESERIES: TimeseriesOutputFeature,
-        VECTOR: VectorOutputFeature,
-        CATEGORY_DISTRIBUTION: CategoryDistributionOutputFeature,
-        IMAGE: ImageOutputFeature,
-    }
+def get_output_type_registry() -> LazyRegistry:
+    return LazyRegistry(_OUTPUT_TYPES)
 
 
 def update_config_with_metadata(config_obj: "ModelConfig", training_set_metadata: Dict[str, Any]):
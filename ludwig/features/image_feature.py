@@ -75,9 +75,9 @@ from ludwig.types import (
 )
 from ludwig.utils import output_feature_utils
 from ludwig.utils.augmentation_utils import get_augmentation_op, register_augmentation_op
-from ludwig.utils.data_utils import get_abs_path
+from ludwig.utils.data_utils import get_abs_path, MEMMAP_FORMATS, MEMMAP_HDF5_FILE
 from ludwig.utils.dataframe_utils import is_dask_series_or_df
-from ludwig.utils.fs_utils import has_remote_protocol, upload_h5
+from ludwig.utils.fs_utils import has_remote_protocol, makedirs, upload_h5
 from ludwig.utils.image_utils import (
     get_class_mask_from_image,
     get_gray_default_image,
@@ -980,6 +980,10 @@ class ImageFeatureMixin(BaseFeatureMixin):
             num_failed_image_reads = 0
 
             data_fp = backend.cache.get_cache_path(wrap(metadata.get(SRC)), metadata.get(CHECKSUM), TRAINING)
+            if backend.cache.data_format in MEMMAP_FORMATS:
+                # Memory-mapped caches are directories of arrays, so images are stored in an HDF5 file inside it.
+                makedirs(data_fp, exist_ok=True)
+                data_fp = os.path.join(data_fp, MEMMAP_HDF5_FILE)
             with upload_h5(data_fp) as h5_file:
                 # todo future add multiprocessing/multithreading
                 image_dataset = h5_file.create_dataset(
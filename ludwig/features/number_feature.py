@@ -16,7 +16,7 @@
 import copy
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Set, Union
 
 import numpy as np
 import pandas as pd
@@ -24,6 +24,7 @@ import torch
 from torch import nn
 
 from ludwig.constants import COLUMN, HIDDEN, LOGITS, NAME, NUMBER, PREDICTIONS, PROC_COLUMN
+from ludwig.data.statistics import ColumnStatistics, FLOAT32_MIN_MAX, FLOAT32_MOMENTS
 from ludwig.features.base_feature import BaseFeatureMixin, InputFeature, OutputFeature, PredictModule
 from ludwig.schema.features.number_feature import NumberInputFeatureConfig, NumberOutputFeatureConfig
 from ludwig.types import (
@@ -41,6 +42,10 @@ logger = logging.getLogger(__name__)
 
 
 class NumberTransformer(nn.Module, ABC):
+    # Column statistics (see `ludwig.data.statistics`) that `fit_transform_params` can consume instead of scanning
+    # the column itself.
+    required_statistics: Set[str] = set()
+
     @abstractmethod
     def transform(self, x: np.ndarray) -> np.ndarray:
         pass
@@ -59,11 +64,15 @@ class NumberTransformer(nn.Module, ABC):
 
     @staticmethod
     @abstractmethod
-    def fit_transform_params(column: np.ndarray, backend: Any) -> Dict[str, Any]:
+    def fit_transform_params(
+        column: np.ndarray, backend: Any, statistics: Optional[ColumnStatistics] = None
+    ) -> Dict[str, Any]:
         pass
 
 
 class ZScoreTransformer(NumberTransformer):
+    required_statistics = {FLOAT32_MOMENTS}
+
     def __init__(self, mean: float = None, std: float = None, **kwargs: dict):
         super().__init__()
         self.mu = float(mean) if mean is not None else mean
@@ -90,7 +99,12 @@ class ZScoreTransformer(NumberTransformer):
         return x * self.sigma + self.mu
 
     @staticmethod
-    def fit_transform_params(column: np.ndarray, backend: "Backend") -> Dict[str, Any]:  # noqa
+    def fit_transform_params(
+        column: np.ndarray, backend: "Backend", statistics: Optional[ColumnStatistics] = None  # noqa
+    ) -> Dict[str, Any]:
+        if statistics is not None:
+            return {"mean": statistics.mean, "std": statistics.std}
+
         compute = backend.df_engine.compute
         return {
             "mean": compute(column.astype(np.float32).mean()),
@@ -99,6 +113,8 @@ class ZScoreTransformer(NumberTransformer):
 
 
 class MinMaxTransformer(NumberTransformer):
+    required_statistics = {FLOAT32_MIN_MAX}
+
     def __init__(self, min: float = None, max: float = None, **kwargs: dict):
         super().__init__()
         self.min_value = float(min) if min is not None else min
@@ -125,7 +141,12 @@ class MinMaxTransformer(NumberTransformer):
         return x * self.range + self.min_value
 
     @staticmethod
-    def fit_transform_params(column: np.ndarray, backend: "Backend") -> Dict[str, Any]:  # noqa
+    def fit_transform_params(
+        column: np.ndarray, backend: "Backend", statistics: Optional[ColumnStatistics] = None  # noqa
+    ) -> Dict[str, Any]:
+        if statistics is not None:
+            return {"min": statistics.min, "max": statistics.max}
+
         compute = backend.df_engine.compute
         return {
             "min": compute(column.astype(np.float32).min()),
@@ -163,7 +184,9 @@ class InterQuartileTransformer(NumberTransformer):
         return x * self.interquartile_range + self.q2
 
     @staticmethod
-    def fit_transform_params(column: np.ndarray, backend: "Backend") -> Dict[str, Any]:  # noqa
+    def fit_transform_params(
+        column: np.ndarray, backend: "Backend", statistics: Optional[ColumnStatistics] = None  # noqa
+    ) -> Dict[str, Any]:
         # backend.df_engine.compute is not used here because `percentile` is not parallelized in dask.
         # We compute the percentile directly.
         return {
@@ -196,7 +219,9 @@ class Log1pTransformer(NumberTransformer):
         return torch.expm1(x)
 
     @staticmethod
-    def fit_transform_params(column: np.ndarray, backend: "Backend") -> Dict[str, Any]:  # noqa
+    def fit_transform_params(
+        column: np.ndarray, backend: "Backend", statistics: Optional[ColumnStatistics] = None  # noqa
+    ) -> Dict[str, Any]:
         return {}
 
 
@@ -217,7 +242,9 @@ class IdentityTransformer(NumberTransformer):
         return x
 
     @staticmethod
-    def fit_transform_params(column: np.ndarray, backend: "Backend") -> Dict[str, Any]:  # noqa
+    def fit_transform_params(
+        column: np.ndarray, backend: "Backend", statistics: Optional[ColumnStatistics] = None  # noqa
+    ) -> Dict[str, Any]:
         return {}
 
 
@@ -314,6 +341,17 @@ class NumberFeatureMixin(BaseFeatureMixin):
     def cast_column(column, backend):
         return backend.df_engine.df_lib.to_numeric(column, errors="coerce").astype(np.float32)
 
+    @staticmethod
+    def required_statistics(preprocessing_parameters: PreprocessingConfigDict) -> Set[str]:
+        numeric_transformer: NumberTransformer = get_from_registry(
+            preprocessing_parameters.get("normalization", None),
+            numeric_transformation_registry,
+        )
+        required_statistics = set(numeric_transformer.required_statistics)
+        if preprocessing_parameters.get("outlier_strategy") is not None:
+            required_statistics |= ZScoreTransformer.required_statistics
+        return required_statistics
+
     @staticmethod
     def get_feature_meta(
         config: ModelConfigDict,
@@ -321,18 +359,19 @@ class NumberFeatureMixin(BaseFeatureMixin):
         preprocessing_parameters: PreprocessingConfigDict,
         backend,
         is_input_feature: bool,
+        statistics: Optional[ColumnStatistics] = None,
     ) -> FeatureMetadataDict:
         numeric_transformer: NumberTransformer = get_from_registry(
             preprocessing_parameters.get("normalization", None),
             numeric_transformation_registry,
         )
 
-        params = numeric_transformer.fit_transform_params(column, backend)
+        params = numeric_transformer.fit_transform_params(column, backend, statistics)
 
         # Ensure mean and std are computed if we're removing outliers
         outlier_strategy = preprocessing_parameters.get("outlier_strategy")
         if outlier_strategy is not None and ("mean" not in params or "std" not in params):
-            params.update(ZScoreTransformer.fit_transform_params(column, backend))
+            params.update(ZScoreTransformer.fit_transform_params(column, backend, statistics))
 
         return params
 
@@ -38,11 +38,46 @@ from ludwig.utils.types import TorchscriptPreprocessingInput
 logger = logging.getLogger(__name__)
 
 
+def to_sparse_set(
+    set_str: str, metadata: TrainingSetMetadataDict, preprocessing_parameters: PreprocessingConfigDict
+) -> np.ndarray:
+    """Returns the sorted indices of the distinct tokens of `set_str` and their counts, as int32 array of shape
+    [2 x max_set_size] padded with -1.
+
+    Every row has the width of the largest set seen when building the vocabulary, so that the feature is stored as a
+    fixed-size column. Larger sets are truncated to the tokens that come first in the vocabulary, i.e. the most frequent
+    ones.
+    """
+    max_set_size = max(metadata["max_set_size"], 1)
+    indices, counts = np.unique(
+        set_str_to_idx(set_str, metadata["str2idx"], preprocessing_parameters["tokenizer"]), return_counts=True
+    )
+    sparse_set = np.full((2, max_set_size), -1, dtype=np.int32)
+    sparse_set[0, : len(indices)] = indices[:max_set_size]
+    sparse_set[1, : len(counts)] = counts[:max_set_size]
+    return sparse_set
+
+
+def sample_sparse_set(batch_size: int, max_set_size: int, vocab_size: int) -> torch.Tensor:
+    """Returns random sets in the sparse layout of `to_sparse_set`, the sorted indices of their distinct items padded
+    with -1, as int32 tensor of shape [batch_size x max_set_size]."""
+    sample = torch.full((batch_size, max_set_size), -1, dtype=torch.int32)
+    num_items = min(max_set_size, vocab_size)
+    for row in range(batch_size):
+        indices = torch.randperm(vocab_size)[: int(torch.randint(1, num_items + 1, ()))].sort().values
+        sample[row, : len(indices)] = indices.to(torch.int32)
+    return sample
+
+
 class _SetPreprocessing(torch.nn.Module):
     """Torchscript-enabled version of preprocessing done by SetFeatureMixin.add_feature_data.
 
     If is_bag is true, forward returns a vector for each sample indicating counts of each token. Else, forward returns a
     multi-hot vector for each sample indicating presence of each token.
+
+    If the feature is stored sparsely, forward instead returns the sorted indices of the tokens of each sample, padded
+    with -1, of shape [batch x max_set_size]. For bags, the counts of the tokens follow the indices, with shape
+    [batch x 2 x max_set_size].
     """
 
     def __init__(self, metadata: TrainingSetMetadataDict, is_bag: bool = False):
@@ -59,6 +94,8 @@ class _SetPreprocessing(torch.nn.Module):
         self.unknown_symbol = UNKNOWN_SYMBOL
         self.unit_to_id = metadata["str2idx"]
         self.is_bag = is_bag
+        self.sparse = metadata.get("sparse", False)
+        self.max_set_size = int(max(metadata["max_set_size"], 1))
 
     def forward(self, v: TorchscriptPreprocessingInput) -> torch.Tensor:
         """Takes a list of strings and returns a tensor of counts for each token."""
@@ -74,6 +111,9 @@ class _SetPreprocessing(torch.nn.Module):
         # refines type of unit_sequences from Any to List[List[str]]
         assert torch.jit.isinstance(unit_sequences, List[List[str]]), "unit_sequences is not a list of lists."
 
+        if self.sparse:
+            return self._forward_sparse(unit_sequences)
+
         set_matrix = torch.zeros(len(unit_sequences), self.vocab_size, dtype=torch.float32)
         for sample_idx, unit_sequence in enumerate(unit_sequences):
             sequence_length = len(unit_sequence)
@@ -91,6 +131,26 @@ class _SetPreprocessing(torch.nn.Module):
 
         return set_matrix
 
+    def _forward_sparse(self, unit_sequences: List[List[str]]) -> torch.Tensor:
+        set_matrix = torch.full((len(unit_sequences), 2, self.max_set_size), -1, dtype=torch.int32)
+        for sample_idx, unit_sequence in enumerate(unit_sequences):
+            counts: Dict[int, int] = {}
+            for curr_unit in unit_sequence:
+                if curr_unit in self.unit_to_id:
+                    curr_id = self.unit_to_id[curr_unit]
+                else:
+                    curr_id = self.unit_to_id[self.unknown_symbol]
+                counts[curr_id] = counts.get(curr_id, 0) + 1
+
+            # Same truncation as add_feature_data, which keeps the most frequent tokens of the vocabulary.
+            ids = sorted(counts.keys())[: self.max_set_size]
+            set_matrix[sample_idx, 0, : len(ids)] = torch.tensor(ids, dtype=torch.int32)
+            set_matrix[sample_idx, 1, : len(ids)] = torch.tensor([counts[i] for i in ids], dtype=torch.int32)
+
+        if self.is_bag:
+            return set_matrix
+        return set_matrix[:, 0]
+
 
 class _SetPostprocessing(torch.nn.Module):
     """Torchscript-enabled version of postprocessing done by SetFeatureMixin.add_feature_data."""
@@ -172,10 +232,17 @@ class SetFeatureMixin(BaseFeatureMixin):
             "str2freq": vocabulary.str2freq,
             "vocab_size": len(vocabulary.str2idx),
             "max_set_size": vocabulary.max_sequence_length,
+            # Input sets are embedded from the indices of their items, output sets are predicted as multi-hot vectors.
+            "sparse": is_input_feature,
         }
 
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters: PreprocessingConfigDict, backend):
+        if metadata.get("sparse", False):
+            return backend.df_engine.map_objects(
+                column, lambda x: to_sparse_set(x, metadata, preprocessing_parameters)[0]
+            )
+
         def to_dense(x):
             feature_vector = set_str_to_idx(x, metadata["str2idx"], preprocessing_parameters["tokenizer"])
 
@@ -215,7 +282,7 @@ class SetInputFeature(SetFeatureMixin, InputFeature):
 
     def forward(self, inputs):
         assert isinstance(inputs, torch.Tensor)
-        assert inputs.dtype in [torch.bool, torch.int64, torch.float32]
+        assert inputs.dtype in [torch.bool, torch.int32, torch.int64, torch.float32]
 
         encoder_output = self.encoder_obj(inputs)
 
@@ -223,15 +290,26 @@ class SetInputFeature(SetFeatureMixin, InputFeature):
 
     @property
     def input_dtype(self):
+        if self.encoder_obj.config.max_set_size is not None:
+            return torch.int32
         return torch.bool
 
     @property
     def input_shape(self) -> torch.Size:
+        if self.encoder_obj.config.max_set_size is not None:
+            return torch.Size([self.encoder_obj.config.max_set_size])
         return torch.Size([len(self.encoder_obj.config.vocab)])
 
+    def create_sample_input(self, batch_size: int = 2):
+        if self.encoder_obj.config.max_set_size is None:
+            return super().create_sample_input(batch_size)
+        return sample_sparse_set(batch_size, self.encoder_obj.config.max_set_size, len(self.encoder_obj.config.vocab))
+
     @staticmethod
     def update_config_with_metadata(feature_config, feature_metadata, *args, **kwargs):
         feature_config.encoder.vocab = feature_metadata["idx2str"]
+        if feature_metadata.get("sparse", False):
+            feature_config.encoder.max_set_size = max(feature_metadata["max_set_size"], 1)
 
     @staticmethod
     def get_schema_cls():
@@ -17,6 +17,7 @@ import logging
 from typing import Dict, List, TYPE_CHECKING, Union
 
 import numpy as np
+import pandas as pd
 import torch
 
 from ludwig.constants import COLUMN, HIDDEN, LOGITS, NAME, PREDICTIONS, PROC_COLUMN, TIMESERIES
@@ -53,6 +54,13 @@ def create_time_delay_embedding(
     # Replace default fill value of "" with nan as we will be assuming numeric values here
     series = series.replace("", np.nan)
 
+    if not backend.df_engine.partitioned:
+        # Windows are rows of a single contiguous matrix, so the whole series is embedded without a Python loop.
+        values = pd.to_numeric(series).to_numpy(dtype=np.float32)
+        windows = sliding_windows(values, window_size, horizon, padding_value)
+        return pd.Series(list(windows), index=series.index, name=series.name)
+
+    # Windows span partitions, so distributed series are embedded from shifted copies of the whole series.
     # Create the list of shifts we want to perform over the series.
     # For backwards looking shifts, we want to include the current element, while for forward looking shifts we do not.
     # Example:
@@ -65,6 +73,41 @@ def create_time_delay_embedding(
     return df.apply(lambda x: np.nan_to_num(np.array(x.tolist()).astype(np.float32), nan=padding_value), axis=1)
 
 
+def sliding_windows(values: np.ndarray, window_size: int, horizon: int, padding_value: float) -> np.ndarray:
+    """Returns the time delay embedding of `values` as a contiguous float32 matrix of shape [len(values) x
+    (window_size + horizon)].
+
+    Row t holds the `window_size` values up to and including t, followed by the `horizon` values after t. Missing
+    values, and positions before the start or past the end of the series, are set to `padding_value`.
+    """
+    # For backwards looking windows, the current element is the last element of the window, while forward looking
+    # windows start right after it.
+    lookback = window_size - 1 if window_size > 0 else -1
+    padded = np.full((len(values) + max(lookback, 0) + horizon + 1,), padding_value, dtype=np.float32)
+    padded[max(lookback, 0) : max(lookback, 0) + len(values)] = np.nan_to_num(values, nan=padding_value)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window_size + horizon)
+    start = max(lookback, 0) - lookback
+    return np.ascontiguousarray(windows[start : start + len(values)])
+
+
+def pad_timeseries(vectors: List[np.ndarray], max_length: int, padding_value: float, padding: str) -> np.ndarray:
+    """Truncates the timeseries to `max_length` and pads them with `padding_value` on the `padding` side, returning
+    them as rows of a contiguous float32 matrix."""
+    lengths = np.fromiter((min(len(vector), max_length) for vector in vectors), dtype=np.int64, count=len(vectors))
+    matrix = np.full((len(vectors), max_length), padding_value, dtype=np.float32)
+    if not lengths.any():
+        return matrix
+
+    positions = np.arange(max_length)
+    if padding == "right":
+        mask = positions < lengths[:, np.newaxis]
+    else:  # if padding == 'left
+        mask = positions >= (max_length - lengths)[:, np.newaxis]
+    # Row-major order of the mask matches the order of the concatenated timeseries.
+    matrix[mask] = np.concatenate([vector[:length] for vector, length in zip(vectors, lengths)])
+    return np.nan_to_num(matrix, nan=padding_value, copy=False)
+
+
 class _TimeseriesPreprocessing(torch.nn.Module):
     """Torchscript-enabled version of preprocessing done by TimeseriesFeatureMixin.add_feature_data."""
 
@@ -171,25 +214,12 @@ class TimeseriesFeatureMixin(BaseFeatureMixin):
     def build_matrix(timeseries, tokenizer_name, length_limit, padding_value, padding, backend):
         tokenizer = get_tokenizer_from_registry(tokenizer_name)()
 
-        ts_vectors = backend.df_engine.map_objects(
-            timeseries, lambda ts: np.nan_to_num(np.array(tokenizer(ts)).astype(np.float32), nan=padding_value)
-        )
+        def pad_partition(partition):
+            vectors = [np.array(tokenizer(ts)).astype(np.float32) for ts in partition]
+            matrix = pad_timeseries(vectors, length_limit, padding_value, padding)
+            return pd.Series(list(matrix), index=partition.index)
 
-        max_length = backend.df_engine.compute(ts_vectors.map(len).max())
-        if max_length < length_limit:
-            logger.debug(f"max length of {tokenizer_name}: {max_length} < limit: {length_limit}")
-        max_length = length_limit
-
-        def pad(vector):
-            padded = np.full((max_length,), padding_value, dtype=np.float32)
-            limit = min(vector.shape[0], max_length)
-            if padding == "right":
-                padded[:limit] = vector[:limit]
-            else:  # if padding == 'left
-                padded[max_length - limit :] = vector[:limit]
-            return padded
-
-        return backend.df_engine.map_objects(ts_vectors, pad)
+        return backend.df_engine.map_partitions(timeseries, pad_partition)
 
     @staticmethod
     def feature_data(column, metadata, preprocessing_parameters: PreprocessingConfigDict, backend):
@@ -36,7 +36,9 @@ from ludwig.backend.ray import initialize_ray
 from ludwig.callbacks import Callback
 from ludwig.constants import MAXIMIZE, TEST, TRAINER, TRAINING, TYPE, VALIDATION
 from ludwig.globals import MODEL_FILE_NAME
+from ludwig.hyperopt.pruning import LearningCurvePruner, LearningCurvePrunerCallback
 from ludwig.hyperopt.results import HyperoptResults, TrialResults
+from ludwig.hyperopt.shared_dataset import attach_shared_datasets
 from ludwig.hyperopt.syncer import RemoteSyncer
 from ludwig.hyperopt.utils import load_json_values, substitute_parameters
 from ludwig.modules.metric_modules import get_best_function
@@ -156,6 +158,7 @@ class RayTuneExecutor:
         max_concurrent_trials: Optional[int] = None,
         num_samples: int = 1,
         scheduler: Optional[Dict] = None,
+        pruner: Optional[Dict] = None,
         **kwargs,
     ) -> None:
         # Force-populate the search algorithm registry
@@ -171,6 +174,9 @@ class RayTuneExecutor:
         self.goal = goal
         self.search_algorithm = get_search_algorithm_cls(search_alg[TYPE])(**search_alg)
         self.scheduler = None if scheduler is None else tune.create_scheduler(scheduler[TYPE], **scheduler)
+        self.pruner_config = pruner
+        # Actor shared by all trials of the sweep, created when the sweep starts.
+        self.pruner = None
         self.output_feature = output_feature
         self.metric = metric
         self.split = split
@@ -590,6 +596,17 @@ class RayTuneExecutor:
 
         callbacks = hyperopt_dict.get("callbacks") or []
         hyperopt_dict["callbacks"] = callbacks + [RayTuneReportCallback()]
+        if self.pruner is not None:
+            pruner = self.pruner
+            hyperopt_dict["callbacks"].append(
+                LearningCurvePrunerCallback(
+                    trial_id,
+                    lambda *args: ray.get(pruner.report.remote(*args)),
+                    self.output_feature,
+                    self.metric,
+                    hyperopt_dict["eval_split"],
+                )
+            )
 
         # set tune resources
         if is_using_ray_backend:
@@ -777,6 +794,10 @@ class RayTuneExecutor:
             else:
                 search_alg = ConcurrencyLimiter(search_alg, max_concurrent=self.max_concurrent_trials)
 
+        if self.pruner_config is not None:
+            # Trials stop based on the curves of the other trials, which they report to a shared actor.
+            self.pruner = ray.remote(num_cpus=0)(LearningCurvePruner).remote(goal=self.goal, **self.pruner_config)
+
         def run_experiment_trial(config, local_hyperopt_dict, checkpoint_dir=None):
             # Checkpoint dir exists when trials are temporarily paused and resumed, for e.g.,
             # when using the HB_BOHB scheduler.
@@ -1039,32 +1060,34 @@ def run_experiment(
     )
 
     try:
-        eval_stats, train_stats, _, _ = model.experiment(
-            dataset=dataset,
-            training_set=training_set,
-            validation_set=validation_set,
-            test_set=test_set,
-            training_set_metadata=training_set_metadata,
-            data_format=data_format,
-            experiment_name=experiment_name,
-            model_name=model_name,
-            model_resume_path=model_resume_path,
-            eval_split=eval_split,
-            skip_save_training_description=skip_save_training_description,
-            skip_save_training_statistics=skip_save_training_statistics,
-            skip_save_model=skip_save_model,
-            skip_save_progress=skip_save_progress,
-            skip_save_log=skip_save_log,
-            skip_save_processed_input=skip_save_processed_input,
-            skip_save_unprocessed_output=skip_save_unprocessed_output,
-            skip_save_predictions=skip_save_predictions,
-            skip_save_eval_stats=skip_save_eval_stats,
-            output_directory=output_directory,
-            skip_collect_predictions=True,
-            skip_collect_overall_stats=False,
-            random_seed=random_seed,
-            debug=debug,
-        )
+        # Keeps the datasets shared with the other trials on this node from being removed while training.
+        with attach_shared_datasets(training_set, validation_set, test_set):
+            eval_stats, train_stats, _, _ = model.experiment(
+                dataset=dataset,
+                training_set=training_set,
+                validation_set=validation_set,
+                test_set=test_set,
+                training_set_metadata=training_set_metadata,
+                data_format=data_format,
+                experiment_name=experiment_name,
+                model_name=model_name,
+                model_resume_path=model_resume_path,
+                eval_split=eval_split,
+                skip_save_training_description=skip_save_training_description,
+                skip_save_training_statistics=skip_save_training_statistics,
+                skip_save_model=skip_save_model,
+                skip_save_progress=skip_save_progress,
+                skip_save_log=skip_save_log,
+                skip_save_processed_input=skip_save_processed_input,
+                skip_save_unprocessed_output=skip_save_unprocessed_output,
+                skip_save_predictions=skip_save_predictions,
+                skip_save_eval_stats=skip_save_eval_stats,
+                output_directory=output_directory,
+                skip_collect_predictions=True,
+                skip_collect_overall_stats=False,
+                random_seed=random_seed,
+                debug=debug,
+            )
         return train_stats, eval_stats
     finally:
         for callback in callbacks or []:
@@ -0,0 +1,205 @@
+"""Early termination of hyperopt trials by extrapolation of their learning curves.
+
+Schedulers like ASHA compare trials at fixed rungs, so every trial trains at least until the first rung. Instead,
+`LearningCurvePruner` fits a few parametric learning-curve models to the evaluation metric history of a trial, and
+predicts the metric the trial will reach at the end of training. A trial is stopped as soon as this prediction is,
+with high confidence, worse than the best metric already reached by the `top_k`-th best other trial.
+
+The pruner is driven by `LearningCurvePrunerCallback`, which reports the metric history of the trial after every
+evaluation and requests early stopping through the trainer callbacks, independently of the Ray Tune scheduler.
+"""
+import logging
+import math
+import warnings
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Set
+
+import numpy as np
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.callbacks import Callback
+from ludwig.constants import MAXIMIZE, TEST, TRAINING, VALIDATION
+
+logger = logging.getLogger(__name__)
+
+
+def _pow3(x, c, a, alpha):
+    return c - a * np.power(x, -alpha)
+
+
+def _exp3(x, c, a, b):
+    return c - a * np.exp(-b * x)
+
+
+def _log_linear(x, a, b):
+    return a + b * np.log(x)
+
+
+# Learning curve models of the metric, oriented so that higher is better, as a function of the fraction of training
+# completed. Each entry holds the model, the initial guess of its parameters given the curve, and their bounds.
+CURVE_MODELS = {
+    "pow3": (
+        _pow3,
+        lambda x, y: [y[-1], y[-1] - y[0], 0.5],
+        ([-np.inf, -np.inf, 0.0], [np.inf, np.inf, 5.0]),
+    ),
+    "exp3": (
+        _exp3,
+        lambda x, y: [y[-1], y[-1] - y[0], 1.0 / x[-1]],
+        ([-np.inf, -np.inf, 0.0], [np.inf, np.inf, 100.0]),
+    ),
+    "log_linear": (
+        _log_linear,
+        lambda x, y: [y[-1], 0.0],
+        ([-np.inf, -np.inf], [np.inf, np.inf]),
+    ),
+}
+
+
+@DeveloperAPI
+class CurvePrediction(NamedTuple):
+    """Predicted final metric of a trial, oriented so that higher is better, with the standard deviation of the
+    prediction."""
+
+    mean: float
+    std: float
+
+
+@DeveloperAPI
+def predict_final_metric(fractions: Sequence[float], values: Sequence[float]) -> Optional[CurvePrediction]:
+    """Extrapolates the curve of `values`, oriented so that higher is better, from the fractions of training at
+    which they were evaluated to the end of training.
+
+    The models that can be fit to the curve form an ensemble: the spread of their predictions and the residuals of
+    their fits give the uncertainty of the prediction. Returns None if no model could be fit.
+    """
+    from scipy.optimize import curve_fit
+
+    x = np.asarray(fractions, dtype=np.float64)
+    y = np.asarray(values, dtype=np.float64)
+    predictions, variances = [], []
+    for model, initial_guess, bounds in CURVE_MODELS.values():
+        num_params = len(bounds[0])
+        if len(x) <= num_params:
+            continue
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                params, _ = curve_fit(model, x, y, p0=initial_guess(x, y), bounds=bounds, maxfev=1000)
+        except (RuntimeError, ValueError):
+            continue
+        prediction = float(model(1.0, *params))
+        if not math.isfinite(prediction):
+            continue
+        residuals = y - model(x, *params)
+        predictions.append(prediction)
+        variances.append(float(np.sum(residuals**2)) / (len(x) - num_params))
+
+    if not predictions:
+        return None
+    # Keeps perfect fits of a constant curve from yielding a certain prediction.
+    min_std = 1e-3 * (float(np.ptp(y)) + abs(float(y[-1])) + 1e-8)
+    std = math.sqrt(float(np.var(predictions)) + float(np.mean(variances)))
+    return CurvePrediction(mean=float(np.mean(predictions)), std=max(std, min_std))
+
+
+@DeveloperAPI
+class LearningCurvePruner:
+    """Keeps track of the metric curves reported by the trials of a sweep, and decides which trials to stop.
+
+    Args:
+        goal: `minimize` or `maximize` the metric.
+        top_k: number of other trials the predicted final metric of a trial must be worse than for it to be stopped.
+        confidence: minimum probability of the predicted final metric being worse for the trial to be stopped.
+        min_evals: minimum number of evaluations of a trial before its curve is extrapolated.
+    """
+
+    def __init__(self, goal: str, top_k: int = 3, confidence: float = 0.95, min_evals: int = 4, **kwargs):
+        self.sign = 1.0 if goal == MAXIMIZE else -1.0
+        self.top_k = top_k
+        self.confidence = confidence
+        self.min_evals = min_evals
+        # Best metric reached so far by each trial, oriented so that higher is better.
+        self.best_scores: Dict[str, float] = {}
+        self.pruned_trials: Set[str] = set()
+
+    def report(self, trial_id: str, steps: List[int], values: List[float], total_steps: int) -> bool:
+        """Records the metric history of a trial, evaluated at the given training steps, and returns whether the
+        trial should stop."""
+        scores = [self.sign * value for value in values if value == value]
+        if not scores:
+            return False
+        best_score = max(scores)
+        self.best_scores[trial_id] = max(best_score, self.best_scores.get(trial_id, -math.inf))
+
+        threshold = self.get_threshold(trial_id)
+        if threshold is None or best_score >= threshold or len(scores) < self.min_evals:
+            return False
+
+        # Training may run past the planned steps, e.g. when the batch size changes, in which case the curve is only
+        # extrapolated to its last evaluation.
+        total_steps = max(total_steps, max(steps))
+        fractions = [max(step, 1) / total_steps for step, value in zip(steps, values) if value == value]
+        prediction = predict_final_metric(fractions, scores)
+        if prediction is None:
+            return False
+        # The trial keeps the best checkpoint, so its final metric is at least the best one reached so far.
+        mean = max(prediction.mean, best_score)
+        probability_worse = 0.5 * (1 + math.erf((threshold - mean) / (prediction.std * math.sqrt(2))))
+        if probability_worse < self.confidence:
+            return False
+
+        logger.info(
+            f"Stopping trial {trial_id}: its predicted final metric {self.sign * mean:.6g} is worse than the top "
+            f"{self.top_k} trials ({self.sign * threshold:.6g}) with probability {probability_worse:.3f}."
+        )
+        self.pruned_trials.add(trial_id)
+        return True
+
+    def get_threshold(self, trial_id: str) -> Optional[float]:
+        """Returns the score of the `top_k`-th best other trial, or None if there are not enough other trials."""
+        other_scores = sorted((score for other, score in self.best_scores.items() if other != trial_id), reverse=True)
+        if len(other_scores) < self.top_k:
+            return None
+        return other_scores[self.top_k - 1]
+
+
+@DeveloperAPI
+class LearningCurvePrunerCallback(Callback):
+    """Reports the hyperopt metric of a trial after every evaluation, and stops training if the pruner decides to.
+
+    Args:
+        trial_id: id of the trial being trained.
+        report_fn: `LearningCurvePruner.report`, or a function forwarding its arguments to a shared pruner.
+        output_feature: name of the output feature of the hyperopt metric, or `combined`.
+        metric: name of the hyperopt metric.
+        split: split the hyperopt metric is evaluated on.
+    """
+
+    def __init__(
+        self,
+        trial_id: str,
+        report_fn: Callable[[str, List[int], List[float], int], bool],
+        output_feature: str,
+        metric: str,
+        split: str = VALIDATION,
+    ):
+        self.trial_id = trial_id
+        self.report_fn = report_fn
+        self.output_feature = output_feature
+        self.metric = metric
+        self.split = split
+
+    def should_early_stop(self, trainer, progress_tracker, is_coordinator):
+        if not is_coordinator:
+            return False
+        split_metrics = {
+            TRAINING: progress_tracker.train_metrics,
+            VALIDATION: progress_tracker.validation_metrics,
+            TEST: progress_tracker.test_metrics,
+        }[self.split]
+        history = split_metrics.get(self.output_feature, {}).get(self.metric, [])
+        if not history:
+            return False
+        steps = [trainer_metric.step for trainer_metric in history]
+        values = [float(trainer_metric.value) for trainer_metric in history]
+        return bool(self.report_fn(self.trial_id, steps, values, trainer.total_steps))
@@ -33,6 +33,7 @@ from ludwig.constants import (
 )
 from ludwig.data.split import get_splitter
 from ludwig.hyperopt.results import HyperoptResults
+from ludwig.hyperopt.shared_dataset import share_datasets, trials_share_node
 from ludwig.hyperopt.utils import (
     log_warning_if_all_grid_type_parameters,
     print_hyperopt_results,
@@ -81,6 +82,7 @@ def hyperopt(
     skip_save_predictions: bool = False,
     skip_save_eval_stats: bool = False,
     skip_save_hyperopt_statistics: bool = False,
+    skip_share_datasets: bool = False,
     output_directory: str = "results",
     gpus: Union[str, int, List[int]] = None,
     gpu_memory_limit: Optional[float] = None,
@@ -170,6 +172,10 @@ def hyperopt(
         statistics JSON file.
     :param skip_save_hyperopt_statistics: (bool, default: `False`) skips saving
         hyperopt stats file.
+    :param skip_share_datasets: (bool, default: `False`) hands every trial its
+        own in-memory copy of the processed datasets, instead of memory-mapping
+        a single copy written to the temporary directory of the node. Datasets
+        are never shared when Ray runs a multi-node cluster.
     :param output_directory: (str, default: `'results'`) the directory that
         will contain the training statistics, TensorBoard logs, the saved
         model and the training progress files.
@@ -343,40 +349,58 @@ def hyperopt(
         for callback in callbacks or []:
             callback.on_hyperopt_preprocessing_end(experiment_name)
 
+    shared_dataset_directory = None
+    if isinstance(backend, LocalBackend) and not skip_share_datasets:
+        if trials_share_node():
+            # Trials on this node memory-map a single copy of the processed datasets instead of each loading their own.
+            shared_dataset_directory, (training_set, validation_set, test_set) = share_datasets(
+                [training_set, validation_set, test_set]
+            )
+        else:
+            logger.info(
+                "Not sharing the processed datasets between hyperopt trials, as trials may run on other nodes of the "
+                "Ray cluster than the node-local directory the datasets would be shared from."
+            )
+
     for callback in callbacks or []:
         callback.on_hyperopt_start(experiment_name)
 
-    hyperopt_results = hyperopt_executor.execute(
-        premerged_config,
-        dataset=dataset,
-        training_set=training_set,
-        validation_set=validation_set,
-        test_set=test_set,
-        training_set_metadata=training_set_metadata,
-        data_format=data_format,
-        experiment_name=experiment_name,
-        model_name=model_name,
-        resume=resume,
-        skip_save_training_description=skip_save_training_description,
-        skip_save_training_statistics=skip_save_training_statistics,
-        skip_save_model=skip_save_model,
-        skip_save_progress=skip_save_progress,
-        skip_save_log=skip_save_log,
-        skip_save_processed_input=skip_save_processed_input,
-        skip_save_unprocessed_output=skip_save_unprocessed_output,
-        skip_save_predictions=skip_save_predictions,
-        skip_save_eval_stats=skip_save_eval_stats,
-        output_directory=output_directory,
-        gpus=gpus,
-        gpu_memory_limit=gpu_memory_limit,
-        allow_parallel_threads=allow_parallel_threads,
-        callbacks=callbacks,
-        tune_callbacks=tune_callbacks,
-        backend=backend,
-        random_seed=random_seed,
-        hyperopt_log_verbosity=hyperopt_log_verbosity,
-        **kwargs,
-    )
+    try:
+        hyperopt_results = hyperopt_executor.execute(
+            premerged_config,
+            dataset=dataset,
+            training_set=training_set,
+            validation_set=validation_set,
+            test_set=test_set,
+            training_set_metadata=training_set_metadata,
+            data_format=data_format,
+            experiment_name=experiment_name,
+            model_name=model_name,
+            resume=resume,
+            skip_save_training_description=skip_save_training_description,
+            skip_save_training_statistics=skip_save_training_statistics,
+            skip_save_model=skip_save_model,
+            skip_save_progress=skip_save_progress,
+            skip_save_log=skip_save_log,
+            skip_save_processed_input=skip_save_processed_input,
+            skip_save_unprocessed_output=skip_save_unprocessed_output,
+            skip_save_predictions=skip_save_predictions,
+            skip_save_eval_stats=skip_save_eval_stats,
+            output_directory=output_directory,
+            gpus=gpus,
+            gpu_memory_limit=gpu_memory_limit,
+            allow_parallel_threads=allow_parallel_threads,
+            callbacks=callbacks,
+            tune_callbacks=tune_callbacks,
+            backend=backend,
+            random_seed=random_seed,
+            hyperopt_log_verbosity=hyperopt_log_verbosity,
+            **kwargs,
+        )
+    finally:
+        if shared_dataset_directory is not None:
+            # Trials stopped by Tune may not have released their reference, but none are running anymore.
+            shared_dataset_directory.cleanup()
 
     if backend.is_coordinator():
         print_hyperopt_results(hyperopt_results)
@@ -0,0 +1,191 @@
+"""Sharing of the processed dataset between the hyperopt trials running on the same node.
+
+When preprocessing is not tuned, the dataset is preprocessed once before the sweep, and every trial receives the same
+training, validation and test sets. Passed as in-memory arrays, each trial process holds its own copy of them. Instead,
+`share_datasets` writes the arrays once to a node-local directory as `.npy` files, and the datasets handed to trials
+memory-map these files read-only, so that concurrent trials share a single copy through the OS page cache.
+
+The directory is reference counted: the hyperopt driver holds a reference for the duration of the sweep, and every
+trial attaches to it while it runs. The directory is removed when the last reference is released, or when the sweep
+ends. Sweeps run with `skip_share_datasets` hand every trial its own copy of the datasets instead, as do sweeps on a
+multi-node Ray cluster, whose trials may be scheduled on nodes that cannot read the directory.
+"""
+import contextlib
+import logging
+import os
+import shutil
+import tempfile
+from typing import List, Optional, Tuple
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.data.dataset.base import Dataset
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.utils.data_utils import save_memmap
+from ludwig.utils.fs_utils import file_lock
+
+logger = logging.getLogger(__name__)
+
+REFCOUNT_FILE = "refcount"
+LOCK_SUFFIX = ".lock"
+
+
+@DeveloperAPI
+class SharedDatasetDirectory:
+    """Node-local directory holding memory-mapped datasets, removed once no process references it anymore."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @classmethod
+    def create(cls, root: Optional[str] = None) -> "SharedDatasetDirectory":
+        """Creates a new directory under `root` (the system temporary directory by default), referenced by the
+        caller."""
+        directory = cls(tempfile.mkdtemp(prefix="ludwig_hyperopt_dataset_", dir=root))
+        directory._write_refcount(1)
+        return directory
+
+    @classmethod
+    def of(cls, dataset: Optional[Dataset]) -> Optional["SharedDatasetDirectory"]:
+        """Returns the shared directory the dataset is memory-mapped from, if any."""
+        memmap_fp = getattr(dataset, "memmap_fp", None)
+        if memmap_fp is None:
+            return None
+        path = os.path.dirname(os.path.normpath(memmap_fp))
+        if not os.path.exists(os.path.join(path, REFCOUNT_FILE)):
+            return None
+        return cls(path)
+
+    @property
+    def refcount(self) -> int:
+        with self._lock():
+            return self._read_refcount()
+
+    def acquire(self):
+        with self._lock():
+            if not os.path.exists(self.path):
+                # Already cleaned up at the end of the sweep, the datasets stay readable until they are unmapped.
+                return
+            self._write_refcount(self._read_refcount() + 1)
+
+    def release(self):
+        """Drops a reference, removing the directory if it was the last one."""
+        with self._lock():
+            if not os.path.exists(self.path):
+                return
+            refcount = self._read_refcount() - 1
+            self._write_refcount(max(refcount, 0))
+            if refcount <= 0:
+                self._remove()
+
+    def cleanup(self):
+        """Removes the directory regardless of its references.
+
+        Processes that still have the datasets open keep reading the memory-mapped files, which are only deleted
+        from disk once unmapped.
+        """
+        with self._lock():
+            self._remove()
+        try:
+            os.remove(self._lock_path)
+        except OSError:
+            pass
+
+    @property
+    def _lock_path(self) -> str:
+        return os.path.normpath(self.path) + LOCK_SUFFIX
+
+    def _lock(self) -> file_lock:
+        # The lock file lives next to the directory rather than in it, so that it outlives the removal of the directory
+        # and every reference count update is serialized with it.
+        return file_lock(os.path.dirname(self._lock_path), lock_file=os.path.basename(self._lock_path))
+
+    def _remove(self):
+        if os.path.exists(self.path):
+            logger.info(f"Removing shared datasets in {self.path}")
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def _read_refcount(self) -> int:
+        refcount_fp = os.path.join(self.path, REFCOUNT_FILE)
+        if not os.path.exists(refcount_fp):
+            return 0
+        with open(refcount_fp) as f:
+            return int(f.read().strip() or 0)
+
+    def _write_refcount(self, refcount: int):
+        with open(os.path.join(self.path, REFCOUNT_FILE), "w") as f:
+            f.write(str(refcount))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SharedDatasetDirectory) and self.path == other.path
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+
+@DeveloperAPI
+def share_datasets(
+    datasets: List[Optional[Dataset]], root: Optional[str] = None
+) -> Tuple[Optional[SharedDatasetDirectory], List[Optional[Dataset]]]:
+    """Writes the in-memory `PandasDataset`s to a new shared directory, and returns the directory along with the
+    datasets memory-mapped from it.
+
+    Other datasets are returned unchanged: distributed datasets already live in a shared object store, and
+    memory-mapped datasets are already shared. No directory is created if there is nothing to share.
+    """
+    if not any(_should_share(dataset) for dataset in datasets):
+        return None, datasets
+
+    directory = SharedDatasetDirectory.create(root)
+    shared = []
+    try:
+        for i, dataset in enumerate(datasets):
+            if not _should_share(dataset):
+                shared.append(dataset)
+                continue
+            memmap_fp = os.path.join(directory.path, str(i))
+            save_memmap(memmap_fp, dataset.get_dataset())
+            shared.append(
+                PandasDataset(
+                    memmap_fp,
+                    dataset.features,
+                    dataset.data_hdf5_fp,
+                    training_set_metadata=dataset.training_set_metadata,
+                )
+            )
+    except Exception:
+        directory.cleanup()
+        raise
+
+    logger.info(f"Shared the processed datasets between hyperopt trials in {directory.path}")
+    return directory, shared
+
+
+@DeveloperAPI
+@contextlib.contextmanager
+def attach_shared_datasets(*datasets: Optional[Dataset]):
+    """Holds a reference to the shared directories of the datasets while the context is active."""
+    directories = {SharedDatasetDirectory.of(dataset) for dataset in datasets} - {None}
+    for directory in directories:
+        directory.acquire()
+    try:
+        yield
+    finally:
+        for directory in directories:
+            directory.release()
+
+
+@DeveloperAPI
+def trials_share_node() -> bool:
+    """Returns whether every hyperopt trial runs on this node, i.e. whether Ray is not running a multi-node cluster."""
+    try:
+        import ray
+    except ImportError:
+        return True
+
+    if not ray.is_initialized():
+        return True
+    return sum(1 for node in ray.nodes() if node["Alive"]) <= 1
+
+
+def _should_share(dataset: Optional[Dataset]) -> bool:
+    return isinstance(dataset, PandasDataset) and dataset.memmap_fp is None and len(dataset) > 0
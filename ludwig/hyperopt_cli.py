@@ -52,6 +52,7 @@ def hyperopt_cli(
     skip_save_predictions: bool = False,
     skip_save_eval_stats: bool = False,
     skip_save_hyperopt_statistics: bool = False,
+    skip_share_datasets: bool = False,
     output_directory: str = "results",
     gpus: Union[str, int, List[int]] = None,
     gpu_memory_limit: Optional[float] = None,
@@ -134,6 +135,9 @@ def hyperopt_cli(
         statistics JSON file
     :param skip_save_hyperopt_statistics: (bool, default: `False`) skips saving
         hyperopt stats file.
+    :param skip_share_datasets: (bool, default: `False`) hands every trial its
+        own in-memory copy of the processed datasets, instead of memory-mapping
+        a single copy written to the temporary directory of the node.
     :param output_directory: (str, default: `'results'`) the directory that
         will contain the training statistics, TensorBoard logs, the saved
         model and the training progress files.
@@ -180,6 +184,7 @@ def hyperopt_cli(
         skip_save_predictions=skip_save_predictions,
         skip_save_eval_stats=skip_save_eval_stats,
         skip_save_hyperopt_statistics=skip_save_hyperopt_statistics,
+        skip_share_datasets=skip_share_datasets,
         output_directory=output_directory,
         gpus=gpus,
         gpu_memory_limit=gpu_memory_limit,
@@ -209,6 +214,13 @@ def cli(sys_argv):
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "--skip_share_datasets",
+        help="hands every trial its own in-memory copy of the processed datasets instead of memory-mapping a single "
+        "copy shared by the trials of a node",
+        action="store_true",
+        default=False,
+    )
 
     # ----------------------------
     # Experiment naming parameters
@@ -1,3 +1,4 @@
+import os
 from typing import Callable, Dict, List, Optional
 
 import numpy as np
@@ -5,7 +6,8 @@ import pandas as pd
 import torch
 
 from ludwig.api_annotations import DeveloperAPI
-from ludwig.constants import ENCODER_OUTPUT, MODEL_ECD, NAME, PROC_COLUMN, TYPE
+from ludwig.constants import ENCODER, ENCODER_OUTPUT, MODEL_ECD, NAME, PROC_COLUMN, TYPE
+from ludwig.data.cache.embeddings import EmbeddingCache, get_encoder_key, hash_encoder_weights, hash_rows
 from ludwig.features.feature_registries import get_input_type_registry
 from ludwig.features.feature_utils import LudwigFeatureDict
 from ludwig.models.base import BaseModel
@@ -86,8 +88,14 @@ def create_embed_batch_size_evaluator(
 
 @DeveloperAPI
 def create_embed_transform_fn(
-    features_to_encode: List[FeatureConfigDict], metadata: TrainingSetMetadataDict
+    features_to_encode: List[FeatureConfigDict], metadata: TrainingSetMetadataDict, cache_dir: Optional[str] = None
 ) -> Callable:
+    """Returns the class of the batch transform that embeds `features_to_encode`.
+
+    If `cache_dir` is set, the embeddings of every feature are looked up in, and added to, the persistent embedding
+    cache of its encoder in `cache_dir`, and the encoder only runs on the rows missing from the cache.
+    """
+
     class EmbedTransformFn:
         def __init__(self):
             embedder = Embedder(features_to_encode, metadata)
@@ -95,17 +103,23 @@ def create_embed_transform_fn(
             self.embedder = embedder.to(self.device)
             self.embedder.eval()
 
+            self.caches: Dict[str, EmbeddingCache] = {}
+            if cache_dir is not None:
+                for feature in features_to_encode:
+                    input_feature = self.embedder.input_features.get(feature[NAME])
+                    if next(input_feature.parameters(), None) is None:
+                        # Encoders without weights, like one-hot encoders, are cheaper to run than to look up.
+                        continue
+                    weights_hash = hash_encoder_weights(input_feature)
+                    encoder_key = get_encoder_key(feature[TYPE], feature[ENCODER], weights_hash)
+                    self.caches[feature[NAME]] = EmbeddingCache(os.path.join(cache_dir, encoder_key))
+
         def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
             batch = _prepare_batch(df, features_to_encode, metadata)
-            name_to_proc = {i_feat.feature_name: i_feat.proc_column for i_feat in self.embedder.input_features.values()}
-            inputs = {
-                i_feat.feature_name: torch.from_numpy(np.array(batch[i_feat.proc_column], copy=True)).to(self.device)
+            encoded = {
+                i_feat.proc_column: self._embed(i_feat.feature_name, batch[i_feat.proc_column])
                 for i_feat in self.embedder.input_features.values()
             }
-            with torch.no_grad():
-                encoder_outputs = self.embedder(inputs)
-
-            encoded = {name_to_proc[k]: v.detach().cpu().float().numpy() for k, v in encoder_outputs.items()}
             output_df = from_numpy_dataset(encoded)
 
             for c in output_df.columns:
@@ -113,6 +127,31 @@ def create_embed_transform_fn(
 
             return df
 
+        def _embed(self, feature_name: str, values: np.ndarray) -> np.ndarray:
+            cache = self.caches.get(feature_name)
+            if cache is None:
+                return self._run_encoder(feature_name, values)
+
+            keys = hash_rows(values)
+            found, cached = cache.get(keys)
+            if cached is not None and found.all():
+                return cached
+            missing = ~found
+            embeddings = self._run_encoder(feature_name, values[missing])
+            cache.put(keys[missing], embeddings)
+            if cached is None:
+                return embeddings
+            merged = np.empty((len(values), *embeddings.shape[1:]), dtype=embeddings.dtype)
+            merged[found] = cached
+            merged[missing] = embeddings
+            return merged
+
+        def _run_encoder(self, feature_name: str, values: np.ndarray) -> np.ndarray:
+            inputs = {feature_name: torch.from_numpy(np.array(values, copy=True)).to(self.device)}
+            with torch.no_grad():
+                encoder_outputs = self.embedder(inputs)
+            return encoder_outputs[feature_name].detach().cpu().float().numpy()
+
     return EmbedTransformFn
 
 
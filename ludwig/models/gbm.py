@@ -114,26 +114,7 @@ class GBM(BaseModel):
         # the Hummingbird compiled model. Notably, when compiling the model to torchscript, compiling with Hummingbird
         # first should preserve the torch predictions code path.
         if self.compiled_model is None:
-            feature_vectors = []
-            for a in inputs.values():
-                if a.ndim > 1:
-                    # Input feature is a vector of shape [batch_size, nfeatures]
-                    # We need to expand this into `nfeatures` individual vectors of shape [batch_size]
-                    nfeatures = a.shape[1]
-                    vectors = [v.squeeze() for v in np.hsplit(a, nfeatures)]
-                    feature_vectors += vectors
-                else:
-                    feature_vectors.append(a)
-
-            # The LGBM sklearn interface works with array-likes, so we place the inputs into a 2D numpy array.
-            in_array = np.stack(feature_vectors, axis=0).T
-
-            # Predict on the input batch and convert the predictions to torch tensors so that they are compatible with
-            # the existing metrics modules.
-            # Input: 2D eval_batch_size x n_features array
-            # Output: 1D eval_batch_size array if regression, else 2D eval_batch_size x n_classes array
-            logits = torch.from_numpy(self.lgbm_model.predict(in_array, raw_score=True))
-            logits = reshape_logits(output_feature, logits)
+            return self.predict_native(inputs)
         else:
             # Convert inputs to tensors of type float as expected by hummingbird GEMMTreeImpl.
             for input_feature_name, t in inputs.items():
@@ -182,6 +163,42 @@ class GBM(BaseModel):
         output_logits[USED_TOKENS] = get_used_tokens_for_gbm(inputs)
         return output_logits
 
+    def to_feature_matrix(self, inputs: Dict[str, Union[np.ndarray, torch.Tensor]]) -> np.ndarray:
+        """Returns the inputs as the 2D batch_size x n_features array expected by LightGBM.
+
+        Input features are laid out in the order of `self.input_features`, vector features spanning one column per
+        element, like the columns of `Dataset.to_scalar_df` the model was trained on. The array is built with a
+        single copy of the inputs.
+        """
+        columns = [np.asarray(inputs[name]) for name in self.input_features.keys()]
+        return np.concatenate([column.reshape(len(column), -1) for column in columns], axis=1)
+
+    def predict_native(
+        self, inputs: Dict[str, Union[np.ndarray, torch.Tensor]], num_threads: Optional[int] = None
+    ) -> Dict[str, torch.Tensor]:
+        """Predicts the logits of the output feature with the native LightGBM model, bypassing the compiled model.
+
+        Args:
+            inputs: batch of inputs keyed by input feature name.
+            num_threads: number of threads LightGBM predicts with, 0 for one thread per core. Defaults to the number
+                of threads the model was trained with.
+
+        Returns:
+            The model outputs, like `forward`.
+        """
+        output_feature_name = self.output_features.keys()[0]
+        output_feature = self.output_features.get(output_feature_name)
+
+        # Convert the predictions to torch tensors so that they are compatible with the existing metrics modules.
+        predict_params = {} if num_threads is None else {"num_threads": num_threads}
+        preds = self.lgbm_model.predict(self.to_feature_matrix(inputs), raw_score=True, **predict_params)
+        logits = reshape_logits(output_feature, torch.from_numpy(preds))
+
+        output_logits = {}
+        output_feature_utils.set_output_feature_tensor(output_logits, output_feature_name, LOGITS, logits)
+        output_logits[USED_TOKENS] = get_used_tokens_for_gbm(inputs)
+        return output_logits
+
     def save(self, save_path):
         """Saves the model to the given path."""
         if self.lgbm_model is None:
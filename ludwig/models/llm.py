@@ -1,4 +1,5 @@
 import contextlib
+import inspect
 import logging
 import os
 from typing import Any, Dict, List, Optional, Tuple, Union
@@ -16,17 +17,22 @@ from ludwig.globals import MODEL_WEIGHTS_FILE_NAME
 from ludwig.models.base import BaseModel
 from ludwig.modules.training_hooks import NEFTuneHook
 from ludwig.schema.features.base import BaseOutputFeatureConfig, FeatureCollection
+from ludwig.schema.llms.generation import LLMGenerationConfig, LUDWIG_GENERATION_PARAMETERS
 from ludwig.schema.model_types.llm import LLMModelConfig
 from ludwig.utils.augmentation_utils import AugmentationPipelines
 from ludwig.utils.data_utils import clear_data_cache
+from ludwig.utils.llm_continuous_batching import ContinuousBatchingScheduler, UNSUPPORTED_GENERATION_PARAMETERS
+from ludwig.utils.llm_prefix_cache import get_common_prefix_length, PrefixKVCache
 from ludwig.utils.llm_quantization_utils import convert_quantized_linear_to_linear
 from ludwig.utils.llm_utils import (
     add_left_padding,
     generate_merged_ids,
+    generate_packed_ids,
     get_context_len,
     get_realigned_target_and_prediction_tensors_for_inference,
     initialize_adapter,
     load_pretrained_from_config,
+    PackingStats,
     pad_target_tensor_for_fine_tuning,
     remove_left_padding,
     to_device,
@@ -118,6 +124,17 @@ class LLM(BaseModel):
         # Initialize tokenizer
         self.tokenizer = HFTokenizer(self.config_obj.base_model).tokenizer
 
+        # When fine-tuning with sequence packing, several examples are concatenated into each row of the batch, and
+        # position ids are reset at each example boundary, which requires the base model to accept `position_ids`.
+        self.sequence_packing = getattr(self.config_obj.trainer, "sequence_packing", False)
+        if self.sequence_packing and "position_ids" not in inspect.signature(self.model.forward).parameters:
+            logger.warning(f"Base model `{self.model_name}` does not accept position ids, disabling sequence packing.")
+            self.sequence_packing = False
+        self.packing_stats = PackingStats()
+        self.packed_labels = None
+
+        self.prefix_cache = None
+        self.continuous_batching_stats = None
         self._set_generation_config(self.config_obj.generation.to_dict())
 
         # ================ Inputs ================
@@ -154,6 +171,22 @@ class LLM(BaseModel):
 
         clear_data_cache()
 
+    def _set_prefix_cache(self, enabled: bool, max_memory_mb: int):
+        if not enabled:
+            self.prefix_cache = None
+        elif self.prefix_cache is None:
+            self.prefix_cache = PrefixKVCache(max_memory_mb * 1024 * 1024)
+        else:
+            # Keep the prefixes cached so far, they only depend on the model weights.
+            self.prefix_cache.max_memory_bytes = max_memory_mb * 1024 * 1024
+
+    def train(self, mode: bool = True):
+        # Cached prefixes are only valid for the current weights. Training or evaluation (after which the best weights
+        # may be restored) always starts by setting the mode, so prefixes are never reused across weight updates.
+        if getattr(self, "prefix_cache", None) is not None:
+            self.prefix_cache.clear()
+        return super().train(mode)
+
     def create_feature_dict(self) -> DictWrapper:
         return DictWrapper(LudwigFeatureDict())
 
@@ -162,7 +195,7 @@ class LLM(BaseModel):
         """Sets the generation config for the model."""
         # Save the original generation config so that we can reset it if/when we change it when self.generation gets is
         # dynamically mutated during 1-off predict calls after fine-tuning.
-        original_generation_config_dict = self.generation.to_dict()
+        original_generation_config_dict = self.generation_config_dict
         try:
             # no-op if generation_config is None
             if generation_config_dict is not None:
@@ -174,7 +207,14 @@ class LLM(BaseModel):
             self._set_generation_config(original_generation_config_dict)
 
     def _set_generation_config(self, new_generation_config_dict: Dict[str, Any]):
-        self.generation = GenerationConfig(**new_generation_config_dict)
+        self.generation_config_dict = new_generation_config_dict
+        self._set_prefix_cache(
+            new_generation_config_dict.get("prefix_cache", False),
+            new_generation_config_dict.get("prefix_cache_max_memory_mb", 1024),
+        )
+        self.generation = GenerationConfig(
+            **{k: v for k, v in new_generation_config_dict.items() if k not in LUDWIG_GENERATION_PARAMETERS}
+        )
         # We need to manually set the pad_token_id to the tokenizer's pad_token_id for certain models like GPT and
         # CodeLlama to avoid getting an error. This workaround can be found here:
         # (https://github.com/huggingface/transformers/issues/25353#issuecomment-1669339754)
@@ -260,20 +300,36 @@ class LLM(BaseModel):
         """
         input_ids, target_ids = self._unpack_inputs(inputs)
 
-        # Generate merged input_id, target_id pairs for the model, and create corresponding attention masks
-        # We save them as class variables so that we can use them when realigning target and prediction tensors
-        self.model_inputs, self.attention_masks = generate_merged_ids(
-            input_ids, target_ids, self.tokenizer, self.global_max_sequence_length
-        )
+        model_kwargs = {}
+        self.packed_labels = None
+        if self.training and self.sequence_packing and target_ids is not None and self.output_feature_type == TEXT:
+            # Pack several merged input_id, target_id pairs into each row. A block-diagonal causal mask keeps the
+            # examples of a row from attending to each other. The labels of the packed rows replace the realigned
+            # targets when computing the loss and training metrics.
+            packed_batch = generate_packed_ids(input_ids, target_ids, self.tokenizer, self.global_max_sequence_length)
+            self.model_inputs = packed_batch.input_ids
+            self.attention_masks = packed_batch.causal_attention_mask(self.model.dtype)
+            self.packed_labels = packed_batch.labels
+            model_kwargs["position_ids"] = packed_batch.position_ids
+            self.packing_stats.update(packed_batch)
+        else:
+            # Generate merged input_id, target_id pairs for the model, and create corresponding attention masks
+            # We save them as class variables so that we can use them when realigning target and prediction tensors
+            self.model_inputs, self.attention_masks = generate_merged_ids(
+                input_ids, target_ids, self.tokenizer, self.global_max_sequence_length
+            )
 
-        # Wrap with flash attention backend for faster generation
+        # Wrap with flash attention backend for faster generation. The flash kernel does not support the custom
+        # attention mask of packed rows.
         with (
             torch.backends.cuda.sdp_kernel(enable_flash=True, enable_math=False, enable_mem_efficient=False)
-            if (torch.cuda.is_available() and self.curr_device.type == "cuda")
+            if (torch.cuda.is_available() and self.curr_device.type == "cuda" and self.packed_labels is None)
             else contextlib.nullcontext()
         ):
             # TODO (jeffkinnison): Determine why the 8-bit `SCB` and `CB` matrices are deleted in the forward pass
-            model_outputs = self.model(input_ids=self.model_inputs, attention_mask=self.attention_masks).get(LOGITS)
+            model_outputs = self.model(
+                input_ids=self.model_inputs, attention_mask=self.attention_masks, **model_kwargs
+            ).get(LOGITS)
 
         if self.output_feature_type != TEXT:
             # Pass generated tokens through decoder after averaging the token probabilities
@@ -317,8 +373,7 @@ class LLM(BaseModel):
         input_ids, _ = self._unpack_inputs(inputs)
 
         with torch.no_grad():
-            input_lengths = []
-            sequences_list = []
+            samples = []
             for input_ids_sample in input_ids:
                 input_ids_sample_no_padding = remove_left_padding(input_ids_sample, self.tokenizer)
 
@@ -328,8 +383,33 @@ class LLM(BaseModel):
                         f"greater than max input length {self.max_input_length}. Truncating."
                     )
                     input_ids_sample_no_padding = input_ids_sample_no_padding[:, -self.max_input_length :]  # noqa E203
+                samples.append(input_ids_sample_no_padding)
+
+            input_lengths = [sample.shape[1] for sample in samples]
+            if self._use_continuous_batching():
+                scheduler = self.create_continuous_batching_scheduler()
+                sequences_list = scheduler.generate(samples)
+                self.continuous_batching_stats = scheduler.stats
+                logger.debug(
+                    f"Generated {scheduler.stats.generated_tokens} tokens at {scheduler.stats.tokens_per_second:.1f} "
+                    f"tokens/s, with {scheduler.stats.slot_utilization:.0%} slot utilization."
+                )
+                return self.output_feature_decoder.decoder_obj.forward(
+                    sequences_list,
+                    input_lengths,
+                    self.max_new_tokens,
+                )
+
+            prefix_ids = self._get_shared_prefix(samples)
 
-                input_lengths.append(input_ids_sample_no_padding.shape[1])
+            sequences_list = []
+            for input_ids_sample_no_padding in samples:
+                attention_mask = mask
+                prefix_kwargs = {}
+                if prefix_ids is not None:
+                    # Only the tokens after the cached prefix are run through the model, and none of them are padding.
+                    attention_mask = torch.ones_like(input_ids_sample_no_padding)
+                    prefix_kwargs["past_key_values"] = self.prefix_cache.get(self.model, prefix_ids)
 
                 # Wrap with flash attention backend for faster generation
                 with (
@@ -340,10 +420,11 @@ class LLM(BaseModel):
                     # Generate text using the model
                     model_outputs = self.model.generate(
                         input_ids=input_ids_sample_no_padding,
-                        attention_mask=mask,
+                        attention_mask=attention_mask,
                         generation_config=self.generation,
                         return_dict_in_generate=True,
                         output_scores=True,
+                        **prefix_kwargs,
                     )
 
                 sequences_list.append(model_outputs.sequences[0])
@@ -358,6 +439,61 @@ class LLM(BaseModel):
 
         return outputs
 
+    def _use_continuous_batching(self) -> bool:
+        """Returns whether to generate with the continuous batching scheduler, which only supports part of the
+        generation config.
+
+        Falls back to `model.generate` when any generation parameter the scheduler does not implement is set, so that
+        outputs never silently differ. Prefix caching is not used together with continuous batching, which prefills
+        every prompt on its own.
+        """
+        if not self.generation_config_dict.get("continuous_batching", False):
+            return False
+        if self.generation.num_beams > 1 or self.generation.num_return_sequences > 1:
+            log_once("Continuous batching only supports a single beam and sequence, disabling it.")
+            return False
+        defaults = LLMGenerationConfig().to_dict()
+        unsupported = [
+            name
+            for name in UNSUPPORTED_GENERATION_PARAMETERS
+            if self.generation_config_dict.get(name, defaults.get(name)) != defaults.get(name)
+        ]
+        if unsupported:
+            log_once(f"Continuous batching does not support the generation parameters {unsupported}, disabling it.")
+            return False
+        if self.prefix_cache is not None:
+            log_once("Prefix caching is not used with continuous batching, which prefills every prompt on its own.")
+        return True
+
+    def create_continuous_batching_scheduler(self, max_batch_size: Optional[int] = None) -> ContinuousBatchingScheduler:
+        """Returns a scheduler generating with the current generation config, decoding up to `max_batch_size`
+        sequences together (by default `continuous_batching_slots`)."""
+        return ContinuousBatchingScheduler(
+            self.model,
+            max_batch_size=max_batch_size or self.generation_config_dict.get("continuous_batching_slots", 8),
+            max_new_tokens=self.max_new_tokens,
+            eos_token_id=self.generation.eos_token_id or self.tokenizer.eos_token_id,
+            do_sample=self.generation.do_sample,
+            temperature=self.generation.temperature,
+            top_k=self.generation.top_k,
+            top_p=self.generation.top_p,
+        )
+
+    def _get_shared_prefix(self, samples: List[torch.Tensor]) -> Optional[torch.Tensor]:
+        """Returns the token ids shared by the start of all samples whose key/value cache should be reused, or None
+        if prefix caching is disabled or not worthwhile."""
+        if self.prefix_cache is None:
+            return None
+        if not self.generation.use_cache or self.generation.num_beams > 1 or self.generation.num_return_sequences > 1:
+            log_once("Prefix caching is only supported with `use_cache` and a single beam and sequence, disabling it.")
+            return None
+
+        # Keep at least one token per sample, generation needs to run the model over the last prompt token.
+        prefix_length = min(get_common_prefix_length(samples), min(sample.shape[1] for sample in samples) - 1)
+        if prefix_length < self.prefix_cache.min_prefix_length:
+            return None
+        return samples[0][:, :prefix_length]
+
     def is_merge_and_unload_set(self) -> bool:
         """Check if the "adapter" configuration section exists and, if affirmative, that it contains the
         "postprocessor" subsection and the "merge_adapter_into_base_model" and "progressbar" directives.
@@ -427,6 +563,10 @@ class LLM(BaseModel):
 
     def update_metrics(self, targets, predictions):
         """Updates the model's metrics given targets and predictions for zero-shot/few-shot."""
+        if self.packed_labels is not None:
+            # Predictions are over packed rows, so compare them with the labels of the packed rows.
+            targets = {of_name: self.packed_labels for of_name in self.output_features.keys()}
+
         for of_name, of_obj in self.output_features.items():
             if isinstance(of_obj, TextOutputFeature):
                 # Align the target length with the predictions length to enable text metric evaluation.
@@ -674,6 +814,12 @@ class LLM(BaseModel):
         Returns:
             Dict[str, torch.Tensor]: A dictionary containing the updated target tensors aligned with predictions.
         """
+        if self.packed_labels is not None:
+            # With sequence packing, the labels were built alongside the packed rows in the forward pass and are
+            # already aligned with the predictions.
+            targets[of_name] = self.packed_labels.to(dtype=targets[of_name].dtype, device=targets[of_name].device)
+            return targets
+
         # Remove left padding from target tensors since we also do this for the model's forward pass when we
         # concatenate the input_ids with the target_ids. We also need to add the pad token to the end of the
         # target tensors.
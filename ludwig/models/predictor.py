@@ -3,8 +3,9 @@ import os
 import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict, OrderedDict
+from functools import partial
 from pprint import pformat
-from typing import Dict, List, Optional, Type
+from typing import Callable, Dict, List, Optional, Tuple, Type
 
 import numpy as np
 import pandas as pd
@@ -30,9 +31,23 @@ EXCLUDE_PRED_SET = {LOGITS, LAST_HIDDEN}
 SKIP_EVAL_METRICS = {"confusion_matrix", "roc_curve"}
 STATS_SAMPLE_SIZE = 10000
 
+# Default number of rows GBMs predict on at once. Tree ensembles have a small per-row cost, so larger chunks amortize
+# the per-batch overhead and let LightGBM spread the rows of a chunk across threads.
+GBM_PREDICT_CHUNK_SIZE = 65536
+
 logger = logging.getLogger(__name__)
 
 
+def _collect_layer_output(layer_outputs: Dict[str, torch.Tensor], layer_name: str, module, inputs, output):
+    """Forward hook storing the tensors output by the module in `layer_outputs`."""
+    if torch.is_tensor(output):
+        layer_outputs[layer_name] = output
+    elif isinstance(output, dict):
+        layer_outputs.update({f"{layer_name}::{key}": value for key, value in output.items() if torch.is_tensor(value)})
+    elif isinstance(output, (list, tuple)):
+        layer_outputs.update({f"{layer_name}::{i}": value for i, value in enumerate(output) if torch.is_tensor(value)})
+
+
 class BasePredictor(ABC):
     @abstractmethod
     def batch_predict(self, dataset, dataset_name=None):
@@ -47,7 +62,7 @@ class BasePredictor(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    def batch_collect_activations(self, layer_names, dataset, bucketing_field=None):
+    def batch_collect_activations(self, layer_names, dataset, bucketing_field=None, collect_fn=None):
         raise NotImplementedError()
 
     # Remote implementations may override this
@@ -78,14 +93,17 @@ def get_predictor_cls(model_type: str) -> Type[BasePredictor]:
     return _predictor_registry[model_type]
 
 
-@register_predictor([MODEL_ECD, MODEL_GBM])
+@register_predictor([MODEL_ECD])
 class Predictor(BasePredictor):
     """Predictor is a class that uses a model to predict and evaluate."""
 
+    # Number of rows predicted on at once when no batch size is requested.
+    default_batch_size = 128
+
     def __init__(
         self,
         dist_model: nn.Module,
-        batch_size: int = 128,
+        batch_size: Optional[int] = None,
         distributed: DistributedStrategy = None,
         report_tqdm_to_ray: bool = False,
         model: Optional[BaseModel] = None,
@@ -94,7 +112,7 @@ class Predictor(BasePredictor):
     ):
         """
         :param dist_model: model to use for prediction, post-wrap for distributed training
-        :param batch_size: batch size to use for prediction
+        :param batch_size: batch size to use for prediction, defaults to `default_batch_size`
         :param distributed: distributed strategy to use for prediction
         :param report_tqdm_to_ray: whether to report tqdm progress to Ray
         :param model: Ludwig BaseModel before being wrapped for distributed training.
@@ -103,7 +121,7 @@ class Predictor(BasePredictor):
         model = model or dist_model
         assert isinstance(model, BaseModel)
 
-        self._batch_size = batch_size
+        self._batch_size = batch_size if batch_size is not None else self.default_batch_size
         self._distributed = distributed if distributed is not None else LocalStrategy()
         self.report_tqdm_to_ray = report_tqdm_to_ray
 
@@ -293,44 +311,102 @@ class Predictor(BasePredictor):
 
             return metrics, from_numpy_dataset(predictions)
 
-    def batch_collect_activations(self, layer_names, dataset, bucketing_field=None):
+    def batch_collect_activations(
+        self,
+        layer_names: List[str],
+        dataset: Dataset,
+        bucketing_field: Optional[str] = None,
+        collect_fn: Optional[Callable[[Dict[str, torch.Tensor]], None]] = None,
+    ) -> Optional[List[Tuple[str, torch.Tensor]]]:
+        """Collects the outputs of the model, and of the modules named in `layer_names`, for every row of the
+        dataset.
+
+        Params:
+            layer_names: names of modules of the model, as listed by `named_modules()`, whose outputs are collected in
+                addition to the outputs of the model. Modules returning a dictionary or a sequence of tensors have
+                their outputs collected as `<layer name>::<key or index>`.
+            dataset: dataset to collect the activations of.
+            bucketing_field: not supported.
+            collect_fn: called with the activations of every batch, keyed by name, as soon as they are computed, so
+                that they can be written out without holding the activations of the whole dataset in memory.
+
+        Returns:
+            If `collect_fn` is None, the list of (name, tensor) of the activations of the whole dataset, concatenated
+            in memory. None otherwise.
+        """
         if bucketing_field:
             raise ValueError("BucketedBatcher is not supported yet")
 
-        prev_model_training_mode = self.dist_model.training  # store previous model training mode
-        self.dist_model.eval()  # set model to eval mode
+        modules = dict(self.model.named_modules())
+        layer_outputs = {}
+        hook_handles = [
+            modules[layer_name].register_forward_hook(partial(_collect_layer_output, layer_outputs, layer_name))
+            for layer_name in layer_names
+            if layer_name in modules
+        ]
 
-        with torch.no_grad():
-            with dataset.initialize_batcher(
-                self._batch_size, should_shuffle=False, distributed=self._distributed
-            ) as batcher:
-                progress_bar_config = {
-                    "desc": "Collecting Tensors",
-                    "total": batcher.steps_per_epoch,
-                    "file": sys.stdout,
-                    "disable": is_progressbar_disabled(),
-                }
-                progress_bar = LudwigProgressBar(self.report_tqdm_to_ray, progress_bar_config, self.is_coordinator())
+        collected_tensors = None
+        if collect_fn is None:
+            collected_tensors = defaultdict(list)
 
-                collected_tensors = []
-                while not batcher.last_batch():
-                    batch = batcher.next_batch()
+            def collect_fn(activations: Dict[str, torch.Tensor]):
+                for name, tensor in activations.items():
+                    collected_tensors[name].append(tensor.cpu())
 
-                    inputs = {
-                        i_feat.feature_name: torch.from_numpy(np.array(batch[i_feat.proc_column], copy=True)).to(
-                            self.device
-                        )
-                        for i_feat in self.model.input_features.values()
-                    }
-                    outputs = self._predict_on_inputs(inputs)
-                    collected_tensors = [(concat_name, tensor) for concat_name, tensor in outputs.items()]
-                    progress_bar.update(1)
+        prev_model_training_mode = self.dist_model.training  # store previous model training mode
+        self.dist_model.eval()  # set model to eval mode
 
-                progress_bar.close()
+        try:
+            with torch.no_grad():
+                with dataset.initialize_batcher(
+                    self._batch_size, should_shuffle=False, distributed=self._distributed
+                ) as batcher:
+                    progress_bar_config = {
+                        "desc": "Collecting Tensors",
+                        "total": batcher.steps_per_epoch,
+                        "file": sys.stdout,
+                        "disable": is_progressbar_disabled(),
+                    }
+                    progress_bar = LudwigProgressBar(
+                        self.report_tqdm_to_ray, progress_bar_config, self.is_coordinator()
+                    )
 
-        self.dist_model.train(prev_model_training_mode)  # Restores previous model training mode.
+                    is_first_batch = True
+                    while not batcher.last_batch():
+                        batch = batcher.next_batch()
+
+                        inputs = {
+                            i_feat.feature_name: torch.from_numpy(np.array(batch[i_feat.proc_column], copy=True)).to(
+                                self.device
+                            )
+                            for i_feat in self.model.input_features.values()
+                        }
+                        outputs = self._predict_on_inputs(inputs)
+                        # Skip non-tensor outputs, e.g. used_tokens.
+                        activations = {name: tensor for name, tensor in outputs.items() if torch.is_tensor(tensor)}
+                        activations.update(layer_outputs)
+                        layer_outputs.clear()
+
+                        if is_first_batch:
+                            unknown_layer_names = [
+                                name for name in layer_names if name not in modules and name not in activations
+                            ]
+                            if unknown_layer_names:
+                                logger.warning(f"Layers {unknown_layer_names} are not modules nor outputs of the model")
+                            is_first_batch = False
+
+                        collect_fn(activations)
+                        progress_bar.update(1)
+
+                    progress_bar.close()
+        finally:
+            for handle in hook_handles:
+                handle.remove()
+            self.dist_model.train(prev_model_training_mode)  # Restores previous model training mode.
 
-        return collected_tensors
+        if collected_tensors is None:
+            return None
+        return [(name, torch.cat(tensors)) for name, tensors in collected_tensors.items()]
 
     def _predict_on_inputs(self, inputs: Dict) -> Dict:
         return self.dist_model(inputs)
@@ -339,6 +415,50 @@ class Predictor(BasePredictor):
         return self._distributed.rank() == 0
 
 
+def _get_ray_worker_num_cpus() -> Optional[int]:
+    """Returns the number of CPUs allotted to the current Ray actor or task, or None outside of Ray workers."""
+    try:
+        import ray
+    except ImportError:
+        return None
+
+    if not ray.is_initialized() or ray.get_runtime_context().worker.mode != ray.WORKER_MODE:
+        return None
+    num_cpus = ray.get_runtime_context().get_assigned_resources().get("CPU")
+    return max(int(num_cpus), 1) if num_cpus else None
+
+
+@register_predictor([MODEL_GBM])
+class GbmPredictor(Predictor):
+    """Predictor of GBM models, which scores large chunks of rows at once.
+
+    Unless the model was compiled to tensors with Hummingbird, every chunk is scored with the native multi-threaded
+    LightGBM predict on a feature matrix built straight from the columns of the dataset.
+    """
+
+    default_batch_size = GBM_PREDICT_CHUNK_SIZE
+
+    def __init__(self, dist_model: nn.Module, num_threads: Optional[int] = None, **kwargs):
+        """
+        :param num_threads: number of threads LightGBM predicts with, 0 for one thread per core. Defaults to the CPUs
+            allotted to the Ray worker the predictor runs in, or else to the number of threads the model was trained
+            with, so that the workers sharing a node do not oversubscribe its cores.
+        """
+        super().__init__(dist_model, **kwargs)
+        self.num_threads = num_threads if num_threads is not None else _get_ray_worker_num_cpus()
+
+    def _predict(self, batch: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        if self.model.compiled_model is not None:
+            return super()._predict(batch)
+        inputs = {i_feat.feature_name: batch[i_feat.proc_column] for i_feat in self.model.input_features.values()}
+        return self.model.outputs_to_predictions(self.model.predict_native(inputs, num_threads=self.num_threads))
+
+    def _predict_on_inputs(self, inputs: Dict) -> Dict:
+        if self.model.compiled_model is not None:
+            return super()._predict_on_inputs(inputs)
+        return self.model.predict_native(inputs, num_threads=self.num_threads)
+
+
 @register_predictor([MODEL_LLM])
 class LlmPredictor(Predictor):
     def _predict_on_inputs(self, inputs: Dict) -> Dict:
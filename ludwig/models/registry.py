@@ -2,7 +2,6 @@ import logging
 
 from ludwig.constants import MODEL_ECD, MODEL_GBM, MODEL_LLM
 from ludwig.models.ecd import ECD
-from ludwig.models.llm import LLM
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +19,15 @@ def gbm(*args, **kwargs):
     return GBM(*args, **kwargs)
 
 
+def llm(*args, **kwargs):
+    # Imported on use, as LLMs pull in transformers, peft and bitsandbytes.
+    from ludwig.models.llm import LLM
+
+    return LLM(*args, **kwargs)
+
+
 model_type_registry = {
     MODEL_ECD: ECD,
     MODEL_GBM: gbm,
-    MODEL_LLM: LLM,
+    MODEL_LLM: llm,
 }
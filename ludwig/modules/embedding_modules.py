@@ -166,8 +166,55 @@ class Embed(LudwigModule):
         return torch.Size([self.embedding_size])
 
 
-class EmbedSet(LudwigModule):
-    """Module to embed Set data types, works on multi-hot encoded input."""
+@torch.jit.script
+def to_embedding_bag_inputs(
+    inputs: torch.Tensor, index_weights: bool = False, dense_counts: bool = False
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Converts a batch of sets or bags to the flat item indices and weights, and the offsets and number of items of
+    each sample, expected by `torch.nn.functional.embedding_bag`.
+
+    Supports the sparse layouts of set and bag features, where each sample lists the indices of its items padded with
+    -1, either as integers of shape [batch x max_items] or, with the weight of each item, [batch x 2 x max_items]. Also
+    supports the dense layouts of models preprocessed before sparse storage, multi-hot or weights of shape
+    [batch x vocab_size]. If `index_weights` is set, each item of a multi-hot or [batch x max_items] input is weighed by
+    its index, in both layouts, for backwards compatibility with trained set models. If `dense_counts` is set, integer
+    inputs of shape [batch x vocab_size] are also read as dense item counts.
+
+    Scripted so that the layout is checked at runtime in traced models.
+    """
+    if inputs.dtype == torch.bool or inputs.is_floating_point() or (dense_counts and inputs.dim() == 2):
+        nonzero = torch.nonzero(inputs)
+        sample_indices, indices = nonzero[:, 0], nonzero[:, 1]
+        if index_weights:
+            weights = indices.float()
+        else:
+            weights = inputs[sample_indices, indices].float()
+    else:
+        item_indices = inputs
+        if inputs.dim() == 3:
+            item_indices = inputs[:, 0]
+        mask = item_indices >= 0
+        sample_indices = torch.nonzero(mask)[:, 0]
+        indices = item_indices[mask]
+        if inputs.dim() == 3:
+            weights = inputs[:, 1][mask].float()
+        elif index_weights:
+            weights = indices.float()
+        else:
+            weights = torch.ones(indices.shape, device=inputs.device)
+
+    counts = torch.bincount(sample_indices, minlength=inputs.shape[0])
+    offsets = torch.cumsum(counts, dim=0) - counts
+    return indices.long(), weights, offsets, counts
+
+
+class EmbedSparse(LudwigModule):
+    """Module to embed Set and Bag data types, aggregating the embeddings of the items of each sample with a bag-
+    style lookup, so memory and compute scale with the number of items rather than the vocabulary size.
+
+    Inputs list the indices of the items of each sample padded with -1, of shape [batch x max_items], or with the
+    weight of each item, of shape [batch x 2 x max_items] (see `to_embedding_bag_inputs`).
+    """
 
     def __init__(
         self,
@@ -198,37 +245,28 @@ class EmbedSet(LudwigModule):
         )
 
         if dropout > 0:
-            self.dropout = torch.nn.Dropout(p=dropout)
+            self.dropout = nn.Dropout(p=dropout)
         else:
             self.dropout = None
 
-        if aggregation_function == "sum":
-            self.aggregation_function = torch.sum
-        elif aggregation_function == "avg":
-            self.aggregation_function = torch.mean
-        else:
+        if aggregation_function not in {"sum", "avg"}:
             raise ValueError(f"Unsupported aggregation function {aggregation_function}")
+        self.aggregation_function = aggregation_function
 
-        self.register_buffer("vocab_indices", torch.arange(self.vocab_size))
-
-    def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
-        """
-        Params:
-            inputs: Boolean multi-hot tensor of size [batch x vocab_size], where
-                    inputs[b, i] indicates that token i is present in sample b.
-        """
-        # Convert multi-hot input to input of indices
-        inputs = inputs.int() * self.vocab_indices
-        embedded = self.embeddings(inputs.long())
-        # Mask out the 0th embedding
-        mask = torch.unsqueeze(inputs, -1)
-        embedded = embedded * mask
-        # Sum over all positive tokens
-        embedded = self.aggregation_function(embedded, dim=1)
+    def embed_bags(self, inputs: torch.Tensor, index_weights: bool = False, dense_counts: bool = False) -> torch.Tensor:
+        indices, weights, offsets, counts = to_embedding_bag_inputs(inputs, index_weights, dense_counts)
+        embedded = nn.functional.embedding_bag(
+            indices, self.embeddings.weight, offsets, mode="sum", per_sample_weights=weights
+        )
+        if self.aggregation_function == "avg":
+            embedded = embedded / counts.clamp(min=1).unsqueeze(-1).to(embedded.device, embedded.dtype)
         if self.dropout:
             embedded = self.dropout(embedded)
         return embedded
 
+    def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+        return self.embed_bags(inputs)
+
     @property
     def input_shape(self) -> torch.Size:
         return torch.Size([self.vocab_size])
@@ -237,13 +275,57 @@ class EmbedSet(LudwigModule):
     def output_shape(self) -> torch.Size:
         return torch.Size([self.embedding_size])
 
+
+class EmbedSet(EmbedSparse):
+    """Module to embed Set data types, works on the indices of the items of each sample (see `EmbedSparse`), or on
+    the multi-hot encoded input of models preprocessed before sparse storage."""
+
+    def __init__(
+        self,
+        vocab: List[str],
+        embedding_size: int,
+        representation: str = "dense",
+        embeddings_trainable: bool = True,
+        pretrained_embeddings: Optional[str] = None,
+        force_embedding_size: bool = False,
+        embeddings_on_cpu: bool = False,
+        dropout: float = 0.0,
+        embedding_initializer: Optional[Union[str, Dict]] = None,
+        aggregation_function: str = "sum",
+    ):
+        super().__init__(
+            vocab,
+            embedding_size,
+            representation=representation,
+            embeddings_trainable=embeddings_trainable,
+            pretrained_embeddings=pretrained_embeddings,
+            force_embedding_size=force_embedding_size,
+            embeddings_on_cpu=embeddings_on_cpu,
+            dropout=dropout,
+            embedding_initializer=embedding_initializer,
+            aggregation_function=aggregation_function,
+        )
+        # Unused, kept so that the weights of previously trained models still load.
+        self.register_buffer("vocab_indices", torch.arange(self.vocab_size))
+
+    def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """
+        Params:
+            inputs: Tensor of item indices of size [batch x max_items], padded with -1, or boolean multi-hot tensor
+                    of size [batch x vocab_size], where inputs[b, i] indicates that token i is present in sample b.
+        """
+        # Set embeddings used to be scaled by the index of their token, which trained models depend on, so items are
+        # weighed by their index in both the sparse and the multi-hot layouts.
+        return self.embed_bags(inputs, index_weights=True)
+
     @property
     def input_dtype(self):
         return torch.bool
 
 
-class EmbedWeighted(LudwigModule):
-    """Module to embed Bag data type, works on input of token frequencies."""
+class EmbedWeighted(EmbedSparse):
+    """Module to embed Bag data type, works on the indices and frequencies of the tokens of each sample (see
+    `EmbedSparse`), or on the token frequencies of models preprocessed before sparse storage."""
 
     def __init__(
         self,
@@ -257,9 +339,7 @@ class EmbedWeighted(LudwigModule):
         dropout: float = 0.0,
         embedding_initializer: Optional[str] = None,
     ):
-        super().__init__()
-
-        self.embeddings, self.embedding_size = embedding_matrix_on_device(
+        super().__init__(
             vocab,
             embedding_size,
             representation=representation,
@@ -267,107 +347,20 @@ class EmbedWeighted(LudwigModule):
             pretrained_embeddings=pretrained_embeddings,
             force_embedding_size=force_embedding_size,
             embeddings_on_cpu=embeddings_on_cpu,
+            dropout=dropout,
             embedding_initializer=embedding_initializer,
         )
-        self.vocab_size = len(vocab)
-
-        if dropout > 0:
-            self.dropout = nn.Dropout(dropout)
-        else:
-            self.dropout = None
-
+        # Unused, kept so that the weights of previously trained models still load.
         self.register_buffer("vocab_indices", torch.arange(self.vocab_size, dtype=torch.int32))
 
     def forward(self, inputs: torch.Tensor, mask: Optional[torch.Tensor] = None) -> torch.Tensor:
         """
         Params:
-            inputs: Tensor of frequencies, where inputs[b, i] represents
-                    frequency of token i in sample b of batch.
+            inputs: Tensor of token indices and frequencies of size [batch x 2 x max_tokens], padded with -1, or
+                    tensor of frequencies of size [batch x vocab_size], where inputs[b, i] represents frequency of
+                    token i in sample b of batch.
         """
-        # Convert to multi-hot input
-        signed_input = (inputs != 0).type(torch.int32)
-        multiple_hot_indexes = signed_input * self.vocab_indices
-        embedded = self.embeddings(multiple_hot_indexes)
-        # Mask out the 0th embedding
-        mask = torch.unsqueeze(inputs, -1)
-        weighted_embedded = embedded * mask
-        # Sum over the all the positive indices
-        embedded_reduced = torch.sum(weighted_embedded, dim=1)
-        if self.dropout:
-            embedded_reduced = self.dropout(embedded_reduced)
-        return embedded_reduced
-
-    @property
-    def input_shape(self) -> torch.Size:
-        return torch.Size([self.vocab_size])
-
-    @property
-    def output_shape(self) -> torch.Size:
-        return torch.Size([self.embedding_size])
-
-
-# TODO(shreya): Implement sparse embedding lookup.
-# class EmbedSparse(LudwigModule):
-#     def __init__(
-#             self,
-#             vocab: List[str],
-#             embedding_size: int = 50,
-#             representation: str = 'dense',
-#             embeddings_trainable: bool = True,
-#             pretrained_embeddings: Optional[str] = None,
-#             force_embedding_size: bool = False,
-#             embeddings_on_cpu: bool = False,
-#             dropout: float = 0.0,
-#             embedding_initializer: Optional[str] = None,
-#             reduce_output: str = 'sum'
-#     ):
-#         super().__init__()
-
-#         self.embeddings, self.embedding_size = embedding_matrix_on_device(
-#             vocab,
-#             embedding_size,
-#             representation=representation,
-#             embeddings_trainable=embeddings_trainable,
-#             pretrained_embeddings=pretrained_embeddings,
-#             force_embedding_size=force_embedding_size,
-#             embeddings_on_cpu=embeddings_on_cpu,
-#             embedding_initializer=embedding_initializer,
-#         )
-
-#         if dropout > 0:
-#             self.dropout = nn.Dropout(dropout)
-#         else:
-#             self.dropout = None
-
-#         self.reduce_output = reduce_output
-
-#     def forward(self, inputs: torch.Tensor):
-#         # idx = tf.where(tf.equal(inputs, True))
-#         # TODO(shreya): Check if this is equivalent
-#         idx = torch.nonzero(inputs)
-
-#         # sparse_multiple_hot_indexes = tf.SparseTensor(
-#         #     idx,
-#         #     idx[:, 1],
-#         #     tf.shape(inputs, out_type=tf.int64)
-#         # )
-#         sparse_multiple_hot_index = torch.sparse_coo_tensor(
-#             idx, idx[:, 1], inputs.shape
-#         )
-
-#         # TODO(shreya): Check if supported in torch
-#         # embedded_reduced = tf.nn.embedding_lookup_sparse(
-#         #     self.embeddings,
-#         #     sparse_multiple_hot_indexes,
-#         #     sp_weights=None,
-#         #     combiner=self.reduce_output
-#         # )
-
-#         # if self.dropout:
-#         #     embedded_reduced = self.dropout(embedded_reduced)
-
-#         # return embedded_reduced
-#         return None
+        return self.embed_bags(inputs, dense_counts=True)
 
 
 class EmbedSequence(LudwigModule):
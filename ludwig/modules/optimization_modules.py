@@ -18,6 +18,7 @@ from typing import Dict, Optional, Tuple, Type, TYPE_CHECKING
 import torch
 
 from ludwig.utils.misc_utils import get_from_registry
+from ludwig.utils.package_utils import import_attr
 from ludwig.utils.torch_utils import LudwigModule
 
 if TYPE_CHECKING:
@@ -45,6 +46,8 @@ def get_optimizer_class_and_kwargs(
 
     # Get the corresponding torch optimizer class for the given config:
     optimizer_cls = get_from_registry(optimizer_config.type.lower(), optimizer_registry)[0]
+    if isinstance(optimizer_cls, str):
+        optimizer_cls = import_attr(optimizer_cls)
 
     # Create a dict of parameters to be passed to torch (i.e. everything except `type`):
     cls_kwargs = {field: value for field, value in asdict(optimizer_config).items() if field != "type"}
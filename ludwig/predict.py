@@ -37,7 +37,7 @@ def predict_cli(
     dataset: Union[str, dict, pd.DataFrame] = None,
     data_format: str = None,
     split: str = FULL,
-    batch_size: int = 128,
+    batch_size: Optional[int] = None,
     generation_config: Optional[str] = None,
     skip_save_unprocessed_output: bool = False,
     skip_save_predictions: bool = False,
@@ -67,7 +67,8 @@ def predict_cli(
     :param split: (str, default: `full`) split on which
         to perform predictions. Valid values are `'training'`, `'validation'`,
         `'test'` and `'full'`.
-    :param batch_size: (int, default `128`) size of batches for processing.
+    :param batch_size: (int, default `None`) size of batches for processing,
+        128 unless the model type predicts on larger chunks.
     :param generation_config: (str, default: `None`) a string representing
         the parameters for generation required to perform predictions with
         an LLM. The string must be a JSON formatted dictionary with keys from
@@ -192,7 +193,7 @@ def cli(sys_argv):
     # ------------------
     # Generic parameters
     # ------------------
-    parser.add_argument("-bs", "--batch_size", type=int, default=128, help="size of batches")
+    parser.add_argument("-bs", "--batch_size", type=int, default=None, help="size of batches")
 
     # ------------------
     # Runtime parameters
@@ -6,6 +6,7 @@ from ludwig.schema import utils as schema_utils
 from ludwig.schema.encoders.base import BaseEncoderConfig
 from ludwig.schema.encoders.utils import register_encoder_config
 from ludwig.schema.metadata import ENCODER_METADATA
+from ludwig.schema.metadata.parameter_metadata import INTERNAL_ONLY
 from ludwig.schema.utils import ludwig_dataclass
 
 
@@ -41,6 +42,15 @@ class BagEmbedWeightedConfig(BaseEncoderConfig):
         parameter_metadata=ENCODER_METADATA["BagEmbedWeighted"]["vocab"],
     )
 
+    # Internal param set based on preprocessing metadata. Only set when the feature is stored sparsely, as the indices
+    # of its items padded to this size.
+    max_set_size: int = schema_utils.PositiveInteger(
+        default=None,
+        allow_none=True,
+        description="",
+        parameter_metadata=INTERNAL_ONLY,
+    )
+
     representation: str = schema_utils.StringOptions(
         ["dense", "sparse"],
         default="dense",
@@ -50,6 +50,14 @@ class AudioPreprocessingConfig(BasePreprocessingConfig):
         parameter_metadata=FEATURE_METADATA[AUDIO][PREPROCESSING]["in_memory"],
     )
 
+    num_processes: int = schema_utils.PositiveInteger(
+        default=None,
+        allow_none=True,
+        description="Number of worker processes used to read and featurize audio files when preprocessing in memory "
+        "on the local backend. If null, one process per available CPU is used.",
+        parameter_metadata=FEATURE_METADATA[AUDIO][PREPROCESSING]["num_processes"],
+    )
+
     padding_value: float = schema_utils.NonNegativeFloat(
         default=0.0,
         allow_none=False,
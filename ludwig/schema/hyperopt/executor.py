@@ -6,6 +6,7 @@ from marshmallow import fields, ValidationError
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import RAY
 from ludwig.schema import utils as schema_utils
+from ludwig.schema.hyperopt.pruner import LearningCurvePrunerConfig, PrunerConfigField
 from ludwig.schema.hyperopt.scheduler import BaseSchedulerConfig, SchedulerDataclassField
 from ludwig.schema.utils import ludwig_dataclass
 
@@ -75,6 +76,8 @@ class ExecutorConfig(schema_utils.BaseMarshmallowConfig):
 
     scheduler: BaseSchedulerConfig = SchedulerDataclassField(description="")
 
+    pruner: Optional[LearningCurvePrunerConfig] = PrunerConfigField().get_default_field()
+
 
 @DeveloperAPI
 def ExecutorDataclassField(description: str, default: Dict = {}):
@@ -0,0 +1,63 @@
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.schema import utils as schema_utils
+from ludwig.schema.utils import ludwig_dataclass
+
+
+@DeveloperAPI
+@ludwig_dataclass
+class LearningCurvePrunerConfig(schema_utils.BaseMarshmallowConfig):
+    """Stops trials whose extrapolated learning curve is unlikely to reach the best trials of the sweep.
+
+    Unlike schedulers, the pruner is driven by the trials' own training callbacks, so it can be combined with any
+    scheduler and search algorithm.
+    """
+
+    type: str = schema_utils.ProtectedString("learning_curve")
+
+    top_k: int = schema_utils.PositiveInteger(
+        default=3,
+        description=(
+            "A trial is only stopped if its predicted final metric is worse than the best metric of at least `top_k` "
+            "other trials, so no trial is stopped before `top_k` other trials have reported results."
+        ),
+    )
+
+    confidence: float = schema_utils.FloatRange(
+        default=0.95,
+        min=0.5,
+        max=1,
+        max_inclusive=False,
+        description=(
+            "Minimum predicted probability that the final metric of a trial is worse than the `top_k`-th best trial "
+            "for the trial to be stopped. Higher values stop fewer trials."
+        ),
+    )
+
+    min_evals: int = schema_utils.IntegerRange(
+        default=4,
+        min=4,
+        description=(
+            "Number of evaluations of a trial before its learning curve is extrapolated. The curve models have up to 3 "
+            "parameters, so at least 4 evaluations are needed to estimate the uncertainty of their predictions."
+        ),
+    )
+
+
+@DeveloperAPI
+class PrunerConfigField(schema_utils.DictMarshmallowField):
+    def __init__(self):
+        super().__init__(LearningCurvePrunerConfig, default_missing=True)
+
+    def _jsonschema_type_mapping(self):
+        return {
+            "oneOf": [
+                {"type": "null", "title": "disabled", "description": "Disable pruning."},
+                {
+                    **schema_utils.unload_jsonschema_from_marshmallow_class(LearningCurvePrunerConfig),
+                    "title": "learning_curve",
+                    "description": "Stop trials based on the extrapolation of their learning curve.",
+                },
+            ],
+            "title": "pruner",
+            "description": "Stops unpromising trials before they complete.",
+        }
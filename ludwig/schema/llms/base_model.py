@@ -3,7 +3,6 @@ import os
 from dataclasses import field
 
 from marshmallow import fields, ValidationError
-from transformers import AutoConfig
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import BASE_MODEL
@@ -82,6 +81,8 @@ def BaseModelDataclassField():
                 return MODEL_PRESETS[model_name]
             if os.path.isdir(model_name):
                 return model_name
+            from transformers import AutoConfig
+
             try:
                 AutoConfig.from_pretrained(model_name)
                 return model_name
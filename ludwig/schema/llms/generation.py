@@ -4,6 +4,14 @@ from ludwig.api_annotations import DeveloperAPI
 from ludwig.schema import utils as schema_utils
 from ludwig.schema.metadata import LLM_METADATA
 
+# Parameters that configure how Ludwig runs generation, rather than being passed to the HuggingFace generation config.
+LUDWIG_GENERATION_PARAMETERS = (
+    "prefix_cache",
+    "prefix_cache_max_memory_mb",
+    "continuous_batching",
+    "continuous_batching_slots",
+)
+
 
 @DeveloperAPI
 @schema_utils.ludwig_dataclass
@@ -327,6 +335,40 @@ class LLMGenerationConfig(schema_utils.BaseMarshmallowConfig):
         description="The id of the end of sentence token. If not set, the eos token id of the tokenizer is used.",
     )
 
+    # Parameters that control how Ludwig runs generation
+
+    prefix_cache: bool = schema_utils.Boolean(
+        default=False,
+        description="Whether to compute the key/value cache of the prompt tokens shared by the samples of a batch, "
+        "e.g. the prompt template, only once and reuse it for every sample and later batches, instead of recomputing "
+        "attention over the shared tokens for each sample. Only used for greedy or sampling generation with a single "
+        "beam.",
+        parameter_metadata=LLM_METADATA["generation"]["prefix_cache"],
+    )
+
+    prefix_cache_max_memory_mb: int = schema_utils.PositiveInteger(
+        default=1024,
+        description="Maximum memory in megabytes used by the key/value caches of shared prompt prefixes kept across "
+        "batches when `prefix_cache` is enabled. The least recently used prefixes are evicted first.",
+        parameter_metadata=LLM_METADATA["generation"]["prefix_cache_max_memory_mb"],
+    )
+
+    continuous_batching: bool = schema_utils.Boolean(
+        default=False,
+        description="Whether to generate with iteration-level batching: up to `continuous_batching_slots` sequences "
+        "are decoded together, and after every step finished sequences are replaced by waiting ones, instead of "
+        "each sequence being generated on its own. Supports greedy decoding and sampling with temperature, top-k and "
+        "top-p with a single beam. Generation falls back to decoding each sequence on its own when other generation "
+        "parameters, e.g. `repetition_penalty`, are set. Prefix caching is not used with continuous batching.",
+        parameter_metadata=LLM_METADATA["generation"]["continuous_batching"],
+    )
+
+    continuous_batching_slots: int = schema_utils.PositiveInteger(
+        default=8,
+        description="Maximum number of sequences decoded together when `continuous_batching` is enabled.",
+        parameter_metadata=LLM_METADATA["generation"]["continuous_batching_slots"],
+    )
+
 
 @DeveloperAPI
 class LLMGenerationConfigField(schema_utils.DictMarshmallowField):
@@ -1,6 +1,5 @@
 import warnings
-
-from transformers import BitsAndBytesConfig
+from typing import TYPE_CHECKING
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.schema import utils as schema_utils
@@ -8,6 +7,9 @@ from ludwig.schema.metadata import LLM_METADATA
 from ludwig.schema.metadata.parameter_metadata import convert_metadata_to_json
 from ludwig.schema.utils import ludwig_dataclass
 
+if TYPE_CHECKING:
+    from transformers import BitsAndBytesConfig
+
 warnings.filterwarnings(
     action="ignore",
     category=UserWarning,
@@ -71,7 +73,9 @@ class QuantizationConfig(schema_utils.BaseMarshmallowConfig):
         description="This sets the quantization data type in the bnb.nn.Linear4Bit layers.",
     )
 
-    def to_bitsandbytes(self) -> BitsAndBytesConfig:
+    def to_bitsandbytes(self) -> "BitsAndBytesConfig":
+        from transformers import BitsAndBytesConfig
+
         return BitsAndBytesConfig(
             load_in_4bit=self.bits == 4,
             load_in_8bit=self.bits == 8,
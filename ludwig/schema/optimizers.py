@@ -1,8 +1,7 @@
 from abc import ABC
 from dataclasses import field
-from typing import ClassVar, Dict, Optional, Tuple, Type
+from typing import ClassVar, Dict, Optional, Tuple, Type, Union
 
-import bitsandbytes as bnb
 import torch
 from marshmallow import fields, ValidationError
 
@@ -41,8 +40,12 @@ class BaseOptimizerConfig(schema_utils.BaseMarshmallowConfig, ABC):
     different from the torch-specified defaults.
     """
 
-    optimizer_class: ClassVar[Optional[torch.optim.Optimizer]] = None
-    "Class variable pointing to the corresponding `torch.optim.Optimizer` class."
+    optimizer_class: ClassVar[Optional[Union[torch.optim.Optimizer, str]]] = None
+    """Class variable pointing to the corresponding `torch.optim.Optimizer` class.
+
+    Optimizers from bitsandbytes are referenced by their fully qualified name, so that bitsandbytes is only imported
+    when one of them is used.
+    """
 
     type: str
     """Name corresponding to an optimizer `ludwig.modules.optimization_modules.optimizer_registry`.
@@ -107,7 +110,7 @@ class SGDOptimizerConfig(BaseOptimizerConfig):
 class SGD8BitOptimizerConfig(SGDOptimizerConfig):
     """Parameters for stochastic gradient descent."""
 
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.SGD8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.SGD8bit"
 
     type: str = schema_utils.ProtectedString("sgd_8bit")
 
@@ -222,7 +225,7 @@ class AdamOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="adam_8bit")
 @ludwig_dataclass
 class Adam8BitOptimizerConfig(AdamOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.Adam8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.Adam8bit"
 
     type: str = schema_utils.ProtectedString("adam_8bit")
 
@@ -247,7 +250,7 @@ class Adam8BitOptimizerConfig(AdamOptimizerConfig):
 @register_optimizer(name="paged_adam")
 @ludwig_dataclass
 class PagedAdamOptimizerConfig(Adam8BitOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedAdam
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedAdam"
 
     type: str = schema_utils.ProtectedString("paged_adam")
 
@@ -264,7 +267,7 @@ class PagedAdamOptimizerConfig(Adam8BitOptimizerConfig):
 @register_optimizer(name="paged_adam_8bit")
 @ludwig_dataclass
 class PagedAdam8BitOptimizerConfig(PagedAdamOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedAdam8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedAdam8bit"
 
     type: str = schema_utils.ProtectedString("paged_adam_8bit")
 
@@ -315,7 +318,7 @@ class AdamWOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="adamw_8bit")
 @ludwig_dataclass
 class AdamW8BitOptimizerConfig(AdamWOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.AdamW8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.AdamW8bit"
 
     type: str = schema_utils.ProtectedString("adamw_8bit")
 
@@ -340,7 +343,7 @@ class AdamW8BitOptimizerConfig(AdamWOptimizerConfig):
 @register_optimizer(name="paged_adamw")
 @ludwig_dataclass
 class PagedAdamWOptimizerConfig(AdamW8BitOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedAdamW
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedAdamW"
 
     type: str = schema_utils.ProtectedString("paged_adamw")
 
@@ -357,7 +360,7 @@ class PagedAdamWOptimizerConfig(AdamW8BitOptimizerConfig):
 @register_optimizer(name="paged_adamw_8bit")
 @ludwig_dataclass
 class PagedAdamW8BitOptimizerConfig(PagedAdamWOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedAdamW8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedAdamW8bit"
 
     type: str = schema_utils.ProtectedString("paged_adamw_8bit")
 
@@ -437,7 +440,7 @@ class AdagradOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="adagrad_8bit")
 @ludwig_dataclass
 class Adagrad8BitOptimizerConfig(AdagradOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.Adagrad8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.Adagrad8bit"
 
     type: str = schema_utils.ProtectedString("adagrad_8bit")
 
@@ -592,7 +595,7 @@ class RMSPropOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="rmsprop_8bit")
 @ludwig_dataclass
 class RMSProp8BitOptimizerConfig(RMSPropOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.RMSprop8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.RMSprop8bit"
 
     type: str = schema_utils.ProtectedString("rmsprop_8bit")
 
@@ -622,7 +625,7 @@ class LAMBOptimizerConfig(BaseOptimizerConfig):
     Paper: https://arxiv.org/pdf/1904.00962.pdf
     """
 
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.LAMB
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.LAMB"
 
     type: str = schema_utils.ProtectedString("lamb")
 
@@ -684,7 +687,7 @@ class LAMBOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="lamb_8bit")
 @ludwig_dataclass
 class LAMB8BitOptimizerConfig(LAMBOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.LAMB8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.LAMB8bit"
 
     type: str = schema_utils.ProtectedString("lamb_8bit")
 
@@ -702,7 +705,7 @@ class LARSOptimizerConfig(BaseOptimizerConfig):
     Paper: https://arxiv.org/pdf/1708.03888.pdf
     """
 
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.LARS
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.LARS"
 
     type: str = schema_utils.ProtectedString("lars")
 
@@ -755,7 +758,7 @@ class LARSOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="lars_8bit")
 @ludwig_dataclass
 class LARS8BitOptimizerConfig(LARSOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.LARS8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.LARS8bit"
 
     type: str = schema_utils.ProtectedString("lars_8bit")
 
@@ -773,7 +776,7 @@ class LIONOptimizerConfig(BaseOptimizerConfig):
     Paper: https://arxiv.org/pdf/2302.06675.pdf
     """
 
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.Lion
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.Lion"
 
     type: str = schema_utils.ProtectedString("lion")
 
@@ -806,7 +809,7 @@ class LIONOptimizerConfig(BaseOptimizerConfig):
 @register_optimizer(name="lion_8bit")
 @ludwig_dataclass
 class LION8BitOptimizerConfig(LIONOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.Lion8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.Lion8bit"
 
     type: str = schema_utils.ProtectedString("lion_8bit")
 
@@ -819,7 +822,7 @@ class LION8BitOptimizerConfig(LIONOptimizerConfig):
 @register_optimizer(name="paged_lion")
 @ludwig_dataclass
 class PagedLionOptimizerConfig(LIONOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedLion
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedLion"
 
     type: str = schema_utils.ProtectedString("paged_lion")
 
@@ -832,7 +835,7 @@ class PagedLionOptimizerConfig(LIONOptimizerConfig):
 @register_optimizer(name="paged_lion_8bit")
 @ludwig_dataclass
 class PagedLion8BitOptimizerConfig(PagedLionOptimizerConfig):
-    optimizer_class: ClassVar[torch.optim.Optimizer] = bnb.optim.PagedLion8bit
+    optimizer_class: ClassVar[Union[torch.optim.Optimizer, str]] = "bitsandbytes.optim.PagedLion8bit"
 
     type: str = schema_utils.ProtectedString("paged_lion_8bit")
 
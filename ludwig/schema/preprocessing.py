@@ -55,6 +55,23 @@ class PreprocessingConfig(schema_utils.BaseMarshmallowConfig):
         parameter_metadata=PREPROCESSING_METADATA["global_max_sequence_length"],
     )
 
+    num_feature_workers: int = schema_utils.PositiveInteger(
+        default=None,
+        allow_none=True,
+        description="Number of workers used to build metadata and data for independent features in parallel on the "
+        "local backend. If not set, features are preprocessed sequentially.",
+        parameter_metadata=PREPROCESSING_METADATA["num_feature_workers"],
+    )
+
+    feature_executor: str = schema_utils.StringOptions(
+        ["auto", "thread", "process"],
+        default="auto",
+        description="Type of worker pool used when `num_feature_workers` is greater than 1. `thread` suits numpy-heavy "
+        "features, `process` suits Python-heavy tokenization, and `auto` picks processes for text, sequence, set, bag "
+        "and timeseries features and threads for everything else.",
+        parameter_metadata=PREPROCESSING_METADATA["feature_executor"],
+    )
+
 
 @DeveloperAPI
 class PreprocessingField(schema_utils.DictMarshmallowField):
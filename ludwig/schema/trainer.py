@@ -326,6 +326,21 @@ class ECDTrainerConfig(BaseTrainerConfig):
         parameter_metadata=TRAINER_METADATA[MODEL_ECD]["evaluate_training_set"],
     )
 
+    async_evaluation: bool = schema_utils.Boolean(
+        default=False,
+        description=(
+            "Whether to evaluate a snapshot of the model weights in a background thread while training continues, "
+            "instead of pausing training at every checkpoint until evaluation is complete. The results of a snapshot "
+            "are recorded as of the step at which it was taken, once training reaches the next checkpoint, and are "
+            "then used for early stopping and to save the best model. Keeps a copy of the model in memory. The "
+            "evaluation shares the intra-op thread pool of PyTorch with training, so it only speeds up training when "
+            "training leaves cores idle. A checkpoint does not include the results of the snapshot still being "
+            "evaluated, which are lost if training is interrupted and resumed from it. Only supported for ECD models "
+            "trained without a distributed strategy."
+        ),
+        parameter_metadata=TRAINER_METADATA[MODEL_ECD]["async_evaluation"],
+    )
+
     validation_field: str = schema_utils.String(
         default=None,
         allow_none=True,
@@ -430,7 +445,11 @@ class ECDTrainerConfig(BaseTrainerConfig):
     bucketing_field: str = schema_utils.String(
         default=None,
         allow_none=True,
-        description="Feature to use for bucketing datapoints",
+        description=(
+            "Name of a sequence, text or audio input feature used to bucket datapoints by length. Batches are formed "
+            "from examples of similar length and, when the feature's encoder supports it, trimmed to the longest "
+            "example in the batch."
+        ),
         parameter_metadata=TRAINER_METADATA[MODEL_ECD]["bucketing_field"],
     )
 
@@ -969,6 +988,18 @@ class FineTuneTrainerConfig(ECDTrainerConfig):
         ],
     )
 
+    sequence_packing: bool = schema_utils.Boolean(
+        default=False,
+        description=(
+            "Whether to pack multiple training examples into each row of a batch, up to the global maximum sequence "
+            "length, instead of padding every example to the longest one. Position ids are reset at the start of "
+            "each example, a block-diagonal causal attention mask keeps examples from attending to each other, and "
+            "the loss is only computed on target tokens. Only applies to text output features, and requires a base "
+            "model whose forward pass accepts `position_ids` and custom 4D attention masks."
+        ),
+        parameter_metadata=TRAINER_METADATA[MODEL_LLM]["sequence_packing"],
+    )
+
 
 @DeveloperAPI
 def get_model_type_jsonschema(model_type: str = MODEL_ECD):
@@ -14,6 +14,7 @@
 # limitations under the License.
 # ==============================================================================
 import argparse
+import asyncio
 import io
 import json
 import logging
@@ -26,7 +27,7 @@ import torch
 from torchvision.io import decode_image
 
 from ludwig.api import LudwigModel
-from ludwig.constants import AUDIO, COLUMN
+from ludwig.constants import AUDIO, COLUMN, MODEL_LLM
 from ludwig.contrib import add_contrib_callback_args
 from ludwig.globals import LUDWIG_VERSION
 from ludwig.utils.print_utils import get_logging_level_registry, print_ludwig
@@ -124,9 +125,88 @@ def server(model, allowed_origins=None):
             logger.exception("Failed to run batch_predict: {}")
             return NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
 
+    if model.config_obj.model_type == MODEL_LLM:
+        add_generate_endpoints(app, model)
+
     return app
 
 
+def add_generate_endpoints(app, model):
+    """Adds endpoints generating completions for raw prompts.
+
+    When the model's generation config supports continuous batching, the completions of concurrent requests are decoded
+    together by a continuous batching scheduler. Otherwise, each request falls back to `LudwigModel.generate`.
+    """
+    if not model.model._use_continuous_batching():
+        _add_fallback_generate_endpoint(app, model)
+        return
+
+    tokenizer = model.model.tokenizer
+    model.model.eval()
+    scheduler = model.model.create_continuous_batching_scheduler()
+
+    @app.on_event("startup")
+    def start_scheduler():
+        scheduler.start()
+
+    @app.on_event("shutdown")
+    def stop_scheduler():
+        scheduler.stop()
+
+    @app.post("/generate")
+    async def generate(request: Request):
+        prompts, error_response = await _parse_prompts(request)
+        if error_response is not None:
+            return error_response
+        try:
+            input_ids = [tokenizer(prompt, return_tensors="pt").input_ids[0] for prompt in prompts]
+            sequences = await asyncio.gather(*[asyncio.wrap_future(scheduler.submit(ids)) for ids in input_ids])
+            responses = [
+                tokenizer.decode(sequence[len(ids) :], skip_special_tokens=True)  # noqa E203
+                for ids, sequence in zip(input_ids, sequences)
+            ]
+            return NumpyJSONResponse({"responses": responses})
+        except Exception:
+            logger.exception("Failed to run generate")
+            return NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
+
+    @app.get("/generate/stats")
+    def generate_stats():
+        return NumpyJSONResponse(scheduler.stats.to_dict())
+
+
+def _add_fallback_generate_endpoint(app, model):
+    """Adds a generate endpoint that runs `LudwigModel.generate` once per request, off the event loop."""
+
+    @app.post("/generate")
+    async def generate(request: Request):
+        prompts, error_response = await _parse_prompts(request)
+        if error_response is not None:
+            return error_response
+        try:
+            responses = await asyncio.get_running_loop().run_in_executor(None, model.generate, prompts)
+            if isinstance(responses, str):
+                responses = [responses]
+            return NumpyJSONResponse({"responses": responses})
+        except Exception:
+            logger.exception("Failed to run generate")
+            return NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
+
+
+async def _parse_prompts(request):
+    """Returns the prompts of a generate request, or an error response if there are none."""
+    try:
+        form = await request.form()
+        prompts = form.getlist("prompt")
+    except Exception:
+        logger.exception("Failed to parse generate form")
+        return None, NumpyJSONResponse(COULD_NOT_RUN_INFERENCE_ERROR, status_code=500)
+
+    if not prompts:
+        return None, NumpyJSONResponse({"error": "Data received does not contain a prompt."}, status_code=400)
+    return prompts, None
+
+
 def _write_file(v, files):
     # Convert UploadFile to a NamedTemporaryFile to ensure it's on the disk
     suffix = os.path.splitext(v.filename)[1]
@@ -0,0 +1,149 @@
+"""Evaluation of snapshots of the weights of a model in the background of its training.
+
+With `trainer.async_evaluation`, the trainer does not pause training at every checkpoint to evaluate the model.
+Instead it snapshots the weights into a replica of the model, which is evaluated by a background thread while training
+continues, and records the results of the snapshot at the next checkpoint as of the step at which it was taken.
+
+A checkpoint therefore holds the results of the previous snapshot but not those of the snapshot taken at that
+checkpoint, which are lost if training is resumed from it.
+"""
+import contextlib
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import torch
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.data.dataset.base import Dataset
+from ludwig.distributed.base import DistributedStrategy
+from ludwig.models.base import BaseModel
+from ludwig.models.predictor import Predictor
+from ludwig.utils.checkpoint_utils import CheckpointManager
+from ludwig.utils.trainer_utils import ProgressTracker
+
+
+@DeveloperAPI
+class EvaluationSnapshot(NamedTuple):
+    """Training progress at the time a snapshot of the weights was taken to be evaluated in the background."""
+
+    steps: int
+    epoch: int
+    checkpoint_number: int
+
+
+@DeveloperAPI
+@contextlib.contextmanager
+def rewind_progress(progress_tracker: ProgressTracker, snapshot: EvaluationSnapshot):
+    """Rewinds the steps, epoch and checkpoint number of `progress_tracker` to those of `snapshot` within the context,
+    so that the evaluation of the snapshot is recorded as of the step at which it was taken."""
+    current = EvaluationSnapshot(progress_tracker.steps, progress_tracker.epoch, progress_tracker.checkpoint_number)
+    progress_tracker.steps, progress_tracker.epoch, progress_tracker.checkpoint_number = snapshot
+    try:
+        yield progress_tracker
+    finally:
+        progress_tracker.steps, progress_tracker.epoch, progress_tracker.checkpoint_number = current
+
+
+@DeveloperAPI
+@contextlib.contextmanager
+def swap_model(trainer, model: BaseModel):
+    """Replaces `trainer.model` with `model` within the context, so that the callbacks invoked while the evaluation of
+    a snapshot is recorded, e.g. `on_save_best_checkpoint`, see the weights of the snapshot rather than those of the
+    model being trained."""
+    current = trainer.model
+    trainer.model = model
+    try:
+        yield model
+    finally:
+        trainer.model = current
+
+
+@DeveloperAPI
+class AsyncEvaluator:
+    """Evaluates snapshots of the weights of a model in a background thread while training continues.
+
+    Every snapshot is copied into a replica of the model, which is evaluated by a single worker thread. At most one
+    evaluation is in flight: its results are waited for before the next snapshot overwrites the replica. PyTorch
+    releases the GIL while running its kernels, so the evaluation runs on the cores left idle by the training steps.
+    It shares the intra-op thread pool of PyTorch with training, whose size is process-wide, so its thread count
+    cannot be budgeted separately.
+
+    Args:
+        model: model being trained.
+        distributed: distributed strategy of the trainer.
+        checkpoints_directory: directory of the training checkpoints, in which the best snapshot is saved.
+        device: device of the checkpoints.
+        report_tqdm_to_ray: whether to report the progress of the evaluation to Ray.
+    """
+
+    def __init__(
+        self,
+        model: BaseModel,
+        distributed: DistributedStrategy,
+        checkpoints_directory: str,
+        device: torch.device,
+        report_tqdm_to_ray: bool = False,
+    ):
+        self.model = copy.deepcopy(model)
+        self.report_tqdm_to_ray = report_tqdm_to_ray
+        # Saves the weights of the evaluated snapshot, rather than those of the model being trained, as the best model.
+        self.checkpoint_manager = CheckpointManager(
+            distributed.create_checkpoint_handle(dist_model=self.model, model=self.model),
+            checkpoints_directory,
+            device=device,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ludwig_async_evaluation")
+        self._pending: Optional[Tuple[EvaluationSnapshot, Future]] = None
+
+    def submit(
+        self,
+        model: BaseModel,
+        snapshot: EvaluationSnapshot,
+        datasets: Dict[str, Dataset],
+        batch_size: int,
+        metrics: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None,
+    ):
+        """Snapshots the current weights of `model` and evaluates them on `datasets` in the background.
+
+        Args:
+            model: model being trained.
+            snapshot: training progress at the time of the snapshot.
+            datasets: datasets to evaluate the snapshot on, by dataset name.
+            batch_size: evaluation batch size.
+            metrics: metrics of the snapshot that are already computed, by dataset name, e.g. the training metrics
+                accumulated during training.
+        """
+        # The results of the previous snapshot must be consumed before its replica is overwritten.
+        assert self._pending is None, "the evaluation of the previous snapshot has not been consumed"
+        with torch.no_grad():
+            self.model.load_state_dict(model.state_dict())
+        future = self._executor.submit(self._evaluate, datasets, batch_size, dict(metrics or {}))
+        self._pending = (snapshot, future)
+
+    def _evaluate(
+        self, datasets: Dict[str, Dataset], batch_size: int, metrics: Dict[str, Dict[str, Dict[str, float]]]
+    ) -> Dict[str, Dict[str, Dict[str, float]]]:
+        predictor = Predictor(self.model, batch_size=batch_size, report_tqdm_to_ray=self.report_tqdm_to_ray)
+        for dataset_name, dataset in datasets.items():
+            metrics[dataset_name], _ = predictor.batch_evaluation(
+                dataset, collect_predictions=False, dataset_name=dataset_name
+            )
+        return metrics
+
+    def has_pending(self) -> bool:
+        return self._pending is not None
+
+    def result(self) -> Tuple[EvaluationSnapshot, Dict[str, Dict[str, Dict[str, float]]]]:
+        """Waits for the evaluation in flight, and returns its snapshot with its metrics by dataset name.
+
+        Raises any error of the evaluation.
+        """
+        snapshot, future = self._pending
+        self._pending = None
+        return snapshot, future.result()
+
+    def close(self):
+        """Waits for the evaluation in flight, if any, and discards its results."""
+        self._pending = None
+        self._executor.shutdown(wait=True)
@@ -64,6 +64,7 @@ from ludwig.modules.metric_registry import get_metric_objective
 from ludwig.modules.optimization_modules import create_clipper
 from ludwig.progress_bar import LudwigProgressBar
 from ludwig.schema.trainer import ECDTrainerConfig
+from ludwig.trainers.async_evaluation import AsyncEvaluator, EvaluationSnapshot, rewind_progress, swap_model
 from ludwig.trainers.base import BaseTrainer
 from ludwig.trainers.registry import register_trainer
 from ludwig.types import ModelConfigDict
@@ -89,6 +90,7 @@ from ludwig.utils.trainer_utils import (
     get_total_expected_checkpoints,
     get_total_steps,
     ProgressTracker,
+    StepTelemetry,
 )
 
 logger = logging.getLogger(__name__)
@@ -169,6 +171,7 @@ class Trainer(BaseTrainer):
         self.max_batch_size = config.max_batch_size
         self.eval_batch_size = config.batch_size if config.eval_batch_size is None else config.eval_batch_size
         self.should_shuffle = config.should_shuffle
+        self.bucketing_field = config.bucketing_field
         self._validation_field = config.validation_field
         self._validation_metric = config.validation_metric
         self.early_stop = config.early_stop
@@ -177,6 +180,7 @@ class Trainer(BaseTrainer):
         self.checkpoints_per_epoch = config.checkpoints_per_epoch
         self.evaluate_training_set = config.evaluate_training_set
         self.skip_all_evaluation = config.skip_all_evaluation
+        self.async_evaluation = config.async_evaluation
         self.increase_batch_size_on_plateau = config.increase_batch_size_on_plateau
         self.increase_batch_size_on_plateau_patience = config.increase_batch_size_on_plateau_patience
         self.increase_batch_size_on_plateau_rate = config.increase_batch_size_on_plateau_rate
@@ -195,6 +199,7 @@ class Trainer(BaseTrainer):
         self.received_sigint = False
         self.report_tqdm_to_ray = report_tqdm_to_ray
         self.callbacks = callbacks or []
+        self.step_telemetry = StepTelemetry()
         self.device = device
         if self.device is None:
             self.device = get_torch_device()
@@ -204,6 +209,16 @@ class Trainer(BaseTrainer):
         self.model = self.distributed.to_device(self.model)
         self.model.metrics_to_device(self.device)
 
+        if self.async_evaluation and (
+            self.model.type() != MODEL_ECD or not isinstance(self.distributed, LocalStrategy)
+        ):
+            logger.warning(
+                "`trainer.async_evaluation` is only supported for ECD models trained without a distributed strategy. "
+                "Evaluating synchronously instead."
+            )
+            self.async_evaluation = False
+        self._async_evaluator: Optional[AsyncEvaluator] = None
+
         self.compiled_model = self.model
         if config.compile:
             self.compiled_model = torch.compile(self.model)
@@ -446,11 +461,18 @@ class Trainer(BaseTrainer):
         # all other losses
         for feature_name, loss in all_losses.items():
             loss_tag = f"{feature_name}/step_training_loss"
-            train_summary_writer.add_scalar(loss_tag, loss.detach().float(), global_step=step)
+            train_summary_writer.add_scalar(loss_tag, loss, global_step=step)
 
         if learning_rate:
             train_summary_writer.add_scalar("combined/step_learning_rate", learning_rate, global_step=step)
 
+    @classmethod
+    def write_resource_summary(cls, train_summary_writer, step):
+        """Logs the memory used by the process, and writes the CUDA memory stats to the summary."""
+        logger.debug("training: step %s memory used: %.2fMB", step, psutil.Process(os.getpid()).memory_info()[0] / 1e6)
+        if not train_summary_writer:
+            return
+
         # Log CUDA memory stats.
         if torch.cuda.is_available():
             for i in range(torch.cuda.device_count()):
@@ -690,6 +712,7 @@ class Trainer(BaseTrainer):
         all_losses: Dict[str, torch.Tensor],
         early_stopping_steps: int,
         checkpoint_manager: CheckpointManager,
+        evaluated_metrics: Optional[Dict[str, Dict[str, Dict[str, float]]]] = None,
     ) -> bool:
         """Runs evaluation over training, validation, and test sets.
 
@@ -698,6 +721,9 @@ class Trainer(BaseTrainer):
         - Saves the model if the validation score is the best so far
         - If there is no validation set, the model is always saved.
 
+        If `evaluated_metrics` are given, they are the metrics of a snapshot of the model evaluated in the background,
+        by dataset name, and are recorded instead of evaluating the model.
+
         Returns whether the trainer should early stop, based on validation metrics history.
         """
         start_time = time.time()
@@ -710,10 +736,10 @@ class Trainer(BaseTrainer):
         # eval metrics on train
         self.eval_batch_size = max(self.eval_batch_size, progress_tracker.batch_size)
 
-        if self.evaluate_training_set:
-            # Run a separate pass over the training data to compute metrics
-            self.evaluation(
-                training_set, "train", progress_tracker.train_metrics, self.eval_batch_size, progress_tracker
+        if self.evaluate_training_set or evaluated_metrics is not None:
+            # Run a separate pass over the training data to compute metrics, or record those of the evaluated snapshot
+            self._evaluate_or_record(
+                training_set, "train", progress_tracker.train_metrics, progress_tracker, evaluated_metrics
             )
         else:
             # Use metrics accumulated during training
@@ -731,12 +757,12 @@ class Trainer(BaseTrainer):
             self.callback(lambda c: c.on_validation_start(self, progress_tracker, save_path))
 
             # eval metrics on validation set
-            self.evaluation(
+            self._evaluate_or_record(
                 validation_set,
                 VALIDATION,
                 progress_tracker.validation_metrics,
-                self.eval_batch_size,
                 progress_tracker,
+                evaluated_metrics,
             )
 
             llm_eval_examples = progress_tracker.llm_eval_examples
@@ -761,7 +787,7 @@ class Trainer(BaseTrainer):
             self.callback(lambda c: c.on_test_start(self, progress_tracker, save_path))
 
             # eval metrics on test set
-            self.evaluation(test_set, TEST, progress_tracker.test_metrics, self.eval_batch_size, progress_tracker)
+            self._evaluate_or_record(test_set, TEST, progress_tracker.test_metrics, progress_tracker, evaluated_metrics)
 
             self.write_eval_summary(
                 summary_writer=test_summary_writer,
@@ -817,6 +843,125 @@ class Trainer(BaseTrainer):
 
         return should_break
 
+    def _evaluate_or_record(self, dataset, dataset_name, metrics_log, progress_tracker, evaluated_metrics):
+        if evaluated_metrics is None:
+            return self.evaluation(dataset, dataset_name, metrics_log, self.eval_batch_size, progress_tracker)
+        return append_metrics(self.model, dataset_name, evaluated_metrics[dataset_name], metrics_log, progress_tracker)
+
+    def run_async_evaluation(
+        self,
+        training_set,
+        validation_set,
+        test_set,
+        progress_tracker: ProgressTracker,
+        train_summary_writer,
+        validation_summary_writer,
+        test_summary_writer,
+        model_hyperparameters_path,
+        output_features,
+        metrics_names,
+        save_path,
+        loss: torch.Tensor,
+        all_losses: Dict[str, torch.Tensor],
+        early_stopping_steps: int,
+        checkpoint_manager: CheckpointManager,
+    ) -> bool:
+        """Records the evaluation of the previous snapshot of the weights, then snapshots the current weights to be
+        evaluated in the background while training continues.
+
+        Returns whether the trainer should early stop, based on the validation metrics recorded so far.
+        """
+        should_break = self.record_async_evaluation(
+            training_set,
+            validation_set,
+            test_set,
+            progress_tracker,
+            train_summary_writer,
+            validation_summary_writer,
+            test_summary_writer,
+            model_hyperparameters_path,
+            output_features,
+            metrics_names,
+            save_path,
+            loss,
+            all_losses,
+            early_stopping_steps,
+            checkpoint_manager,
+        )
+        if should_break:
+            return True
+
+        self.eval_batch_size = max(self.eval_batch_size, progress_tracker.batch_size)
+        datasets = {VALIDATION: validation_set, TEST: test_set}
+        metrics = {}
+        if self.evaluate_training_set:
+            datasets["train"] = training_set
+        else:
+            # Use metrics accumulated during training up to the snapshot
+            metrics["train"] = self.model.get_metrics()
+            self.model.reset_metrics()
+
+        self._async_evaluator.submit(
+            self.model,
+            EvaluationSnapshot(progress_tracker.steps, progress_tracker.epoch, progress_tracker.checkpoint_number),
+            {dataset_name: dataset for dataset_name, dataset in datasets.items() if dataset is not None},
+            self.eval_batch_size,
+            metrics=metrics,
+        )
+        return False
+
+    def record_async_evaluation(
+        self,
+        training_set,
+        validation_set,
+        test_set,
+        progress_tracker: ProgressTracker,
+        train_summary_writer,
+        validation_summary_writer,
+        test_summary_writer,
+        model_hyperparameters_path,
+        output_features,
+        metrics_names,
+        save_path,
+        loss: torch.Tensor,
+        all_losses: Dict[str, torch.Tensor],
+        early_stopping_steps: int,
+        checkpoint_manager: CheckpointManager,
+    ) -> bool:
+        """Waits for the evaluation of the snapshot in flight, if any, and records its results as of the step at
+        which the snapshot was taken.
+
+        The snapshot is saved as the best model if its validation score is the best so far. While its results are
+        recorded, `self.model` holds the weights of the snapshot, so that callbacks see the model that was evaluated.
+        The checkpoint saved after the next snapshot is submitted includes these results, but not those of the next
+        snapshot, which are only recorded at the following checkpoint.
+
+        Returns whether the trainer should early stop, based on validation metrics history.
+        """
+        if not self._async_evaluator.has_pending():
+            return False
+
+        snapshot, evaluated_metrics = self._async_evaluator.result()
+        with rewind_progress(progress_tracker, snapshot), swap_model(self, self._async_evaluator.model):
+            return self.run_evaluation(
+                training_set,
+                validation_set,
+                test_set,
+                progress_tracker,
+                train_summary_writer,
+                validation_summary_writer,
+                test_summary_writer,
+                model_hyperparameters_path,
+                output_features,
+                metrics_names,
+                save_path,
+                loss,
+                all_losses,
+                early_stopping_steps,
+                self._async_evaluator.checkpoint_manager,
+                evaluated_metrics=evaluated_metrics,
+            )
+
     def save_checkpoint(self, progress_tracker: ProgressTracker, save_path: str, checkpoint_manager: CheckpointManager):
         """Checkpoints the model, progress tracker, and invokes the checkpoint callback."""
         progress_tracker.increment_checkpoint()
@@ -968,6 +1113,11 @@ class Trainer(BaseTrainer):
         else:
             profiler = None
 
+        if self.async_evaluation and not self.skip_all_evaluation:
+            self._async_evaluator = AsyncEvaluator(
+                self.model, self.distributed, training_checkpoints_path, self.device, self.report_tqdm_to_ray
+            )
+
         try:
             with training_set.initialize_batcher(
                 batch_size=self.batch_size,
@@ -976,6 +1126,7 @@ class Trainer(BaseTrainer):
                 distributed=self.distributed,
                 ignore_last=True,
                 augmentation_pipeline=self.model.get_augmentation_pipelines(),
+                bucketing_field=self.bucketing_field,
             ) as batcher:
                 # ================ Training Loop ================
                 self.steps_per_epoch = batcher.steps_per_epoch
@@ -1096,6 +1247,28 @@ class Trainer(BaseTrainer):
                     # Early stop if needed.
                     if should_break:
                         break
+
+                if self._async_evaluator is not None:
+                    # The evaluation of the last snapshot is still in flight when training ends.
+                    self.record_async_evaluation(
+                        training_set,
+                        validation_set,
+                        test_set,
+                        progress_tracker,
+                        train_summary_writer,
+                        validation_summary_writer,
+                        test_summary_writer,
+                        model_hyperparameters_path,
+                        output_features,
+                        metrics_names,
+                        save_path,
+                        None,
+                        None,
+                        early_stopping_steps,
+                        checkpoint_manager,
+                    )
+                    if self.is_coordinator() and not self.skip_save_progress:
+                        progress_tracker.save(os.path.join(save_path, TRAINING_PROGRESS_TRACKER_FILE_NAME))
         finally:
             # ================ Finished Training ================
             self.callback(
@@ -1110,6 +1283,11 @@ class Trainer(BaseTrainer):
             if profiler:
                 profiler.stop()
 
+            # Stop evaluating in the background.
+            if self._async_evaluator is not None:
+                self._async_evaluator.close()
+                self._async_evaluator = None
+
             # Close the summary writers.
             if train_summary_writer is not None:
                 train_summary_writer.close()
@@ -1258,25 +1436,23 @@ class Trainer(BaseTrainer):
             # Update progress tracker with token information.
             progress_tracker.set_token_usage_for_this_step(used_tokens)
 
-            if self.is_coordinator() and not self.skip_save_log:
-                self.write_step_summary(
-                    train_summary_writer=train_summary_writer,
-                    combined_loss=loss.detach().float(),
-                    all_losses=all_losses,
-                    step=progress_tracker.steps,
-                    used_tokens=used_tokens,
-                    total_tokens_used=progress_tracker.total_tokens_used,
-                    learning_rate=progress_tracker.learning_rate,
-                )
+            # Losses stay on device until enough steps are buffered, so that the step does not wait for the device.
+            should_flush_telemetry = self.step_telemetry.record(
+                step=progress_tracker.steps,
+                combined_loss=loss,
+                all_losses=all_losses,
+                used_tokens=used_tokens,
+                total_tokens_used=progress_tracker.total_tokens_used,
+                learning_rate=progress_tracker.learning_rate,
+            )
+            if should_flush_telemetry:
+                self._flush_step_telemetry(progress_bar, train_summary_writer)
 
             progress_tracker.steps += 1
-            progress_bar.set_postfix({"loss": float(loss)})
             progress_bar.update(1)
-            if self.is_coordinator():
-                logger.debug(
-                    "training: completed batch %s memory used: %.2fMB",
-                    progress_bar.total_steps,
-                    psutil.Process(os.getpid()).memory_info()[0] / 1e6,
+            if self.is_coordinator() and self.step_telemetry.should_sample_resources():
+                self.write_resource_summary(
+                    train_summary_writer if not self.skip_save_log else None, progress_tracker.steps
                 )
 
             # Executing `on_batch_end` calls before `run_evaluation` enables more accurate
@@ -1297,11 +1473,16 @@ class Trainer(BaseTrainer):
                 # a bad state. Theere is also no point in continuing to train the model since the loss will always be
                 # NaN or Inf from this point forward.
                 if has_nan_or_inf_tensors:
+                    self._flush_step_telemetry(progress_bar, train_summary_writer)
                     return True, has_nan_or_inf_tensors
 
+                # Step summaries are complete up to the evaluated step.
+                self._flush_step_telemetry(progress_bar, train_summary_writer)
+
                 if not self.skip_all_evaluation:
+                    run_evaluation = self.run_evaluation if self._async_evaluator is None else self.run_async_evaluation
                     # Publishes metrics to MLFLow if there are any MLFlow callbacks.
-                    should_break = self.run_evaluation(
+                    should_break = run_evaluation(
                         training_set,
                         validation_set,
                         test_set,
@@ -1333,8 +1514,30 @@ class Trainer(BaseTrainer):
             if batcher.last_batch():
                 self.callback(lambda c: c.on_epoch_end(self, progress_tracker, save_path))
 
+        self._flush_step_telemetry(progress_bar, train_summary_writer)
         return should_break, has_nan_or_inf_tensors
 
+    def _flush_step_telemetry(self, progress_bar: LudwigProgressBar, train_summary_writer):
+        """Reads back the losses of the buffered steps, writes their summaries and shows the latest loss."""
+        summaries = self.step_telemetry.flush()
+        if not summaries:
+            return
+
+        if self.is_coordinator() and not self.skip_save_log:
+            for summary in summaries:
+                self.write_step_summary(
+                    train_summary_writer=train_summary_writer,
+                    combined_loss=summary.combined_loss,
+                    all_losses=summary.all_losses,
+                    step=summary.step,
+                    used_tokens=summary.used_tokens,
+                    total_tokens_used=summary.total_tokens_used,
+                    learning_rate=summary.learning_rate,
+                )
+            if train_summary_writer:
+                train_summary_writer.flush()
+        progress_bar.set_postfix({"loss": summaries[-1].combined_loss})
+
     def _has_nan_or_inf_weights(self, model: torch.nn.Module) -> bool:
         """Check for NaN or infinity (inf) values in the weights (parameters and buffers) of a PyTorch model in a
         local or distributed training environment. It is called to ensure the model's numerical stability during
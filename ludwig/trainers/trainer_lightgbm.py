@@ -22,7 +22,7 @@ from ludwig.globals import (
     TRAINING_PROGRESS_TRACKER_FILE_NAME,
 )
 from ludwig.models.gbm import GBM
-from ludwig.models.predictor import Predictor
+from ludwig.models.predictor import GbmPredictor
 from ludwig.modules.metric_modules import get_improved_fn, get_initial_validation_value
 from ludwig.modules.metric_registry import get_metric_objective
 from ludwig.progress_bar import LudwigProgressBar
@@ -202,7 +202,7 @@ class LightGBMTrainer(BaseTrainer):
         batch_size: int,
         progress_tracker: ProgressTracker,
     ):
-        predictor = Predictor(
+        predictor = GbmPredictor(
             self.model, batch_size=batch_size, distributed=self.distributed, report_tqdm_to_ray=self.report_tqdm_to_ray
         )
         metrics, _ = predictor.batch_evaluation(dataset, collect_predictions=False, dataset_name=dataset_name)
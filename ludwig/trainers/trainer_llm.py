@@ -440,6 +440,14 @@ class FineTuneTrainer(Trainer):
         )
 
     def evaluation(self, dataset, dataset_name, metrics_log, batch_size, progress_tracker):
+        packing_stats = self.model.packing_stats
+        if packing_stats.num_rows:
+            logger.info(
+                f"Sequence packing: {packing_stats.num_examples} examples packed into {packing_stats.num_rows} rows, "
+                f"{packing_stats.efficiency:.1%} of packed tokens are not padding."
+            )
+            packing_stats.reset()
+
         predictor = LlmFineTunePredictor(
             self.model, batch_size=batch_size, distributed=self.distributed, report_tqdm_to_ray=self.report_tqdm_to_ray
         )
@@ -0,0 +1,134 @@
+"""Incremental writing of the activations collected by a model over a dataset.
+
+Collecting the activations of a large dataset in memory before saving them does not scale, so `ActivationWriter`
+writes every batch of activations to disk as soon as it is computed, one file per collected tensor:
+
+- `npy`: a `.npy` array preallocated for all the rows of the dataset and memory-mapped, so that it can be read back
+  with `np.load(path, mmap_mode="r")` without loading it in memory.
+- `parquet`: a Parquet file with one row group per batch and a single list column holding the flattened activation of
+  every row. The shape of a row is stored in the schema metadata.
+"""
+import json
+import logging
+import os
+from typing import Dict, List
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import torch
+
+from ludwig.api_annotations import DeveloperAPI
+from ludwig.utils.strings_utils import make_safe_filename
+
+logger = logging.getLogger(__name__)
+
+NPY = "npy"
+PARQUET = "parquet"
+ACTIVATION_FORMATS = [NPY, PARQUET]
+
+# Key of the shape of a row in the schema metadata of Parquet activation files.
+SHAPE_METADATA_KEY = b"shape"
+
+
+@DeveloperAPI
+def to_numpy_activation(tensor: torch.Tensor) -> np.ndarray:
+    """Returns the activation as a numpy array on CPU, upcasting the dtypes numpy does not support."""
+    tensor = tensor.detach()
+    if tensor.dtype == torch.bfloat16:
+        tensor = tensor.float()
+    return tensor.cpu().numpy()
+
+
+@DeveloperAPI
+class ActivationWriter:
+    """Writes batches of named activations to one file per name in `output_directory`.
+
+    Args:
+        output_directory: directory the activation files are written to.
+        num_rows: total number of rows of the activations, required to preallocate `npy` files.
+        output_format: one of `npy` or `parquet`.
+    """
+
+    def __init__(self, output_directory: str, num_rows: int, output_format: str = NPY):
+        if output_format not in ACTIVATION_FORMATS:
+            raise ValueError(f"Unsupported activation format {output_format}, expected one of {ACTIVATION_FORMATS}")
+        self.output_directory = output_directory
+        self.num_rows = num_rows
+        self.output_format = output_format
+        self.filenames: Dict[str, str] = {}
+        self.rows_written: Dict[str, int] = {}
+        self._arrays: Dict[str, np.memmap] = {}
+        self._parquet_writers: Dict[str, pq.ParquetWriter] = {}
+        os.makedirs(output_directory, exist_ok=True)
+
+    def write(self, activations: Dict[str, torch.Tensor]):
+        """Appends a batch of activations, keyed by name, after the rows already written for each name."""
+        for name, tensor in activations.items():
+            values = to_numpy_activation(tensor)
+            if name not in self.filenames:
+                self.filenames[name] = os.path.join(
+                    self.output_directory, f"{make_safe_filename(name)}.{self.output_format}"
+                )
+                self.rows_written[name] = 0
+            if self.output_format == NPY:
+                self._write_npy(name, values)
+            else:
+                self._write_parquet(name, values)
+            self.rows_written[name] += len(values)
+
+    def _write_npy(self, name: str, values: np.ndarray):
+        array = self._arrays.get(name)
+        if array is None:
+            array = np.lib.format.open_memmap(
+                self.filenames[name], mode="w+", dtype=values.dtype, shape=(self.num_rows, *values.shape[1:])
+            )
+            self._arrays[name] = array
+        start = self.rows_written[name]
+        if values.shape[1:] != array.shape[1:] or start + len(values) > len(array):
+            raise ValueError(
+                f"Activations {name} of shape {values.shape} do not fit in rows {start} to {start + len(values)} of "
+                f"the array of shape {array.shape}."
+            )
+        array[start : start + len(values)] = values
+
+    def _write_parquet(self, name: str, values: np.ndarray):
+        flat_values = values.reshape(len(values), -1)
+        offsets = np.arange(len(values) + 1, dtype=np.int32) * flat_values.shape[1]
+        column = pa.ListArray.from_arrays(offsets, pa.array(flat_values.reshape(-1)))
+        table = pa.table({name: column})
+        writer = self._parquet_writers.get(name)
+        if writer is None:
+            schema = table.schema.with_metadata({SHAPE_METADATA_KEY: json.dumps(list(values.shape[1:]))})
+            writer = pq.ParquetWriter(self.filenames[name], schema)
+            self._parquet_writers[name] = writer
+        writer.write_table(table.replace_schema_metadata(writer.schema.metadata))
+
+    def close(self) -> List[str]:
+        """Flushes the files to disk, and returns their paths."""
+        for name, array in self._arrays.items():
+            array.flush()
+            if self.rows_written[name] != len(array):
+                logger.warning(
+                    f"Only {self.rows_written[name]} rows of activations {name} were written out of {len(array)}"
+                )
+        self._arrays.clear()
+        for writer in self._parquet_writers.values():
+            writer.close()
+        self._parquet_writers.clear()
+        return list(self.filenames.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+@DeveloperAPI
+def load_parquet_activations(path: str) -> np.ndarray:
+    """Reads a Parquet activation file written by `ActivationWriter` back into an array of its original shape."""
+    table = pq.read_table(path)
+    shape = json.loads(table.schema.metadata[SHAPE_METADATA_KEY])
+    column = table.column(0).combine_chunks()
+    return column.flatten().to_numpy(zero_copy_only=False).reshape(len(column), *shape)
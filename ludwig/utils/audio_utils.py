@@ -20,21 +20,25 @@ from typing import Any, List, Optional, Union
 
 import torch
 import torch.nn.functional as F
-import torchaudio
 from packaging import version
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import DEFAULT_AUDIO_TENSOR_LENGTH
+from ludwig.utils.package_utils import LazyLoader
 from ludwig.utils.types import TorchAudioTuple
 
+# torchaudio is only imported once audio is read or processed, since it is slow to import.
+torchaudio = LazyLoader("torchaudio", globals(), "torchaudio")
+
 logger = logging.getLogger(__name__)
 
 # https://github.com/pytorch/audio/blob/main/torchaudio/csrc/sox/types.cpp
 AUDIO_EXTENSIONS = (".wav", ".amb", ".mp3", ".ogg", ".vorbis", ".flac", ".opus", ".sphere")
 
 
-_TORCH_AUDIO_210 = version.parse(torchaudio.__version__) >= version.parse("2.1.0")
-_TORCH_AUDIO_201 = version.parse(torchaudio.__version__) >= version.parse("2.0.1")
+@functools.lru_cache(maxsize=None)
+def _torchaudio_version_at_least(min_version: str) -> bool:
+    return version.parse(torchaudio.__version__) >= version.parse(min_version)
 
 
 @DeveloperAPI
@@ -69,9 +73,9 @@ def read_audio_from_path(path: str) -> Optional[TorchAudioTuple]:
     Useful for reading from a small number of paths. For more intensive reads, use backend.read_binary_files instead.
     """
     try:
-        if _TORCH_AUDIO_210:
+        if _torchaudio_version_at_least("2.1.0"):
             return torchaudio.load(path, backend="sox")
-        elif _TORCH_AUDIO_201:
+        elif _torchaudio_version_at_least("2.0.1"):
             return torchaudio.backend.sox_io_backend.load(path)
         else:
             return torchaudio.backend.sox_backend.load(path)
@@ -85,9 +89,9 @@ def read_audio_from_path(path: str) -> Optional[TorchAudioTuple]:
 def read_audio_from_bytes_obj(bytes_obj: bytes) -> Optional[TorchAudioTuple]:
     try:
         f = BytesIO(bytes_obj)
-        if _TORCH_AUDIO_210:
+        if _torchaudio_version_at_least("2.1.0"):
             return torchaudio.load(f, backend="sox")
-        elif _TORCH_AUDIO_201:
+        elif _torchaudio_version_at_least("2.0.1"):
             return torchaudio.backend.sox_io_backend.load(f)
         else:
             return torchaudio.backend.sox_backend.load(f)
@@ -322,6 +326,104 @@ def _preprocess_to_padded_matrix(
     return zero_padded_matrix
 
 
+@DeveloperAPI
+def get_batched_2D_features(
+    waveforms: List[torch.Tensor],
+    feature_type: str,
+    sampling_rate_in_hz: int,
+    window_length_in_s: float,
+    window_shift_in_s: float,
+    num_fft_points: int,
+    window_type: str,
+    num_filter_bands: Optional[int] = None,
+    max_num_frames: Optional[int] = None,
+) -> List[torch.Tensor]:
+    """Batched equivalent of `get_stft_magnitude`, `get_phase_stft_magnitude`, `get_group_delay` and `get_fbank`.
+
+    The waveforms, 1D tensors sampled at the same rate, are zero-padded to the longest one and transformed together.
+    Returns the features of each waveform as a [num_frames x feature_dim] tensor, the transpose of the output of the
+    unbatched functions. If `max_num_frames` is set, only the first `max_num_frames` frames of each waveform are
+    computed. Batching is most efficient for waveforms of similar length.
+    """
+    window_length_in_samp = get_length_in_samp(window_length_in_s, sampling_rate_in_hz)
+    window_shift_in_samp = get_length_in_samp(window_shift_in_s, sampling_rate_in_hz)
+    # Frames past max_num_frames are not needed, and frames before it do not depend on the samples after it.
+    max_num_samples = None
+    if max_num_frames is not None:
+        max_num_samples = (max_num_frames - 1) * window_shift_in_samp + window_length_in_samp
+    waveforms = [waveform[:max_num_samples] for waveform in waveforms]
+    lengths = torch.tensor([waveform.shape[0] for waveform in waveforms])
+    num_frames = [
+        max(get_num_output_padded_to_fit_input(length, window_length_in_samp, window_shift_in_samp), 0)
+        for length in lengths.tolist()
+    ]
+
+    data = torch.nn.utils.rnn.pad_sequence(waveforms, batch_first=True).to(torch.float64)
+    # Same filter as _pre_emphasize_data, which is a first order FIR filter, so it is applied without a recursive
+    # lfilter over the samples. It leaks into the padding of the shorter waveforms, which must stay zero.
+    data[:, 1:] -= 0.97 * data[:, :-1].clone()
+    sample_mask = torch.arange(data.shape[1]) < lengths.unsqueeze(-1)
+    data = data.to(torch.float32) * sample_mask
+
+    frames = _frame_batch(data, lengths, max(num_frames + [1]), window_length_in_samp, window_shift_in_samp)
+    if feature_type == "fbank":
+        frames = _subtract_frame_means(frames, lengths, window_length_in_samp, window_shift_in_samp)
+
+    def stft(data_transformation: Optional[str] = None) -> torch.Tensor:
+        window = get_window(window_type, window_length_in_samp)
+        if data_transformation == "group_delay":
+            window *= torch.arange(window_length_in_samp).float()
+        return get_non_symmetric_data(torch.fft.fft(frames * window, n=num_fft_points))
+
+    if feature_type == "stft":
+        features = torch.abs(stft())
+    elif feature_type == "stft_phase":
+        stft_transform = stft()
+        features = torch.cat([torch.angle(stft_transform), torch.abs(stft_transform)], dim=-1)
+    elif feature_type == "group_delay":
+        X_stft_transform = stft()
+        Y_stft_transform = stft(data_transformation="group_delay")
+        nominator = torch.real(X_stft_transform) * torch.real(Y_stft_transform) + torch.imag(
+            X_stft_transform
+        ) * torch.imag(Y_stft_transform)
+        features = torch.divide(nominator, torch.square(torch.abs(X_stft_transform)) + 1e-10)
+        assert not torch.isnan(features).any(), "There are NaN values in group delay"
+    elif feature_type == "fbank":
+        stft_power = torch.abs(stft()) ** 2
+        upper_limit_mel = _convert_hz_to_mel(int(sampling_rate_in_hz / 2))
+        list_mel_points = torch.linspace(0, upper_limit_mel, num_filter_bands + 2)
+        mel_fbank_matrix = _get_mel_fbank_matrix(list_mel_points, num_filter_bands, num_fft_points, sampling_rate_in_hz)
+        features = torch.log(torch.matmul(stft_power, torch.transpose(mel_fbank_matrix, 0, 1)) + 1.0e-10)
+    else:
+        raise ValueError(f'feature_type "{feature_type}" is not recognized.')
+
+    return [features[i, : num_frames[i]] for i in range(len(waveforms))]
+
+
+def _frame_batch(
+    data: torch.Tensor, lengths: torch.Tensor, num_frames: int, window_length_in_samp: int, window_shift_in_samp: int
+) -> torch.Tensor:
+    """Batched equivalent of `_preprocess_to_padded_matrix`, without the Python loop over frames.
+
+    Returns [batch x num_frames x window_length_in_samp] frames, zero past the end of each waveform.
+    """
+    num_samples = (num_frames - 1) * window_shift_in_samp + window_length_in_samp
+    if data.shape[1] < num_samples:
+        data = F.pad(data, (0, num_samples - data.shape[1]))
+    return data[:, :num_samples].unfold(1, window_length_in_samp, window_shift_in_samp)
+
+
+def _subtract_frame_means(
+    frames: torch.Tensor, lengths: torch.Tensor, window_length_in_samp: int, window_shift_in_samp: int
+) -> torch.Tensor:
+    """Zero-mean offset of each frame, where the mean of the last frame of a waveform only covers its samples."""
+    frame_starts = torch.arange(frames.shape[1]) * window_shift_in_samp
+    num_valid_samples = torch.clamp(lengths.unsqueeze(-1) - frame_starts, min=0, max=window_length_in_samp)
+    frame_means = frames.sum(dim=-1) / num_valid_samples.clamp(min=1)
+    sample_mask = torch.arange(window_length_in_samp) < num_valid_samples.unsqueeze(-1)
+    return (frames - frame_means.unsqueeze(-1)) * sample_mask
+
+
 @DeveloperAPI
 def get_num_output_padded_to_fit_input(num_input: int, window_length_in_samp: int, window_shift_in_samp: int) -> int:
     num_output_valid = torch.tensor((num_input - window_length_in_samp) / window_shift_in_samp + 1)
@@ -376,7 +478,7 @@ def get_non_symmetric_length(symmetric_length: int) -> int:
 def get_non_symmetric_data(data: torch.Tensor) -> torch.Tensor:
     num_fft_points = data.shape[-1]
     num_ess_fft_points = get_non_symmetric_length(num_fft_points)
-    return data[:, :num_ess_fft_points]
+    return data[..., :num_ess_fft_points]
 
 
 @DeveloperAPI
@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
+import dask
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.utils.audio_utils import is_audio_score
+from ludwig.utils.automl.sketches import ColumnSketch
 from ludwig.utils.automl.utils import avg_num_tokens
 from ludwig.utils.image_utils import is_image_score
 from ludwig.utils.misc_utils import memoized_method
@@ -27,6 +30,10 @@ class DataSource(ABC):
     def get_distinct_values(self, column: str, max_values_to_return: int) -> Tuple[int, List[str], float]:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_unique_values(self, column: str) -> List:
+        raise NotImplementedError()
+
     @abstractmethod
     def get_nonnull_values(self, column: str) -> int:
         raise NotImplementedError()
@@ -71,6 +78,9 @@ class DataframeSourceMixin:
             unique_values_balance = 1.0
         return num_unique_values, unique_values[:max_values_to_return], unique_values_balance
 
+    def get_unique_values(self, column: str) -> List:
+        return self.df[column].unique()
+
     def get_nonnull_values(self, column: str) -> int:
         return len(self.df[column].notnull())
 
@@ -131,8 +141,98 @@ class DaskDataSource(DataframeSource):
         return avg_num_tokens(self.sample[column])
 
 
+def _sketch_partition(df: pd.DataFrame, seed: int, **sketch_kwargs) -> Dict[str, ColumnSketch]:
+    return {column: ColumnSketch(seed=seed, **sketch_kwargs).update(df[column]) for column in df.columns}
+
+
+def _merge_sketches(a: Dict[str, ColumnSketch], b: Dict[str, ColumnSketch]) -> Dict[str, ColumnSketch]:
+    return {column: a[column].merge(b[column]) for column in a}
+
+
+@DeveloperAPI
+class SketchDataSource(DataframeSource):
+    """Profiles every column in a single pass over the data using mergeable sketches.
+
+    Distinct counts come from HyperLogLog, top values and imbalance from a top-values summary, and image, audio and
+    token checks from a uniform reservoir sample. Results are exact for columns with fewer distinct values than
+    `top_values_capacity`, and approximate otherwise. Dask DataFrames are sketched per partition and merged.
+    """
+
+    def __init__(
+        self,
+        df: DataFrame,
+        hll_precision: int = 14,
+        top_values_capacity: int = 1000,
+        sample_size: int = 100,
+        seed: int = 42,
+    ):
+        super().__init__(df)
+        self.sketch_kwargs = dict(
+            hll_precision=hll_precision, top_values_capacity=top_values_capacity, sample_size=sample_size
+        )
+        self.seed = seed
+
+    @memoized_method(maxsize=1)
+    def get_sketches(self) -> Dict[str, ColumnSketch]:
+        if not isinstance(self.df, dd.core.DataFrame):
+            return _sketch_partition(self.df, self.seed, **self.sketch_kwargs)
+
+        partials = [
+            dask.delayed(_sketch_partition)(partition, self.seed + i, **self.sketch_kwargs)
+            for i, partition in enumerate(self.df.to_delayed())
+        ]
+        while len(partials) > 1:
+            merged = [dask.delayed(_merge_sketches)(a, b) for a, b in zip(partials[::2], partials[1::2])]
+            if len(partials) % 2 == 1:
+                merged.append(partials[-1])
+            partials = merged
+        (sketches,) = dask.compute(partials[0])
+        return sketches
+
+    def get_sketch(self, column: str) -> ColumnSketch:
+        return self.get_sketches()[column]
+
+    def get_distinct_values(self, column, max_values_to_return: int) -> Tuple[int, List[str], float]:
+        """Returns the approximate number of distinct values, the most frequent ones, and the imbalance ratio.
+
+        The imbalance ratio is exact for columns with at most `top_values_capacity` distinct values, and an upper bound
+        otherwise (see `TopValuesSketch.balance`).
+        """
+        sketch = self.get_sketch(column)
+        distinct_values = np.array(sketch.top_values.top_values(max_values_to_return), dtype=object)
+        return sketch.num_distinct, distinct_values, sketch.top_values.balance()
+
+    def get_unique_values(self, column: str) -> List:
+        sketch = self.get_sketch(column)
+        unique_values = sketch.top_values.top_values()
+        if sketch.num_nonnull < sketch.num_rows:
+            unique_values.append(np.nan)
+        return unique_values
+
+    def get_nonnull_values(self, column: str) -> int:
+        return self.get_sketch(column).num_nonnull
+
+    def get_image_values(self, column: str, sample_size: int = 10) -> int:
+        return int(sum(is_image_score(x) for x in self.get_sketch(column).sample.sample(sample_size)))
+
+    def get_audio_values(self, column: str, sample_size: int = 10) -> int:
+        return int(sum(is_audio_score(x) for x in self.get_sketch(column).sample.sample(sample_size)))
+
+    def get_avg_num_tokens(self, column: str) -> int:
+        return avg_num_tokens(self.get_sketch(column).sample.sample().rename(column))
+
+    def __len__(self) -> int:
+        if isinstance(self.df, dd.core.DataFrame):
+            sketches = self.get_sketches()
+            if sketches:
+                return next(iter(sketches.values())).num_rows
+        return len(self.df)
+
+
 @DeveloperAPI
-def wrap_data_source(df: DataFrame) -> DataSource:
+def wrap_data_source(df: DataFrame, use_sketches: bool = False) -> DataSource:
+    if use_sketches:
+        return SketchDataSource(df)
     if isinstance(df, dd.core.DataFrame):
         return DaskDataSource(df)
     return DataframeSource(df)
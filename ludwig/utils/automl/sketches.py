@@ -0,0 +1,206 @@
+"""Mergeable, bounded-memory sketches used to profile columns for AutoML type inference in a single pass.
+
+Every sketch can be built independently over each partition of a dataset and then merged, so profiling a Dask
+DataFrame requires a single scan of the data regardless of the number of columns.
+"""
+from typing import Any, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ludwig.api_annotations import DeveloperAPI
+
+
+def _hash_values(values: pd.Series) -> np.ndarray:
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns the bit length of every uint64 value, 0 for 0.
+
+    Values of more than 53 bits would be rounded when cast to float64, possibly up to the next power of two, so each
+    32-bit half is measured separately with frexp, which is exact for them.
+    """
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, np.frexp(high)[1] + 32, np.frexp(low)[1])
+
+
+@DeveloperAPI
+class HyperLogLog:
+    """HyperLogLog estimator of the number of distinct values (Flajolet et al., 2007) over 64-bit hashes.
+
+    The relative standard error is roughly `1.04 / sqrt(2 ** precision)`, i.e., about 0.8% for the default precision.
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, found {precision}")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values: pd.Series) -> "HyperLogLog":
+        if len(values) == 0:
+            return self
+        hashes = _hash_values(values)
+        num_bits = 64 - self.precision
+        indices = (hashes >> np.uint64(num_bits)).astype(np.int64)
+        rest = hashes & np.uint64((1 << num_bits) - 1)
+        ranks = (num_bits - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, indices, ranks)
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def count(self) -> int:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        num_zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and num_zeros > 0:
+            # Small range correction (linear counting)
+            estimate = m * np.log(m / num_zeros)
+        return int(round(estimate))
+
+
+@DeveloperAPI
+class TopValuesSketch:
+    """Mergeable summary of the most frequent values, keeping the exact counts of the top `capacity` values.
+
+    Every update or merge adds up the counts of both sides, then drops all but the `capacity` largest counts. Unlike a
+    Misra-Gries summary, which decrements every counter on overflow, the dropped counts are simply lost. While no value
+    has been dropped, the counts are exact. Once some were, `exact` is False, and `error`, the sum of the largest count
+    dropped by each truncation, bounds both how much a kept count may be underestimated and the count of any value
+    that is not kept. `total` is the exact number of non-null values seen, including those whose counts were dropped.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.error = 0
+        self.exact = True
+        self.total = 0
+
+    def update(self, values: pd.Series) -> "TopValuesSketch":
+        counts = values.value_counts()
+        return self._combine(counts, 0, True, int(counts.sum()))
+
+    def merge(self, other: "TopValuesSketch") -> "TopValuesSketch":
+        merged = TopValuesSketch(self.capacity)
+        merged.counts, merged.error, merged.exact, merged.total = self.counts, self.error, self.exact, self.total
+        return merged._combine(other.counts, other.error, other.exact, other.total)
+
+    def _combine(self, counts: pd.Series, error: int, exact: bool, total: int) -> "TopValuesSketch":
+        combined = self.counts.add(counts, fill_value=0) if len(self.counts) else counts
+        combined = combined.astype(np.int64).sort_values(ascending=False, kind="stable")
+        self.error += error
+        self.exact = self.exact and exact
+        self.total += total
+        if len(combined) > self.capacity:
+            self.error += int(combined.iloc[self.capacity])
+            self.exact = False
+            combined = combined.iloc[: self.capacity]
+        self.counts = combined
+        return self
+
+    def top_values(self, k: Optional[int] = None) -> List[Any]:
+        values = self.counts.index.tolist()
+        return values if k is None else values[:k]
+
+    def balance(self) -> float:
+        """Ratio of the count of the least frequent value to that of the most frequent one.
+
+        Exact while no value has been dropped. Otherwise the least frequent value is not tracked, and its count is
+        bounded by both the smallest kept count and the total count of the values that are not kept, so the ratio is
+        an upper bound of the true balance.
+        """
+        if len(self.counts) == 0:
+            return 1.0
+        least_frequent = self.counts.iloc[-1]
+        if not self.exact:
+            least_frequent = min(least_frequent, self.total - int(self.counts.sum()))
+        return least_frequent / self.counts.iloc[0]
+
+
+@DeveloperAPI
+class ReservoirSample:
+    """Mergeable uniform sample without replacement, using random priorities (bottom-k sampling).
+
+    Each value is assigned a uniform random key, and the `capacity` values with the smallest keys are kept. Merging
+    two samples keeps the smallest keys of their union, which is a uniform sample of the combined data.
+    """
+
+    def __init__(self, capacity: int = 100, seed: Optional[int] = None):
+        self.capacity = capacity
+        self.seed = seed
+        self.keys = np.empty(0, dtype=np.float64)
+        self.values = np.empty(0, dtype=object)
+
+    def update(self, values: pd.Series) -> "ReservoirSample":
+        rng = np.random.default_rng(self.seed)
+        keys = rng.random(len(values))
+        return self._combine(keys, values.to_numpy(dtype=object))
+
+    def merge(self, other: "ReservoirSample") -> "ReservoirSample":
+        merged = ReservoirSample(self.capacity, self.seed)
+        merged.keys, merged.values = self.keys, self.values
+        return merged._combine(other.keys, other.values)
+
+    def _combine(self, keys: np.ndarray, values: np.ndarray) -> "ReservoirSample":
+        keys = np.concatenate([self.keys, keys])
+        values = np.concatenate([self.values, values])
+        if len(keys) > self.capacity:
+            keep = np.argpartition(keys, self.capacity)[: self.capacity]
+            keys, values = keys[keep], values[keep]
+        order = np.argsort(keys, kind="stable")
+        self.keys, self.values = keys[order], values[order]
+        return self
+
+    def sample(self, n: Optional[int] = None) -> pd.Series:
+        return pd.Series(self.values if n is None else self.values[:n], dtype=object)
+
+
+@DeveloperAPI
+class ColumnSketch:
+    """All statistics AutoML type inference needs for one column, built in a single pass."""
+
+    def __init__(
+        self,
+        hll_precision: int = 14,
+        top_values_capacity: int = 1000,
+        sample_size: int = 100,
+        seed: Optional[int] = None,
+    ):
+        self.num_rows = 0
+        self.num_nonnull = 0
+        self.distinct = HyperLogLog(hll_precision)
+        self.top_values = TopValuesSketch(top_values_capacity)
+        self.sample = ReservoirSample(sample_size, seed)
+
+    def update(self, column: pd.Series) -> "ColumnSketch":
+        nonnull = column.dropna()
+        self.num_rows += len(column)
+        self.num_nonnull += len(nonnull)
+        self.distinct.update(nonnull)
+        self.top_values.update(nonnull)
+        self.sample.update(nonnull)
+        return self
+
+    def merge(self, other: "ColumnSketch") -> "ColumnSketch":
+        merged = ColumnSketch.__new__(ColumnSketch)
+        merged.num_rows = self.num_rows + other.num_rows
+        merged.num_nonnull = self.num_nonnull + other.num_nonnull
+        merged.distinct = self.distinct.merge(other.distinct)
+        merged.top_values = self.top_values.merge(other.top_values)
+        merged.sample = self.sample.merge(other.sample)
+        return merged
+
+    @property
+    def num_distinct(self) -> int:
+        # The top values sketch is exact until it overflows, which covers all low-cardinality columns.
+        if self.top_values.exact:
+            return len(self.top_values.counts)
+        return max(self.distinct.count(), len(self.top_values.counts))
@@ -20,6 +20,7 @@ import csv
 import dataclasses
 import functools
 import hashlib
+import io
 import json
 import logging
 import os
@@ -30,7 +31,7 @@ import re
 import tempfile
 import threading
 from itertools import islice
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -38,14 +39,13 @@ import pyarrow as pa
 import yaml
 from fsspec.config import conf, set_conf_files
 from pandas.errors import ParserError
-from sklearn.model_selection import KFold
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import PREPROCESSING, SPLIT
 from ludwig.data.cache.types import CacheableDataset
 from ludwig.globals import MODEL_HYPERPARAMETERS_FILE_NAME, MODEL_WEIGHTS_FILE_NAME, TRAIN_SET_METADATA_FILE_NAME
 from ludwig.utils.dataframe_utils import from_numpy_dataset, is_dask_lib, to_numpy_dataset
-from ludwig.utils.fs_utils import download_h5, has_remote_protocol, open_file, upload_h5
+from ludwig.utils.fs_utils import download_h5, has_remote_protocol, makedirs, open_file, path_exists, upload_h5
 from ludwig.utils.math_utils import cumsum
 from ludwig.utils.misc_utils import get_from_registry
 from ludwig.utils.types import DataFrame
@@ -70,6 +70,9 @@ DATA_VALIDATION_PARQUET_FP = "data_validation_parquet_fp"
 DATA_TEST_PARQUET_FP = "data_test_parquet_fp"
 
 HDF5_COLUMNS_KEY = "columns"
+MEMMAP_COLUMNS_FILE = "columns.json"
+# Data of features not kept in memory (e.g., images) is stored in this HDF5 file inside memory-mapped datasets.
+MEMMAP_HDF5_FILE = "data.hdf5"
 DICT_FORMATS = {"dict", "dictionary", dict}
 DATAFRAME_FORMATS = {"dataframe", "df", pd.DataFrame} | DASK_DF_FORMATS
 CSV_FORMATS = {"csv"}
@@ -87,6 +90,7 @@ SAS_FORMATS = {"sas"}
 SPSS_FORMATS = {"spss"}
 STATA_FORMATS = {"stata"}
 HDF5_FORMATS = {"hdf5", "h5"}
+MEMMAP_FORMATS = {"mmap"}
 CACHEABLE_FORMATS = set.union(
     *(
         CSV_FORMATS,
@@ -109,6 +113,29 @@ CACHEABLE_FORMATS = set.union(
 
 PANDAS_DF = pd
 
+# Strings parsed as missing values by pandas.read_csv by default.
+XSV_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
 
 # Lock over the entire interpreter as we can only have one set
 # of credentials scoped to the interpreter at once.
@@ -169,12 +196,64 @@ def read_nrows_via_chunksize(fp, read_fn, **kwargs):
     return ret
 
 
+def get_projected_columns(names: List[str], columns: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Returns the column names of a data source to read in order to get `columns` after sanitization.
+
+    :param names: column names of the data source, as stored in the file
+    :param columns: sanitized names of the columns needed, None means all columns
+    :return: list of names to read, or None if all columns should be read
+    """
+    if columns is None or len(set(names)) != len(names):
+        # Duplicate names are renamed by the readers, so they cannot be projected by name.
+        return None
+    columns = set(columns)
+    projected = [name for name in names if get_sanitized_feature_name(name) in columns]
+    return projected or None
+
+
+def _read_xsv_header(sample: str, separator: str, complete: bool) -> Optional[List[str]]:
+    if not complete and "\n" not in sample:
+        # The header is longer than the sample, so it cannot be parsed from it.
+        return None
+    return next(csv.reader(io.StringIO(sample.lstrip("\ufeff")), delimiter=separator), None)
+
+
+def _read_xsv_with_pyarrow(data_fp, separator: str, names: List[str], usecols: Optional[List[str]]) -> pd.DataFrame:
+    import pyarrow.csv as pa_csv
+
+    # Every column is read as a string with the same missing values as pandas, which is equivalent to `dtype=object`.
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in usecols or names},
+        include_columns=usecols,
+        null_values=XSV_NA_VALUES,
+        strings_can_be_null=True,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=separator, newlines_in_values=True)
+    with open_file(data_fp, "rb") as f:
+        table = pa_csv.read_csv(f, parse_options=parse_options, convert_options=convert_options)
+    df = table.to_pandas()
+    # Arrow nulls become None, while pandas represents missing values as NaN.
+    return df.where(df.notna(), np.nan)
+
+
 @DeveloperAPI
 @spread
-def read_xsv(data_fp, df_lib=PANDAS_DF, separator=",", header=0, nrows=None, skiprows=None, dtype=object, **kwargs):
+def read_xsv(
+    data_fp,
+    df_lib=PANDAS_DF,
+    separator=",",
+    header=0,
+    nrows=None,
+    skiprows=None,
+    dtype=object,
+    columns=None,
+    **kwargs,
+):
     """Helper method to read a csv file. Wraps around pd.read_csv to handle some exceptions. Can extend to cover
     cases as necessary.
 
+    Whole files are read with the pyarrow CSV reader when possible, falling back to pandas otherwise.
+
     :param data_fp: path to the xsv file
     :param df_lib: DataFrame library used to read in the CSV
     :param separator: defaults separator to use for splitting
@@ -182,15 +261,31 @@ def read_xsv(data_fp, df_lib=PANDAS_DF, separator=",", header=0, nrows=None, ski
     :param nrows: number of rows to read from the csv, None means all
     :param skiprows: number of rows to skip from the csv, None means no skips
     :param dtype: dtype to use for columns. Defaults to object to disable type inference.
+    :param columns: sanitized names of the columns to read, None means all columns. Other columns are skipped by the
+        parser rather than being loaded and dropped later.
     :return: Pandas dataframe with the data
     """
+    sample_size = 1024 * 100
     with open_file(data_fp, "r", encoding="utf8") as csvfile:
+        sample = csvfile.read(sample_size)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=[",", "\t", "|"])
+        separator = dialect.delimiter
+    except csv.Error:
+        # Could not conclude the delimiter, defaulting to user provided
+        pass
+
+    # The header is parsed from the sample used to sniff the delimiter, rather than reading the file again.
+    names = None
+    if header == 0 and skiprows is None:
+        names = _read_xsv_header(sample, separator, complete=len(sample) < sample_size)
+    usecols = get_projected_columns(names, columns) if names is not None else None
+
+    if df_lib is PANDAS_DF and names is not None and dtype is object and nrows is None and not kwargs:
         try:
-            dialect = csv.Sniffer().sniff(csvfile.read(1024 * 100), delimiters=[",", "\t", "|"])
-            separator = dialect.delimiter
-        except csv.Error:
-            # Could not conclude the delimiter, defaulting to user provided
-            pass
+            return _read_xsv_with_pyarrow(data_fp, separator, names, usecols)
+        except pa.ArrowException as e:
+            logger.debug(f"Failed to parse the CSV with pyarrow, falling back to pandas: {e}")
 
     # NOTE: by default we read all XSV columns in as dtype=object, bypassing all type inference. This is to avoid silent
     # issues related to incorrect type inference (e.g. NaNs in bool columns). Convert data to correct types after
@@ -199,6 +294,8 @@ def read_xsv(data_fp, df_lib=PANDAS_DF, separator=",", header=0, nrows=None, ski
 
     if nrows is not None:
         kwargs["nrows"] = nrows
+    if usecols is not None:
+        kwargs["usecols"] = usecols
 
     try:
         df = df_lib.read_csv(data_fp, **kwargs)
@@ -247,9 +344,30 @@ def read_excel(data_fp, df_lib, **kwargs):
     return df_lib.read_excel(data_fp, engine=excel_engine, **kwargs)
 
 
+def _get_parquet_projected_columns(data_fp, columns: Optional[Iterable[str]]) -> Optional[List[str]]:
+    import pyarrow.parquet as pq
+
+    from ludwig.utils.fs_utils import get_fs_and_path
+
+    if columns is None:
+        return None
+    fs, path = get_fs_and_path(data_fp)
+    if fs.isdir(path):
+        # Partition keys of a partitioned dataset are not part of the file schemas, so read everything.
+        return None
+    with fs.open(path, "rb") as f:
+        names = pq.read_schema(f).names
+    return get_projected_columns(names, columns)
+
+
 @DeveloperAPI
 @spread
-def read_parquet(data_fp, df_lib, nrows=None, **kwargs):
+def read_parquet(data_fp, df_lib, nrows=None, columns=None, **kwargs):
+    """Reads a Parquet file or directory.
+
+    :param columns: sanitized names of the columns to read, None means all columns. Other columns are not loaded.
+    """
+    projected_columns = _get_parquet_projected_columns(data_fp, columns)
     if nrows is not None:
         import pyarrow.parquet as pq
 
@@ -258,12 +376,14 @@ def read_parquet(data_fp, df_lib, nrows=None, **kwargs):
         fs, _ = get_fs_and_path(data_fp)
         dataset = pq.ParquetDataset(data_fp, filesystem=fs, use_legacy_dataset=False).fragments[0]
 
-        preview = dataset.head(nrows).to_pandas()
+        preview = dataset.head(nrows, columns=projected_columns).to_pandas()
 
         if is_dask_lib(df_lib):
             return df_lib.from_pandas(preview, npartitions=1)
         return preview
 
+    if projected_columns is not None:
+        kwargs["columns"] = projected_columns
     return df_lib.read_parquet(data_fp, **kwargs)
 
 
@@ -506,6 +626,51 @@ def load_hdf5(data_fp, clean_cols: bool = False):
     return from_numpy_dataset(numpy_dataset)
 
 
+@DeveloperAPI
+def save_memmap(data_fp, data):
+    """Saves every column of a processed dataset, either a dataframe or a dictionary of column name to array, as a
+    contiguous `.npy` array in the directory `data_fp`.
+
+    The list of columns is written last, so a directory without it is an incomplete cache entry.
+    """
+    numpy_dataset = data if isinstance(data, dict) else to_numpy_dataset(data)
+    makedirs(data_fp, exist_ok=True)
+    columns = [str(column) for column in numpy_dataset]
+    for i, column in enumerate(numpy_dataset):
+        # Column names are not necessarily valid file names, so arrays are named after the column position.
+        with open_file(os.path.join(data_fp, f"{i}.npy"), "wb") as f:
+            np.save(f, np.asarray(numpy_dataset[column]), allow_pickle=True)
+    save_json(os.path.join(data_fp, MEMMAP_COLUMNS_FILE), columns)
+
+
+@DeveloperAPI
+def load_memmap(data_fp) -> Dict[str, np.ndarray]:
+    """Opens a dataset saved with `save_memmap` as a dictionary of column name to array.
+
+    Local arrays are memory-mapped read-only, so pages are only read from disk when accessed and are shared through
+    the OS page cache between processes reading the same dataset. Arrays of Python objects and remote datasets cannot
+    be memory-mapped and are loaded in memory instead.
+    """
+    columns = load_json(os.path.join(data_fp, MEMMAP_COLUMNS_FILE))
+    numpy_dataset = {}
+    for i, column in enumerate(columns):
+        array_fp = os.path.join(data_fp, f"{i}.npy")
+        if not has_remote_protocol(array_fp):
+            try:
+                numpy_dataset[column] = np.load(array_fp, mmap_mode="r")
+                continue
+            except ValueError:
+                pass
+        with open_file(array_fp, "rb") as f:
+            numpy_dataset[column] = np.load(f, allow_pickle=True)
+    return numpy_dataset
+
+
+@DeveloperAPI
+def is_memmap_dataset(data_fp) -> bool:
+    return isinstance(data_fp, str) and path_exists(os.path.join(data_fp, MEMMAP_COLUMNS_FILE))
+
+
 @DeveloperAPI
 def load_object(object_fp):
     with open_file(object_fp, "rb") as f:
@@ -844,6 +1009,8 @@ class NumpyEncoder(json.JSONEncoder):
 
 @DeveloperAPI
 def generate_kfold_splits(data_df, num_folds, random_state):
+    from sklearn.model_selection import KFold
+
     kf = KFold(n_splits=num_folds, shuffle=True, random_state=random_state)
     fold_num = 0
     for train_indices, test_indices in kf.split(data_df):
@@ -1,7 +1,6 @@
 from typing import List, Optional, Tuple, Union
 
 import pandas as pd
-from sklearn.model_selection import train_test_split
 
 from ludwig.api_annotations import PublicAPI
 from ludwig.constants import TEST_SPLIT, TRAIN_SPLIT, VALIDATION_SPLIT
@@ -73,6 +72,8 @@ def get_repeatable_train_val_test_split(
             do_stratify_split = False
 
     if do_stratify_split:
+        from sklearn.model_selection import train_test_split
+
         # Make sure the `stratify_colname` doesn't have any NaNs.
         df_input = df_input[df_input[stratify_colname].notna()]
 
@@ -21,8 +21,8 @@ import yaml
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.contrib import add_contrib_callback_args
-from ludwig.features.feature_registries import get_input_type_registry
 from ludwig.globals import LUDWIG_VERSION
+from ludwig.schema.features.utils import ecd_input_config_registry
 from ludwig.schema.model_config import ModelConfig
 from ludwig.schema.preprocessing import PreprocessingConfig
 from ludwig.utils.backward_compatibility import upgrade_config_dict_to_latest_version
@@ -37,8 +37,8 @@ default_random_seed = 42
 # Still needed for preprocessing  TODO(Connor): Refactor ludwig/data/preprocessing to use schema
 # TODO(travis): remove this, make type a protected string for each subclass
 default_feature_specific_preprocessing_parameters = {
-    name: preproc_sect.get_schema_cls()(name="__tmp__", type=name).preprocessing.to_dict()
-    for name, preproc_sect in get_input_type_registry().items()
+    name: feature_config_cls(name="__tmp__", type=name).preprocessing.to_dict()
+    for name, feature_config_cls in ecd_input_config_registry.items()
 }
 
 default_training_preprocessing_parameters = copy.deepcopy(default_feature_specific_preprocessing_parameters)
@@ -2,16 +2,20 @@ import logging
 import os
 import tempfile
 from os import PathLike
-from typing import Optional, Tuple, Type, Union
-
-from transformers import AutoTokenizer, PreTrainedModel
-from transformers.tokenization_utils import PreTrainedTokenizer
+from typing import Optional, Tuple, Type, TYPE_CHECKING, Union
 
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.utils.error_handling_utils import default_retry
 from ludwig.utils.fs_utils import download, path_exists
+from ludwig.utils.package_utils import LazyLoader
 from ludwig.utils.upload_utils import hf_hub_login
 
+if TYPE_CHECKING:
+    from transformers import PreTrainedModel
+    from transformers.tokenization_utils import PreTrainedTokenizer
+
+transformers = LazyLoader("transformers", globals(), "transformers")
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,7 +24,7 @@ def load_pretrained_hf_model_from_hub(
     model_class: Type,
     pretrained_model_name_or_path: Optional[Union[str, PathLike]],
     **pretrained_kwargs,
-) -> PreTrainedModel:
+) -> "PreTrainedModel":
     """Download a HuggingFace model.
 
     Downloads a model from the HuggingFace zoo with retry on failure.
@@ -37,7 +41,7 @@ def load_pretrained_hf_model_from_hub(
 @default_retry()
 def load_pretrained_hf_tokenizer(
     pretrained_model_name_or_path: Optional[Union[str, PathLike]], **pretrained_kwargs
-) -> PreTrainedTokenizer:
+) -> "PreTrainedTokenizer":
     """Download a HuggingFace tokenizer.
 
     Args:
@@ -46,14 +50,14 @@ def load_pretrained_hf_tokenizer(
     Returns:
         The pretrained tokenizer object.
     """
-    return AutoTokenizer.from_pretrained(pretrained_model_name_or_path, **pretrained_kwargs)
+    return transformers.AutoTokenizer.from_pretrained(pretrained_model_name_or_path, **pretrained_kwargs)
 
 
 def _load_pretrained_hf_model_from_dir(
     model_class: Type,
     pretrained_model_name_or_path: Optional[Union[str, PathLike]],
     **pretrained_kwargs,
-) -> PreTrainedModel:
+) -> "PreTrainedModel":
     """Downloads a model to a local temporary directory, and Loads a pretrained HF model from a local directory."""
     with tempfile.TemporaryDirectory() as tmpdir:
         download(pretrained_model_name_or_path, tmpdir)
@@ -65,7 +69,7 @@ def load_pretrained_hf_model_with_hub_fallback(
     model_class: Type,
     pretrained_model_name_or_path: Optional[Union[str, PathLike]],
     **pretrained_kwargs,
-) -> Tuple[PreTrainedModel, bool]:
+) -> Tuple["PreTrainedModel", bool]:
     """Returns the model and a boolean indicating whether the model was downloaded from the HuggingFace hub.
 
     If the `LUDWIG_PRETRAINED_MODELS_DIR` environment variable is set, we attempt to load the HF model from this
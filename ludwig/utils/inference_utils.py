@@ -1,6 +1,7 @@
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import torch
 
@@ -61,6 +62,41 @@ def to_inference_module_input_from_dataframe(
     return inputs
 
 
+def to_inference_module_input_from_records(
+    records: List[Dict[str, Any]],
+    config: ModelConfigDict,
+    load_paths: bool = False,
+    device: Optional[torch.device] = None,
+) -> Dict[str, TorchscriptPreprocessingInput]:
+    """Converts a list of records (dicts of column name to value) to be compatible with a torchscripted
+    InferenceModule forward pass, without building an intermediate DataFrame."""
+    inputs = {}
+    for if_config in config["input_features"]:
+        column = if_config[COLUMN]
+        feature_inputs = to_inference_model_input_from_values(
+            [record[column] for record in records],
+            if_config[TYPE],
+            load_paths=load_paths,
+            feature_config=if_config,
+        )
+        feature_inputs = place_on_device(feature_inputs, device)
+        inputs[if_config[NAME]] = feature_inputs
+    return inputs
+
+
+def to_inference_model_input_from_values(
+    values: List[Any], feature_type: str, load_paths: bool = False, feature_config: Optional[FeatureConfigDict] = None
+) -> TorchscriptPreprocessingInput:
+    """Converts a list of raw values the same way `to_inference_model_input_from_series` converts a Series."""
+    if feature_type in {IMAGE, AUDIO, DATE}:
+        return to_inference_model_input_from_series(
+            pd.Series(values), feature_type, load_paths=load_paths, feature_config=feature_config
+        )
+    elif feature_type in FEATURES_TO_CAST_AS_STRINGS:
+        return [str(v) for v in values]
+    return torch.from_numpy(np.asarray([np.nan if v is None else v for v in values]))
+
+
 def to_inference_model_input_from_series(
     s: pd.Series, feature_type: str, load_paths: bool = False, feature_config: Optional[FeatureConfigDict] = None
 ) -> TorchscriptPreprocessingInput:
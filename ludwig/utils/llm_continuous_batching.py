@@ -0,0 +1,364 @@
+"""Iteration-level (continuous) batching for LLM generation.
+
+Generating a batch with `model.generate` runs until its longest sequence is done, so the slots of short completions sit
+idle while long ones finish. `ContinuousBatchingScheduler` instead keeps a running batch of sequences and, after every
+decoding step, retires the finished ones and admits waiting requests into the freed slots.
+
+The running sequences share one left-padded key/value cache. A new request is prefilled on its own and its cache is
+padded to the length of the running batch (or the other way around) before joining it; retiring a sequence removes its
+row, and cache positions that have become padding for every remaining sequence are trimmed.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Union
+
+import torch
+
+from ludwig.api_annotations import DeveloperAPI
+
+logger = logging.getLogger(__name__)
+
+# Generation parameters that the scheduler does not implement: it only supports greedy decoding and sampling with
+# temperature, top-k and top-p. Generating with any of them set to a non-default value needs `model.generate`.
+UNSUPPORTED_GENERATION_PARAMETERS = (
+    "min_new_tokens",
+    "min_length",
+    "max_time",
+    "num_beam_groups",
+    "penalty_alpha",
+    "prompt_lookup_num_tokens",
+    "typical_p",
+    "epsilon_cutoff",
+    "eta_cutoff",
+    "diversity_penalty",
+    "repetition_penalty",
+    "encoder_repetition_penalty",
+    "no_repeat_ngram_size",
+    "bad_words_ids",
+    "force_words_ids",
+    "renormalize_logits",
+    "forced_bos_token_id",
+    "forced_eos_token_id",
+    "remove_invalid_values",
+    "exponential_decay_length_penalty",
+    "suppress_tokens",
+    "begin_suppress_tokens",
+    "forced_decoder_ids",
+    "sequence_bias",
+    "guidance_scale",
+)
+
+# Either a `transformers` `Cache` object, or the legacy format of a (key, value) tuple per layer. Key and value tensors
+# have shape [batch, heads, sequence, dim].
+KeyValueCache = Any
+
+
+@DeveloperAPI
+@dataclass
+class ContinuousBatchingStats:
+    """Throughput and utilization of a `ContinuousBatchingScheduler`."""
+
+    max_batch_size: int
+    num_requests: int = 0
+    generated_tokens: int = 0
+    decode_steps: int = 0
+    # Sum over decode steps of the number of running sequences.
+    occupied_slot_steps: int = 0
+    elapsed_s: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.generated_tokens / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def slot_utilization(self) -> float:
+        """Fraction of the batch slots that were occupied, averaged over decode steps."""
+        if self.decode_steps == 0:
+            return 0.0
+        return self.occupied_slot_steps / (self.decode_steps * self.max_batch_size)
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        return {
+            "num_requests": self.num_requests,
+            "generated_tokens": self.generated_tokens,
+            "decode_steps": self.decode_steps,
+            "elapsed_s": self.elapsed_s,
+            "tokens_per_second": self.tokens_per_second,
+            "slot_utilization": self.slot_utilization,
+        }
+
+
+@dataclass
+class _Request:
+    input_ids: torch.Tensor
+    max_new_tokens: int
+    future: Future
+    generated: List[int] = field(default_factory=list)
+
+
+def _map_cache(fn: Callable[..., torch.Tensor], cache: KeyValueCache, *others: KeyValueCache) -> KeyValueCache:
+    """Replaces every key and value tensor of `cache` by `fn` applied to it and the matching tensors of `others`.
+
+    `Cache` objects are updated in place, through their per-layer `keys` and `values` (`transformers>=4.56`) or their
+    `key_cache` and `value_cache` lists, while a new tuple is returned for legacy caches.
+    """
+    if hasattr(cache, "layers"):
+        for i, layer in enumerate(cache.layers):
+            layer.keys = fn(layer.keys, *(other.layers[i].keys for other in others))
+            layer.values = fn(layer.values, *(other.layers[i].values for other in others))
+        return cache
+    if hasattr(cache, "key_cache"):
+        for i in range(len(cache.key_cache)):
+            cache.key_cache[i] = fn(cache.key_cache[i], *(other.key_cache[i] for other in others))
+            cache.value_cache[i] = fn(cache.value_cache[i], *(other.value_cache[i] for other in others))
+        return cache
+    return tuple(
+        tuple(fn(tensor, *(other[i][j] for other in others)) for j, tensor in enumerate(layer))
+        for i, layer in enumerate(cache)
+    )
+
+
+def _pad_cache(cache: KeyValueCache, mask: torch.Tensor, length: int) -> Tuple[KeyValueCache, torch.Tensor]:
+    """Left-pads the sequence dimension of the cache and its attention mask to `length`."""
+    padding = length - mask.shape[1]
+    if padding == 0:
+        return cache, mask
+    cache = _map_cache(lambda tensor: torch.nn.functional.pad(tensor, (0, 0, padding, 0)), cache)
+    return cache, torch.nn.functional.pad(mask, (padding, 0))
+
+
+@DeveloperAPI
+class ContinuousBatchingScheduler:
+    """Generates completions for a stream of requests, running up to `max_batch_size` sequences per decoding step.
+
+    Supports greedy decoding and sampling with temperature, top-k and top-p, with a single sequence per request. The
+    model must be a causal language model that accepts `position_ids` and returns either a `transformers` `Cache` with
+    per-layer key and value tensors (such as `DynamicCache`) or a legacy tuple cache.
+
+    Requests can be run to completion with `generate`, or submitted from any thread with `submit` while `start` runs
+    the scheduling loop in a background thread, so that concurrent callers share the running batch.
+    """
+
+    def __init__(
+        self,
+        model: torch.nn.Module,
+        max_batch_size: int,
+        max_new_tokens: int,
+        eos_token_id: Optional[Union[int, List[int]]] = None,
+        do_sample: bool = False,
+        temperature: float = 1.0,
+        top_k: Optional[int] = None,
+        top_p: Optional[float] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"`max_batch_size` must be at least 1, got {max_batch_size}.")
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_new_tokens = max_new_tokens
+        if eos_token_id is None:
+            eos_token_id = []
+        self.eos_token_ids = set(eos_token_id if isinstance(eos_token_id, (list, tuple)) else [eos_token_id])
+        self.do_sample = do_sample
+        self.temperature = temperature
+        self.top_k = top_k
+        self.top_p = top_p
+
+        self.stats = ContinuousBatchingStats(max_batch_size=max_batch_size)
+
+        self._waiting: Deque[_Request] = deque()
+        self._running: List[_Request] = []
+        self._cache: Optional[KeyValueCache] = None
+        self._attention_mask: Optional[torch.Tensor] = None
+        self._positions: Optional[torch.Tensor] = None
+        self._next_tokens: Optional[torch.Tensor] = None
+
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    @property
+    def device(self) -> torch.device:
+        return next(self.model.parameters()).device
+
+    @property
+    def num_running(self) -> int:
+        return len(self._running)
+
+    @property
+    def num_waiting(self) -> int:
+        return len(self._waiting)
+
+    def submit(self, input_ids: torch.Tensor, max_new_tokens: Optional[int] = None) -> Future:
+        """Queues the prompt `input_ids` of shape [length] or [1, length].
+
+        Returns a future resolving to the prompt followed by the generated token ids.
+        """
+        request = _Request(
+            input_ids=input_ids.reshape(-1).to(self.device),
+            max_new_tokens=max_new_tokens or self.max_new_tokens,
+            future=Future(),
+        )
+        with self._condition:
+            self._waiting.append(request)
+            self.stats.num_requests += 1
+            self._condition.notify()
+        return request.future
+
+    def generate(self, input_ids: List[torch.Tensor]) -> List[torch.Tensor]:
+        """Generates completions for all prompts, returning each prompt followed by its generated token ids."""
+        futures = [self.submit(sample) for sample in input_ids]
+        while any(not future.done() for future in futures):
+            self.step()
+        return [future.result() for future in futures]
+
+    def step(self):
+        """Admits waiting requests into free slots, then runs one decoding step for all running sequences."""
+        start = time.perf_counter()
+        with torch.no_grad():
+            self._admit()
+            if self._running:
+                self._decode()
+        self.stats.elapsed_s += time.perf_counter() - start
+
+    def start(self):
+        """Runs the scheduling loop in a background thread until `stop` is called."""
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, name="ludwig-continuous-batching", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self):
+        while True:
+            with self._condition:
+                while not self._stopped and not self._waiting and not self._running:
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            try:
+                self.step()
+            except Exception as e:
+                logger.exception("Continuous batching step failed, failing all pending requests.")
+                self._fail_all(e)
+
+    def _fail_all(self, error: Exception):
+        with self._condition:
+            requests = self._running + list(self._waiting)
+            self._running, self._waiting = [], deque()
+        self._cache = self._attention_mask = self._positions = self._next_tokens = None
+        for request in requests:
+            request.future.set_exception(error)
+
+    def _forward(self, input_ids, attention_mask, position_ids, past_key_values=None):
+        outputs = self.model(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            position_ids=position_ids,
+            past_key_values=past_key_values,
+            use_cache=True,
+        )
+        return outputs.logits[:, -1, :], outputs.past_key_values
+
+    def _select_tokens(self, logits: torch.Tensor) -> torch.Tensor:
+        if not self.do_sample:
+            return logits.argmax(dim=-1)
+
+        logits = logits / max(self.temperature, 1e-5)
+        if self.top_k:
+            kth_largest = torch.topk(logits, min(self.top_k, logits.shape[-1]), dim=-1).values[:, -1:]
+            logits = logits.masked_fill(logits < kth_largest, float("-inf"))
+        if self.top_p is not None and self.top_p < 1.0:
+            sorted_logits, sorted_indices = torch.sort(logits, descending=True, dim=-1)
+            cumulative_probs = sorted_logits.softmax(dim=-1).cumsum(dim=-1)
+            # Remove the tokens after the probability mass reaches top_p, always keeping the most likely one.
+            sorted_remove = cumulative_probs - sorted_logits.softmax(dim=-1) >= self.top_p
+            logits = logits.masked_fill(sorted_remove.scatter(1, sorted_indices, sorted_remove), float("-inf"))
+        return torch.multinomial(logits.softmax(dim=-1), num_samples=1).squeeze(-1)
+
+    def _admit(self):
+        while len(self._running) < self.max_batch_size:
+            with self._condition:
+                if not self._waiting:
+                    return
+                request = self._waiting.popleft()
+
+            # Prefill the prompt on its own, which also yields the first generated token.
+            input_ids = request.input_ids.unsqueeze(0)
+            mask = torch.ones_like(input_ids)
+            positions = torch.arange(input_ids.shape[1], device=self.device).unsqueeze(0)
+            logits, cache = self._forward(input_ids, mask, positions)
+            next_token = self._select_tokens(logits)
+            self.stats.generated_tokens += 1
+            if self._finish_if_done(request, int(next_token)):
+                continue
+
+            position = torch.tensor([input_ids.shape[1]], device=self.device)
+            if not self._running:
+                self._cache, self._attention_mask = cache, mask
+                self._positions, self._next_tokens = position, next_token
+            else:
+                length = max(mask.shape[1], self._attention_mask.shape[1])
+                cache, mask = _pad_cache(cache, mask, length)
+                self._cache, self._attention_mask = _pad_cache(self._cache, self._attention_mask, length)
+                self._cache = _map_cache(lambda running, new: torch.cat([running, new]), self._cache, cache)
+                self._attention_mask = torch.cat([self._attention_mask, mask])
+                self._positions = torch.cat([self._positions, position])
+                self._next_tokens = torch.cat([self._next_tokens, next_token])
+            self._running.append(request)
+
+    def _decode(self):
+        batch_size = len(self._running)
+        self._attention_mask = torch.nn.functional.pad(self._attention_mask, (0, 1), value=1)
+        logits, self._cache = self._forward(
+            self._next_tokens.unsqueeze(-1),
+            self._attention_mask,
+            self._positions.unsqueeze(-1),
+            past_key_values=self._cache,
+        )
+        self._positions = self._positions + 1
+        self._next_tokens = self._select_tokens(logits)
+        self.stats.decode_steps += 1
+        self.stats.occupied_slot_steps += batch_size
+        self.stats.generated_tokens += batch_size
+
+        keep = [
+            i
+            for i, (request, token) in enumerate(zip(self._running, self._next_tokens.tolist()))
+            if not self._finish_if_done(request, token)
+        ]
+        if len(keep) == batch_size:
+            return
+        self._running = [self._running[i] for i in keep]
+        if not keep:
+            self._cache = self._attention_mask = self._positions = self._next_tokens = None
+            return
+
+        index = torch.tensor(keep, device=self.device)
+        mask = self._attention_mask.index_select(0, index)
+        # Drop the cache positions that are padding for every remaining sequence.
+        start = int(mask.any(dim=0).int().argmax())
+        self._attention_mask = mask[:, start:]
+        self._cache = _map_cache(lambda tensor: tensor.index_select(0, index)[:, :, start:], self._cache)
+        self._positions = self._positions.index_select(0, index)
+        self._next_tokens = self._next_tokens.index_select(0, index)
+
+    def _finish_if_done(self, request: _Request, token: int) -> bool:
+        """Appends the token to the request, and completes the request if it is done."""
+        request.generated.append(token)
+        if token not in self.eos_token_ids and len(request.generated) < request.max_new_tokens:
+            return False
+        generated = torch.tensor(request.generated, dtype=request.input_ids.dtype, device=request.input_ids.device)
+        request.future.set_result(torch.cat([request.input_ids, generated]))
+        return True
@@ -0,0 +1,141 @@
+"""Reuse of the key/value cache of prompt prefixes shared across samples during LLM generation.
+
+With a prompt template, every prompt starts with the same instruction tokens. Instead of recomputing attention over
+these tokens for every sample, `PrefixKVCache` runs the model over the shared prefix once and hands out copies of the
+resulting key/value cache, so that generation only has to prefill the tokens specific to each sample.
+"""
+import copy
+import logging
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+import torch
+
+from ludwig.api_annotations import DeveloperAPI
+
+logger = logging.getLogger(__name__)
+
+# Shorter shared prefixes save too little prefill to be worth a separate forward pass and cache copies.
+DEFAULT_MIN_PREFIX_LENGTH = 8
+
+
+@DeveloperAPI
+def get_common_prefix_length(sequences: List[torch.Tensor]) -> int:
+    """Returns the number of leading token ids shared by all sequences, each of shape [length] or [1, length]."""
+    if not sequences:
+        return 0
+    sequences = [sequence.reshape(-1) for sequence in sequences]
+    min_length = min(len(sequence) for sequence in sequences)
+    if min_length == 0:
+        return 0
+    stacked = torch.stack([sequence[:min_length] for sequence in sequences])
+    mismatches = torch.nonzero((stacked != stacked[0]).any(dim=0))
+    return int(mismatches[0]) if len(mismatches) else min_length
+
+
+def get_kv_cache_nbytes(cache: Any) -> int:
+    """Returns the memory used by the tensors of a key/value cache, either in the legacy tuple format or a `Cache`
+    object from transformers."""
+    seen = set()
+
+    def nbytes(obj: Any) -> int:
+        if id(obj) in seen:
+            return 0
+        seen.add(id(obj))
+        if isinstance(obj, torch.Tensor):
+            return obj.numel() * obj.element_size()
+        if isinstance(obj, (list, tuple)):
+            return sum(nbytes(item) for item in obj)
+        if isinstance(obj, dict):
+            return sum(nbytes(item) for item in obj.values())
+        if hasattr(obj, "__dict__"):
+            return sum(nbytes(item) for item in vars(obj).values())
+        return 0
+
+    return nbytes(cache)
+
+
+def crop_kv_cache(cache: Any, length: int) -> Any:
+    """Returns the key/value cache for the first `length` tokens, cropping `Cache` objects in place."""
+    if hasattr(cache, "crop"):
+        cache.crop(length)
+        return cache
+    # Legacy format: a (key, value, ...) tuple per layer, with tensors of shape [batch, heads, sequence, head_dim].
+    return tuple(tuple(tensor[:, :, :length] for tensor in layer) for layer in cache)
+
+
+@DeveloperAPI
+class PrefixKVCache:
+    """LRU cache of the key/value caches computed by a causal language model over prompt prefixes.
+
+    Entries are reused for any later prefix they share at least `min_prefix_length` tokens with: a longer cached
+    prefix is cropped, and a shorter one is extended by running the model over the remaining tokens only. Entries are
+    evicted, least recently used first, to keep the cached tensors under `max_memory_bytes`.
+
+    The cached states are only valid for the model weights they were computed with, so the cache must be cleared
+    whenever the weights change.
+    """
+
+    def __init__(self, max_memory_bytes: int, min_prefix_length: int = DEFAULT_MIN_PREFIX_LENGTH):
+        self.max_memory_bytes = max_memory_bytes
+        self.min_prefix_length = min_prefix_length
+        self._entries: "OrderedDict[Tuple[int, ...], Tuple[Any, int]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(nbytes for _, nbytes in self._entries.values())
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _find_longest_match(self, key: Tuple[int, ...]) -> Tuple[Optional[Tuple[int, ...]], int]:
+        best_key, best_length = None, 0
+        for cached_key in self._entries:
+            length = get_common_prefix_length([torch.tensor(cached_key), torch.tensor(key)])
+            if length > best_length:
+                best_key, best_length = cached_key, length
+        return best_key, best_length
+
+    def get(self, model: torch.nn.Module, prefix_ids: torch.Tensor) -> Any:
+        """Returns a key/value cache of `model` over `prefix_ids` of shape [1, length], which the caller may
+        modify.
+
+        Only the tokens not covered by a cached prefix are run through the model.
+        """
+        key = tuple(prefix_ids.reshape(-1).tolist())
+        cached_key, length = self._find_longest_match(key)
+
+        past_key_values = None
+        if cached_key is not None and length >= self.min_prefix_length:
+            self._entries.move_to_end(cached_key)
+            past_key_values = crop_kv_cache(copy.deepcopy(self._entries[cached_key][0]), length)
+            if length == len(key):
+                self.hits += 1
+                return past_key_values
+        else:
+            length = 0
+
+        self.misses += 1
+        with torch.no_grad():
+            outputs = model(
+                input_ids=prefix_ids[:, length:],
+                attention_mask=torch.ones_like(prefix_ids),
+                past_key_values=past_key_values,
+                use_cache=True,
+            )
+        past_key_values = outputs.past_key_values
+
+        nbytes = get_kv_cache_nbytes(past_key_values)
+        if nbytes > self.max_memory_bytes:
+            logger.debug(f"Not caching a prefix of {len(key)} tokens, its key/value cache needs {nbytes} bytes.")
+            return past_key_values
+
+        self._entries[key] = (past_key_values, nbytes)
+        while self.memory_bytes > self.max_memory_bytes:
+            self._entries.popitem(last=False)
+        return copy.deepcopy(past_key_values)
@@ -1,7 +1,8 @@
 import copy
 import logging
 import tempfile
-from typing import Dict, Optional, Tuple, TYPE_CHECKING, Union
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import torch
 import torch.nn.functional as F
@@ -488,6 +489,142 @@ def generate_merged_ids(
     return torch.stack(merged_input_and_targets), torch.stack(attention_masks)
 
 
+@dataclass
+class PackedBatch:
+    """A batch of merged input and target ids packed into rows of multiple examples."""
+
+    input_ids: torch.Tensor
+    # 1 for the tokens of the packed examples and 0 for padding.
+    attention_mask: torch.Tensor
+    # Positions restart at 0 at the beginning of each example.
+    position_ids: torch.Tensor
+    # 1-based index of the example each token belongs to within its row, 0 for padding.
+    sequence_ids: torch.Tensor
+    # Target token ids at the positions of the target tokens of each example and IGNORE_INDEX_TOKEN_ID elsewhere.
+    labels: torch.Tensor
+    num_examples: int
+    num_tokens: int
+
+    @property
+    def efficiency(self) -> float:
+        """Fraction of the packed tensor occupied by real (non-padding) tokens."""
+        return self.num_tokens / self.input_ids.numel()
+
+    def causal_attention_mask(self, dtype: torch.dtype) -> torch.Tensor:
+        """Returns a block-diagonal causal attention mask of shape [rows, 1, length, length].
+
+        Each token only attends to itself and the preceding tokens of its own example, so that together with the
+        position ids every example is encoded as if it were alone in its row. The mask is in the inverted (additive)
+        form that Hugging Face models accept as a custom 4D attention mask: 0 where attention is allowed and the
+        minimum value of `dtype` elsewhere. Padding tokens attend to the preceding padding of their row.
+        """
+        length = self.sequence_ids.shape[1]
+        causal = torch.ones((length, length), dtype=torch.bool, device=self.sequence_ids.device).tril()
+        same_example = self.sequence_ids.unsqueeze(2) == self.sequence_ids.unsqueeze(1)
+        mask = torch.zeros(same_example.shape, dtype=dtype, device=self.sequence_ids.device)
+        mask.masked_fill_(~(same_example & causal), torch.finfo(dtype).min)
+        return mask.unsqueeze(1)
+
+
+class PackingStats:
+    """Running packing efficiency across packed batches."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.num_examples = 0
+        self.num_rows = 0
+        self.num_tokens = 0
+        self.num_slots = 0
+
+    def update(self, packed_batch: PackedBatch):
+        self.num_examples += packed_batch.num_examples
+        self.num_rows += packed_batch.input_ids.shape[0]
+        self.num_tokens += packed_batch.num_tokens
+        self.num_slots += packed_batch.input_ids.numel()
+
+    @property
+    def efficiency(self) -> float:
+        return self.num_tokens / self.num_slots if self.num_slots else 0.0
+
+
+def _pack_lengths(lengths: List[int], max_sequence_length: int) -> List[List[int]]:
+    """Assigns examples to rows with the first-fit decreasing heuristic, returning the example indices per row."""
+    rows = []
+    row_lengths = []
+    for idx in sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True):
+        for row, row_length in enumerate(row_lengths):
+            if row_length + lengths[idx] <= max_sequence_length:
+                rows[row].append(idx)
+                row_lengths[row] += lengths[idx]
+                break
+        else:
+            rows.append([idx])
+            row_lengths.append(lengths[idx])
+    return rows
+
+
+def generate_packed_ids(
+    input_ids: torch.Tensor, target_ids: torch.Tensor, tokenizer: PreTrainedTokenizer, max_sequence_length: int
+) -> PackedBatch:
+    """Merges input and target ids like `generate_merged_ids`, then packs several examples into each row.
+
+    Every example is truncated to `max_sequence_length` exactly as in `generate_merged_ids`, and examples are packed
+    into rows of at most `max_sequence_length` tokens. Rows are right padded to the longest row. Position ids restart
+    at every example boundary, and the labels hold the target tokens (and EOS) of each example at their positions in
+    the row. When the model is given the position ids and `PackedBatch.causal_attention_mask`, examples do not attend
+    to each other, so the next token loss over a packed row is the same as over the unpacked examples.
+    """
+    eos_tensor = torch.tensor([tokenizer.eos_token_id]).to(target_ids[0].device)
+
+    examples = []
+    example_labels = []
+    for input_id_sample, target_id_sample in zip(input_ids, target_ids):
+        input_id_sample_no_padding = remove_left_padding(input_id_sample, tokenizer)[0]
+        target_id_sample_no_padding = remove_left_padding(target_id_sample, tokenizer)[0]
+        target_id_sample_no_padding = torch.cat((target_id_sample_no_padding, eos_tensor), dim=-1)
+
+        merged_sample_ids = torch.cat((input_id_sample_no_padding, target_id_sample_no_padding), dim=-1)
+        labels = torch.cat(
+            (torch.full_like(input_id_sample_no_padding, IGNORE_INDEX_TOKEN_ID), target_id_sample_no_padding), dim=-1
+        )
+        examples.append(merged_sample_ids[:max_sequence_length].to(torch.int64))
+        example_labels.append(labels[:max_sequence_length].to(torch.int64))
+
+    lengths = [example.shape[0] for example in examples]
+    rows = _pack_lengths(lengths, max_sequence_length)
+    row_length = max(sum(lengths[idx] for idx in row) for row in rows)
+
+    device = examples[0].device
+    pad_token_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id
+    packed_ids = torch.full((len(rows), row_length), pad_token_id, dtype=torch.int64, device=device)
+    attention_mask = torch.zeros((len(rows), row_length), dtype=torch.int64, device=device)
+    position_ids = torch.zeros((len(rows), row_length), dtype=torch.int64, device=device)
+    sequence_ids = torch.zeros((len(rows), row_length), dtype=torch.int64, device=device)
+    packed_labels = torch.full((len(rows), row_length), IGNORE_INDEX_TOKEN_ID, dtype=torch.int64, device=device)
+    for row, example_idxs in enumerate(rows):
+        offset = 0
+        for sequence_id, idx in enumerate(example_idxs, start=1):
+            end = offset + lengths[idx]
+            packed_ids[row, offset:end] = examples[idx]
+            attention_mask[row, offset:end] = 1
+            position_ids[row, offset:end] = torch.arange(lengths[idx], device=device)
+            sequence_ids[row, offset:end] = sequence_id
+            packed_labels[row, offset:end] = example_labels[idx]
+            offset = end
+
+    return PackedBatch(
+        input_ids=packed_ids,
+        attention_mask=attention_mask,
+        position_ids=position_ids,
+        sequence_ids=sequence_ids,
+        labels=packed_labels,
+        num_examples=len(examples),
+        num_tokens=sum(lengths),
+    )
+
+
 def _get_decoded_targets_and_predictions(
     targets: Dict[str, torch.Tensor],
     predictions: Dict[str, Dict[str, torch.Tensor]],
@@ -37,3 +37,14 @@ class LazyLoader(types.ModuleType):
     def __dir__(self):
         module = self._load()
         return dir(module)
+
+
+def import_attr(path: str):
+    """Imports the module of a fully qualified attribute path, e.g. `bitsandbytes.optim.Adam8bit`, and returns the
+    attribute.
+
+    Registries store such paths for entries that depend on heavy or optional packages, so that the package is only
+    imported once the entry is actually used.
+    """
+    module_name, attr_name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), attr_name)
@@ -15,7 +15,10 @@
 # ==============================================================================
 
 from collections import UserDict
-from typing import Generic, TypeVar
+from collections.abc import Mapping
+from typing import Dict, Generic, TypeVar
+
+from ludwig.utils.package_utils import import_attr
 
 DEFAULT_KEYS = ["None", "none", "null", None]
 
@@ -75,3 +78,26 @@ class Registry(UserDict, Generic[T]):
             return cls
 
         return wrap
+
+
+class LazyRegistry(Mapping, Generic[T]):
+    """Read-only registry of names to objects given by their import path, e.g. `"package.module.ClassName"`.
+
+    The module defining an object is only imported the first time the object is looked up, so that listing the
+    registered names, or looking up a single entry, does not import the dependencies of every other entry.
+    """
+
+    def __init__(self, paths: Dict[str, str]):
+        self.paths = paths
+
+    def __getitem__(self, key: str) -> T:
+        return import_attr(self.paths[key])
+
+    def __contains__(self, key: str):
+        return key in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self):
+        return iter(self.paths)
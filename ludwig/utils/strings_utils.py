@@ -27,6 +27,7 @@ from dateutil.parser import parse as parse_datetime
 from ludwig.constants import PADDING_SYMBOL, START_SYMBOL, STOP_SYMBOL, UNKNOWN_SYMBOL
 from ludwig.data.dataframe.base import DataFrameEngine
 from ludwig.data.dataframe.pandas import PANDAS
+from ludwig.data.statistics import strip_value_counts
 from ludwig.utils.fs_utils import open_file
 from ludwig.utils.math_utils import int_type
 from ludwig.utils.tokenizers import get_tokenizer_from_registry
@@ -466,6 +467,7 @@ def create_vocabulary_single_token(
     num_most_frequent: Optional[int] = None,
     processor: DataFrameEngine = PANDAS,
     unknown_symbol: str = UNKNOWN_SYMBOL,
+    value_counts: Optional[Series] = None,
 ):
     """Computes a vocabulary over the provided data frame.
 
@@ -480,6 +482,8 @@ def create_vocabulary_single_token(
         num_most_frequent: Upper limit on vocabulary size.
         unknown_symbol: String representation for the UNKNOWN symbol.
         processor: Which processor to use to process data.
+        value_counts: Precomputed counts of the stripped values, most frequent first. Computed from `data` if not
+            provided.
 
     Returns:
         Tuple of:
@@ -487,17 +491,18 @@ def create_vocabulary_single_token(
             str2idx: Map of symbol to index.
             str2freq: Map of symbol to frequency.
     """
-    processed_counts = data.str.strip().value_counts(sort=True)
-    processed_counts = processor.compute(processed_counts)
-    full_vocab = processed_counts.index.tolist()
+    if value_counts is not None:
+        processed_counts = value_counts
+    else:
+        processed_counts = strip_value_counts(processor.compute(data.value_counts()))
     # Only add unknown symbol if num most frequent tokens is less than total number of unique tokens
-    if num_most_frequent < len(full_vocab):
-        vocab = [unknown_symbol] + full_vocab[:num_most_frequent]
+    if num_most_frequent < len(processed_counts):
+        vocab = [unknown_symbol] + processed_counts.index[:num_most_frequent].tolist()
     else:
-        vocab = full_vocab
+        vocab = processed_counts.index.tolist()
     str2idx = {unit: i for i, unit in enumerate(vocab)}
-    str2freq = processed_counts.to_dict()
-    str2freq = {k: str2freq.get(k, 0) for k in vocab}
+    # Only the counts of the kept values are looked up, high-cardinality columns can have many more distinct values.
+    str2freq = processed_counts.reindex(vocab, fill_value=0).to_dict()
     return vocab, str2idx, str2freq
 
 
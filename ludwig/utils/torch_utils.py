@@ -6,6 +6,7 @@ from functools import lru_cache
 from typing import List, Optional, Tuple, Union
 
 import torch
+from packaging import version
 from torch import nn
 from torch.nn import Module, ModuleDict
 
@@ -150,6 +151,9 @@ def get_activation(activation):
 def reg_loss(model: nn.Module, regularizer: str, l1: float = 0.01, l2: float = 0.01):
     """Computes the regularization loss for a given model.
 
+    The norms of all the parameters are computed by fused multi-tensor kernels, rather than by one reduction per
+    parameter tensor.
+
     Parameters:
         model: torch.nn.Module object to compute regularization loss for.
         regularizer: regularizer to use (currently l1, l2 and l1_l2 supported).
@@ -159,17 +163,37 @@ def reg_loss(model: nn.Module, regularizer: str, l1: float = 0.01, l2: float = 0
     Returns:
         Regularization loss for the model (float).
     """
-
-    if regularizer == "l1":
-        l1_reg = l1 * sum(torch.abs(p).sum() for p in model.parameters())
-        return l1_reg
-    if regularizer == "l2":
-        l2_reg = l2 * sum(torch.square(p).sum() for p in model.parameters())
-        return l2_reg
-    if regularizer == "l1_l2":
-        l1_reg = l1 * sum(torch.abs(p).sum() for p in model.parameters())
-        l2_reg = l2 * sum(torch.square(p).sum() for p in model.parameters())
-        return l1_reg + l2_reg
+    if regularizer not in {"l1", "l2", "l1_l2"}:
+        return None
+
+    parameters = list(model.parameters())
+    loss = 0
+    if regularizer in {"l1", "l1_l2"}:
+        loss = loss + l1 * _sum_of_powered_norms(parameters, 1)
+    if regularizer in {"l2", "l1_l2"}:
+        loss = loss + l2 * _sum_of_powered_norms(parameters, 2)
+    return loss
+
+
+# Backpropagating through `torch._foreach_norm` is supported from torch 2.1.
+_FOREACH_NORM_DIFFERENTIABLE = version.parse(torch.__version__) >= version.parse("2.1.0")
+
+
+def _sum_of_powered_norms(parameters: List[torch.Tensor], p: int) -> Union[torch.Tensor, float]:
+    """Returns the sum over all the parameters of their `p`-norm raised to the power `p`, i.e. of the absolute
+    values of their elements raised to the power `p`."""
+    float_parameters = [param for param in parameters if param.is_floating_point()]
+    # Non-floating point parameters, like quantized weights, are not supported by the fused kernels.
+    total = sum(torch.abs(param).pow(p).sum() for param in parameters if not param.is_floating_point())
+    if float_parameters:
+        device = float_parameters[0].device
+        if _FOREACH_NORM_DIFFERENTIABLE:
+            norms = torch._foreach_norm(float_parameters, p)
+        else:
+            norms = [torch.linalg.vector_norm(param, p) for param in float_parameters]
+        norms = torch.stack([norm.float().to(device) for norm in norms])
+        total = total + (norms if p == 1 else norms.pow(p)).sum()
+    return total
 
 
 @DeveloperAPI
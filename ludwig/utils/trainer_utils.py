@@ -1,18 +1,20 @@
 import logging
 import re
+import time
 from collections import defaultdict
-from typing import Dict, List, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING, Union
 
 try:
     from typing import Literal
 except ImportError:
     from typing_extensions import Literal
 
+import torch
+
 from ludwig.api_annotations import DeveloperAPI
 from ludwig.constants import AUTO, COMBINED, LOSS
 from ludwig.models.base import BaseModel
 from ludwig.models.ecd import ECD
-from ludwig.models.llm import LLM
 from ludwig.modules.metric_modules import get_best_function
 from ludwig.schema.trainer import ECDTrainerConfig, FineTuneTrainerConfig
 from ludwig.utils.data_utils import save_json
@@ -20,11 +22,18 @@ from ludwig.utils.metric_utils import TrainerMetric
 
 if TYPE_CHECKING:
     from ludwig.features.base_feature import OutputFeature
+    from ludwig.models.llm import LLM
     from ludwig.schema.trainer import BaseTrainerConfig
 
 
 logger = logging.getLogger(__name__)
 
+# Number of training steps whose losses are kept on device before being read back in a single transfer.
+STEPS_PER_TELEMETRY_FLUSH = 50
+
+# Minimum wall-clock time in seconds between two samples of the system resources used by training.
+RESOURCE_SAMPLE_INTERVAL_S = 10.0
+
 
 @DeveloperAPI
 def initialize_trainer_metric_dict(output_features) -> Dict[str, Dict[str, List[TrainerMetric]]]:
@@ -357,6 +366,93 @@ class ProgressTracker:
         self.cumulative_step_token_usage[steps_str] = self.total_tokens_used
 
 
+@DeveloperAPI
+class StepSummary(NamedTuple):
+    """Telemetry of a single training step."""
+
+    step: int
+    combined_loss: Union[torch.Tensor, float]
+    all_losses: Dict[str, Union[torch.Tensor, float]]
+    used_tokens: int
+    total_tokens_used: int
+    learning_rate: Optional[float]
+
+
+@DeveloperAPI
+class StepTelemetry:
+    """Collects the telemetry of training steps without synchronizing with the device on every step.
+
+    Reading a loss back to the host blocks until the device has computed it, so the losses of every step are kept on
+    device and read back all at once every `steps_per_flush` steps. System resources are sampled at most once every
+    `resource_sample_interval_s` seconds, independently of how fast steps are.
+    """
+
+    def __init__(
+        self,
+        steps_per_flush: int = STEPS_PER_TELEMETRY_FLUSH,
+        resource_sample_interval_s: float = RESOURCE_SAMPLE_INTERVAL_S,
+    ):
+        self.steps_per_flush = steps_per_flush
+        self.resource_sample_interval_s = resource_sample_interval_s
+        self._pending: List[StepSummary] = []
+        self._last_resource_sample: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(
+        self,
+        step: int,
+        combined_loss: torch.Tensor,
+        all_losses: Dict[str, torch.Tensor],
+        used_tokens: int = 0,
+        total_tokens_used: int = 0,
+        learning_rate: Optional[float] = None,
+    ) -> bool:
+        """Buffers the telemetry of a step, and returns whether enough steps are buffered to be flushed."""
+        self._pending.append(
+            StepSummary(
+                step=step,
+                combined_loss=combined_loss.detach(),
+                all_losses={name: loss.detach() for name, loss in all_losses.items()},
+                used_tokens=used_tokens,
+                total_tokens_used=total_tokens_used,
+                learning_rate=learning_rate,
+            )
+        )
+        return len(self._pending) >= self.steps_per_flush
+
+    def flush(self) -> List[StepSummary]:
+        """Returns the buffered step summaries with their losses read back as floats, in a single device transfer."""
+        if not self._pending:
+            return []
+        pending, self._pending = self._pending, []
+
+        device = pending[0].combined_loss.device
+        losses = [
+            torch.as_tensor(loss).float().reshape(()).to(device)
+            for summary in pending
+            for loss in [summary.combined_loss, *summary.all_losses.values()]
+        ]
+        values = iter(torch.stack(losses).cpu().tolist())
+
+        summaries = []
+        for summary in pending:
+            combined_loss = next(values)
+            all_losses = {name: next(values) for name in summary.all_losses}
+            summaries.append(summary._replace(combined_loss=combined_loss, all_losses=all_losses))
+        return summaries
+
+    def should_sample_resources(self) -> bool:
+        """Returns whether the sampling interval of system resources has elapsed since the last sample."""
+        now = time.monotonic()
+        last_sample = self._last_resource_sample
+        if last_sample is not None and now - last_sample < self.resource_sample_interval_s:
+            return False
+        self._last_resource_sample = now
+        return True
+
+
 @DeveloperAPI
 def append_metrics(
     model: BaseModel,
@@ -513,7 +609,7 @@ def get_rendered_batch_size_grad_accum(config: "BaseTrainerConfig", num_workers:
     return batch_size, gradient_accumulation_steps
 
 
-def freeze_layers_regex(config: Union[ECDTrainerConfig, FineTuneTrainerConfig], model: Union[ECD, LLM]) -> None:
+def freeze_layers_regex(config: Union[ECDTrainerConfig, FineTuneTrainerConfig], model: Union[ECD, "LLM"]) -> None:
     """Freezes layers in a model whose names match a specified regular expression pattern.
 
     This function iterates over all parameters of the model, checking each parameter's name against
@@ -1,15 +1,25 @@
 import os
 from pathlib import Path
+from unittest import mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from ludwig.api import LudwigModel
 from ludwig.constants import CHECKSUM, META, TEST, TRAINING, VALIDATION
 from ludwig.data.cache.manager import alphanum, CacheManager
-from ludwig.data.cache.types import CacheableDataframe, wrap
+from ludwig.data.cache.types import CacheableDataframe, fingerprint_dataframe, wrap
 from ludwig.data.dataset.pandas import PandasDatasetManager
 from ludwig.globals import TRAINING_PREPROC_FILE_NAME
-from tests.integration_tests.utils import category_feature, LocalTestBackend, sequence_feature
+from tests.integration_tests.utils import (
+    binary_feature,
+    category_feature,
+    generate_data,
+    LocalTestBackend,
+    number_feature,
+    sequence_feature,
+)
 
 
 @pytest.fixture
@@ -92,3 +102,78 @@ def test_cache_dataset(use_cache_dir, use_split, use_df, tmpdir, change_test_dir
 
     for cache_path in cache_map.values():
         assert not os.path.exists(cache_path)
+
+
+def test_fingerprint_dataframe():
+    df = pd.DataFrame({"a": np.arange(100), "b": [f"v{i % 7}" for i in range(100)]})
+    fingerprint = fingerprint_dataframe(df)
+    assert fingerprint == fingerprint_dataframe(df.copy())
+    assert wrap(df).checksum == wrap(df.copy()).checksum == fingerprint
+
+    modified = df.copy()
+    modified.loc[42, "b"] = "changed"
+    assert fingerprint_dataframe(modified) != fingerprint
+    assert fingerprint_dataframe(df.astype({"a": np.float64})) != fingerprint
+    assert fingerprint_dataframe(df.set_axis(np.arange(100) + 1)) != fingerprint
+    assert fingerprint_dataframe(df.iloc[1:]) != fingerprint_dataframe(df.iloc[1:].reset_index(drop=True))
+
+    # Values that cannot be hashed fall back to a unique checksum
+    unhashable = pd.DataFrame({"a": [[1, 2], [3]]})
+    assert fingerprint_dataframe(unhashable) is None
+    assert wrap(unhashable).checksum != wrap(unhashable).checksum
+
+
+def test_fingerprint_sampled_rows():
+    df = pd.DataFrame({"a": np.arange(1000), "b": [f"v{i % 7}" for i in range(1000)]})
+    full = fingerprint_dataframe(df)
+    sampled = fingerprint_dataframe(df, sample_rows=10)
+    assert sampled != full
+    # The sample is deterministic, so the sampled fingerprint is stable across calls
+    assert sampled == fingerprint_dataframe(df.copy(), sample_rows=10)
+    assert wrap(df, fingerprint_sample_rows=10).checksum == sampled
+
+    # Row 999 is always part of the evenly spaced sample
+    modified = df.copy()
+    modified.loc[999, "b"] = "changed"
+    assert fingerprint_dataframe(modified) != full
+    assert fingerprint_dataframe(modified, sample_rows=10) != sampled
+
+
+def test_fingerprint_computed_lazily():
+    df = pd.DataFrame({"a": np.arange(100)})
+    with mock.patch("ludwig.data.cache.types.fingerprint_dataframe", return_value="abc") as fingerprint:
+        dataset = wrap(df)
+        assert dataset.unwrap() is df
+        fingerprint.assert_not_called()
+
+        assert dataset.checksum == dataset.name == "abc"
+        assert dataset.get_cache_path() == "abc"
+        fingerprint.assert_called_once()
+
+
+@pytest.mark.distributed
+def test_fingerprint_dask_dataframe():
+    dd = pytest.importorskip("dask.dataframe")
+
+    df = pd.DataFrame({"a": np.arange(100), "b": np.random.rand(100)})
+    fingerprint = fingerprint_dataframe(dd.from_pandas(df, npartitions=4))
+    assert fingerprint == fingerprint_dataframe(dd.from_pandas(df.copy(), npartitions=4))
+    df.loc[99, "b"] = -1.0
+    assert fingerprint_dataframe(dd.from_pandas(df, npartitions=4)) != fingerprint
+
+
+def test_dataframe_cache_hit(tmpdir, change_test_dir):
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, filename=os.path.join(tmpdir, "train.csv"))
+    config = {"input_features": input_features, "output_features": output_features, "trainer": {"epochs": 1}}
+
+    model = LudwigModel(config, backend=LocalTestBackend())
+    model.preprocess(dataset=pd.read_csv(data_csv), skip_save_processed_input=False)
+    cache_path = os.path.join(tmpdir, f"{wrap(pd.read_csv(data_csv)).name}.{TRAINING_PREPROC_FILE_NAME}")
+    assert os.path.exists(cache_path)
+    mtime = os.path.getmtime(cache_path)
+
+    # Preprocessing an identical frame reuses the cache
+    model.preprocess(dataset=pd.read_csv(data_csv), skip_save_processed_input=False)
+    assert os.path.getmtime(cache_path) == mtime
@@ -16,12 +16,16 @@ import os
 import shutil
 
 import numpy as np
+import pandas as pd
+import pytest
 import torch
 
 from ludwig.api import LudwigModel
 from ludwig.collect import collect_activations, collect_weights, print_model_summary
 from ludwig.constants import BATCH_SIZE, ENCODER, TRAINER, TYPE
 from ludwig.globals import MODEL_FILE_NAME
+from ludwig.utils.activation_utils import load_parquet_activations
+from ludwig.utils.strings_utils import make_safe_filename
 from ludwig.utils.torch_utils import get_torch_device
 from tests.integration_tests.utils import category_feature, ENCODERS, generate_data, sequence_feature
 
@@ -58,10 +62,6 @@ def _get_layers(model_path):
     return [name for name, _ in model.model.named_children()]
 
 
-def _collect_activations(model_path, layers, csv_filename, output_directory):
-    return collect_activations(model_path, layers, dataset=csv_filename, output_directory=output_directory)
-
-
 def test_collect_weights(tmpdir, csv_filename):
     output_dir = None
     try:
@@ -89,17 +89,40 @@ def test_collect_weights(tmpdir, csv_filename):
             shutil.rmtree(output_dir, ignore_errors=True)
 
 
-def test_collect_activations(tmpdir, csv_filename):
+@pytest.mark.parametrize("output_format", ["npy", "parquet"])
+def test_collect_activations(tmpdir, csv_filename, output_format):
     output_dir = None
     try:
         model, output_dir = _train(*_prepare_data(csv_filename))
         model_path = os.path.join(output_dir, MODEL_FILE_NAME)
 
-        # [last_hidden, logits, projection_input]
-        filenames = _collect_activations(
-            model_path, [name for name, _ in model.model.named_children()], csv_filename, tmpdir
+        # Batches smaller than the dataset, so that activations are written incrementally
+        filenames = collect_activations(
+            model_path,
+            ["combiner"],
+            dataset=csv_filename,
+            batch_size=16,
+            output_directory=str(tmpdir),
+            output_format=output_format,
         )
-        assert len(filenames) == 3
+        # [last_hidden, logits, projection_input] of the output feature, and the outputs of the combiner
+        expected = dict(model.collect_activations(["combiner"], csv_filename, batch_size=16))
+        output_feature_name = model.config["output_features"][0]["name"]
+        for name in ["last_hidden", "logits", "projection_input"]:
+            assert f"{output_feature_name}::{name}" in expected
+        assert "combiner::combiner_output" in expected
+        assert sorted(filenames) == sorted(
+            os.path.join(str(tmpdir), f"{make_safe_filename(name)}.{output_format}") for name in expected
+        )
+
+        assert expected["combiner::combiner_output"].shape[0] == len(pd.read_csv(csv_filename))
+        for name, tensor in expected.items():
+            filename = os.path.join(str(tmpdir), f"{make_safe_filename(name)}.{output_format}")
+            if output_format == "npy":
+                saved = np.load(filename, mmap_mode="r")
+            else:
+                saved = load_parquet_activations(filename)
+            np.testing.assert_allclose(saved, tensor.numpy(), rtol=1e-5)
     finally:
         if output_dir:
             shutil.rmtree(output_dir, ignore_errors=True)
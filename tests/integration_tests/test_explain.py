@@ -12,6 +12,7 @@ from ludwig.explain.explainer import Explainer
 from ludwig.explain.explanation import Explanation
 from ludwig.explain.gbm import GBMExplainer
 from tests.integration_tests.utils import (
+    bag_feature,
     binary_feature,
     category_feature,
     date_feature,
@@ -193,7 +194,7 @@ def run_test_explainer_api(
                 date_feature(),
                 # h3_feature(),
                 set_feature(encoder={"vocab_size": 3}),
-                # bag_feature(encoder={"vocab_size": 3}),
+                bag_feature(encoder={"vocab_size": 3}),
             ]
 
     # Generate data
@@ -7,6 +7,7 @@ from ludwig.api import LudwigModel
 from ludwig.constants import INPUT_FEATURES, MODEL_TYPE, OUTPUT_FEATURES, TRAINER
 from ludwig.error import ConfigValidationError
 from ludwig.globals import MODEL_FILE_NAME
+from ludwig.models import predictor
 from ludwig.schema.model_types.base import ModelConfig
 from tests.integration_tests import synthetic_test_data
 from tests.integration_tests.utils import binary_feature
@@ -252,6 +253,22 @@ def test_hummingbird_conversion_category(vocab_size, tmpdir, local_backend):
     assert np.allclose(probs_hb, probs_lgbm, rtol=1e-6, atol=1e-6)
 
 
+def test_gbm_predictor_chunks(tmpdir, local_backend):
+    """Verify that predictions do not depend on the number of rows the GBM predictor scores at once."""
+    input_features = [number_feature(), category_feature(encoder={"reduce_output": "sum"})]
+    output_features = [number_feature()]
+
+    preds, model = _train_and_predict_gbm(input_features, output_features, tmpdir, local_backend)
+
+    # An explicit batch size is honored, large chunks are only the default
+    assert predictor.GbmPredictor(model.model)._batch_size == predictor.GBM_PREDICT_CHUNK_SIZE
+    assert predictor.GbmPredictor(model.model, batch_size=16)._batch_size == 16
+
+    preds_chunked, _ = model.predict(dataset=os.path.join(tmpdir, "training.csv"), split="test", batch_size=16)
+
+    assert np.allclose(preds_chunked, preds, rtol=1e-6, atol=1e-6)
+
+
 def test_loss_decreases(tmpdir, local_backend):
     input_features, output_features = synthetic_test_data.get_feature_configs()
 
@@ -246,6 +246,79 @@ def test_llm_zero_shot_classification(tmpdir, backend, ray_cluster_4cpu):
     assert preds
 
 
+@pytest.mark.llm
+@pytest.mark.parametrize(
+    "generation_config",
+    [
+        pytest.param({"prefix_cache": True}, id="prefix_cache"),
+        pytest.param({"continuous_batching": True, "continuous_batching_slots": 3}, id="continuous_batching"),
+    ],
+)
+def test_llm_generation_batching_options(tmpdir, generation_config):
+    input_features = [{"name": "review", "type": "text"}]
+    output_features = [
+        category_feature(
+            name="output",
+            preprocessing={"fallback_label": "neutral"},
+            decoder={
+                "type": "category_extractor",
+                "match": {
+                    "positive": {"type": "contains", "value": "positive"},
+                    "negative": {"type": "contains", "value": "negative"},
+                },
+            },
+        )
+    ]
+
+    config = {
+        MODEL_TYPE: MODEL_LLM,
+        BASE_MODEL: TEST_MODEL_NAME,
+        GENERATION: {"do_sample": False, "num_beams": 1, "max_new_tokens": MAX_NEW_TOKENS_TEST_DEFAULT},
+        PROMPT: {"task": "This is a review of a restaurant. Classify the sentiment as positive or negative."},
+        INPUT_FEATURES: input_features,
+        OUTPUT_FEATURES: output_features,
+        BACKEND: LOCAL_BACKEND,
+    }
+
+    model = LudwigModel(config)
+    model.train(dataset=get_dataset(), output_directory=str(tmpdir), skip_save_processed_input=True)
+
+    preds, _ = model.predict(dataset=get_dataset(), output_directory=str(tmpdir))
+    batched_preds, _ = model.predict(
+        dataset=get_dataset(), output_directory=str(tmpdir), generation_config=generation_config
+    )
+
+    # Reusing the key/value cache of the prompt template, or decoding samples together, does not change the outputs
+    assert convert_preds(batched_preds)["output_predictions"] == convert_preds(preds)["output_predictions"]
+    assert model.model.prefix_cache is None
+
+
+@pytest.mark.llm
+@pytest.mark.parametrize(
+    "generation_config,expected",
+    [
+        pytest.param({}, True, id="greedy"),
+        pytest.param({"do_sample": True, "top_k": 5, "top_p": 0.9}, True, id="sampling"),
+        pytest.param({"num_beams": 2}, False, id="beam_search"),
+        pytest.param({"repetition_penalty": 1.2}, False, id="repetition_penalty"),
+        pytest.param({"no_repeat_ngram_size": 2}, False, id="no_repeat_ngram_size"),
+        pytest.param({"min_new_tokens": 2}, False, id="min_new_tokens"),
+    ],
+)
+def test_llm_continuous_batching_unsupported_generation_config(generation_config, expected):
+    config = {
+        MODEL_TYPE: MODEL_LLM,
+        BASE_MODEL: TEST_MODEL_NAME,
+        GENERATION: {"continuous_batching": True, **generation_config},
+        INPUT_FEATURES: [text_feature(name="input", encoder={"type": "passthrough"})],
+        OUTPUT_FEATURES: [text_feature(name="output")],
+    }
+    model = LLM(ModelConfig.from_dict(config))
+
+    # Generation parameters that the scheduler does not implement fall back to generating each sequence on its own.
+    assert model._use_continuous_batching() == expected
+
+
 @pytest.mark.llm
 @pytest.mark.parametrize(
     "backend",
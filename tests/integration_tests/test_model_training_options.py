@@ -11,6 +11,7 @@ import torch
 from ludwig import globals as global_vars
 from ludwig.api import LudwigModel
 from ludwig.backend import LOCAL_BACKEND
+from ludwig.callbacks import Callback
 from ludwig.constants import (
     BATCH_SIZE,
     CATEGORY,
@@ -25,7 +26,13 @@ from ludwig.constants import (
 from ludwig.contribs.mlflow import MlflowCallback
 from ludwig.experiment import experiment_cli
 from ludwig.features.number_feature import numeric_transformation_registry
-from ludwig.globals import DESCRIPTION_FILE_NAME, MODEL_FILE_NAME, MODEL_WEIGHTS_FILE_NAME, TRAINING_PREPROC_FILE_NAME
+from ludwig.globals import (
+    DESCRIPTION_FILE_NAME,
+    MODEL_FILE_NAME,
+    MODEL_WEIGHTS_FILE_NAME,
+    TRAINING_PREPROC_FILE_NAME,
+    TRAINING_PROGRESS_TRACKER_FILE_NAME,
+)
 from ludwig.schema.optimizers import optimizer_registry
 from ludwig.utils.data_utils import load_json, replace_file_extension
 from ludwig.utils.misc_utils import get_from_registry
@@ -38,15 +45,16 @@ mlflow = LazyLoader("mlflow", globals(), "mlflow")
 RANDOM_SEED = 42
 
 
+@pytest.mark.parametrize("async_evaluation", [False, True])
 @pytest.mark.parametrize("early_stop", [3, 5])
-def test_early_stopping(early_stop, tmp_path):
+def test_early_stopping(early_stop, async_evaluation, tmp_path):
     input_features, output_features = synthetic_test_data.get_feature_configs()
 
     config = {
         "input_features": input_features,
         "output_features": output_features,
         "combiner": {"type": "concat"},
-        TRAINER: {"epochs": 75, "early_stop": early_stop, "batch_size": 16},
+        TRAINER: {"epochs": 75, "early_stop": early_stop, "batch_size": 16, "async_evaluation": async_evaluation},
     }
 
     # create sub-directory to store results
@@ -92,6 +100,81 @@ def test_early_stopping(early_stop, tmp_path):
     assert last_evaluation - best_evaluation == early_stop_value
 
 
+def test_async_evaluation(tmp_path):
+    input_features, output_features = synthetic_test_data.get_feature_configs()
+
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        "combiner": {"type": "concat"},
+        TRAINER: {"epochs": 4, BATCH_SIZE: 16, "checkpoints_per_epoch": 2, "async_evaluation": True},
+    }
+
+    generated_data = synthetic_test_data.get_generated_data()
+    model = LudwigModel(config, backend=LocalTestBackend())
+    _, _, output_dir = model.train(
+        training_set=generated_data.train_df,
+        validation_set=generated_data.validation_df,
+        test_set=generated_data.test_df,
+        output_directory=str(tmp_path / "results"),
+        skip_save_processed_input=True,
+        skip_save_log=True,
+    )
+    progress = load_json(os.path.join(output_dir, MODEL_FILE_NAME, TRAINING_PROGRESS_TRACKER_FILE_NAME))
+
+    # Every snapshot, including the one still in flight when training ends, is recorded as of the step it was taken.
+    validation_losses = progress["validation_metrics"]["combined"]["loss"]
+    steps = [step for _, step, _ in validation_losses]
+    assert len(steps) > 1 and steps == sorted(set(steps))
+    assert steps[-1] == progress["steps"]
+    for split_metrics in [progress["train_metrics"], progress["test_metrics"]]:
+        assert [step for _, step, _ in split_metrics["combined"]["loss"]] == steps
+    assert progress["best_eval_metric_steps"] in steps
+
+    # The best snapshot, rather than the weights at the end of training, is loaded back as the trained model.
+    eval_stats, _, _ = model.evaluate(generated_data.validation_df)
+    assert eval_stats["combined"]["loss"] == pytest.approx(min(value for _, _, value in validation_losses), rel=1e-4)
+
+
+def test_async_evaluation_save_best_callback(tmp_path):
+    class SaveBestCallback(Callback):
+        """Keeps the weights of `trainer.model` whenever a new best model is checkpointed, like hyperopt trials do."""
+
+        def __init__(self):
+            self.best_steps = []
+            self.best_state_dict = None
+
+        def on_save_best_checkpoint(self, trainer, progress_tracker, save_path):
+            self.best_steps.append(progress_tracker.steps)
+            self.best_state_dict = {k: v.detach().clone() for k, v in trainer.model.state_dict().items()}
+
+    input_features, output_features = synthetic_test_data.get_feature_configs()
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        "combiner": {"type": "concat"},
+        TRAINER: {"epochs": 4, BATCH_SIZE: 16, "checkpoints_per_epoch": 2, "async_evaluation": True},
+    }
+
+    callback = SaveBestCallback()
+    generated_data = synthetic_test_data.get_generated_data()
+    model = LudwigModel(config, backend=LocalTestBackend(), callbacks=[callback])
+    model.train(
+        training_set=generated_data.train_df,
+        validation_set=generated_data.validation_df,
+        test_set=generated_data.test_df,
+        output_directory=str(tmp_path / "results"),
+        skip_save_processed_input=True,
+        skip_save_log=True,
+    )
+
+    # The callback sees the weights of the best snapshot, which are also the ones loaded back at the end of training,
+    # rather than the live weights of the model being trained.
+    assert callback.best_steps
+    for name, value in model.model.state_dict().items():
+        assert torch.equal(callback.best_state_dict[name].to(value.device), value), name
+
+
 @pytest.mark.parametrize("skip_save_progress", [False])
 @pytest.mark.parametrize("skip_save_model", [False, True])
 def test_model_progress_save(skip_save_progress, skip_save_model, tmp_path):
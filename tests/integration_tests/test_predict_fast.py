@@ -0,0 +1,114 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.api import LudwigModel
+from ludwig.constants import BATCH_SIZE, MODEL_TYPE, PREDICTIONS, PROBABILITIES, PROBABILITY, TRAINER
+from tests.integration_tests.utils import (
+    bag_feature,
+    binary_feature,
+    category_feature,
+    generate_data,
+    LocalTestBackend,
+    number_feature,
+    sequence_feature,
+    set_feature,
+    text_feature,
+    vector_feature,
+)
+
+
+def _assert_predictions_match(model, df):
+    expected, _ = model.predict(dataset=df)
+    records = df.to_dict("records")
+    outputs = model.predict_fast(records)
+    assert len(outputs) == len(records)
+
+    compared = 0
+    for column in expected.columns:
+        if not column.endswith((PREDICTIONS, PROBABILITIES, PROBABILITY)) or column not in outputs[0]:
+            continue
+        for expected_value, output in zip(expected[column], outputs):
+            expected_value, value = np.asarray(expected_value), np.asarray(output[column])
+            if expected_value.dtype.kind in "biuf":
+                np.testing.assert_allclose(value.astype(float), expected_value.astype(float), rtol=1e-5, atol=1e-6)
+            else:
+                assert value.tolist() == expected_value.tolist(), column
+        compared += 1
+    assert compared > 0
+
+    # A single record can be passed directly
+    single_outputs = model.predict_fast(records[0])
+    assert len(single_outputs) == 1
+    assert single_outputs[0].keys() == outputs[0].keys()
+
+
+@pytest.mark.parametrize(
+    "input_features,output_features",
+    [
+        pytest.param(
+            [
+                number_feature(),
+                number_feature(preprocessing={"normalization": "minmax"}),
+                binary_feature(),
+                category_feature(encoder={"vocab_size": 3}),
+                bag_feature(encoder={"vocab_size": 3}),
+                set_feature(encoder={"vocab_size": 3}),
+                vector_feature(),
+            ],
+            [binary_feature(), number_feature(), category_feature(decoder={"vocab_size": 3})],
+            id="tabular",
+        ),
+        pytest.param(
+            [text_feature(encoder={"vocab_size": 3}), sequence_feature(encoder={"vocab_size": 3})],
+            [category_feature(decoder={"vocab_size": 3}), set_feature(decoder={"vocab_size": 3})],
+            id="text",
+        ),
+    ],
+)
+def test_predict_fast_matches_predict(input_features, output_features, tmpdir):
+    data_csv = generate_data(input_features, output_features, os.path.join(tmpdir, "train.csv"), num_examples=50)
+    config = {"input_features": input_features, "output_features": output_features, TRAINER: {"epochs": 2}}
+    model = LudwigModel(config, backend=LocalTestBackend())
+    model.train(dataset=data_csv, output_directory=os.path.join(tmpdir, "results"))
+
+    _assert_predictions_match(model, pd.read_csv(data_csv))
+
+
+def test_predict_fast_gbm(tmpdir):
+    pytest.importorskip("lightgbm")
+
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, os.path.join(tmpdir, "train.csv"), num_examples=50)
+    config = {
+        MODEL_TYPE: "gbm",
+        "input_features": input_features,
+        "output_features": output_features,
+        TRAINER: {"num_boost_round": 2, "feature_pre_filter": False},
+    }
+    model = LudwigModel(config, backend=LocalTestBackend())
+    model.train(dataset=data_csv, output_directory=os.path.join(tmpdir, "results"))
+
+    _assert_predictions_match(model, pd.read_csv(data_csv))
+
+
+def test_predict_fast_after_retraining(tmpdir):
+    input_features = [number_feature()]
+    output_features = [number_feature()]
+    data_csv = generate_data(input_features, output_features, os.path.join(tmpdir, "train.csv"), num_examples=50)
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        TRAINER: {"epochs": 1, BATCH_SIZE: 8},
+    }
+    model = LudwigModel(config, backend=LocalTestBackend())
+    model.train(dataset=data_csv, output_directory=os.path.join(tmpdir, "results"))
+    df = pd.read_csv(data_csv)
+    model.predict_fast(df.to_dict("records"))
+
+    # Inference stages are rebuilt from the updated weights
+    model.train_online(dataset=df)
+    _assert_predictions_match(model, df)
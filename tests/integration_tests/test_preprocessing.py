@@ -287,6 +287,42 @@ def test_strip_whitespace_category(csv_filename, tmpdir):
     assert len(np.unique(train_ds.dataset[cat_feat[PROC_COLUMN]])) == cat_feat[DECODER]["vocab_size"]
 
 
+@pytest.mark.parametrize("feature_executor", ["thread", "process", "auto"])
+def test_feature_parallel_preprocessing(feature_executor, csv_filename, tmpdir):
+    data_csv_path = os.path.join(tmpdir, csv_filename)
+
+    input_features = [
+        number_feature(),
+        number_feature(),
+        category_feature(encoder={"vocab_size": 5}),
+        text_feature(encoder={"vocab_size": 10}),
+        sequence_feature(encoder={"vocab_size": 10}),
+    ]
+    output_features = [binary_feature()]
+    training_data_csv_path = generate_data(input_features, output_features, data_csv_path)
+    df = pd.read_csv(training_data_csv_path)
+
+    def preprocess(preprocessing):
+        config = {
+            INPUT_FEATURES: input_features,
+            OUTPUT_FEATURES: output_features,
+            PREPROCESSING: {"split": {"type": "random"}, **preprocessing},
+        }
+        ludwig_model = LudwigModel(config, backend=LocalTestBackend())
+        return ludwig_model.preprocess(dataset=df, skip_save_processed_input=True)
+
+    train_seq, val_seq, test_seq, metadata_seq = preprocess({})
+    train_par, val_par, test_par, metadata_par = preprocess(
+        {"num_feature_workers": 4, "feature_executor": feature_executor}
+    )
+
+    for feature in input_features + output_features:
+        name = feature[NAME]
+        assert metadata_seq[name] == metadata_par[name]
+    for ds_seq, ds_par in [(train_seq, train_par), (val_seq, val_par), (test_seq, test_par)]:
+        assert ds_seq.to_df().equals(ds_par.to_df())
+
+
 @pytest.mark.parametrize(
     "backend",
     [
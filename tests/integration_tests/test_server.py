@@ -16,12 +16,15 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import Future
+from unittest import mock
 
 import numpy as np
 import pytest
+import torch
 
 from ludwig.api import LudwigModel
-from ludwig.constants import BATCH_SIZE, DECODER, TRAINER
+from ludwig.constants import BATCH_SIZE, DECODER, MODEL_LLM, TRAINER
 from ludwig.serve import server
 from ludwig.utils.data_utils import read_csv
 from tests.integration_tests.utils import (
@@ -320,3 +323,53 @@ def test_server_integration_with_audio(single_record, tmpdir):
         model_output, _ = model.predict(dataset=data_df)
         model_output = model_output.to_dict("split")
         assert model_output == server_response
+
+
+def _mock_llm_model(use_continuous_batching):
+    model = mock.Mock()
+    model.config = {"input_features": [{"column": "prompt"}]}
+    model.config_obj.model_type = MODEL_LLM
+    model.model._use_continuous_batching.return_value = use_continuous_batching
+    return model
+
+
+def test_server_generate_falls_back_without_continuous_batching():
+    model = _mock_llm_model(use_continuous_batching=False)
+    model.generate.side_effect = lambda prompts: [f"{prompt} completed" for prompt in prompts]
+
+    client = TestClient(server(model))
+    response = client.post("/generate", data={"prompt": ["hello", "goodbye"]})
+    assert response.status_code == 200
+    assert response.json() == {"responses": ["hello completed", "goodbye completed"]}
+    model.generate.assert_called_once_with(["hello", "goodbye"])
+    model.model.create_continuous_batching_scheduler.assert_not_called()
+
+    # Stats only exist for the continuous batching scheduler.
+    assert client.get("/generate/stats").status_code == 404
+    assert client.post("/generate").status_code == 400
+
+
+def test_server_generate_with_continuous_batching():
+    model = _mock_llm_model(use_continuous_batching=True)
+    model.model.tokenizer.side_effect = lambda prompt, return_tensors: mock.Mock(
+        input_ids=torch.tensor([[len(prompt), len(prompt)]])
+    )
+    model.model.tokenizer.decode.side_effect = lambda tokens, skip_special_tokens: " ".join(map(str, tokens.tolist()))
+
+    def submit(input_ids):
+        future = Future()
+        future.set_result(torch.cat([input_ids, torch.tensor([7])]))
+        return future
+
+    scheduler = model.model.create_continuous_batching_scheduler.return_value
+    scheduler.submit.side_effect = submit
+    scheduler.stats.to_dict.return_value = {"generated_tokens": 2}
+
+    with TestClient(server(model)) as client:
+        response = client.post("/generate", data={"prompt": ["hi", "hello"]})
+        assert response.status_code == 200
+        assert response.json() == {"responses": ["7", "7"]}
+        assert client.get("/generate/stats").json() == {"generated_tokens": 2}
+        scheduler.start.assert_called_once()
+    scheduler.stop.assert_called_once()
+    model.generate.assert_not_called()
@@ -283,6 +283,27 @@ model_type: ecd
     ModelConfig.from_dict(config)
 
 
+def test_check_bucketing_field():
+    config = {
+        "input_features": [
+            {"name": "description", "type": "text"},
+            {"name": "required_experience", "type": "category"},
+        ],
+        "output_features": [{"name": "title", "type": "category"}],
+        "trainer": {"bucketing_field": "description"},
+        "model_type": "ecd",
+    }
+    ModelConfig.from_dict(config)
+
+    config["trainer"]["bucketing_field"] = "required_experience"
+    with pytest.raises(ConfigValidationError):
+        ModelConfig.from_dict(config)
+
+    config["trainer"]["bucketing_field"] = "title"
+    with pytest.raises(ConfigValidationError):
+        ModelConfig.from_dict(config)
+
+
 def test_check_llm_input_features():
     config = yaml.safe_load(
         """
@@ -0,0 +1,74 @@
+import json
+import os
+
+import pytest
+from jsonschema.exceptions import best_match
+
+from ludwig.config_validation.snapshot import get_config_feature_types, SchemaSnapshot
+from ludwig.config_validation.validation import build_schema, get_config_validator, get_validator
+from ludwig.constants import DEFAULTS, INPUT_FEATURES, MODEL_ECD, MODEL_GBM, MODEL_LLM, OUTPUT_FEATURES
+
+
+def _fail_build(model_type):
+    raise AssertionError("The schema should be loaded from the snapshot")
+
+
+@pytest.mark.parametrize("model_type", [MODEL_ECD, MODEL_GBM, MODEL_LLM])
+def test_schema_snapshot_roundtrip(model_type, tmpdir):
+    expected = json.loads(json.dumps(build_schema(model_type)))
+
+    snapshot = SchemaSnapshot(model_type, build_schema, str(tmpdir))
+    assert snapshot.get() == expected
+    assert os.path.exists(os.path.join(tmpdir, model_type, "index.json"))
+
+    loaded = SchemaSnapshot(model_type, _fail_build, str(tmpdir))
+    assert loaded.get() == expected
+
+
+def test_schema_snapshot_feature_types(tmpdir):
+    config = {
+        INPUT_FEATURES: [{"name": "in1", "type": "number"}, {"name": "in2", "type": "text"}],
+        OUTPUT_FEATURES: [{"name": "out", "type": "binary"}],
+    }
+    feature_types = get_config_feature_types(config)
+    assert dict(feature_types) == {
+        INPUT_FEATURES: frozenset({"number", "text"}),
+        OUTPUT_FEATURES: frozenset({"binary"}),
+        DEFAULTS: frozenset(),
+    }
+
+    SchemaSnapshot(MODEL_ECD, build_schema, str(tmpdir)).get()
+    schema = SchemaSnapshot(MODEL_ECD, _fail_build, str(tmpdir)).get(feature_types)
+    input_branches = schema["properties"][INPUT_FEATURES]["items"]["allOf"]
+    assert [branch["if"]["properties"]["type"]["const"] for branch in input_branches] == ["number", "text"]
+    assert schema["properties"][DEFAULTS]["properties"] == {}
+
+    # A feature without a type can only be validated against the full schema
+    config[INPUT_FEATURES].append({"name": "in3"})
+    assert dict(get_config_feature_types(config))[INPUT_FEATURES] is None
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {
+            INPUT_FEATURES: [{"name": "in", "type": "number", "encoder": {"type": "dense", "num_layers": "two"}}],
+            OUTPUT_FEATURES: [{"name": "out", "type": "binary"}],
+        },
+        {
+            INPUT_FEATURES: [{"name": "in", "type": "text", "encoder": {"type": "not_an_encoder"}}],
+            OUTPUT_FEATURES: [{"name": "out", "type": "category"}],
+            DEFAULTS: {"text": {"preprocessing": {"max_sequence_length": "long"}}},
+        },
+        {
+            INPUT_FEATURES: [{"name": "in", "type": "category"}],
+            OUTPUT_FEATURES: [{"name": "out", "type": "numbr"}],
+        },
+    ],
+)
+def test_config_validator_matches_full_schema(config):
+    expected = best_match(get_validator()(build_schema(MODEL_ECD)).iter_errors(config))
+    error = best_match(get_config_validator(MODEL_ECD, get_config_feature_types(config)).iter_errors(config))
+    assert expected is not None
+    assert error.message == expected.message
+    assert list(error.absolute_path) == list(expected.absolute_path)
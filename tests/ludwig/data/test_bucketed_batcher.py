@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.api import LudwigModel
+from ludwig.data.batcher.bucketed import BucketedBatcher, compute_lengths
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.data.sampler import DistributedSampler
+from tests.integration_tests.utils import category_feature, generate_data, sequence_feature
+
+PAD = 2
+
+
+def _padded_sequences(lengths, max_length=20):
+    matrix = np.full((len(lengths), max_length), PAD, dtype=np.int32)
+    for i, length in enumerate(lengths):
+        matrix[i, :length] = 5
+    return matrix
+
+
+def test_compute_lengths():
+    matrix = _padded_sequences([3, 0, 20, 1])
+    matrix[0, 1] = PAD  # padding symbols inside a sequence do not shorten it
+    assert compute_lengths(matrix, PAD).tolist() == [3, 0, 20, 1]
+    assert compute_lengths(matrix[:, ::-1], PAD, padding_side="left").tolist() == [3, 0, 20, 1]
+
+    audio = np.zeros((2, 10, 4), dtype=np.float32)
+    audio[0, :7, 1] = 1.0
+    assert compute_lengths(audio, 0).tolist() == [7, 0]
+
+    with pytest.raises(ValueError):
+        compute_lengths(matrix, PAD, padding_side="center")
+
+
+@pytest.mark.parametrize("num_replicas", [1, 3])
+def test_bucketed_batcher(num_replicas):
+    rng = np.random.default_rng(0)
+    lengths = rng.integers(1, 21, size=103)
+    dataset = PandasDataset(
+        pd.DataFrame({"seq": list(_padded_sequences(lengths)), "label": np.arange(len(lengths))}),
+        {"seq": {"name": "seq"}, "label": {"name": "label"}},
+        None,
+    )
+    batch_size = 8
+
+    def get_epoch(rank, epoch):
+        distributed = Mock(size=Mock(return_value=num_replicas), rank=Mock(return_value=rank))
+        sampler = DistributedSampler(len(dataset), shuffle=True, random_seed=7, distributed=distributed)
+        batcher = BucketedBatcher(
+            dataset,
+            sampler,
+            "seq",
+            compute_lengths(dataset.get("seq"), PAD),
+            batch_size=batch_size,
+            buckets=3,
+            should_trim=True,
+        )
+        batcher.set_epoch(epoch, batch_size)
+        batches = []
+        while not batcher.last_batch():
+            batches.append(batcher.next_batch())
+        assert len(batches) == batcher.steps_per_epoch
+        return batches
+
+    seen = []
+    for rank in range(num_replicas):
+        batches = get_epoch(rank, epoch=1)
+        for batch in batches:
+            # every batch is trimmed to its longest example, and no non-padding element is lost
+            batch_lengths = lengths[batch["label"]]
+            assert batch["seq"].shape == (len(batch["label"]), batch_lengths.max())
+            assert np.array_equal(compute_lengths(batch["seq"], PAD), batch_lengths)
+            seen.extend(batch["label"].tolist())
+
+        # deterministic for a given seed and epoch, and reshuffled across epochs
+        assert all(np.array_equal(a["label"], b["label"]) for a, b in zip(batches, get_epoch(rank, epoch=1)))
+        assert any(not np.array_equal(a["label"], b["label"]) for a, b in zip(batches, get_epoch(rank, epoch=2)))
+
+    # shards cover the whole dataset
+    assert set(seen) == set(range(len(lengths)))
+
+
+def test_train_with_bucketing_field(tmpdir):
+    input_features = [sequence_feature(encoder={"type": "rnn", "reduce_output": "sum"})]
+    output_features = [category_feature(decoder={"vocab_size": 2})]
+    data_csv = generate_data(input_features, output_features, filename=str(tmpdir.join("train.csv")))
+    config = {
+        "input_features": input_features,
+        "output_features": output_features,
+        "trainer": {"epochs": 2, "batch_size": 4, "bucketing_field": input_features[0]["name"]},
+    }
+    model = LudwigModel(config, backend="local")
+    _, _, output_directory = model.train(dataset=data_csv, output_directory=str(tmpdir))
+    model.predict(dataset=data_csv)
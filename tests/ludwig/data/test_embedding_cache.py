@@ -0,0 +1,155 @@
+import os
+
+import numpy as np
+import pandas as pd
+import torch
+
+from ludwig.data.cache.embeddings import compact_embedding_cache, EmbeddingCache, hash_rows, KEYS_SUFFIX, MAX_SHARDS
+from ludwig.data.cache.manager import CacheManager
+from ludwig.models.embedder import create_embed_transform_fn
+from ludwig.schema.model_config import ModelConfig
+
+VOCAB = ["<UNK>", "a", "b", "c"]
+
+
+def test_embedding_cache(tmpdir):
+    values = np.arange(12, dtype=np.int64).reshape(6, 2)
+    keys = hash_rows(values)
+    assert len(set(keys.tolist())) == 6
+    # Rows with the same content but a different dtype do not collide
+    assert not set(hash_rows(values.astype(np.int32)).tolist()) & set(keys.tolist())
+
+    embeddings = np.random.rand(6, 3).astype(np.float32)
+    cache = EmbeddingCache(str(tmpdir))
+    found, cached = cache.get(keys)
+    assert not found.any() and cached is None
+    cache.put(keys[:4], embeddings[:4])
+    cache.put(keys[2:], embeddings[2:])
+
+    cache = EmbeddingCache(str(tmpdir))
+    assert len(cache) == 6
+    found, cached = cache.get(keys[[5, 0, 3]])
+    assert found.all()
+    np.testing.assert_array_equal(cached, embeddings[[5, 0, 3]])
+
+
+def test_embedding_cache_loads_shards_lazily(tmpdir):
+    values = np.arange(8, dtype=np.int64).reshape(4, 2)
+    keys = hash_rows(values)
+    embeddings = np.random.rand(4, 3).astype(np.float32)
+    cache = EmbeddingCache(str(tmpdir))
+    cache.put(keys[:2], embeddings[:2])
+    cache.put(keys[2:], embeddings[2:])
+
+    cache = EmbeddingCache(str(tmpdir))
+    assert cache._index is None
+    found, cached = cache.get(keys[[0]])
+    assert found.all()
+    np.testing.assert_array_equal(cached, embeddings[[0]])
+    # Only the shard of the found row is memory-mapped
+    assert len(cache._shards) == 1
+
+
+def test_embedding_cache_compact(tmpdir):
+    values = np.arange(12, dtype=np.int64).reshape(6, 2)
+    keys = hash_rows(values)
+    embeddings = np.random.rand(6, 3).astype(np.float32)
+    cache = EmbeddingCache(str(tmpdir))
+    cache.put(keys[:4], embeddings[:4])
+    cache.put(keys[2:], embeddings[2:])
+
+    cache = EmbeddingCache(str(tmpdir))
+    cache.compact()
+    assert len([f for f in os.listdir(tmpdir) if f.endswith(KEYS_SUFFIX)]) == 1
+    assert len(cache) == 6
+    found, cached = cache.get(keys[[5, 0, 3]])
+    assert found.all()
+    np.testing.assert_array_equal(cached, embeddings[[5, 0, 3]])
+
+
+def test_compact_embedding_cache(tmpdir):
+    values = np.arange(2 * (MAX_SHARDS + 1), dtype=np.int64).reshape(-1, 2)
+    keys = hash_rows(values)
+    embeddings = np.random.rand(len(values), 3).astype(np.float32)
+    old_dir, new_dir = os.path.join(tmpdir, "old"), os.path.join(tmpdir, "new")
+    EmbeddingCache(old_dir).put(keys, embeddings)
+    for f in os.listdir(old_dir):
+        os.utime(os.path.join(old_dir, f), (0, 0))
+    new_cache = EmbeddingCache(new_dir)
+    for i in range(len(values)):
+        new_cache.put(keys[[i]], embeddings[[i]])
+
+    # The shards of the new encoder are merged
+    compact_embedding_cache(str(tmpdir), max_size=2**30)
+    assert len(os.listdir(old_dir)) == 2
+    assert len(os.listdir(new_dir)) == 2
+    found, cached = EmbeddingCache(new_dir).get(keys)
+    assert found.all()
+    np.testing.assert_array_equal(cached, embeddings)
+
+    # The least recently written shards are deleted to fit the maximum size
+    new_size = sum(os.path.getsize(os.path.join(new_dir, f)) for f in os.listdir(new_dir))
+    compact_embedding_cache(str(tmpdir), max_size=new_size)
+    assert not os.listdir(old_dir)
+    assert len(os.listdir(new_dir)) == 2
+
+
+def test_cache_manager_persist_embeddings(tmpdir):
+    assert CacheManager(None, str(tmpdir)).get_embedding_cache_directory().startswith(str(tmpdir))
+    assert CacheManager(None, str(tmpdir), persist_embeddings=False).get_embedding_cache_directory() is None
+
+
+def _category_feature(encoder_type):
+    config = ModelConfig.from_dict(
+        {
+            "input_features": [{"name": "c", "type": "category", "encoder": {"type": encoder_type}}],
+            "output_features": [{"name": "y", "type": "number"}],
+        }
+    )
+    feature = config.input_features.to_list()[0]
+    metadata = {
+        "c": {
+            "idx2str": VOCAB,
+            "str2idx": {v: i for i, v in enumerate(VOCAB)},
+            "str2freq": {v: 1 for v in VOCAB},
+            "vocab_size": len(VOCAB),
+            "preprocessing": feature["preprocessing"],
+        }
+    }
+    return feature, metadata
+
+
+def _embed(transform, feature, codes):
+    df = pd.DataFrame({feature["proc_column"]: np.array(codes, dtype=np.int8)})
+    return np.stack(transform(df)[feature["proc_column"]].values)
+
+
+def test_embed_transform_fn_cache(tmpdir):
+    feature, metadata = _category_feature("dense")
+    torch.manual_seed(0)
+    expected = _embed(create_embed_transform_fn([feature], metadata)(), feature, [0, 1, 2, 3])
+
+    torch.manual_seed(0)
+    transform = create_embed_transform_fn([feature], metadata, cache_dir=str(tmpdir))()
+    np.testing.assert_allclose(_embed(transform, feature, [1, 2]), expected[[1, 2]])
+
+    # Another run only encodes the rows missing from the cache
+    torch.manual_seed(0)
+    transform = create_embed_transform_fn([feature], metadata, cache_dir=str(tmpdir))()
+    encoded_rows = []
+    run_encoder = transform._run_encoder
+    transform._run_encoder = lambda name, values: encoded_rows.append(len(values)) or run_encoder(name, values)
+    np.testing.assert_allclose(_embed(transform, feature, [2, 0, 1, 3]), expected[[2, 0, 1, 3]])
+    assert encoded_rows == [2]
+
+    # Different weights are cached separately
+    torch.manual_seed(1)
+    create_embed_transform_fn([feature], metadata, cache_dir=str(tmpdir))()
+    assert len(os.listdir(tmpdir)) == 2
+
+
+def test_embed_transform_fn_cache_skips_encoders_without_weights(tmpdir):
+    feature, metadata = _category_feature("onehot")
+    transform = create_embed_transform_fn([feature], metadata, cache_dir=str(tmpdir))()
+    np.testing.assert_array_equal(_embed(transform, feature, [1, 3]), np.eye(len(VOCAB))[[1, 3]])
+    assert not os.listdir(tmpdir)
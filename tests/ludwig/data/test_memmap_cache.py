@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from ludwig.api import LudwigModel
+from ludwig.backend import LocalBackend
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.utils.data_utils import is_memmap_dataset, load_memmap, save_memmap
+from tests.integration_tests.utils import binary_feature, category_feature, generate_data, number_feature
+
+
+def test_save_load_memmap(tmpdir):
+    df = pd.DataFrame(
+        {
+            "number": np.arange(10, dtype=np.float32),
+            "vector": list(np.arange(30, dtype=np.int16).reshape(10, 3)),
+            "name/with spaces": np.arange(10),
+        }
+    )
+    data_fp = os.path.join(tmpdir, "dataset.mmap")
+    save_memmap(data_fp, df)
+    assert is_memmap_dataset(data_fp)
+    assert not is_memmap_dataset(str(tmpdir))
+
+    dataset = load_memmap(data_fp)
+    assert list(dataset.keys()) == list(df.columns)
+    assert isinstance(dataset["number"], np.memmap)
+    assert dataset["vector"].shape == (10, 3)
+    assert dataset["vector"].dtype == np.int16
+    np.testing.assert_array_equal(dataset["number"], df["number"])
+
+    pandas_dataset = PandasDataset(data_fp, {"number": {"name": "number"}}, None)
+    assert isinstance(pandas_dataset.dataset["number"], np.memmap)
+    assert len(pandas_dataset) == 10
+
+
+def test_train_with_memmap_cache(tmpdir):
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, filename=os.path.join(tmpdir, "train.csv"))
+    config = {"input_features": input_features, "output_features": output_features, "trainer": {"epochs": 1}}
+
+    def train_and_predict():
+        model = LudwigModel(config, backend=LocalBackend(cache_format="mmap"))
+        model.train(dataset=data_csv, output_directory=os.path.join(tmpdir, "results"), skip_save_processed_input=False)
+        predictions, _ = model.predict(dataset=data_csv)
+        return predictions
+
+    train_and_predict()
+    cache_fp = os.path.join(tmpdir, "train.training.mmap")
+    assert is_memmap_dataset(cache_fp)
+
+    # The second run reads the memory-mapped cache instead of preprocessing the data again.
+    mtime = os.path.getmtime(os.path.join(cache_fp, "columns.json"))
+    train_and_predict()
+    assert os.path.getmtime(os.path.join(cache_fp, "columns.json")) == mtime
@@ -1,5 +1,13 @@
-from ludwig.data.preprocessing import is_input_feature
-from tests.integration_tests.utils import text_feature
+import os
+
+import pandas as pd
+
+from ludwig.api import LudwigModel
+from ludwig.callbacks import Callback
+from ludwig.constants import INPUT_FEATURES, OUTPUT_FEATURES, PREPROCESSING
+from ludwig.data.preprocessing import get_dataset_columns, is_input_feature
+from ludwig.schema.model_types.base import ModelConfig
+from tests.integration_tests.utils import binary_feature, category_feature, generate_data, number_feature, text_feature
 
 
 def test_is_input_feature():
@@ -7,3 +15,40 @@ def test_is_input_feature():
     assert is_input_feature(text_feature(output_feature=False)) is True
     # Adds decoder when output_feature=True
     assert is_input_feature(text_feature(output_feature=True)) is False
+
+
+def test_get_dataset_columns():
+    config = ModelConfig.from_dict(
+        {
+            INPUT_FEATURES: [
+                {"name": "review", "type": "text", PREPROCESSING: {"prompt": {"template": "{title}: {__sample__}"}}},
+                {"name": "price", "type": "number"},
+            ],
+            OUTPUT_FEATURES: [{"name": "label", "type": "category"}],
+            PREPROCESSING: {"split": {"type": "datetime", "column": "date"}},
+        }
+    ).to_dict()
+    features = config[INPUT_FEATURES] + config[OUTPUT_FEATURES]
+
+    columns = get_dataset_columns(config, features, config[PREPROCESSING])
+    assert columns == {"review", "price", "label", "title", "date", "split"}
+
+
+def test_preprocess_reads_config_columns(tmpdir):
+    input_features = [number_feature(), category_feature(encoder={"vocab_size": 3})]
+    output_features = [binary_feature()]
+    data_csv = generate_data(input_features, output_features, filename=os.path.join(tmpdir, "train.csv"))
+    df = pd.read_csv(data_csv)
+    df["unused"] = "x"
+    df.to_csv(data_csv, index=False)
+
+    read_columns = set()
+
+    class RecordColumns(Callback):
+        def on_build_metadata_start(self, df, mode):
+            read_columns.update(df.columns)
+
+    config = {INPUT_FEATURES: input_features, OUTPUT_FEATURES: output_features}
+    model = LudwigModel(config, backend="local", callbacks=[RecordColumns()])
+    model.preprocess(dataset=data_csv)
+    assert read_columns == {feature["column"] for feature in input_features + output_features}
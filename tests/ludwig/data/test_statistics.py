@@ -0,0 +1,96 @@
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.dataframe.pandas import PandasEngine
+from ludwig.data.statistics import (
+    ColumnStatistics,
+    compute_statistics,
+    FLOAT32_MIN_MAX,
+    FLOAT32_MOMENTS,
+    MEAN,
+    StatisticsPlan,
+    STRIPPED_VALUE_COUNTS,
+    VALUE_COUNTS,
+)
+
+try:
+    from ludwig.data.dataframe.dask import DaskEngine
+except ImportError:
+    DaskEngine = Mock
+
+
+@pytest.mark.parametrize(
+    ("df_engine",),
+    [
+        pytest.param(PandasEngine(), id="pandas"),
+        pytest.param(DaskEngine(_use_ray=False), id="dask", marks=pytest.mark.distributed),
+    ],
+)
+def test_compute_statistics(df_engine, ray_cluster_2cpu):
+    nrows = 100
+    npartitions = 7
+
+    rng = np.random.default_rng(42)
+    numbers = rng.normal(size=nrows)
+    numbers[::10] = np.nan
+    df = pd.DataFrame(
+        {
+            "number": numbers,
+            "category": rng.choice([" a", "b ", "c", "d"], size=nrows, p=[0.4, 0.3, 0.2, 0.1]),
+        }
+    )
+    expected_df = df
+    if isinstance(df_engine, DaskEngine):
+        df = df_engine.df_lib.from_pandas(df, npartitions=npartitions)
+
+    plan = StatisticsPlan()
+    plan.request("number", {MEAN, FLOAT32_MOMENTS})
+    plan.request("number", {FLOAT32_MIN_MAX})
+    plan.request("category", {VALUE_COUNTS, STRIPPED_VALUE_COUNTS})
+    backend = Mock(df_engine=df_engine)
+    statistics = compute_statistics(plan, {"number": df["number"], "category": df["category"]}, backend)
+
+    number_stats = statistics["number"]
+    as_float32 = expected_df["number"].astype(np.float32)
+    assert number_stats.float_mean == pytest.approx(expected_df["number"].mean())
+    assert number_stats.mean == pytest.approx(as_float32.mean(), rel=1e-5)
+    assert number_stats.std == pytest.approx(as_float32.std(), rel=1e-5)
+    assert number_stats.min == as_float32.min()
+    assert number_stats.max == as_float32.max()
+
+    category_stats = statistics["category"]
+    assert category_stats.value_counts().to_dict() == expected_df["category"].value_counts().to_dict()
+    assert category_stats.mode == expected_df["category"].value_counts().index[0]
+    expected_stripped = expected_df["category"].str.strip().value_counts(sort=True)
+    assert category_stats.stripped_value_counts().index.tolist() == expected_stripped.index.tolist()
+    assert category_stats.stripped_value_counts().to_dict() == expected_stripped.to_dict()
+
+
+@pytest.mark.parametrize("empty", [pd.Series([], dtype=float), pd.Series([np.nan, np.nan])], ids=["empty", "all_nan"])
+def test_merge_with_empty_partial(empty):
+    aggregations = {MEAN, FLOAT32_MOMENTS, FLOAT32_MIN_MAX, VALUE_COUNTS}
+    series = pd.Series([1.0, 2.0, np.nan, 6.0])
+    stats = ColumnStatistics.from_series(series, aggregations)
+    empty_stats = ColumnStatistics.from_series(empty, aggregations)
+
+    for merged in [stats.merge(empty_stats), empty_stats.merge(stats)]:
+        assert merged.float_mean == pytest.approx(3.0)
+        assert merged.mean == pytest.approx(3.0)
+        assert merged.std == pytest.approx(series.astype(np.float32).std())
+        assert merged.min == 1.0
+        assert merged.max == 6.0
+        assert merged.value_counts().to_dict() == series.value_counts().to_dict()
+
+
+def test_statistics_plan_unknown_aggregation():
+    plan = StatisticsPlan()
+    assert not plan
+
+    with pytest.raises(ValueError):
+        plan.request("x", {"median"})
+
+    plan.request("x", set())
+    assert not plan
@@ -2,6 +2,7 @@ import os
 from random import choice
 from string import ascii_lowercase, ascii_uppercase, digits
 
+import numpy as np
 import pandas as pd
 import pytest
 import torch
@@ -94,3 +95,32 @@ def test_add_feature_data(feature_type, tmpdir):
     )
 
     assert len(proc_df[audio_feature_config[PROC_COLUMN]]) == 10
+
+
+@pytest.mark.parametrize("num_processes", [1, 2])
+@pytest.mark.parametrize("feature_type", ["raw", "fbank"])
+def test_process_in_memory_local(feature_type, num_processes, monkeypatch):
+    # Several chunks, so that they are spread over the worker processes
+    monkeypatch.setattr("ludwig.features.audio_feature.AUDIO_CHUNK_SIZE", 4)
+    torch.manual_seed(0)
+    sampling_rate_in_hz = 8000
+    audio_feature_dict = {"type": feature_type, "window_length_in_s": 0.04, "window_shift_in_s": 0.02}
+    if feature_type == "fbank":
+        audio_feature_dict["num_filter_bands"] = 40
+    feature_dim = AudioFeatureMixin._get_feature_dim(audio_feature_dict, sampling_rate_in_hz)
+    max_length = AudioFeatureMixin._get_max_length_feature(audio_feature_dict, sampling_rate_in_hz, 1.0)
+
+    audio = [(torch.randn(1, length), sampling_rate_in_hz) for length in [4000, 12000, 8000, 900, 6500, 7000]]
+    # Audio shorter than a window has no frames, and unreadable audio is replaced by the default audio
+    column = pd.Series(audio + [(torch.randn(1, 100), sampling_rate_in_hz), None], index=range(10, 18))
+
+    processed = AudioFeatureMixin._process_in_memory_local(
+        column, audio_feature_dict, feature_dim, max_length, 0.0, "per_file", 1.0, num_processes=num_processes
+    )
+    assert processed.index.tolist() == column.index.tolist()
+    for (waveform, sampling_rate), features in zip(audio, processed):
+        expected = AudioFeatureMixin._transform_to_feature(
+            waveform, sampling_rate, audio_feature_dict, feature_dim, max_length, 0.0, "per_file"
+        )
+        np.testing.assert_allclose(features, expected.numpy(), rtol=1e-3, atol=1e-3)
+    assert processed[17].shape == (max_length, feature_dim)
@@ -2,18 +2,20 @@ from random import choice
 from string import ascii_lowercase, ascii_uppercase, digits
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
+from ludwig.backend import LOCAL_BACKEND
 from ludwig.constants import ENCODER, ENCODER_OUTPUT
-from ludwig.features.bag_feature import BagInputFeature
+from ludwig.features.bag_feature import BagFeatureMixin, BagInputFeature
 from ludwig.schema.features.bag_feature import BagInputFeatureConfig
 from ludwig.schema.utils import load_config_with_kwargs
 from ludwig.utils.torch_utils import get_torch_device
 
 BATCH_SIZE = 2
 SEQ_SIZE = 20
-BAG_W_SIZE = 256
 EMBEDDING_SIZE = 5
 
 CHARS = ascii_uppercase + ascii_lowercase + digits
@@ -40,6 +42,51 @@ def test_bag_input_feature(bag_config: Dict, encoder: str) -> None:
     bag_config[ENCODER].update({"type": encoder})
     bag_config, _ = load_config_with_kwargs(BagInputFeatureConfig, bag_config)
     bag_input_feature = BagInputFeature(bag_config).to(DEVICE)
-    bag_tensor = torch.randn([BATCH_SIZE, SEQ_SIZE, BAG_W_SIZE], dtype=torch.float32).to(DEVICE)
+    # Token indices padded with -1, followed by their counts
+    token_indices = torch.randint(-1, len(VOCAB), [BATCH_SIZE, SEQ_SIZE])
+    token_counts = torch.randint(1, 5, [BATCH_SIZE, SEQ_SIZE])
+    bag_tensor = torch.stack([token_indices, token_counts], dim=1).type(torch.int32).to(DEVICE)
     encoder_output = bag_input_feature(bag_tensor)
-    assert encoder_output[ENCODER_OUTPUT].shape[1:][1:] == bag_input_feature.output_shape
+    assert encoder_output[ENCODER_OUTPUT].shape[1:] == bag_input_feature.output_shape
+
+
+def test_bag_input_feature_sparse_sample_input(bag_config: Dict) -> None:
+    bag_config = {**bag_config, ENCODER: {**bag_config[ENCODER], "type": "embed", "max_set_size": SEQ_SIZE}}
+    bag_config, _ = load_config_with_kwargs(BagInputFeatureConfig, bag_config)
+    bag_input_feature = BagInputFeature(bag_config).to(DEVICE)
+
+    # Sample inputs have the sparse layout rather than the vocabulary size.
+    assert bag_input_feature.input_shape == torch.Size([2, SEQ_SIZE])
+    sample_input = bag_input_feature.create_sample_input(batch_size=BATCH_SIZE)
+    assert sample_input.shape == (BATCH_SIZE, 2, SEQ_SIZE)
+    assert sample_input.dtype == torch.int32
+    # Counts are only set for the items of each bag.
+    assert torch.equal(sample_input[:, 1] >= 1, sample_input[:, 0] >= 0)
+
+    encoder_output = bag_input_feature(sample_input.to(DEVICE))
+    assert encoder_output[ENCODER_OUTPUT].shape[1:] == bag_input_feature.output_shape
+
+
+def test_bag_feature_data_sparse():
+    metadata = {
+        "str2idx": {"<UNK>": 0, "a": 1, "b": 2, "c": 3},
+        "vocab_size": 4,
+        "max_set_size": 4,
+        "sparse": True,
+        "preprocessing": {"tokenizer": "space", "lowercase": False},
+    }
+    column = pd.Series(["c a c", "b b x", ""])
+
+    feature_data = BagFeatureMixin.feature_data(column, metadata, metadata["preprocessing"], LOCAL_BACKEND)
+    expected = np.array(
+        [
+            [[1, 3, -1, -1], [1, 2, -1, -1]],
+            [[0, 2, -1, -1], [1, 2, -1, -1]],
+            [[-1, -1, -1, -1], [-1, -1, -1, -1]],
+        ],
+        dtype=np.int32,
+    )
+    np.testing.assert_array_equal(np.stack(feature_data), expected)
+
+    preprocessing = torch.jit.script(BagInputFeature.create_preproc_module(metadata))
+    np.testing.assert_array_equal(preprocessing(column.tolist()).numpy(), expected)
@@ -1,10 +1,13 @@
 from copy import deepcopy
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
-from ludwig.constants import ENCODER, ENCODER_OUTPUT, TYPE
+from ludwig.backend import LOCAL_BACKEND
+from ludwig.constants import ENCODER, ENCODER_OUTPUT, TYPE, UNKNOWN_SYMBOL
 from ludwig.features.category_feature import CategoryInputFeature
 from ludwig.schema.features.category_feature import ECDCategoryInputFeatureConfig
 from ludwig.schema.utils import load_config_with_kwargs
@@ -55,3 +58,26 @@ def test_category_input_feature(
 
     encoder_output = input_feature_obj(input_tensor)
     assert encoder_output[ENCODER_OUTPUT].shape == (BATCH_SIZE, *input_feature_obj.output_shape)
+
+
+@pytest.mark.parametrize("most_common", [2, 10])
+def test_category_feature_data(most_common):
+    column = pd.Series([" dog", "cat", "bird", "dog ", "cat", "fish", "dog"], name="animal")
+    preprocessing_parameters = {"most_common": most_common, "vocab": None}
+    metadata = CategoryInputFeature.get_feature_meta({}, column, preprocessing_parameters, LOCAL_BACKEND, True)
+    str2idx = metadata["str2idx"]
+
+    codes = CategoryInputFeature.feature_data(LOCAL_BACKEND, column, metadata)
+
+    assert codes.dtype == np.int8
+    assert codes.index.equals(column.index)
+    # Values out of the vocabulary fall back to the unknown symbol, or the most frequent value without one.
+    fallback = str2idx.get(UNKNOWN_SYMBOL, str2idx["dog"])
+    assert codes.tolist() == [str2idx.get(value.strip(), fallback) for value in column]
+
+    unseen = pd.Series(["cat", "zebra", np.nan], name="animal")
+    assert CategoryInputFeature.feature_data(LOCAL_BACKEND, unseen, metadata).tolist() == [
+        str2idx["cat"],
+        fallback,
+        fallback,
+    ]
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ludwig.features.feature_registries import get_base_type_registry, get_input_type_registry, get_output_type_registry
+
+# Looks up the encoders and decoders of each feature type in a fresh interpreter, where only the modules registered for
+# that feature type have been imported, and compares them to the registries with every module imported.
+LAZY_REGISTRY_SCRIPT = """
+import json
+
+from ludwig.decoders.registry import get_decoder_classes, get_decoder_registry
+from ludwig.encoders.registry import get_encoder_classes, get_encoder_registry
+
+feature_types = ["audio", "bag", "binary", "category", "category_distribution", "date", "h3", "image", "number",
+                 "sequence", "set", "text", "timeseries", "vector"]
+
+def describe(classes):
+    return {name: f"{cls.__module__}.{cls.__qualname__}" for name, cls in classes.items()}
+
+def lookup(get_classes):
+    classes = {}
+    for feature_type in feature_types:
+        try:
+            classes[feature_type] = describe(get_classes(feature_type))
+        except KeyError:
+            pass
+    return classes
+
+lazy = {"encoders": lookup(get_encoder_classes), "decoders": lookup(get_decoder_classes)}
+full = {
+    "encoders": {feature_type: describe(classes) for feature_type, classes in get_encoder_registry().items()},
+    "decoders": {feature_type: describe(classes) for feature_type, classes in get_decoder_registry().items()},
+}
+print(json.dumps({"lazy": lazy, "full": full}))
+"""
+
+
+def test_feature_registries():
+    for registry in [get_base_type_registry(), get_input_type_registry(), get_output_type_registry()]:
+        for feature_type, feature_cls in registry.items():
+            assert isinstance(feature_cls, type)
+            assert feature_type in registry
+        assert "not_a_feature_type" not in registry
+        with pytest.raises(KeyError):
+            registry["not_a_feature_type"]
+
+
+def test_lazy_encoder_and_decoder_registries():
+    output = subprocess.run([sys.executable, "-c", LAZY_REGISTRY_SCRIPT], check=True, capture_output=True, text=True)
+    registries = json.loads(output.stdout.strip().splitlines()[-1])
+    assert registries["lazy"] == registries["full"]
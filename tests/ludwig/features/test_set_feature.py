@@ -1,11 +1,14 @@
 from copy import deepcopy
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
+from ludwig.backend import LOCAL_BACKEND
 from ludwig.constants import ENCODER, ENCODER_OUTPUT
-from ludwig.features.set_feature import SetInputFeature
+from ludwig.features.set_feature import _SetPreprocessing, SetFeatureMixin, SetInputFeature
 from ludwig.schema.features.set_feature import SetInputFeatureConfig
 from ludwig.schema.utils import load_config_with_kwargs
 from ludwig.utils.misc_utils import merge_dict
@@ -60,3 +63,43 @@ def test_set_input_feature(set_config: Dict) -> None:
 
     encoder_output = input_feature_obj(input_tensor)
     assert encoder_output[ENCODER_OUTPUT].shape == (BATCH_SIZE, *input_feature_obj.output_shape)
+
+
+def test_set_input_feature_sparse_sample_input(set_config: Dict) -> None:
+    set_def = merge_dict(SetInputFeatureConfig(name="foo").to_dict(), deepcopy(set_config))
+    set_def[ENCODER]["max_set_size"] = 3
+    set_config, _ = load_config_with_kwargs(SetInputFeatureConfig, set_def)
+    input_feature_obj = SetInputFeature(set_config).to(DEVICE)
+
+    # Sample inputs have the sparse layout rather than the vocabulary size.
+    assert input_feature_obj.input_shape == torch.Size([3])
+    sample_input = input_feature_obj.create_sample_input(batch_size=BATCH_SIZE)
+    assert sample_input.shape == (BATCH_SIZE, 3)
+    assert sample_input.dtype == torch.int32
+    assert sample_input.min() >= -1 and sample_input.max() < len(set_def[ENCODER]["vocab"])
+
+    encoder_output = input_feature_obj(sample_input.to(DEVICE))
+    assert encoder_output[ENCODER_OUTPUT].shape == (BATCH_SIZE, *input_feature_obj.output_shape)
+
+
+def test_set_feature_data_sparse():
+    metadata = {
+        "str2idx": {"<UNK>": 0, "a": 1, "b": 2, "c": 3},
+        "vocab_size": 4,
+        "max_set_size": 3,
+        "sparse": True,
+        "preprocessing": {"tokenizer": "space", "lowercase": False},
+    }
+    column = pd.Series(["c a", "b b x", "", "c b a a"])
+
+    feature_data = SetFeatureMixin.feature_data(column, metadata, metadata["preprocessing"], LOCAL_BACKEND)
+    expected = np.array([[1, 3, -1], [0, 2, -1], [-1, -1, -1], [1, 2, 3]], dtype=np.int32)
+    np.testing.assert_array_equal(np.stack(feature_data), expected)
+
+    preprocessing = torch.jit.script(_SetPreprocessing(metadata))
+    np.testing.assert_array_equal(preprocessing(column.tolist()).numpy(), expected)
+
+    # Output sets stay multi-hot encoded
+    dense_metadata = {**metadata, "sparse": False}
+    dense_data = SetFeatureMixin.feature_data(column, dense_metadata, metadata["preprocessing"], LOCAL_BACKEND)
+    np.testing.assert_array_equal(dense_data[3], [False, True, True, True])
@@ -1,10 +1,17 @@
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import torch
 
+from ludwig.backend import LOCAL_BACKEND
 from ludwig.constants import ENCODER, ENCODER_OUTPUT, TYPE
-from ludwig.features.timeseries_feature import TimeseriesInputFeature
+from ludwig.features.timeseries_feature import (
+    create_time_delay_embedding,
+    TimeseriesFeatureMixin,
+    TimeseriesInputFeature,
+)
 from ludwig.schema.features.timeseries_feature import TimeseriesInputFeatureConfig
 from ludwig.schema.utils import load_config_with_kwargs
 from ludwig.utils.torch_utils import get_torch_device
@@ -42,3 +49,31 @@ def test_timeseries_input_feature(timeseries_config: Dict, encoder: str) -> None
     timeseries_tensor = torch.randn([SEQ_SIZE, TIMESERIES_W_SIZE], dtype=torch.float32).to(DEVICE)
     encoder_output = timeseries_input_feature(timeseries_tensor)
     assert encoder_output[ENCODER_OUTPUT].shape[1:] == timeseries_input_feature.output_shape
+
+
+@pytest.mark.parametrize(
+    "window_size,horizon,expected",
+    [
+        (3, 0, [[-1, -1, 1], [-1, 1, 2], [1, 2, -1], [2, -1, 4]]),
+        (0, 2, [[2, -1], [-1, 4], [4, -1], [-1, -1]]),
+        (2, 1, [[-1, 1, 2], [1, 2, -1], [2, -1, 4], [-1, 4, -1]]),
+    ],
+)
+def test_create_time_delay_embedding(window_size, horizon, expected):
+    series = pd.Series([1, 2, "", 4], dtype=object)
+    embedding = create_time_delay_embedding(series, window_size, horizon, -1, LOCAL_BACKEND)
+    np.testing.assert_array_equal(np.stack(embedding), np.array(expected, dtype=np.float32))
+    assert all(row.dtype == np.float32 for row in embedding)
+
+
+@pytest.mark.parametrize(
+    "padding,expected",
+    [
+        ("right", [[1, 2, 0, 0], [0, 0, 0, 0], [3, 4, 5, 6], [7, 0, 8, 0]]),
+        ("left", [[0, 0, 1, 2], [0, 0, 0, 0], [3, 4, 5, 6], [0, 7, 0, 8]]),
+    ],
+)
+def test_build_matrix(padding, expected):
+    timeseries = pd.Series(["1 2", "", "3 4 5 6 7", "7 nan 8"])
+    matrix = TimeseriesFeatureMixin.build_matrix(timeseries, "space", 4, 0, padding, LOCAL_BACKEND)
+    np.testing.assert_array_equal(np.stack(matrix), np.array(expected, dtype=np.float32))
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ludwig.constants import MAXIMIZE, MINIMIZE, VALIDATION
+from ludwig.hyperopt.pruning import LearningCurvePruner, LearningCurvePrunerCallback, predict_final_metric
+from ludwig.utils.metric_utils import TrainerMetric
+
+TOTAL_STEPS = 1000
+STEPS = list(range(100, TOTAL_STEPS + 1, 100))
+
+
+def _curve(final, start, rate=0.5, noise=0.0, seed=0):
+    """Power law accuracy curve from `start` at the first evaluation to `final` at the end of training."""
+    rng = np.random.RandomState(seed)
+    fractions = np.asarray(STEPS) / TOTAL_STEPS
+    decay = (fractions**-rate - 1) / (fractions[0] ** -rate - 1)
+    return list(final - (final - start) * decay + rng.normal(0, noise, len(STEPS)))
+
+
+def test_predict_final_metric():
+    fractions = np.asarray(STEPS) / TOTAL_STEPS
+    values = 0.9 - 0.2 * fractions**-0.7
+    prediction = predict_final_metric(fractions[:5], values[:5])
+    assert abs(prediction.mean - 0.7) < prediction.std
+
+    # The prediction gets more certain as the curve gets longer
+    longer_prediction = predict_final_metric(fractions[:8], values[:8])
+    assert abs(longer_prediction.mean - 0.7) < abs(prediction.mean - 0.7)
+    assert longer_prediction.std < prediction.std
+
+    assert predict_final_metric(fractions[:2], values[:2]) is None
+
+
+@pytest.mark.parametrize("goal", [MAXIMIZE, MINIMIZE])
+def test_learning_curve_pruner(goal):
+    sign = 1 if goal == MAXIMIZE else -1
+    pruner = LearningCurvePruner(goal, top_k=2, confidence=0.95, min_evals=4)
+
+    def report(trial_id, curve, num_evals):
+        return pruner.report(trial_id, STEPS[:num_evals], [sign * v for v in curve[:num_evals]], TOTAL_STEPS)
+
+    # Not enough other trials to compare against
+    bad_curve = _curve(0.5, 0.3, noise=0.002, seed=1)
+    assert not report("bad", bad_curve, 6)
+
+    for i, trial_id in enumerate(["good_1", "good_2"]):
+        assert not report(trial_id, _curve(0.9, 0.6, noise=0.002, seed=2 + i), len(STEPS))
+
+    # Too few evaluations to extrapolate the curve
+    assert not report("bad", bad_curve, 3)
+    assert report("bad", bad_curve, 4)
+    assert pruner.pruned_trials == {"bad"}
+
+    # A trial that is still behind the top trials, but steep enough to catch up, keeps training
+    assert not report("promising", _curve(0.95, 0.2, rate=0.3, noise=0.002, seed=4), 4)
+
+    # A trial that is already better than the top trials is never stopped
+    assert not report("best", _curve(0.97, 0.92, seed=5), len(STEPS))
+
+
+def test_learning_curve_pruner_callback():
+    reports = []
+
+    def report_fn(trial_id, steps, values, total_steps):
+        reports.append((trial_id, steps, values, total_steps))
+        return len(steps) >= 2
+
+    callback = LearningCurvePrunerCallback("trial_1", report_fn, "label", "accuracy", VALIDATION)
+    trainer = SimpleNamespace(total_steps=TOTAL_STEPS)
+    history = []
+    progress_tracker = SimpleNamespace(
+        train_metrics={}, validation_metrics={"label": {"accuracy": history}}, test_metrics={}
+    )
+
+    history.append(TrainerMetric(epoch=1, step=100, value=0.5))
+    assert not callback.should_early_stop(trainer, progress_tracker, is_coordinator=True)
+    history.append(TrainerMetric(epoch=2, step=200, value=0.6))
+    assert not callback.should_early_stop(trainer, progress_tracker, is_coordinator=False)
+    assert callback.should_early_stop(trainer, progress_tracker, is_coordinator=True)
+    assert reports[-1] == ("trial_1", [100, 200], [0.5, 0.6], TOTAL_STEPS)
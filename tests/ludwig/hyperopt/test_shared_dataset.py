@@ -0,0 +1,99 @@
+import os
+import pickle
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.data.dataset.pandas import PandasDataset
+from ludwig.hyperopt.shared_dataset import (
+    attach_shared_datasets,
+    share_datasets,
+    SharedDatasetDirectory,
+    trials_share_node,
+)
+
+
+def _create_dataset(size):
+    df = pd.DataFrame(
+        {
+            "number_1a2b": np.arange(size, dtype=np.float32),
+            "text_3c4d": list(np.random.randint(0, 10, size=(size, 8)).astype(np.int32)),
+        }
+    )
+    return PandasDataset(df, features={}, data_hdf5_fp=None)
+
+
+def _assert_dataset_equal(dataset, expected):
+    assert len(dataset) == len(expected)
+    for column, array in expected.get_dataset().items():
+        np.testing.assert_array_equal(dataset.get(column), array)
+
+
+def test_share_datasets(tmpdir):
+    training_set, validation_set = _create_dataset(1000), _create_dataset(100)
+    directory, (shared_training_set, shared_validation_set, test_set) = share_datasets(
+        [training_set, validation_set, None], root=str(tmpdir)
+    )
+    assert test_set is None
+    assert directory.refcount == 1
+    for shared, dataset in [(shared_training_set, training_set), (shared_validation_set, validation_set)]:
+        assert SharedDatasetDirectory.of(shared) == directory
+        assert isinstance(shared.get_dataset()["number_1a2b"], np.memmap)
+        _assert_dataset_equal(shared, dataset)
+
+    # Trials receive the path to the arrays rather than a copy of them
+    pickled = pickle.dumps(shared_training_set)
+    assert len(pickled) < training_set.get_dataset()["text_3c4d"].nbytes
+    unpickled = pickle.loads(pickled)
+    assert isinstance(unpickled.get_dataset()["text_3c4d"], np.memmap)
+    _assert_dataset_equal(unpickled, training_set)
+
+    # Memory-mapped datasets are read-only
+    with pytest.raises(ValueError):
+        unpickled.get_dataset()["number_1a2b"][0] = 1
+
+    # Already shared datasets are not written again
+    assert share_datasets([shared_training_set, None])[0] is None
+
+    directory.cleanup()
+    assert not os.path.exists(directory.path)
+    assert not os.listdir(tmpdir)
+
+
+def test_shared_dataset_refcount(tmpdir):
+    directory, (training_set,) = share_datasets([_create_dataset(10)], root=str(tmpdir))
+
+    with attach_shared_datasets(training_set, None):
+        assert directory.refcount == 2
+        with attach_shared_datasets(pickle.loads(pickle.dumps(training_set))):
+            assert directory.refcount == 3
+        assert directory.refcount == 2
+
+    # The trial still attached keeps the directory after the sweep released its reference
+    with attach_shared_datasets(training_set):
+        directory.release()
+        assert directory.refcount == 1
+        assert os.path.exists(directory.path)
+    assert not os.path.exists(directory.path)
+
+    # Attaching after the cleanup is a no-op
+    with attach_shared_datasets(training_set):
+        pass
+    directory.acquire()
+    assert not os.path.exists(directory.path)
+    directory.release()
+
+
+@pytest.mark.parametrize(
+    "is_initialized,alive_nodes,expected",
+    [(False, [], True), (True, [True], True), (True, [True, False], True), (True, [True, True], False)],
+)
+def test_trials_share_node(is_initialized, alive_nodes, expected, monkeypatch):
+    ray = SimpleNamespace(
+        is_initialized=lambda: is_initialized, nodes=lambda: [{"Alive": alive} for alive in alive_nodes]
+    )
+    monkeypatch.setitem(sys.modules, "ray", ray)
+    assert trials_share_node() == expected
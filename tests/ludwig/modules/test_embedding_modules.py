@@ -3,7 +3,14 @@ from typing import List
 import pytest
 import torch
 
-from ludwig.modules.embedding_modules import Embed, EmbedSequence, EmbedSet, EmbedWeighted, TokenAndPositionEmbedding
+from ludwig.modules.embedding_modules import (
+    Embed,
+    EmbedSequence,
+    EmbedSet,
+    EmbedSparse,
+    EmbedWeighted,
+    TokenAndPositionEmbedding,
+)
 from ludwig.utils.torch_utils import get_torch_device
 
 DEVICE = get_torch_device()
@@ -59,6 +66,45 @@ def test_embed_weighted(
     assert outputs.shape[1:] == embed_weighted.output_shape
 
 
+@pytest.mark.parametrize("aggregation_function", ["sum", "avg"])
+def test_embed_sparse(aggregation_function: str):
+    embed = EmbedSparse(vocab=["a", "b", "c", "d"], embedding_size=3, aggregation_function=aggregation_function)
+    weights = embed.embeddings.weight
+
+    # Item indices padded with -1
+    outputs = embed(torch.tensor([[2, 0, -1], [-1, -1, -1], [1, 3, 3]]))
+    expected = torch.stack([weights[2] + weights[0], torch.zeros(3), weights[1] + 2 * weights[3]])
+    if aggregation_function == "avg":
+        expected = expected / torch.tensor([[2.0], [1.0], [3.0]])
+    assert torch.allclose(outputs, expected)
+
+    # Item indices followed by their weights
+    outputs = embed(torch.tensor([[[2, 0, -1], [3, 1, -1]]], dtype=torch.int32))
+    expected = 3 * weights[2] + weights[0]
+    if aggregation_function == "avg":
+        expected = expected / 2
+    assert torch.allclose(outputs[0], expected)
+
+
+@pytest.mark.parametrize("aggregation_function", ["sum", "avg"])
+def test_embed_set_sparse_matches_dense(aggregation_function: str):
+    embed_set = EmbedSet(vocab=["a", "b", "c", "d", "e"], embedding_size=4, aggregation_function=aggregation_function)
+    dense_inputs = torch.tensor([[True, False, True, True, False], [False] * 5, [False, True, False, False, True]])
+    sparse_inputs = torch.tensor([[0, 2, 3], [-1, -1, -1], [4, 1, -1]])
+    assert torch.allclose(embed_set(sparse_inputs), embed_set(dense_inputs))
+
+
+def test_embed_weighted_sparse_matches_dense():
+    embed_weighted = EmbedWeighted(vocab=["a", "b", "c", "d", "e"], embedding_size=4)
+    dense_inputs = torch.tensor([[0.0, 2.0, 0.0, 1.0, 0.0], [0.0, 0.0, 0.0, 0.0, 0.0]])
+    sparse_inputs = torch.tensor([[[1, 3], [2, 1]], [[-1, -1], [-1, -1]]], dtype=torch.int32)
+    assert torch.allclose(embed_weighted(sparse_inputs), embed_weighted(dense_inputs))
+
+    # Traced with dense inputs, the module still embeds sparse inputs
+    traced = torch.jit.trace(embed_weighted, (dense_inputs,))
+    assert torch.allclose(traced(sparse_inputs), embed_weighted(sparse_inputs))
+
+
 @pytest.mark.parametrize("vocab", [["a", "b", "c"]])
 @pytest.mark.parametrize("embedding_size", [2])
 @pytest.mark.parametrize("representation", ["dense", "sparse"])
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ludwig.utils.automl import sketches
+from ludwig.utils.automl.data_source import DataframeSource, SketchDataSource
+from ludwig.utils.automl.sketches import ColumnSketch, HyperLogLog, ReservoirSample, TopValuesSketch
+
+
+@pytest.mark.parametrize("num_distinct", [10, 1000, 100000])
+def test_hyperloglog_accuracy(num_distinct):
+    values = pd.Series(np.arange(num_distinct)).astype(str)
+    hll = HyperLogLog(precision=14).update(values).update(values)
+    assert hll.count() == pytest.approx(num_distinct, rel=0.03)
+
+
+@pytest.mark.parametrize("precision", [4, 14])
+def test_hyperloglog_ranks(precision, monkeypatch):
+    num_bits = 64 - precision
+    # Values of more than 53 bits just below a power of two, which round up to it when cast to float64.
+    rests = np.array([(1 << (num_bits - 1)) - 1, 1 << (num_bits - 1), 1, 0], dtype=np.uint64)
+    hashes = (np.arange(len(rests), dtype=np.uint64) << np.uint64(num_bits)) | rests
+    monkeypatch.setattr(sketches, "_hash_values", lambda values: hashes)
+
+    hll = HyperLogLog(precision=precision).update(pd.Series(range(len(hashes))))
+    assert hll.registers[: len(rests)].tolist() == [2, 1, num_bits, num_bits + 1]
+
+
+def test_sketches_merge_matches_single_pass():
+    rng = np.random.default_rng(0)
+    column = pd.Series(rng.choice([f"v{i}" for i in range(50)], size=5000, p=np.full(50, 1 / 50)))
+    parts = [column.iloc[i : i + 1250] for i in range(0, len(column), 1250)]
+
+    single = ColumnSketch(top_values_capacity=100, sample_size=20, seed=0).update(column)
+    merged = ColumnSketch(top_values_capacity=100, sample_size=20, seed=0).update(parts[0])
+    for i, part in enumerate(parts[1:], start=1):
+        merged = merged.merge(ColumnSketch(top_values_capacity=100, sample_size=20, seed=i).update(part))
+
+    assert np.array_equal(single.distinct.registers, merged.distinct.registers)
+    assert single.top_values.counts.to_dict() == merged.top_values.counts.to_dict()
+    assert merged.num_rows == len(column)
+    assert merged.num_distinct == 50
+    assert len(merged.sample.sample()) == 20
+
+
+def test_top_values_sketch_overflow():
+    sketch = TopValuesSketch(capacity=2).update(pd.Series(["a"] * 5 + ["b"] * 3 + ["c"] * 2 + ["d"]))
+    assert not sketch.exact
+    assert sketch.top_values() == ["a", "b"]
+    assert sketch.error == 2
+    assert sketch.total == 11
+
+
+def test_top_values_sketch_balance_counts_dropped_values():
+    values = pd.Series(["a"] * 6 + ["b"] * 5 + ["c", "d"])
+    assert TopValuesSketch(capacity=4).update(values).balance() == pytest.approx(1 / 6)
+
+    # "c" and "d" are dropped: the kept counts alone would give a balance of 5 / 6, but the least frequent value has a
+    # count of at most 2, the total count of the dropped values.
+    sketch = (
+        TopValuesSketch(capacity=2).update(values.iloc[:7]).merge(TopValuesSketch(capacity=2).update(values.iloc[7:]))
+    )
+    assert sketch.total == len(values)
+    assert sketch.balance() == pytest.approx(2 / 6)
+
+
+def test_reservoir_sample_is_subset():
+    values = pd.Series(range(1000))
+    sample = ReservoirSample(capacity=10, seed=1).update(values).sample()
+    assert len(sample) == 10
+    assert set(sample).issubset(set(values))
+
+
+def test_sketch_data_source_matches_exact():
+    df = pd.DataFrame(
+        {
+            "category": ["a", "b", "a", "c", None, "a"] * 10,
+            "number": [1.0, 2.0, 3.0, np.nan, 5.0, 6.0] * 10,
+            "binary": [True, False] * 30,
+        }
+    )
+    exact = DataframeSource(df)
+    sketched = SketchDataSource(df)
+
+    for column in df.columns:
+        num_distinct, distinct_values, _ = exact.get_distinct_values(column, 10)
+        sketch_num_distinct, sketch_distinct_values, _ = sketched.get_distinct_values(column, 10)
+        assert sketch_num_distinct == num_distinct
+        assert set(sketch_distinct_values) == set(distinct_values)
+        assert sketched.get_nonnull_values(column) == df[column].notnull().sum()
+    assert len(sketched.get_unique_values("category")) == len(exact.get_unique_values("category"))
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+import torch
+
+from ludwig.utils.activation_utils import ActivationWriter, load_parquet_activations
+
+
+@pytest.mark.parametrize("output_format", ["npy", "parquet"])
+def test_activation_writer(tmpdir, output_format):
+    batches = [
+        {"out::logits": torch.randn(4, 3), "combiner::hidden": torch.randn(4, 2, 5)},
+        {"out::logits": torch.randn(2, 3), "combiner::hidden": torch.randn(2, 2, 5)},
+    ]
+    with ActivationWriter(str(tmpdir), num_rows=6, output_format=output_format) as writer:
+        for batch in batches:
+            writer.write(batch)
+    assert writer.rows_written == {"out::logits": 6, "combiner::hidden": 6}
+
+    for name, filename in writer.filenames.items():
+        assert filename.endswith(f".{output_format}")
+        expected = torch.cat([batch[name] for batch in batches]).numpy()
+        if output_format == "npy":
+            saved = np.load(filename, mmap_mode="r")
+        else:
+            saved = load_parquet_activations(filename)
+        np.testing.assert_array_equal(saved, expected)
+
+
+def test_activation_writer_npy_shape_mismatch(tmpdir):
+    with ActivationWriter(str(tmpdir), num_rows=4) as writer:
+        writer.write({"hidden": torch.zeros(2, 3, dtype=torch.bfloat16)})
+        with pytest.raises(ValueError):
+            writer.write({"hidden": torch.zeros(2, 4)})
+        with pytest.raises(ValueError):
+            writer.write({"hidden": torch.zeros(3, 3)})
+    assert np.load(writer.filenames["hidden"]).dtype == np.float32
@@ -1,6 +1,8 @@
 import pytest
+import torch
 
-from ludwig.utils.audio_utils import is_audio_score
+from ludwig.features.audio_feature import AudioFeatureMixin
+from ludwig.utils.audio_utils import get_batched_2D_features, is_audio_score
 
 
 @pytest.mark.parametrize(
@@ -21,3 +23,35 @@ from ludwig.utils.audio_utils import is_audio_score
 )
 def test_is_audio_score(path: str, score: int):
     assert is_audio_score(path) == score
+
+
+@pytest.mark.parametrize("feature_type", ["stft", "stft_phase", "group_delay", "fbank"])
+@pytest.mark.parametrize("max_num_frames", [None, 20])
+def test_get_batched_2D_features(feature_type: str, max_num_frames):
+    torch.manual_seed(0)
+    sampling_rate_in_hz = 8000
+    audio_feature_dict = {
+        "type": feature_type,
+        "window_length_in_s": 0.04,
+        "window_shift_in_s": 0.02,
+        "window_type": "hamming",
+        "num_filter_bands": 40,
+    }
+    waveforms = [torch.randn(1, length) for length in [8000, 7990, 3000, 4321]]
+
+    batched_features = get_batched_2D_features(
+        [waveform[0] for waveform in waveforms],
+        feature_type,
+        sampling_rate_in_hz,
+        window_length_in_s=0.04,
+        window_shift_in_s=0.02,
+        num_fft_points=320,
+        window_type="hamming",
+        num_filter_bands=40,
+        max_num_frames=max_num_frames,
+    )
+    for waveform, features in zip(waveforms, batched_features):
+        expected = AudioFeatureMixin._get_2D_feature(waveform, feature_type, audio_feature_dict, sampling_rate_in_hz)
+        expected = torch.transpose(expected, 0, 1)[:max_num_frames]
+        assert features.shape == expected.shape
+        assert torch.allclose(features, expected, rtol=1e-3, atol=1e-3)
@@ -239,3 +239,32 @@ def test_sanitize_column_names():
     df = sanitize_column_names(df)
 
     assert list(df.columns) == ["col_one", "col_two_", "col___three", "col _one_ _new_"]
+
+
+@pytest.mark.parametrize(
+    "df_lib", [pytest.param(pd, id="pandas"), pytest.param(dd, marks=pytest.mark.distributed, id="dask")]
+)
+def test_read_csv_columns(df_lib, tmpdir):
+    csv_fp = str(tmpdir.join("data.csv"))
+    with open(csv_fp, "w", encoding="utf-8-sig") as f:
+        f.write('col.one,col two,unused\n"multi\nline",001,x\n,NA,"q,""r"""\nNone,2.50,z\n')
+
+    def read(**kwargs):
+        df = read_csv(csv_fp, df_lib=df_lib, **kwargs)
+        # Dask converts object columns to strings with its own missing value
+        return df.compute().astype(object).fillna(np.nan) if df_lib is dd else df
+
+    expected = pd.read_csv(csv_fp, dtype=object)
+    pd.testing.assert_frame_equal(read(), expected)
+
+    # Columns are selected by their sanitized name
+    pd.testing.assert_frame_equal(read(columns={"col_one", "col two", "missing"}), expected[["col.one", "col two"]])
+
+
+def test_read_parquet_columns(tmpdir):
+    parquet_fp = str(tmpdir.join("data.parquet"))
+    pd.DataFrame({"col.one": [1, 2, 3], "col_two": ["a", "b", "c"], "unused": [0.0, 1.0, 2.0]}).to_parquet(parquet_fp)
+
+    assert list(read_parquet(parquet_fp, PANDAS_DF, columns={"col_one", "col_two"}).columns) == ["col.one", "col_two"]
+    assert list(read_parquet(parquet_fp, PANDAS_DF, nrows=2, columns={"col_two"}).columns) == ["col_two"]
+    assert read_parquet(parquet_fp, PANDAS_DF).shape == (3, 3)
@@ -0,0 +1,148 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+import torch
+from transformers import DynamicCache
+
+from ludwig.utils.llm_continuous_batching import ContinuousBatchingScheduler
+
+VOCAB_SIZE = 32
+HIDDEN_SIZE = 16
+
+
+class LayeredCache:
+    """Cache with the per-layer `keys` and `values` of `transformers>=4.56`, whose `DynamicCache` has no legacy API."""
+
+    def __init__(self):
+        self.layers = [SimpleNamespace(keys=None, values=None)]
+
+    def update(self, key, value, layer_idx):
+        layer = self.layers[layer_idx]
+        layer.keys = key if layer.keys is None else torch.cat([layer.keys, key], dim=2)
+        layer.values = value if layer.values is None else torch.cat([layer.values, value], dim=2)
+        return layer.keys, layer.values
+
+
+class TinyCausalLM(torch.nn.Module):
+    """Single attention layer causal LM with the forward signature of HuggingFace models.
+
+    Returns a cache of type `cache_cls`, or a legacy tuple cache if it is not set.
+    """
+
+    def __init__(self, cache_cls=None):
+        super().__init__()
+        self.cache_cls = cache_cls
+        self.embedding = torch.nn.Embedding(VOCAB_SIZE, HIDDEN_SIZE)
+        self.positions = torch.nn.Embedding(64, HIDDEN_SIZE)
+        self.qkv = torch.nn.Linear(HIDDEN_SIZE, 3 * HIDDEN_SIZE)
+        self.head = torch.nn.Linear(HIDDEN_SIZE, VOCAB_SIZE)
+        self.max_batch_size = 0
+
+    def forward(self, input_ids, attention_mask, position_ids, past_key_values=None, use_cache=True):
+        self.max_batch_size = max(self.max_batch_size, input_ids.shape[0])
+        hidden = self.embedding(input_ids) + self.positions(position_ids)
+        query, key, value = self.qkv(hidden).unsqueeze(1).chunk(3, dim=-1)
+        if self.cache_cls is not None:
+            if past_key_values is None:
+                past_key_values = self.cache_cls()
+            key, value = past_key_values.update(key, value, 0)
+        elif past_key_values is not None:
+            key = torch.cat([past_key_values[0][0], key], dim=2)
+            value = torch.cat([past_key_values[0][1], value], dim=2)
+
+        past_length = key.shape[2] - input_ids.shape[1]
+        causal = torch.ones(input_ids.shape[1], key.shape[2], dtype=torch.bool).tril(diagonal=past_length)
+        allowed = causal.unsqueeze(0) & attention_mask.bool().unsqueeze(1)
+        scores = (query @ key.transpose(-1, -2)).squeeze(1) / math.sqrt(HIDDEN_SIZE)
+        attention = scores.masked_fill(~allowed, float("-inf")).softmax(dim=-1)
+        logits = self.head(hidden + attention @ value.squeeze(1))
+        cache = past_key_values if self.cache_cls is not None else ((key, value),)
+        return SimpleNamespace(logits=logits, past_key_values=cache)
+
+
+def _reference_generate(model, prompt, max_new_tokens, eos_token_id=None):
+    """Greedy decoding of a single prompt, recomputing the whole sequence at every step."""
+    sequence = prompt
+    for _ in range(max_new_tokens):
+        positions = torch.arange(len(sequence)).unsqueeze(0)
+        logits = model(sequence.unsqueeze(0), torch.ones(1, len(sequence)), positions).logits
+        token = logits[0, -1].argmax()
+        sequence = torch.cat([sequence, token.unsqueeze(0)])
+        if token == eos_token_id:
+            break
+    return sequence
+
+
+@pytest.fixture(params=[None, DynamicCache, LayeredCache], ids=["legacy_cache", "dynamic_cache", "layered_cache"])
+def model(request):
+    torch.manual_seed(0)
+    return TinyCausalLM(cache_cls=request.param).double().eval()
+
+
+@pytest.fixture
+def prompts():
+    torch.manual_seed(1)
+    return [torch.randint(0, VOCAB_SIZE, (length,)) for length in [3, 9, 1, 6, 12, 4, 7]]
+
+
+def test_continuous_batching_matches_sequential_generation(model, prompts):
+    max_new_tokens = [5, 2, 8, 1, 6, 3, 9]
+    with torch.no_grad():
+        expected = [_reference_generate(model, p, n) for p, n in zip(prompts, max_new_tokens)]
+
+    scheduler = ContinuousBatchingScheduler(model, max_batch_size=3, max_new_tokens=10)
+    futures = [scheduler.submit(prompt, max_new_tokens=n) for prompt, n in zip(prompts, max_new_tokens)]
+    while scheduler.num_waiting or scheduler.num_running:
+        occupied_slot_steps = scheduler.stats.occupied_slot_steps
+        scheduler.step()
+        if scheduler.num_waiting:
+            # Slots freed by finished sequences are filled by waiting requests before the next decoding step
+            assert scheduler.stats.occupied_slot_steps - occupied_slot_steps == 3
+
+    for future, expected_sequence in zip(futures, expected):
+        assert torch.equal(future.result(), expected_sequence)
+    assert model.max_batch_size == 3
+
+    stats = scheduler.stats
+    assert stats.num_requests == len(prompts)
+    assert stats.generated_tokens == sum(max_new_tokens)
+    assert 0 < stats.slot_utilization <= 1
+    assert stats.tokens_per_second > 0
+
+
+def test_continuous_batching_eos(model, prompts):
+    with torch.no_grad():
+        # Stop on a token the first prompt generates as its third token
+        eos_token_id = int(_reference_generate(model, prompts[0], 3)[-1])
+        expected = [_reference_generate(model, prompt, 10, eos_token_id) for prompt in prompts]
+
+    scheduler = ContinuousBatchingScheduler(model, max_batch_size=2, max_new_tokens=10, eos_token_id=[eos_token_id])
+    sequences = scheduler.generate(prompts)
+    for sequence, expected_sequence in zip(sequences, expected):
+        assert torch.equal(sequence, expected_sequence)
+    assert len(sequences[0]) == len(prompts[0]) + 3
+
+
+def test_continuous_batching_sampling(model, prompts):
+    scheduler = ContinuousBatchingScheduler(
+        model, max_batch_size=4, max_new_tokens=4, do_sample=True, temperature=0.7, top_k=5, top_p=0.9
+    )
+    sequences = scheduler.generate(prompts)
+    for prompt, sequence in zip(prompts, sequences):
+        assert len(sequence) == len(prompt) + 4
+        assert torch.equal(sequence[: len(prompt)], prompt)
+
+
+def test_continuous_batching_background_loop(model, prompts):
+    with torch.no_grad():
+        expected = [_reference_generate(model, prompt, 4) for prompt in prompts]
+
+    scheduler = ContinuousBatchingScheduler(model, max_batch_size=2, max_new_tokens=4)
+    scheduler.start()
+    try:
+        futures = [scheduler.submit(prompt) for prompt in prompts]
+        for future, expected_sequence in zip(futures, expected):
+            assert torch.equal(future.result(timeout=60), expected_sequence)
+    finally:
+        scheduler.stop()
@@ -0,0 +1,125 @@
+from types import SimpleNamespace
+
+import pytest
+import torch
+
+from ludwig.utils.llm_prefix_cache import get_common_prefix_length, get_kv_cache_nbytes, PrefixKVCache
+
+NUM_LAYERS = 2
+HIDDEN_SIZE = 4
+
+
+class CausalLMStub(torch.nn.Module):
+    """Produces a legacy key/value cache that depends on each token and its position, like a causal LM."""
+
+    def __init__(self):
+        super().__init__()
+        self.embedding = torch.nn.Embedding(100, HIDDEN_SIZE)
+        self.forward_tokens = 0
+
+    def forward(self, input_ids, attention_mask=None, past_key_values=None, use_cache=True):
+        past_length = past_key_values[0][0].shape[2] if past_key_values is not None else 0
+        assert attention_mask.shape[1] == past_length + input_ids.shape[1]
+        self.forward_tokens += input_ids.shape[1]
+
+        positions = torch.arange(past_length, past_length + input_ids.shape[1])
+        states = (self.embedding(input_ids) + positions.unsqueeze(-1)).unsqueeze(1)
+        layers = []
+        for layer in range(NUM_LAYERS):
+            key, value = states + layer, states - layer
+            if past_key_values is not None:
+                key = torch.cat([past_key_values[layer][0], key], dim=2)
+                value = torch.cat([past_key_values[layer][1], value], dim=2)
+            layers.append((key, value))
+        return SimpleNamespace(past_key_values=tuple(layers))
+
+
+def _assert_cache_equal(cache, expected):
+    for layer, expected_layer in zip(cache, expected):
+        for tensor, expected_tensor in zip(layer, expected_layer):
+            assert torch.equal(tensor, expected_tensor)
+
+
+def _full_cache(model, ids):
+    # Computed without the cache, and not counted as tokens run through the model by the cache.
+    forward_tokens = model.forward_tokens
+    with torch.no_grad():
+        past_key_values = model(input_ids=ids, attention_mask=torch.ones_like(ids)).past_key_values
+    model.forward_tokens = forward_tokens
+    return past_key_values
+
+
+def test_get_common_prefix_length():
+    assert get_common_prefix_length([]) == 0
+    assert get_common_prefix_length([torch.tensor([[1, 2, 3]])]) == 3
+    assert get_common_prefix_length([torch.tensor([1, 2, 3, 4]), torch.tensor([1, 2, 5]), torch.tensor([1, 2])]) == 2
+    assert get_common_prefix_length([torch.tensor([1, 2]), torch.tensor([3, 2])]) == 0
+    assert get_common_prefix_length([torch.tensor([1, 2]), torch.tensor([], dtype=torch.long)]) == 0
+
+
+def test_prefix_kv_cache_reuse():
+    model = CausalLMStub()
+    cache = PrefixKVCache(max_memory_bytes=2**20, min_prefix_length=2)
+    template = list(range(1, 11))
+
+    prefix = torch.tensor([template])
+    _assert_cache_equal(cache.get(model, prefix), _full_cache(model, prefix))
+    model.forward_tokens = 0
+
+    # The same prefix is not recomputed
+    cache.get(model, prefix)
+    assert model.forward_tokens == 0
+
+    # A shorter prefix is cropped from the cached one
+    _assert_cache_equal(cache.get(model, prefix[:, :6]), _full_cache(model, prefix[:, :6]))
+    assert model.forward_tokens == 0
+    assert cache.hits == 2
+
+    # A longer prefix only runs the model over the tokens that are not cached
+    longer = torch.tensor([template + [42, 43, 44]])
+    result = cache.get(model, longer)
+    assert model.forward_tokens == 3
+    _assert_cache_equal(result, _full_cache(model, longer))
+    assert len(cache) == 2
+
+    # Callers may modify the caches they get without affecting the cached entries
+    result[0][0].zero_()
+    _assert_cache_equal(cache.get(model, longer), _full_cache(model, longer))
+
+
+def test_prefix_kv_cache_memory_limit():
+    model = CausalLMStub()
+    entry_nbytes = get_kv_cache_nbytes(_full_cache(model, torch.arange(1, 11).unsqueeze(0)))
+    assert entry_nbytes == NUM_LAYERS * 2 * 10 * HIDDEN_SIZE * 4
+
+    cache = PrefixKVCache(max_memory_bytes=2 * entry_nbytes)
+    prefixes = [torch.arange(start, start + 10).unsqueeze(0) for start in (1, 21, 41)]
+    for prefix in prefixes:
+        cache.get(model, prefix)
+    assert len(cache) == 2
+    assert cache.memory_bytes <= cache.max_memory_bytes
+
+    # The least recently used prefix was evicted
+    model.forward_tokens = 0
+    cache.get(model, prefixes[2])
+    assert model.forward_tokens == 0
+    cache.get(model, prefixes[0])
+    assert model.forward_tokens == 10
+
+    # Prefixes larger than the limit are computed, but not cached
+    cache.clear()
+    cache.max_memory_bytes = entry_nbytes - 1
+    assert cache.get(model, prefixes[0]) is not None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize("min_prefix_length", [4, 8])
+def test_prefix_kv_cache_min_prefix_length(min_prefix_length):
+    model = CausalLMStub()
+    cache = PrefixKVCache(max_memory_bytes=2**20, min_prefix_length=min_prefix_length)
+    cache.get(model, torch.tensor([[1, 2, 3, 4, 5, 6, 7, 8, 9]]))
+    model.forward_tokens = 0
+
+    # Shares 6 tokens with the cached prefix, which is only reused if it is long enough
+    cache.get(model, torch.tensor([[1, 2, 3, 4, 5, 6, 50, 51]]))
+    assert model.forward_tokens == (2 if min_prefix_length <= 6 else 8)
@@ -2,7 +2,7 @@ import pytest
 import torch
 from transformers import AutoConfig, AutoModelForCausalLM
 
-from ludwig.constants import LOGITS, PREDICTIONS, PROBABILITIES
+from ludwig.constants import IGNORE_INDEX_TOKEN_ID, LOGITS, PREDICTIONS, PROBABILITIES
 from ludwig.modules.training_hooks import NEFTuneHook
 from ludwig.utils.llm_utils import (
     add_left_padding,
@@ -10,6 +10,7 @@ from ludwig.utils.llm_utils import (
     FALLBACK_CONTEXT_LEN,
     find_last_matching_index,
     generate_merged_ids,
+    generate_packed_ids,
     get_context_len,
     get_realigned_target_and_prediction_tensors_for_inference,
     has_padding_token,
@@ -198,6 +199,99 @@ def test_generate_merged_ids_returns_tensor(tokenizer, input_ids, target_ids):
     assert isinstance(attention_masks, torch.Tensor)
 
 
+def test_generate_packed_ids(tokenizer):
+    input_ids = torch.tensor([[3, 4, 5, 6], [1, 1, 7, 8], [1, 1, 1, 9]])
+    target_ids = torch.tensor([[10, 11], [1, 12], [13, 14]])
+    eos = tokenizer.eos_token_id
+
+    packed = generate_packed_ids(input_ids, target_ids, tokenizer, max_sequence_length=10)
+
+    # Merged lengths are 7, 4 and 4: the two shorter examples share a row.
+    assert packed.input_ids.shape == (2, 8)
+    assert packed.num_examples == 3
+    assert packed.num_tokens == 15
+    assert packed.efficiency == pytest.approx(15 / 16)
+
+    assert packed.input_ids[0, :7].tolist() == [3, 4, 5, 6, 10, 11, eos]
+    assert packed.position_ids[0, :7].tolist() == list(range(7))
+    assert packed.attention_mask[0].tolist() == [1] * 7 + [0]
+    assert packed.labels[0].tolist() == [IGNORE_INDEX_TOKEN_ID] * 4 + [10, 11, eos] + [IGNORE_INDEX_TOKEN_ID]
+
+    assert packed.input_ids[1].tolist() == [7, 8, 12, eos, 9, 13, 14, eos]
+    assert packed.position_ids[1].tolist() == [0, 1, 2, 3, 0, 1, 2, 3]
+    assert packed.attention_mask[1].tolist() == [1] * 8
+    assert packed.sequence_ids[1].tolist() == [1, 1, 1, 1, 2, 2, 2, 2]
+    ignore = IGNORE_INDEX_TOKEN_ID
+    assert packed.labels[1].tolist() == [ignore, ignore, 12, eos, ignore, 13, 14, eos]
+
+
+def test_packed_causal_attention_mask(tokenizer):
+    input_ids = torch.tensor([[1, 7, 8], [1, 1, 9]])
+    target_ids = torch.tensor([[12], [13]])
+
+    packed = generate_packed_ids(input_ids, target_ids, tokenizer, max_sequence_length=10)
+    mask = packed.causal_attention_mask(torch.float32)
+
+    # Both examples share one row: each token only attends to the preceding tokens of its own example.
+    assert mask.shape == (1, 1, 7, 7)
+    allowed = (mask[0, 0] == 0).int().tolist()
+    assert allowed == [
+        [1, 0, 0, 0, 0, 0, 0],
+        [1, 1, 0, 0, 0, 0, 0],
+        [1, 1, 1, 0, 0, 0, 0],
+        [1, 1, 1, 1, 0, 0, 0],
+        [0, 0, 0, 0, 1, 0, 0],
+        [0, 0, 0, 0, 1, 1, 0],
+        [0, 0, 0, 0, 1, 1, 1],
+    ]
+    assert mask.min() == torch.finfo(torch.float32).min
+
+
+@pytest.mark.parametrize("attn_implementation", ["eager", "sdpa"])
+def test_packed_logits_match_unpacked(tokenizer, attn_implementation):
+    config = AutoConfig.for_model(
+        "llama",
+        vocab_size=64,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=4,
+        num_key_value_heads=4,
+        attn_implementation=attn_implementation,
+    )
+    torch.manual_seed(0)
+    model = AutoModelForCausalLM.from_config(config).eval()
+
+    input_ids = torch.tensor([[3, 4, 5, 6], [1, 1, 7, 8], [1, 1, 1, 9]])
+    target_ids = torch.tensor([[10, 11], [1, 12], [13, 14]])
+    packed = generate_packed_ids(input_ids, target_ids, tokenizer, max_sequence_length=10)
+
+    with torch.no_grad():
+        packed_logits = model(
+            input_ids=packed.input_ids,
+            attention_mask=packed.causal_attention_mask(torch.float32),
+            position_ids=packed.position_ids,
+        ).logits
+
+        for row in range(packed.input_ids.shape[0]):
+            for sequence_id in packed.sequence_ids[row].unique().tolist():
+                if sequence_id == 0:
+                    continue
+                positions = packed.sequence_ids[row] == sequence_id
+                example = packed.input_ids[row, positions].unsqueeze(0)
+                unpacked_logits = model(input_ids=example).logits[0]
+                assert torch.allclose(packed_logits[row, positions], unpacked_logits, atol=1e-5)
+
+
+def test_generate_packed_ids_truncation(tokenizer, input_ids, target_ids):
+    # Examples longer than the maximum sequence length are truncated exactly like in `generate_merged_ids`.
+    merged_ids, _ = generate_merged_ids(input_ids, target_ids, tokenizer, max_sequence_length=5)
+    packed = generate_packed_ids(input_ids, target_ids, tokenizer, max_sequence_length=5)
+
+    assert packed.input_ids.shape == (2, 5)
+    assert sorted(packed.input_ids.tolist()) == sorted(merged_ids.tolist())
+
+
 def test_pad_target_tensor_for_fine_tuning():
     of_name = "out_1"
     prediction = {
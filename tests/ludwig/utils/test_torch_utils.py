@@ -10,11 +10,39 @@ from ludwig.utils.torch_utils import (
     _get_torch_init_params,
     _set_torch_init_params,
     initialize_pytorch,
+    reg_loss,
     sequence_length_2D,
     sequence_length_3D,
 )
 
 
+@pytest.mark.parametrize("foreach_norm", [True, False])
+@pytest.mark.parametrize("regularizer", ["l1", "l2", "l1_l2"])
+def test_reg_loss(regularizer, foreach_norm):
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.LayerNorm(8), torch.nn.Linear(8, 2))
+    model.register_parameter("counts", torch.nn.Parameter(torch.tensor([-1, 2]), requires_grad=False))
+    # The gradient of the norm of a zero-valued parameter must be 0 rather than NaN.
+    model.register_parameter("zeros", torch.nn.Parameter(torch.zeros(3)))
+
+    def expected_reg_loss():
+        l1 = 0.1 * sum(torch.abs(p).sum() for p in model.parameters())
+        l2 = 0.2 * sum(torch.square(p).sum() for p in model.parameters())
+        return {"l1": l1, "l2": l2, "l1_l2": l1 + l2}[regularizer]
+
+    with patch("ludwig.utils.torch_utils._FOREACH_NORM_DIFFERENTIABLE", foreach_norm):
+        loss = reg_loss(model, regularizer, l1=0.1, l2=0.2)
+    loss.backward()
+    grads = [p.grad.clone() for p in model.parameters() if p.requires_grad]
+    model.zero_grad()
+    expected_loss = expected_reg_loss()
+    expected_loss.backward()
+
+    assert torch.allclose(loss, expected_loss)
+    for grad, p in zip(grads, [p for p in model.parameters() if p.requires_grad]):
+        assert torch.allclose(grad, p.grad)
+
+
 @pytest.mark.parametrize("input_sequence", [[[0, 1, 1], [2, 0, 0], [3, 3, 3]]])
 @pytest.mark.parametrize("expected_output", [[3, 2, 3]])
 def test_sequence_length_2D(input_sequence: List[List[int]], expected_output: List[int]):
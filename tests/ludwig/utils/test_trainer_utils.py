@@ -2,6 +2,7 @@ from collections import OrderedDict
 from typing import Union
 
 import pytest
+import torch
 
 from ludwig.constants import AUTO, BATCH_SIZE, COMBINED, LOSS
 from ludwig.features.category_feature import CategoryOutputFeature
@@ -311,6 +312,33 @@ def test_full_progress_tracker():
     }
 
 
+def test_step_telemetry(monkeypatch):
+    telemetry = trainer_utils.StepTelemetry(steps_per_flush=3, resource_sample_interval_s=10)
+    assert telemetry.flush() == []
+
+    for step in range(3):
+        loss = torch.tensor(float(step), requires_grad=True) * 2
+        should_flush = telemetry.record(step, loss, {"out": loss / 2}, used_tokens=4, total_tokens_used=4 * (step + 1))
+        assert should_flush == (step == 2)
+    assert len(telemetry) == 3
+
+    summaries = telemetry.flush()
+    assert len(telemetry) == 0
+    assert [summary.step for summary in summaries] == [0, 1, 2]
+    assert [summary.combined_loss for summary in summaries] == [0.0, 2.0, 4.0]
+    assert [summary.all_losses for summary in summaries] == [{"out": 0.0}, {"out": 1.0}, {"out": 2.0}]
+    assert summaries[-1].total_tokens_used == 12
+
+    # Resources are sampled on the first call, then once per interval
+    now = [100.0]
+    monkeypatch.setattr(trainer_utils.time, "monotonic", lambda: now[0])
+    assert telemetry.should_sample_resources()
+    now[0] += 5
+    assert not telemetry.should_sample_resources()
+    now[0] += 5
+    assert telemetry.should_sample_resources()
+
+
 def test_get_final_steps_per_checkpoint():
     # steps_per_checkpoint and checkpoints_per_epoch cannot both be specified.
     with pytest.raises(Exception):
@@ -0,0 +1,114 @@
+"""Startup costs of short-lived Ludwig processes, measured in fresh interpreters.
+
+Rather than absolute time budgets, which depend on the machine, the tests check which modules are imported, and
+compare timings within the same machine.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only parse arguments or dispatch commands, and so must not import any of `HEAVY_MODULES`.
+LIGHTWEIGHT_MODULES = ["ludwig", "ludwig.cli"]
+
+HEAVY_MODULES = [
+    "dask",
+    "marshmallow",
+    "numpy",
+    "pandas",
+    "ray",
+    "torch",
+    "transformers",
+    "ludwig.api",
+    "ludwig.backend",
+    "ludwig.data",
+    "ludwig.features",
+    "ludwig.models",
+    "ludwig.schema",
+]
+
+# Minimum speedup of validating a config once the schema snapshot has been written by an earlier process, over
+# validating it while building the snapshot. It is about 10x when measured.
+MIN_SCHEMA_SNAPSHOT_SPEEDUP = 3.0
+
+VALIDATE_CONFIG_SCRIPT = """
+import time
+
+from ludwig.schema.model_types.base import ModelConfig
+
+config = {
+    "input_features": [{"name": "in1", "type": "number"}, {"name": "in2", "type": "text"}],
+    "output_features": [{"name": "out", "type": "category"}],
+}
+start = time.perf_counter()
+ModelConfig.from_dict(config)
+print(time.perf_counter() - start)
+"""
+
+# Optional dependencies that are only imported once a config uses them, and so must not be imported by Ludwig itself.
+LAZY_DEPENDENCIES = ["bitsandbytes", "faiss", "h3", "sklearn", "spacy", "torchaudio"]
+
+# Feature modules (and their dependencies) that building a model without such features must not import.
+BUILD_MODEL_SCRIPT = """
+import json
+import sys
+
+from ludwig.models.ecd import ECD
+from ludwig.schema.model_types.base import ModelConfig
+
+config = {
+    "input_features": [{"name": "in1", "type": "number"}, {"name": "in2", "type": "binary"}],
+    "output_features": [{"name": "out", "type": "number"}],
+}
+ECD(ModelConfig.from_dict(config))
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run(code: str, env=None) -> str:
+    """Runs `code` in a fresh interpreter, and returns the last line it printed."""
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True, env={**os.environ, **(env or {})}
+    )
+    return output.stdout.strip().splitlines()[-1]
+
+
+def _imported_modules(module: str):
+    return set(json.loads(_run(f"import json, sys; import {module}; print(json.dumps(sorted(sys.modules)))")))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", LIGHTWEIGHT_MODULES)
+def test_import_lightweight_modules(module):
+    imported = _imported_modules(module)
+    heavy = [heavy_module for heavy_module in HEAVY_MODULES if heavy_module in imported]
+    assert not heavy, f"Importing {module} imports {heavy}"
+
+
+@pytest.mark.benchmark
+def test_config_validation_time(tmpdir):
+    env = {"LUDWIG_CACHE": str(tmpdir)}
+    # The first process builds and saves the schema snapshot, later processes only load it.
+    cold = float(_run(VALIDATE_CONFIG_SCRIPT, env=env))
+    warm = float(_run(VALIDATE_CONFIG_SCRIPT, env=env))
+    assert warm * MIN_SCHEMA_SNAPSHOT_SPEEDUP < cold, (
+        f"Validating a config took {warm:.2f}s with the schema snapshot, and {cold:.2f}s without it, less than "
+        f"{MIN_SCHEMA_SNAPSHOT_SPEEDUP:.0f}x faster"
+    )
+
+
+@pytest.mark.benchmark
+def test_import_lazy_dependencies():
+    modules = {module.split(".")[0] for module in _imported_modules("ludwig.api")}
+    assert not modules.intersection(LAZY_DEPENDENCIES)
+
+
+@pytest.mark.benchmark
+def test_build_model_lazy_features():
+    modules = set(json.loads(_run(BUILD_MODEL_SCRIPT)))
+    for feature_type in ["audio", "image", "text", "sequence", "timeseries"]:
+        assert f"ludwig.features.{feature_type}_feature" not in modules
+    assert "ludwig.encoders.image.torchvision" not in modules
+    assert "ludwig.encoders.text_encoders" not in modules
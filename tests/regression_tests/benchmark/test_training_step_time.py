@@ -0,0 +1,81 @@
+"""Per-step overhead of the training loop, measured on CPU with a model small enough for the overhead to dominate.
+
+The throughput of `Trainer` is compared to a bare loop of forward, backward and optimizer steps on the same model, so
+that the budget does not depend on the speed of the machine.
+"""
+import logging
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+import torch
+
+from ludwig.api import LudwigModel
+from ludwig.callbacks import Callback
+
+BATCH_SIZE = 16
+NUM_ROWS = 4096
+
+# Minimum ratio between the steps per second of the training loop and of the bare loop. Loading batches, updating
+# metrics and the learning rate, and writing step summaries take the rest. The ratio is around 0.37 on CPU, and the
+# budget leaves a margin of more than 2x for noisy machines.
+MIN_STEP_EFFICIENCY = 0.15
+
+# Steps left out of the measurements while allocations and caches warm up.
+WARMUP_STEPS = 10
+
+
+class StepTimer(Callback):
+    def __init__(self):
+        self.times = []
+
+    def on_batch_start(self, trainer, progress_tracker, save_path):
+        self.times.append(time.perf_counter())
+
+
+def _steps_per_second(times) -> float:
+    return 1.0 / float(np.median(np.diff(times[WARMUP_STEPS:])))
+
+
+@pytest.mark.benchmark
+def test_training_step_overhead(tmpdir):
+    torch.set_num_threads(1)
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({"x1": rng.rand(NUM_ROWS), "x2": rng.rand(NUM_ROWS), "y": rng.rand(NUM_ROWS)})
+    config = {
+        "input_features": [{"name": "x1", "type": "number"}, {"name": "x2", "type": "number"}],
+        "output_features": [{"name": "y", "type": "number"}],
+        "combiner": {"type": "concat", "output_size": 8, "num_fc_layers": 1},
+        "trainer": {"batch_size": BATCH_SIZE, "epochs": 1},
+        "backend": {"type": "local"},
+    }
+    timer = StepTimer()
+    model = LudwigModel(config, logging_level=logging.ERROR, callbacks=[timer])
+    model.train(
+        dataset=df,
+        output_directory=str(tmpdir),
+        skip_save_model=True,
+        skip_save_progress=True,
+        skip_save_processed_input=True,
+    )
+    trainer_steps_per_second = _steps_per_second(timer.times)
+
+    ecd = model.model
+    optimizer = torch.optim.Adam(ecd.parameters())
+    inputs = {"x1": torch.rand(BATCH_SIZE), "x2": torch.rand(BATCH_SIZE)}
+    targets = {"y": torch.rand(BATCH_SIZE)}
+    times = []
+    for _ in range(len(timer.times)):
+        times.append(time.perf_counter())
+        loss, _ = ecd.train_loss(targets, ecd((inputs, targets)))
+        loss.backward()
+        optimizer.step()
+        optimizer.zero_grad()
+    bare_steps_per_second = _steps_per_second(times)
+
+    efficiency = trainer_steps_per_second / bare_steps_per_second
+    assert efficiency > MIN_STEP_EFFICIENCY, (
+        f"The training loop ran {trainer_steps_per_second:.0f} steps/s, {efficiency:.2f} times the "
+        f"{bare_steps_per_second:.0f} steps/s of a bare loop, below the budget of {MIN_STEP_EFFICIENCY:.2f}"
+    )